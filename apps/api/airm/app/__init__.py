@@ -5,13 +5,13 @@
 import asyncio
 import os
 import sys
+import time
 from asyncio import Task
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
 from fastapi import APIRouter, Depends, FastAPI
-from fastapi_mcp import FastApiMCP
 from loguru import logger
 from sqlalchemy.exc import IntegrityError
 
@@ -20,6 +20,7 @@ from .health.router import router as health_router
 from .messaging.admin import configure_inbound_vhost
 from .messaging.consumer import start_consuming_from_common_feedback_queue
 from .messaging.queues import configure_queues_for_common_vhost
+from .metrics.rollups import start_gpu_usage_rollups
 from .metrics.service import init_prometheus_client
 from .organizations.router import router as organizations_router
 from .projects.router import router as projects_router
@@ -40,6 +41,7 @@ from .utilities.exceptions import (
     ValidationException,
 )
 from .utilities.fastapi import (
+    PydanticJSONResponse,
     base_airm_exception_handler,
     conflict_exception_handler,
     exception_group_handler,
@@ -56,6 +58,7 @@ from .utilities.fastapi import (
     value_error_handler,
 )
 from .utilities.keycloak_admin import init_keycloak_admin_client
+from .utilities.mcp import LazyFastApiMCP
 from .utilities.prometheus_instrumentation import setup_instrumentation, start_metrics_server
 from .utilities.security import create_logged_in_user_in_system, track_user_activity_from_token
 from .workloads.router import router as workloads_router
@@ -63,6 +66,7 @@ from .workloads.router import router as workloads_router
 load_dotenv(override=False)
 
 consumer_task: Task | None = None
+gpu_usage_rollup_task: Task | None = None
 
 
 @asynccontextmanager
@@ -72,9 +76,16 @@ async def lifespan(app_lifespan: FastAPI) -> AsyncIterator[None]:
     await shutdown_event(app_lifespan)
 
 
+async def configure_inbound_queues() -> None:
+    """Create the inbound virtual host and the queues shared by all clusters."""
+    await configure_inbound_vhost()
+    await configure_queues_for_common_vhost()
+
+
 async def startup_event(app_lifespan: FastAPI) -> None:
-    global consumer_task
+    global consumer_task, gpu_usage_rollup_task
     app_state = app_lifespan.state
+    start = time.perf_counter()
 
     # Set logging level
     logger.remove()
@@ -86,23 +97,27 @@ async def startup_event(app_lifespan: FastAPI) -> None:
         logger.exception("Failed to connect to database", e)
         sys.exit(1)
 
-    try:
-        # Initialize Keycloak Admin Client and store in app.state
-        app_state.keycloak_admin_client = await init_keycloak_admin_client()
-    except Exception as e:
-        logger.exception("Failed to initialize Keycloak admin client", e)
-        sys.exit(1)
-
     try:
         # Initialize Prometheus Client and store in app.state
         app_state.prometheus_client = init_prometheus_client()
+        gpu_usage_rollup_task = start_gpu_usage_rollups(app_state.prometheus_client)
     except Exception as e:
         logger.exception("Failed to initialize Prometheus client", e)
 
+    # Keycloak and RabbitMQ do not depend on each other, so connect to both at the same time
+    keycloak_admin_client, inbound_queues = await asyncio.gather(
+        init_keycloak_admin_client(), configure_inbound_queues(), return_exceptions=True
+    )
+    if isinstance(keycloak_admin_client, Exception):
+        logger.opt(exception=keycloak_admin_client).error("Failed to initialize Keycloak admin client")
+        sys.exit(1)
+    if isinstance(inbound_queues, Exception):
+        logger.opt(exception=inbound_queues).error("Failed to configure inbound queues")
+        sys.exit(1)
+    app_state.keycloak_admin_client = keycloak_admin_client
+
     try:
         # Start listening inbound queue from the agents.
-        await configure_inbound_vhost()
-        await configure_queues_for_common_vhost()
         consumer_task = start_consuming_from_common_feedback_queue(app_state=app_state)
     except Exception as e:
         logger.exception("Failed to start listening inbound queue", e)
@@ -114,9 +129,20 @@ async def startup_event(app_lifespan: FastAPI) -> None:
         logger.exception("Failed to expose metrics", e)
         sys.exit(1)
 
+    logger.info(f"Startup completed in {time.perf_counter() - start:.2f}s")
+
 
 async def shutdown_event(app_lifespan: FastAPI) -> None:
-    global consumer_task
+    global consumer_task, gpu_usage_rollup_task
+    if gpu_usage_rollup_task:
+        gpu_usage_rollup_task.cancel()
+        try:
+            await gpu_usage_rollup_task
+        except asyncio.CancelledError:
+            logger.info("GPU usage rollup task cancelled successfully.")
+        except Exception as e:
+            logger.error(f"Error during GPU usage rollup task shutdown: {e}")
+
     if consumer_task:
         consumer_task.cancel()
         try:
@@ -133,6 +159,7 @@ app = FastAPI(
     name="AMD Resource Manager API",
     lifespan=lifespan,
     title="AMD Resource Manager API",
+    default_response_class=PydanticJSONResponse,
     swagger_ui_init_oauth={
         "clientId": os.getenv("OPENID_CLIENT_ID", "354a0fa1-35ac-4a6d-9c4d-d661129c2cd0"),
         "scopes": "openid",
@@ -157,11 +184,9 @@ api_secured_router.include_router(storages_router, prefix="/v1")
 app.include_router(api_unsecured_router)
 app.include_router(api_secured_router)
 
-# Initialize MCP support AFTER routers are included
-mcp = FastApiMCP(app)
+# Initialize MCP support AFTER routers are included. The tools are generated from the routes on the first MCP request.
+mcp = LazyFastApiMCP(app)
 mcp.mount()
-# Refresh MCP server to ensure all routes are discovered
-mcp.setup_server()
 
 # Register exception handlers
 app.add_exception_handler(Exception, generic_exception_handler)
@@ -48,6 +48,7 @@ from ..utilities.collections.dependencies import (
 from ..utilities.collections.schemas import FilterCondition, PaginationConditions, SortCondition
 from ..utilities.database import get_session
 from ..utilities.exceptions import NotFoundException
+from ..utilities.fastapi import trusted_response
 from ..utilities.keycloak_admin import (
     KeycloakAdmin,
     get_kc_admin,
@@ -149,6 +150,7 @@ async def get_clusters_stats(
     status_code=status.HTTP_200_OK,
     response_model=Clusters,
 )
+@trusted_response
 async def get_clusters(
     session: AsyncSession = Depends(get_session),
     claimset: dict = Depends(auth_token_claimset),
@@ -305,6 +307,7 @@ async def get_cluster_node(
     status_code=status.HTTP_200_OK,
     response_model=GpuDeviceSingleMetricResponse,
 )
+@trusted_response
 async def get_node_pcie_bandwidth(
     _: None = Depends(ensure_user_can_view_cluster),
     session: AsyncSession = Depends(get_session),
@@ -337,6 +340,7 @@ async def get_node_pcie_bandwidth(
     status_code=status.HTTP_200_OK,
     response_model=GpuDeviceSingleMetricResponse,
 )
+@trusted_response
 async def get_node_pcie_efficiency(
     _: None = Depends(ensure_user_can_view_cluster),
     session: AsyncSession = Depends(get_session),
@@ -415,6 +419,7 @@ async def get_cluster_workload_stats(
     status_code=status.HTTP_200_OK,
     response_model=WorkloadsWithMetrics,
 )
+@trusted_response
 async def get_cluster_workloads_metrics(
     _: None = Depends(ensure_platform_administrator),
     session: AsyncSession = Depends(get_session),
@@ -451,6 +456,7 @@ async def get_cluster_workloads_metrics(
     status_code=status.HTTP_200_OK,
     response_model=MetricsTimeseries,
 )
+@trusted_response
 async def get_gpu_device_utilization_timeseries_for_cluster(
     _: None = Depends(ensure_user_can_view_cluster),
     cluster_id: UUID = Path(description="The ID of the cluster for which to return metrics"),
@@ -484,6 +490,7 @@ async def get_gpu_device_utilization_timeseries_for_cluster(
     status_code=status.HTTP_200_OK,
     response_model=GpuDeviceSingleMetricResponse,
 )
+@trusted_response
 async def get_node_gpu_utilization_metrics(
     _: None = Depends(ensure_user_can_view_cluster),
     session: AsyncSession = Depends(get_session),
@@ -516,6 +523,7 @@ async def get_node_gpu_utilization_metrics(
     status_code=status.HTTP_200_OK,
     response_model=GpuDeviceSingleMetricResponse,
 )
+@trusted_response
 async def get_node_gpu_memory_utilization_metrics(
     _: None = Depends(ensure_user_can_view_cluster),
     session: AsyncSession = Depends(get_session),
@@ -548,6 +556,7 @@ async def get_node_gpu_memory_utilization_metrics(
     status_code=status.HTTP_200_OK,
     response_model=GpuDeviceSingleMetricResponse,
 )
+@trusted_response
 async def get_node_gpu_clock_speed_metrics(
     _: None = Depends(ensure_user_can_view_cluster),
     session: AsyncSession = Depends(get_session),
@@ -580,6 +589,7 @@ async def get_node_gpu_clock_speed_metrics(
     status_code=status.HTTP_200_OK,
     response_model=GpuDeviceSingleMetricResponse,
 )
+@trusted_response
 async def get_node_power_usage_metrics(
     _: None = Depends(ensure_user_can_view_cluster),
     session: AsyncSession = Depends(get_session),
@@ -612,6 +622,7 @@ async def get_node_power_usage_metrics(
     status_code=status.HTTP_200_OK,
     response_model=GpuDeviceSingleMetricResponse,
 )
+@trusted_response
 async def get_node_junction_temperature_metrics(
     _: None = Depends(ensure_user_can_view_cluster),
     session: AsyncSession = Depends(get_session),
@@ -644,6 +655,7 @@ async def get_node_junction_temperature_metrics(
     status_code=status.HTTP_200_OK,
     response_model=GpuDeviceSingleMetricResponse,
 )
+@trusted_response
 async def get_node_memory_temperature_metrics(
     _: None = Depends(ensure_user_can_view_cluster),
     session: AsyncSession = Depends(get_session),
@@ -708,6 +720,7 @@ async def get_node_gpu_devices_metrics(
     status_code=status.HTTP_200_OK,
     response_model=NodeWorkloadsWithMetrics,
 )
+@trusted_response
 async def get_node_workloads_metrics(
     _: None = Depends(ensure_platform_administrator),
     session: AsyncSession = Depends(get_session),
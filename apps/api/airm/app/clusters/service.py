@@ -31,6 +31,7 @@ from ..utilities.exceptions import (
     PreconditionNotMetException,
 )
 from ..utilities.keycloak_admin import KeycloakAdmin, get_client_secret, get_client_uuid, get_public_issuer_url
+from ..utilities.schema import validate_from_attributes
 from .config import KUBE_API_KEYCLOAK_CLIENT_NAME
 from .models import Cluster, ClusterNode
 from .repository import create_cluster as create_cluster_in_db
@@ -374,8 +375,9 @@ def __compute_cluster_resources(
     gpu_vram_bytes = gpu_node.gpu_vram_bytes_per_device if gpu_node else 0
     gpu_name = gpu_node.gpu_product_name if gpu_node else None
 
-    return ClusterWithResources(
-        **ClusterResponse.model_validate(cluster).model_dump(exclude={"status"}),
+    return validate_from_attributes(
+        ClusterWithResources,
+        cluster,
         available_resources=available_resources,
         allocated_resources=allocated_resources,
         gpu_info=(
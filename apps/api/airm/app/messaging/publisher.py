@@ -4,6 +4,8 @@
 
 from aio_pika import DeliveryMode, Message, abc
 
+from ..utilities.request_timing import timed
+
 
 async def publish_message_to_queue(
     connection: abc.AbstractConnection,
@@ -19,7 +21,8 @@ async def publish_message_to_queue(
         delivery_mode=DeliveryMode.PERSISTENT,
         user_id=user_id,
     )
-    await channel.default_exchange.publish(
-        message,
-        routing_key=queue_name,
-    )
+    with timed("rabbitmq", queue_name):
+        await channel.default_exchange.publish(
+            message,
+            routing_key=queue_name,
+        )
@@ -2,7 +2,9 @@
 #
 # SPDX-License-Identifier: MIT
 
+import asyncio
 from contextlib import asynccontextmanager
+from itertools import takewhile
 from uuid import UUID
 
 from loguru import logger
@@ -41,17 +43,34 @@ class MessageSender:
         Send all queued messages to RabbitMQ.
 
         This should only be called after the database transaction has successfully committed.
-        Messages are sent one at a time and removed from the queue after successful delivery.
-        If a message fails to send, an exception is raised and remaining messages stay queued.
+        Consecutive messages for the same cluster are published together over one channel without waiting for the
+        broker to confirm each one before sending the next, so a batch of messages costs about one round trip. The
+        channel sends them in the order they were queued. Messages are removed from the queue after successful
+        delivery. If a message fails to send, an exception is raised and the failed and remaining messages stay
+        queued.
         """
         while self._messages:
-            cluster_id, message = self._messages[0]
-            logger.info(f"Sending {message.message_type} message to cluster {cluster_id}")
+            cluster_id = self._messages[0][0]
+            pending = list(takewhile(lambda queued: queued[0] == cluster_id, self._messages))
+            for _, message in pending:
+                logger.info(f"Sending {message.message_type} message to cluster {cluster_id}")
             connection, channel = await get_connection_to_cluster_vhost(
                 cluster_id, RABBITMQ_HOST, RABBITMQ_PORT, RABBITMQ_ADMIN_USER, RABBITMQ_ADMIN_PASSWORD
             )
-            await publish_message_to_queue(connection, f"{cluster_id}", message.json(), RABBITMQ_ADMIN_USER, channel)
-            self._messages.pop(0)  # Only remove after successful send
+            results = await asyncio.gather(
+                *(
+                    publish_message_to_queue(connection, f"{cluster_id}", message.json(), RABBITMQ_ADMIN_USER, channel)
+                    for _, message in pending
+                ),
+                return_exceptions=True,
+            )
+            # Only remove after successful send
+            failed = [
+                queued for queued, result in zip(pending, results, strict=True) if isinstance(result, BaseException)
+            ]
+            self._messages[: len(pending)] = failed
+            if failed:
+                raise next(result for result in results if isinstance(result, BaseException))
 
 
 @asynccontextmanager
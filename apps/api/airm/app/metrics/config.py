@@ -5,3 +5,10 @@
 import os
 
 PROMETHEUS_URL = os.getenv("PROMETHEUS_URL")
+
+# GPU usage rollups: closed hourly buckets are copied from Prometheus into the database
+GPU_USAGE_ROLLUP_INTERVAL_SECONDS = int(os.getenv("GPU_USAGE_ROLLUP_INTERVAL_SECONDS", "900"))
+# Hours are only rolled up once this long after they closed, so that late scrapes are included
+GPU_USAGE_ROLLUP_SETTLE_SECONDS = int(os.getenv("GPU_USAGE_ROLLUP_SETTLE_SECONDS", "300"))
+# How far back to backfill when no rollups exist yet, bounded by Prometheus retention
+GPU_USAGE_ROLLUP_BACKFILL_HOURS = int(os.getenv("GPU_USAGE_ROLLUP_BACKFILL_HOURS", "168"))
@@ -0,0 +1,51 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, Float, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..utilities.models import BaseEntity
+
+
+class ProjectGpuUsageHourly(BaseEntity):
+    """GPU usage of a project during one closed hour, rolled up from Prometheus."""
+
+    __tablename__ = "project_gpu_usage_hourly"
+
+    project_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    hour: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    allocated_gpu_hours: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    utilized_gpu_hours: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    allocated_vram_mb_hours: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    utilized_vram_mb_hours: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+
+    __table_args__ = (Index("ix_project_gpu_usage_hourly_project_id_hour", project_id, hour, unique=True),)
+
+
+class WorkloadGpuUsageHourly(BaseEntity):
+    """GPU usage of a workload during one closed hour, rolled up from Prometheus.
+
+    workload_id has no foreign key, so that usage history outlives the workload row for chargeback.
+    """
+
+    __tablename__ = "workload_gpu_usage_hourly"
+
+    project_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    workload_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
+    hour: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    utilized_gpu_hours: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    utilized_vram_mb_hours: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_workload_gpu_usage_hourly_workload_id_hour", workload_id, hour, unique=True),
+        Index("ix_workload_gpu_usage_hourly_project_id_hour", project_id, hour),
+    )
@@ -0,0 +1,110 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+import uuid
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import Row, case, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import ProjectGpuUsageHourly, WorkloadGpuUsageHourly
+
+SECONDS_PER_HOUR = 3600
+
+
+def _with_audit_fields(rows: list[dict], updater: str) -> list[dict]:
+    now = datetime.now(UTC)
+    return [
+        {**row, "id": uuid.uuid4(), "created_at": now, "updated_at": now, "created_by": updater, "updated_by": updater}
+        for row in rows
+    ]
+
+
+async def get_latest_gpu_usage_hour(session: AsyncSession) -> datetime | None:
+    result = await session.execute(select(func.max(ProjectGpuUsageHourly.hour)))
+    return result.scalar_one_or_none()
+
+
+async def upsert_project_gpu_usage(session: AsyncSession, rows: list[dict], updater: str = "system") -> None:
+    """Insert hourly project usage rows, replacing existing rows for the same project and hour."""
+    if not rows:
+        return
+    statement = insert(ProjectGpuUsageHourly).values(_with_audit_fields(rows, updater))
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[ProjectGpuUsageHourly.project_id, ProjectGpuUsageHourly.hour],
+            set_={
+                "allocated_gpu_hours": statement.excluded.allocated_gpu_hours,
+                "utilized_gpu_hours": statement.excluded.utilized_gpu_hours,
+                "allocated_vram_mb_hours": statement.excluded.allocated_vram_mb_hours,
+                "utilized_vram_mb_hours": statement.excluded.utilized_vram_mb_hours,
+                "updated_at": func.now(),
+                "updated_by": updater,
+            },
+        )
+    )
+
+
+async def upsert_workload_gpu_usage(session: AsyncSession, rows: list[dict], updater: str = "system") -> None:
+    """Insert hourly workload usage rows, replacing existing rows for the same workload and hour."""
+    if not rows:
+        return
+    statement = insert(WorkloadGpuUsageHourly).values(_with_audit_fields(rows, updater))
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[WorkloadGpuUsageHourly.workload_id, WorkloadGpuUsageHourly.hour],
+            set_={
+                "utilized_gpu_hours": statement.excluded.utilized_gpu_hours,
+                "utilized_vram_mb_hours": statement.excluded.utilized_vram_mb_hours,
+                "updated_at": func.now(),
+                "updated_by": updater,
+            },
+        )
+    )
+
+
+async def get_project_gpu_usage_totals(session: AsyncSession, project_id: UUID, start: datetime, end: datetime) -> Row:
+    """Sum the hourly usage of a project over the hours starting in [start, end).
+
+    Idle seconds add up, per hour, the share of allocated GPUs that was not utilized.
+    """
+    usage = ProjectGpuUsageHourly
+    idle_share = case(
+        (
+            usage.allocated_gpu_hours > 0,
+            func.greatest(usage.allocated_gpu_hours - usage.utilized_gpu_hours, 0) / usage.allocated_gpu_hours,
+        ),
+        else_=0,
+    )
+    result = await session.execute(
+        select(
+            func.coalesce(func.sum(usage.allocated_gpu_hours), 0).label("allocated_gpu_hours"),
+            func.coalesce(func.sum(usage.utilized_gpu_hours), 0).label("utilized_gpu_hours"),
+            func.coalesce(func.sum(usage.allocated_vram_mb_hours), 0).label("allocated_vram_mb_hours"),
+            func.coalesce(func.sum(usage.utilized_vram_mb_hours), 0).label("utilized_vram_mb_hours"),
+            func.coalesce(func.sum(idle_share * SECONDS_PER_HOUR), 0).label("idle_seconds"),
+        ).where(usage.project_id == project_id, usage.hour >= start, usage.hour < end)
+    )
+    return result.one()
+
+
+async def get_workload_gpu_usage_totals(
+    session: AsyncSession, project_id: UUID, start: datetime, end: datetime
+) -> list[Row]:
+    """Sum the hourly usage of each workload of a project over the hours starting in [start, end)."""
+    usage = WorkloadGpuUsageHourly
+    utilized_gpu_hours = func.sum(usage.utilized_gpu_hours)
+    result = await session.execute(
+        select(
+            usage.workload_id,
+            utilized_gpu_hours.label("utilized_gpu_hours"),
+            func.sum(usage.utilized_vram_mb_hours).label("utilized_vram_mb_hours"),
+        )
+        .where(usage.project_id == project_id, usage.hour >= start, usage.hour < end)
+        .group_by(usage.workload_id)
+        .order_by(utilized_gpu_hours.desc(), usage.workload_id)
+    )
+    return result.all()
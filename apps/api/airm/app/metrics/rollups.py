@@ -0,0 +1,178 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Hourly GPU usage rollups.
+
+Closed hours are pulled from Prometheus once and stored per project and per workload, so that usage over arbitrary
+ranges can be read from the database instead of being recomputed from raw samples, and stays available beyond
+Prometheus retention. Each hour is summarized with one instant query per measure at the end of the hour, sampling the
+hour at one minute resolution: the sum of the samples divided by 60 is the usage in GPU-hours (or MB-hours).
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from loguru import logger
+from prometheus_api_client import PrometheusConnect
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..projects.repository import get_project_ids
+from ..utilities.database import session_scope
+from ..utilities.prometheus_instrumentation import ALLOCATED_GPU_VRAM_METRIC_LABEL, ALLOCATED_GPUS_METRIC_LABEL
+from .config import (
+    GPU_USAGE_ROLLUP_BACKFILL_HOURS,
+    GPU_USAGE_ROLLUP_INTERVAL_SECONDS,
+    GPU_USAGE_ROLLUP_SETTLE_SECONDS,
+)
+from .constants import GPU_GFX_ACTIVITY_METRIC, GPU_USED_VRAM_METRIC
+from .constants import PROJECT_ID_METRIC_LABEL as PROJECT_ID
+from .constants import WORKLOAD_ID_METRIC_LABEL as WORKLOAD_ID
+from .repository import get_latest_gpu_usage_hour, upsert_project_gpu_usage, upsert_workload_gpu_usage
+from .utils import a_custom_query, convert_prometheus_string_to_float, is_valid_metric_value
+
+# Advisory lock serializing rollups across replicas, released with the transaction of each hour
+GPU_USAGE_ROLLUP_LOCK_KEY = 0x41524D01
+
+PROJECT_USAGE_QUERIES = {
+    "allocated_gpu_hours": f"max by ({PROJECT_ID}) ({ALLOCATED_GPUS_METRIC_LABEL})",
+    "utilized_gpu_hours": f"count by ({PROJECT_ID}) ({GPU_GFX_ACTIVITY_METRIC})",
+    "allocated_vram_mb_hours": f"max by ({PROJECT_ID}) ({ALLOCATED_GPU_VRAM_METRIC_LABEL})",
+    "utilized_vram_mb_hours": f"sum by ({PROJECT_ID}) ({GPU_USED_VRAM_METRIC})",
+}
+WORKLOAD_USAGE_QUERIES = {
+    "utilized_gpu_hours": f"count by ({PROJECT_ID}, {WORKLOAD_ID}) ({GPU_GFX_ACTIVITY_METRIC})",
+    "utilized_vram_mb_hours": f"sum by ({PROJECT_ID}, {WORKLOAD_ID}) ({GPU_USED_VRAM_METRIC})",
+}
+
+
+def _hourly_usage_query(query: str) -> str:
+    return f"sum_over_time(({query})[1h:1m]) / 60"
+
+
+def _parse_uuid(value: str | None) -> UUID | None:
+    try:
+        return UUID(value) if value else None
+    except ValueError:
+        return None
+
+
+def get_last_closed_hour(now: datetime) -> datetime:
+    """Start of the most recent hour that closed at least GPU_USAGE_ROLLUP_SETTLE_SECONDS ago."""
+    settled = now - timedelta(seconds=GPU_USAGE_ROLLUP_SETTLE_SECONDS)
+    return settled.replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
+
+
+async def _query_hour(prometheus_client: PrometheusConnect, queries: dict[str, str], hour: datetime) -> dict:
+    """Run the usage queries for one hour, keyed by measure and then by (project_id, workload_id) labels."""
+    end_of_hour = (hour + timedelta(hours=1)).timestamp()
+    results = await asyncio.gather(
+        *[
+            a_custom_query(prometheus_client, _hourly_usage_query(query), params={"time": end_of_hour})
+            for query in queries.values()
+        ]
+    )
+    usage: dict[str, dict[tuple[UUID | None, UUID | None], float]] = {}
+    for measure, result in zip(queries, results):
+        usage[measure] = {}
+        for series in result:
+            value = series["value"][1]
+            if not is_valid_metric_value(value):
+                continue
+            key = (_parse_uuid(series["metric"].get(PROJECT_ID)), _parse_uuid(series["metric"].get(WORKLOAD_ID)))
+            usage[measure][key] = convert_prometheus_string_to_float(value)
+    return usage
+
+
+async def roll_up_hour(
+    session: AsyncSession, prometheus_client: PrometheusConnect, hour: datetime, project_ids: set[UUID]
+) -> None:
+    """Store the usage of one closed hour for all given projects, and for their workloads that used GPUs."""
+    project_usage, workload_usage = await asyncio.gather(
+        _query_hour(prometheus_client, PROJECT_USAGE_QUERIES, hour),
+        _query_hour(prometheus_client, WORKLOAD_USAGE_QUERIES, hour),
+    )
+
+    # One row per project and hour, including idle ones, so that the latest hour marks rollup progress
+    project_rows = [
+        {
+            "project_id": project_id,
+            "hour": hour,
+            **{measure: values.get((project_id, None), 0.0) for measure, values in project_usage.items()},
+        }
+        for project_id in project_ids
+    ]
+
+    workload_rows: dict[UUID, dict] = {}
+    for measure, values in workload_usage.items():
+        for (project_id, workload_id), value in values.items():
+            if project_id not in project_ids or workload_id is None:
+                continue
+            row = workload_rows.setdefault(
+                workload_id,
+                {"project_id": project_id, "workload_id": workload_id, "hour": hour}
+                | dict.fromkeys(WORKLOAD_USAGE_QUERIES, 0.0),
+            )
+            row[measure] = value
+
+    await upsert_project_gpu_usage(session, project_rows)
+    await upsert_workload_gpu_usage(session, list(workload_rows.values()))
+
+
+async def roll_up_next_gpu_usage_hour(
+    session: AsyncSession, prometheus_client: PrometheusConnect, now: datetime
+) -> datetime | None:
+    """Roll up the closed hour after the latest stored one, at most GPU_USAGE_ROLLUP_BACKFILL_HOURS back.
+
+    Returns the hour rolled up, or None without querying Prometheus if all closed hours are stored, there are no
+    projects, or another replica is rolling up.
+    """
+    if not await session.scalar(select(func.pg_try_advisory_xact_lock(GPU_USAGE_ROLLUP_LOCK_KEY))):
+        return None
+
+    project_ids = set(await get_project_ids(session))
+    if not project_ids:
+        return None
+
+    last_closed_hour = get_last_closed_hour(now)
+    earliest_hour = last_closed_hour - timedelta(hours=GPU_USAGE_ROLLUP_BACKFILL_HOURS - 1)
+    latest_hour = await get_latest_gpu_usage_hour(session)
+    hour = max(latest_hour + timedelta(hours=1), earliest_hour) if latest_hour else earliest_hour
+    if hour > last_closed_hour:
+        return None
+
+    await roll_up_hour(session, prometheus_client, hour, project_ids)
+    return hour
+
+
+async def roll_up_gpu_usage(prometheus_client: PrometheusConnect, now: datetime | None = None) -> int:
+    """Roll up every closed hour since the latest stored one, each hour in its own transaction.
+
+    The advisory lock is taken again for every hour, so a backfill never holds it across hours. If an hour fails,
+    the hours before it stay stored and the next run resumes from it; an hour that keeps failing is skipped once
+    it falls out of the backfill range. Returns the number of hours rolled up.
+    """
+    now = now or datetime.now(UTC)
+    rolled_up = 0
+    while True:
+        async with session_scope() as session:
+            if await roll_up_next_gpu_usage_hour(session, prometheus_client, now) is None:
+                return rolled_up
+        rolled_up += 1
+
+
+async def _run_gpu_usage_rollups(prometheus_client: PrometheusConnect) -> None:
+    while True:
+        try:
+            rolled_up = await roll_up_gpu_usage(prometheus_client)
+            if rolled_up:
+                logger.info(f"Rolled up GPU usage for {rolled_up} hour(s)")
+        except Exception as e:
+            logger.exception(f"Error rolling up GPU usage: {e}")
+        await asyncio.sleep(GPU_USAGE_ROLLUP_INTERVAL_SECONDS)
+
+
+def start_gpu_usage_rollups(prometheus_client: PrometheusConnect) -> asyncio.Task:
+    return asyncio.create_task(_run_gpu_usage_rollups(prometheus_client))
@@ -3,8 +3,9 @@
 # SPDX-License-Identifier: MIT
 
 from datetime import UTC, datetime, timedelta
+from uuid import UUID
 
-from pydantic import AwareDatetime, BaseModel, Field, model_validator
+from pydantic import AwareDatetime, BaseModel, Field, TypeAdapter, model_validator
 
 from ..projects.schemas import ProjectResponse
 from ..utilities.collections.schemas import BasePaginationList
@@ -39,6 +40,21 @@ class MetricsTimeRange(BaseModel):
         return self
 
 
+class UsageTimeRange(BaseModel):
+    """Validated start/end time range for usage read from hourly rollups, which is not limited to recent data."""
+
+    start: AwareDatetime = Field(description="Start time. ISO 8601 with timezone (e.g. UTC: ...Z or +00:00).")
+    end: AwareDatetime = Field(description="End time. ISO 8601 with timezone (e.g. UTC: ...Z or +00:00).")
+
+    @model_validator(mode="after")
+    def validate_range(self) -> "UsageTimeRange":
+        if self.start >= self.end:
+            raise ValueError("start time must be before end time")
+        if self.end > datetime.now(UTC) + timedelta(minutes=1):
+            raise ValueError("end time must not be in the future")
+        return self
+
+
 class DatapointMetadataBase(BaseModel):
     label: str = Field(
         description="The label for the series that the datapoint belongs to.", min_length=1, max_length=64
@@ -66,6 +82,9 @@ class DatapointsWithMetadata(BaseModel):
     values: list[Datapoint] = Field(description="The list of datapoints corresponding to the metadata.")
 
 
+DatapointsAdapter: TypeAdapter[list[Datapoint]] = TypeAdapter(list[Datapoint])
+
+
 class TimeseriesRange(BaseModel):
     start: AwareDatetime = Field(description="The start of the timeseries range.")
     end: AwareDatetime = Field(description="The end of the timeseries range.")
@@ -158,6 +177,27 @@ class MetricsScalarWithRange(MetricsScalar):
     range: DateRange = Field(..., description="The range for which the scalar metric was computed.")
 
 
+class WorkloadGpuUsage(BaseModel):
+    workload_id: UUID = Field(description="The ID of the workload.")
+    utilized_gpu_hours: float = Field(description="GPU-hours during which the workload's GPUs were active.")
+    utilized_vram_mb_hours: float = Field(description="VRAM used by the workload, in MB-hours.")
+
+
+class ProjectGpuUsage(BaseModel):
+    """
+    GPU usage of a project over a time range, summed from hourly rollups.
+    Only hours that have closed and been rolled up are included, hours are counted if they start within the range.
+    """
+
+    allocated_gpu_hours: float = Field(description="GPU-hours allocated to the project.")
+    utilized_gpu_hours: float = Field(description="GPU-hours during which the project's GPUs were active.")
+    idle_gpu_hours: float = Field(description="Allocated GPU-hours that were not utilized.")
+    allocated_vram_mb_hours: float = Field(description="VRAM allocated to the project, in MB-hours.")
+    utilized_vram_mb_hours: float = Field(description="VRAM used by the project, in MB-hours.")
+    workloads: list[WorkloadGpuUsage] = Field(description="Usage per workload, highest GPU-hours first.")
+    range: DateRange = Field(..., description="The range for which the usage was computed.")
+
+
 class DeviceMetricTimeseries(BaseModel):
     series_label: str = Field(description="Label identifying this metric series.")
     values: list[Datapoint] = Field(description="Timeseries datapoints.", default_factory=list)
@@ -19,14 +19,17 @@ from ..projects.models import Project as ProjectModel
 from ..projects.repository import get_projects
 from ..projects.schemas import ProjectResponse
 from ..quotas.repository import get_quotas
+from ..utilities.collections.queries import get_next_cursor
 from ..utilities.collections.schemas import FilterCondition, PaginationConditions, SortCondition
 from ..utilities.prometheus_instrumentation import ALLOCATED_GPU_VRAM_METRIC_LABEL, ALLOCATED_GPUS_METRIC_LABEL
+from ..utilities.schema import validate_from_attributes
 from ..workloads.repository import (
     get_average_pending_time_for_workloads_in_project_created_between,
     get_workload_counts_with_status_by_project_id,
     get_workloads_by_ids_in_cluster,
     get_workloads_in_cluster,
     get_workloads_with_running_time_in_project,
+    is_sorted_by_run_time,
 )
 from .config import PROMETHEUS_URL
 from .constants import (
@@ -56,6 +59,7 @@ from .constants import CLUSTER_NAME_METRIC_LABEL as CLUSTER_NAME
 from .constants import PROJECT_ID_METRIC_LABEL as PROJECT_ID
 from .constants import WORKLOAD_ID_METRIC_LABEL as WORKLOAD_ID
 from .enums import WorkloadDeviceMetricKind
+from .repository import get_project_gpu_usage_totals, get_workload_gpu_usage_totals
 from .schemas import (
     CurrentUtilization,
     Datapoint,
@@ -69,8 +73,10 @@ from .schemas import (
     NodeGpuDevicesResponse,
     NodeWorkloadsWithMetrics,
     NodeWorkloadWithMetrics,
+    ProjectGpuUsage,
     UtilizationByProject,
     WorkloadGpuDevice,
+    WorkloadGpuUsage,
     WorkloadsWithMetrics,
     WorkloadWithMetrics,
 )
@@ -589,16 +595,24 @@ async def get_workloads_metrics_by_project(
     )
     workload_metrics = []
     for workload, running_time in workloads_with_running_time:
-        workload_dict = {
-            **workload.__dict__,
-            "gpu_count": workload_gpu_counts.get(str(workload.id), 0),
-            "vram": workload_vram_usage.get(str(workload.id), 0),
-            "run_time": int(running_time),
-        }
-        workload_metrics.append(WorkloadWithMetrics.model_validate(workload_dict))
+        workload_metrics.append(
+            validate_from_attributes(
+                WorkloadWithMetrics,
+                workload,
+                gpu_count=workload_gpu_counts.get(str(workload.id), 0),
+                vram=workload_vram_usage.get(str(workload.id), 0),
+                run_time=int(running_time),
+            )
+        )
 
     return WorkloadsWithMetrics(
-        data=workload_metrics, total=count, page=pagination_params.page, page_size=pagination_params.page_size
+        data=workload_metrics,
+        total=count,
+        page=pagination_params.page,
+        page_size=pagination_params.page_size,
+        next_cursor=None
+        if is_sorted_by_run_time(sort_params)
+        else get_next_cursor(workload_metrics, sort_params, pagination_params),
     )
 
 
@@ -625,15 +639,21 @@ async def get_workloads_metrics_by_cluster(
     )
     workload_metrics = []
     for workload in workloads:
-        workload_dict = {
-            **workload.__dict__,
-            "gpu_count": workload_gpu_counts.get(str(workload.id), 0),
-            "vram": workload_vram_usage.get(str(workload.id), 0),
-        }
-        workload_metrics.append(WorkloadWithMetrics.model_validate(workload_dict))
+        workload_metrics.append(
+            validate_from_attributes(
+                WorkloadWithMetrics,
+                workload,
+                gpu_count=workload_gpu_counts.get(str(workload.id), 0),
+                vram=workload_vram_usage.get(str(workload.id), 0),
+            )
+        )
 
     return WorkloadsWithMetrics(
-        data=workload_metrics, total=count, page=pagination_params.page, page_size=pagination_params.page_size
+        data=workload_metrics,
+        total=count,
+        page=pagination_params.page,
+        page_size=pagination_params.page_size,
+        next_cursor=get_next_cursor(workload_metrics, sort_params, pagination_params),
     )
 
 
@@ -706,6 +726,45 @@ on() avg_over_time(
     )
 
 
+async def get_gpu_usage_for_project(
+    session: AsyncSession, start: datetime, end: datetime, project: ProjectModel
+) -> ProjectGpuUsage:
+    """
+    Returns the GPU usage of the given project within the specified date range, read from hourly rollups.
+    Unlike the Prometheus based metrics, the range is not limited to MAX_DAYS_FOR_TIMESERIES.
+    """
+    totals = await get_project_gpu_usage_totals(session, project.id, start, end)
+    workload_totals = await get_workload_gpu_usage_totals(session, project.id, start, end)
+    return ProjectGpuUsage(
+        allocated_gpu_hours=totals.allocated_gpu_hours,
+        utilized_gpu_hours=totals.utilized_gpu_hours,
+        idle_gpu_hours=max(totals.allocated_gpu_hours - totals.utilized_gpu_hours, 0),
+        allocated_vram_mb_hours=totals.allocated_vram_mb_hours,
+        utilized_vram_mb_hours=totals.utilized_vram_mb_hours,
+        workloads=[
+            WorkloadGpuUsage(
+                workload_id=row.workload_id,
+                utilized_gpu_hours=row.utilized_gpu_hours,
+                utilized_vram_mb_hours=row.utilized_vram_mb_hours,
+            )
+            for row in workload_totals
+        ],
+        range=DateRange(start=start, end=end),
+    )
+
+
+async def get_gpu_idle_time_for_project_from_rollups(
+    session: AsyncSession, start: datetime, end: datetime, project: ProjectModel
+) -> MetricsScalarWithRange:
+    """
+    Returns the GPU idle time in seconds for the given project within the specified date range, read from hourly
+    rollups. Matches get_avg_gpu_idle_time_for_project at a one hour step:
+    sum((allocated GPU-hours - utilized GPU-hours) * 3600 / allocated GPU-hours) over the hours of the range.
+    """
+    totals = await get_project_gpu_usage_totals(session, project.id, start, end)
+    return MetricsScalarWithRange(data=totals.idle_seconds, range=DateRange(start=start, end=end))
+
+
 async def _get_gpu_device_single_metric_for_workload(
     workload_id: UUID,
     prometheus_client: PrometheusConnect,
@@ -1170,12 +1229,14 @@ async def get_workloads_metrics_by_node(
     for workload in workloads:
         wid_str = str(workload.id)
         devices = gpu_devices_by_workload.get(wid_str, [])
-        workload_dict = {
-            **workload.__dict__,
-            "gpu_count": len(devices),
-            "vram": workload_vram_usage.get(wid_str, 0),
-            "gpu_devices": devices,
-        }
-        workload_metrics.append(NodeWorkloadWithMetrics.model_validate(workload_dict))
+        workload_metrics.append(
+            validate_from_attributes(
+                NodeWorkloadWithMetrics,
+                workload,
+                gpu_count=len(devices),
+                vram=workload_vram_usage.get(wid_str, 0),
+                gpu_devices=devices,
+            )
+        )
 
     return NodeWorkloadsWithMetrics(data=workload_metrics)
@@ -15,6 +15,7 @@ from ..metrics.service import (
     get_prometheus_client,
 )
 from ..utilities.database import get_session
+from ..utilities.fastapi import trusted_response
 from ..utilities.keycloak_admin import KeycloakAdmin, get_kc_admin
 from ..utilities.security import (
     ensure_platform_administrator,
@@ -53,6 +54,7 @@ async def get_current_user_organization(
     status_code=status.HTTP_200_OK,
     response_model=MetricsTimeseries,
 )
+@trusted_response
 async def get_gpu_memory_utilization_timeseries(
     _: None = Depends(ensure_platform_administrator),
     time_range: MetricsTimeRange = Depends(),
@@ -80,6 +82,7 @@ async def get_gpu_memory_utilization_timeseries(
     status_code=status.HTTP_200_OK,
     response_model=MetricsTimeseries,
 )
+@trusted_response
 async def get_gpu_device_utilization_timeseries(
     _: None = Depends(ensure_platform_administrator),
     time_range: MetricsTimeRange = Depends(),
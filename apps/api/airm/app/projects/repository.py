@@ -109,6 +109,11 @@ async def get_projects(session: AsyncSession) -> list[Project]:
     return result.scalars().all()
 
 
+async def get_project_ids(session: AsyncSession) -> list[UUID]:
+    result = await session.execute(select(Project.id))
+    return result.scalars().all()
+
+
 async def get_active_project_count_per_cluster(session: AsyncSession, cluster_id: UUID) -> int:
     result = await session.execute(
         select(func.count())
@@ -16,6 +16,8 @@ from ..metrics.schemas import (
     MetricsScalarWithRange,
     MetricsTimeRange,
     MetricsTimeseries,
+    ProjectGpuUsage,
+    UsageTimeRange,
     WorkloadsWithMetrics,
 )
 from ..metrics.service import (
@@ -28,12 +30,14 @@ from ..metrics.service import (
     get_gpu_device_utilization_timeseries_for_project as get_gpu_device_utilization_timeseries_for_project_from_ds,
 )
 from ..metrics.service import (
-    get_gpu_memory_utilization_timeseries_for_project as get_gpu_memory_utilization_timeseries_for_project_from_ds,
-)
-from ..metrics.service import (
+    get_gpu_idle_time_for_project_from_rollups,
+    get_gpu_usage_for_project,
     get_prometheus_client,
     get_workloads_metrics_by_project,
 )
+from ..metrics.service import (
+    get_gpu_memory_utilization_timeseries_for_project as get_gpu_memory_utilization_timeseries_for_project_from_ds,
+)
 from ..secrets.enums import SecretUseCase
 from ..secrets.models import OrganizationScopedSecret, ProjectScopedSecret
 from ..secrets.repository import (
@@ -70,6 +74,7 @@ from ..utilities.collections.schemas import (
 from ..utilities.database import get_session
 from ..utilities.enums import Roles
 from ..utilities.exceptions import NotFoundException, ValidationException
+from ..utilities.fastapi import trusted_response
 from ..utilities.keycloak_admin import (
     KeycloakAdmin,
     get_kc_admin,
@@ -365,6 +370,7 @@ async def get_project_workload_stats(
     status_code=status.HTTP_200_OK,
     response_model=MetricsTimeseries,
 )
+@trusted_response
 async def get_gpu_device_utilization_timeseries_for_project(
     _: None = Depends(ensure_user_can_view_project),
     project_id: UUID = Path(description="The ID of the project for which to return metrics"),
@@ -394,6 +400,7 @@ async def get_gpu_device_utilization_timeseries_for_project(
     status_code=status.HTTP_200_OK,
     response_model=MetricsTimeseries,
 )
+@trusted_response
 async def get_gpu_memory_utilization_timeseries_for_project(
     _: None = Depends(ensure_user_can_view_project),
     project_id: UUID = Path(description="The ID of the project for which to return metrics"),
@@ -426,6 +433,7 @@ async def get_gpu_memory_utilization_timeseries_for_project(
     status_code=status.HTTP_200_OK,
     response_model=WorkloadsWithMetrics,
 )
+@trusted_response
 async def get_project_workloads_metrics(
     _: None = Depends(ensure_user_can_view_project),
     session: AsyncSession = Depends(get_session),
@@ -508,6 +516,58 @@ async def get_avg_gpu_idle_time_for_project(
     )
 
 
+@router.get(
+    "/projects/{project_id}/metrics/gpu_usage",
+    operation_id="get_gpu_usage_for_project",
+    summary="Get project GPU usage",
+    description="""
+        Retrieve allocated, utilized and idle GPU-hours and VRAM usage for a project,
+        in total and per workload, over any past period. Read from hourly rollups, so
+        only whole hours that have already closed are included. Suited for chargeback.
+    """,
+    status_code=status.HTTP_200_OK,
+    response_model=ProjectGpuUsage,
+)
+async def get_gpu_usage_for_project_endpoint(
+    _: None = Depends(ensure_user_can_view_project),
+    project_id: UUID = Path(description="The ID of the project for which to return GPU usage"),
+    time_range: UsageTimeRange = Depends(),
+    session: AsyncSession = Depends(get_session),
+) -> ProjectGpuUsage:
+    project = await get_project_by_id(session, project_id)
+    if not project:
+        raise NotFoundException("Project not found")
+
+    return await get_gpu_usage_for_project(session, start=time_range.start, end=time_range.end, project=project)
+
+
+@router.get(
+    "/projects/{project_id}/metrics/gpu_idle_time",
+    operation_id="get_gpu_idle_time_for_project",
+    summary="Get project GPU idle time over any period",
+    description="""
+        Calculate GPU idle time for a project over any past period, from hourly
+        rollups. Same measure as the average GPU idle time at a one hour resolution,
+        without the lookback limit of the live metrics.
+    """,
+    status_code=status.HTTP_200_OK,
+    response_model=MetricsScalarWithRange,
+)
+async def get_gpu_idle_time_for_project(
+    _: None = Depends(ensure_user_can_view_project),
+    project_id: UUID = Path(description="The ID of the project for which to return GPU idle time"),
+    time_range: UsageTimeRange = Depends(),
+    session: AsyncSession = Depends(get_session),
+) -> MetricsScalarWithRange:
+    project = await get_project_by_id(session, project_id)
+    if not project:
+        raise NotFoundException("Project not found")
+
+    return await get_gpu_idle_time_for_project_from_rollups(
+        session, start=time_range.start, end=time_range.end, project=project
+    )
+
+
 @router.get(
     "/projects/{project_id}/secrets",
     operation_id="get_project_secrets",
@@ -5,7 +5,6 @@
 from datetime import UTC, datetime
 from uuid import UUID
 
-import yaml
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -25,6 +24,7 @@ from ..projects.repository import get_project_by_id
 from ..storages.repository import get_project_storages_by_project_ids_secret, get_project_storages_by_project_secret
 from ..storages.service import update_project_storage_secret_status
 from ..utilities.exceptions import ConflictException, NotFoundException, ValidationException
+from ..utilities.yaml_codec import dump
 from .enums import SecretStatus, SecretUseCase
 from .models import OrganizationScopedSecret, OrganizationSecretAssignment, ProjectScopedSecret
 from .models import Secret as SecretModel
@@ -360,7 +360,7 @@ async def create_organization_scoped_secret(
 
     sanitized_model = sanitize_external_secret_manifest(manifest_model)
 
-    secret_in.manifest = yaml.safe_dump(sanitized_model.model_dump(by_alias=True, exclude_none=True), sort_keys=False)
+    secret_in.manifest = dump(sanitized_model.model_dump(by_alias=True, exclude_none=True), sort_keys=False)
 
     status = SecretStatus.PENDING if secret_in.project_ids else SecretStatus.UNASSIGNED
     org_secret = await create_organization_scoped_secret_in_db(session, secret_in, status, user_email)
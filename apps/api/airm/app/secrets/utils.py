@@ -4,8 +4,6 @@
 
 from uuid import UUID
 
-import yaml
-
 from ..messaging.schemas import (
     ExternalSecretManifest,
     KubernetesSecretManifest,
@@ -26,6 +24,7 @@ from ..secrets.constants import (
     PROJECT_SECRET_USE_CASE_LABEL,
 )
 from ..utilities.exceptions import ValidationException
+from ..utilities.yaml_codec import YAMLError, load_all
 from .enums import SecretStatus
 from .models import OrganizationScopedSecret, OrganizationSecretAssignment, ProjectScopedSecret
 from .schemas import (
@@ -341,8 +340,8 @@ def build_project_secret_response(secrets: list, project: Project) -> ProjectSec
 def _load_single_manifest(manifest_yaml: str) -> dict:
     """Load and parse a single YAML manifest."""
     try:
-        manifests = list(yaml.safe_load_all(manifest_yaml))
-    except yaml.YAMLError as e:
+        manifests = load_all(manifest_yaml)
+    except YAMLError as e:
         raise ValidationException(f"Failed to load YAML: {e}")
 
     if len(manifests) != 1:
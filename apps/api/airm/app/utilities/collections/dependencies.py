@@ -13,11 +13,13 @@ from .schemas import FilterCondition, PaginationConditions, SortCondition
 def get_pagination_query_params(
     page: int = 1,
     page_size: int = 10,
+    cursor: str | None = None,
 ) -> PaginationConditions:
     """
     Dependency function to parse collection pagination query parameters with default pagination.
+    When a cursor (the `next_cursor` of a previous page) is given, keyset pagination is used instead of page.
     """
-    return PaginationConditions(page=page, page_size=page_size)
+    return PaginationConditions(page=page, page_size=page_size, cursor=cursor)
 
 
 def get_sort_query_params(
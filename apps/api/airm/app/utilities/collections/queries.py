@@ -2,13 +2,36 @@
 #
 # SPDX-License-Identifier: MIT
 
+import base64
+import binascii
+import enum
+import json
+import time
 import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
 
-from sqlalchemy import Select, asc, desc, func, or_, select
+from sqlalchemy import ColumnElement, Select, and_, asc, desc, false, func, or_, select, tuple_
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..config import COLLECTION_COUNT_CACHE_MAX_ENTRIES, COLLECTION_COUNT_CACHE_TTL_SECONDS
 from .schemas import FilterCondition, FilterOperator, PaginationConditions, SortCondition, SortDirection
 
+# Cached totals keyed by the compiled count statement and its bound parameters: key -> (expires_at, count)
+_count_cache: dict[str, tuple[float, int]] = {}
+
+
+@dataclass(frozen=True)
+class KeysetColumn:
+    """A column participating in keyset (cursor) pagination, in ORDER BY position."""
+
+    name: str
+    column: Any
+    direction: SortDirection
+
 
 def get_count_query[T](query: Select[T]) -> Select[int]:
     """
@@ -161,3 +184,240 @@ def apply_pagination_to_query[T](query: Select[T], pagination: PaginationConditi
     if pagination and pagination.page_size and pagination.page:
         paginated_query = query.limit(pagination.page_size).offset((pagination.page - 1) * pagination.page_size)
     return paginated_query
+
+
+def get_keyset_field_names(sort: list[SortCondition], tiebreaker: str = "id") -> list[str]:
+    """
+    Returns the names of the fields a keyset-paginated collection is ordered by: the requested sort fields,
+    followed by the unique tiebreaker field (unless already sorted on) so that the order is total.
+    """
+    field_names: list[str] = []
+    for spec in sort or []:
+        field_name = getattr(spec, "field", None)
+        if isinstance(field_name, str) and field_name not in field_names:
+            field_names.append(field_name)
+    if tiebreaker not in field_names:
+        field_names.append(tiebreaker)
+    return field_names
+
+
+def resolve_keyset_columns[T](
+    sort: list[SortCondition],
+    model: list[type[T]],
+    tiebreaker: str = "id",
+    custom_columns: dict | None = None,
+) -> list[KeysetColumn]:
+    """
+    Resolves the ordered list of columns used for keyset pagination.
+
+    Args:
+        sort (List[SortCondition]): The requested sorting conditions.
+        model (List[Type[T]]): The SQLAlchemy model classes used to resolve column attributes.
+        tiebreaker (str): Name of a unique, non-nullable column on the first model. Defaults to "id".
+        custom_columns (dict | None): Optional mapping of field names to column expressions. Unlike sorting,
+            these must be real SQL expressions (not label references) since they are used in the WHERE clause.
+
+    Returns:
+        List[KeysetColumn]: The keyset columns in ORDER BY position.
+
+    Notes:
+        - Fields that cannot be resolved are ignored, matching apply_sorting_to_query.
+        - Nullable columns are matched with explicit NULL conditions following the PostgreSQL default order
+          (NULLS LAST ascending, NULLS FIRST descending), which a composite index cannot serve as well.
+    """
+
+    directions = {
+        spec.field: SortDirection(getattr(spec, "direction", SortDirection.asc))
+        for spec in reversed(sort or [])
+        if isinstance(getattr(spec, "field", None), str)
+    }
+
+    keyset_columns: list[KeysetColumn] = []
+    for field_name in get_keyset_field_names(sort, tiebreaker):
+        column = None
+        if custom_columns and field_name in custom_columns:
+            column = custom_columns[field_name]
+        else:
+            for m in model:
+                column = getattr(m, field_name, None)
+                if column is not None:
+                    break
+
+        if column is not None:
+            keyset_columns.append(KeysetColumn(field_name, column, directions.get(field_name, SortDirection.asc)))
+
+    return keyset_columns
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    """
+    Encodes the keyset values of the last row of a page into an opaque, URL-safe cursor.
+    """
+    payload = json.dumps(values, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """
+    Decodes a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    if not isinstance(values, dict):
+        raise ValueError("Invalid pagination cursor")
+    return values
+
+
+def _coerce_cursor_value(column: Any, value: Any) -> Any:
+    """Converts a JSON-decoded cursor value back to the python type expected by the column."""
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+    try:
+        if issubclass(python_type, datetime):
+            return datetime.fromisoformat(value)
+        if issubclass(python_type, uuid.UUID):
+            return uuid.UUID(value)
+        if issubclass(python_type, enum.Enum):
+            return python_type(value)
+        if python_type in (int, float):
+            return python_type(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    return value
+
+
+def _is_nullable(column: Any) -> bool:
+    """Whether a keyset column may hold NULL. Expressions of unknown nullability are assumed to."""
+    return getattr(getattr(column, "expression", column), "nullable", True)
+
+
+def _keyset_seek(keyset_column: KeysetColumn, value: Any, nullable: bool) -> ColumnElement[bool]:
+    """Matches rows after the value in the column order. PostgreSQL sorts NULLs last ascending and first descending."""
+    column = keyset_column.column
+    if keyset_column.direction == SortDirection.asc:
+        if value is None:
+            return false()
+        return or_(column > value, column.is_(None)) if nullable else column > value
+    if value is None:
+        return column.is_not(None)
+    return column < value
+
+
+def _keyset_equal(keyset_column: KeysetColumn, value: Any) -> ColumnElement[bool]:
+    return keyset_column.column.is_(None) if value is None else keyset_column.column == value
+
+
+def _build_keyset_predicate(keyset_columns: list[KeysetColumn], values: list[Any]) -> ColumnElement[bool]:
+    """Builds the WHERE clause selecting rows strictly after the cursor position."""
+    nullable = [_is_nullable(k.column) for k in keyset_columns]
+    directions = {k.direction for k in keyset_columns}
+    if len(directions) == 1 and not any(nullable):
+        # A row-value comparison can be satisfied directly by a matching composite btree index
+        lhs = tuple_(*[k.column for k in keyset_columns])
+        rhs = tuple_(*values)
+        return lhs > rhs if directions == {SortDirection.asc} else lhs < rhs
+
+    # Mixed directions or nullable columns, which a row-value comparison skips:
+    # (c1 after v1) OR (c1 = v1 AND c2 after v2) OR ...
+    conditions = []
+    for i, keyset_column in enumerate(keyset_columns):
+        equal_prefix = [_keyset_equal(k, v) for k, v in zip(keyset_columns[:i], values[:i])]
+        conditions.append(and_(*equal_prefix, _keyset_seek(keyset_column, values[i], nullable[i])))
+    return or_(*conditions)
+
+
+def apply_keyset_pagination_to_query[T](
+    query: Select[T], keyset_columns: list[KeysetColumn], pagination: PaginationConditions
+) -> Select[T]:
+    """
+    Applies ordering and cursor-based (keyset) pagination to a SQLAlchemy Select query.
+
+    Instead of skipping `(page - 1) * page_size` rows with OFFSET, the query seeks directly past the last row
+    of the previous page, so the cost of fetching a page does not grow with its depth.
+
+    Args:
+        query (Select[T]): The filtered SQLAlchemy Select query, without ordering applied.
+        keyset_columns (List[KeysetColumn]): The columns to order and seek by, from resolve_keyset_columns.
+        pagination (PaginationConditions): Pagination parameters; `cursor` is the value returned as
+            `next_cursor` by the previous page, or None for the first page.
+
+    Returns:
+        Select[T]: The ordered query, restricted to rows after the cursor and limited to the page size.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the requested sort order.
+    """
+
+    paginated_query = query.order_by(
+        *[asc(k.column) if k.direction == SortDirection.asc else desc(k.column) for k in keyset_columns]
+    )
+
+    cursor = getattr(pagination, "cursor", None)
+    if cursor:
+        cursor_values = decode_cursor(cursor)
+        if any(k.name not in cursor_values for k in keyset_columns):
+            raise ValueError("Pagination cursor does not match the requested sort order")
+        values = [_coerce_cursor_value(k.column, cursor_values[k.name]) for k in keyset_columns]
+        paginated_query = paginated_query.where(_build_keyset_predicate(keyset_columns, values))
+
+    if pagination and pagination.page_size:
+        paginated_query = paginated_query.limit(pagination.page_size)
+    return paginated_query
+
+
+def get_next_cursor(
+    items: Sequence[Any],
+    sort: list[SortCondition],
+    pagination: PaginationConditions,
+    tiebreaker: str = "id",
+    get_value: Callable[[Any, str], Any] = lambda item, name: getattr(item, name, None),
+) -> str | None:
+    """
+    Returns the cursor pointing after the last item of a page, or None if the page was not full.
+
+    Args:
+        items (Sequence[Any]): The items of the current page, in sort order.
+        sort (List[SortCondition]): The sorting conditions the page was fetched with.
+        pagination (PaginationConditions): The pagination parameters the page was fetched with.
+        tiebreaker (str): The tiebreaker field passed to resolve_keyset_columns. Defaults to "id".
+        get_value (Callable[[Any, str], Any]): Returns the value of a field for an item.
+    """
+    if not items or not pagination or not pagination.page_size or len(items) < pagination.page_size:
+        return None
+    last_item = items[-1]
+    return encode_cursor({name: get_value(last_item, name) for name in get_keyset_field_names(sort, tiebreaker)})
+
+
+async def get_cached_count[T](session: AsyncSession, count_query: Select[T]) -> int:
+    """
+    Executes a count query, reusing a recent result for the same statement and parameters.
+
+    Counting every row matching a filter requires visiting all of them, which dominates the cost of fetching
+    deep pages. Totals are only used for display, so they are cached for COLLECTION_COUNT_CACHE_TTL_SECONDS.
+    """
+    compiled = count_query.compile()
+    key = f"{compiled}|{sorted(compiled.params.items(), key=lambda item: item[0])!r}"
+
+    now = time.monotonic()
+    cached = _count_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    count = (await session.execute(count_query)).scalar_one()
+
+    if len(_count_cache) >= COLLECTION_COUNT_CACHE_MAX_ENTRIES:
+        for expired_key in [k for k, (expires_at, _) in _count_cache.items() if expires_at <= now]:
+            del _count_cache[expired_key]
+        if len(_count_cache) >= COLLECTION_COUNT_CACHE_MAX_ENTRIES:
+            _count_cache.pop(next(iter(_count_cache)))
+    _count_cache[key] = (now + COLLECTION_COUNT_CACHE_TTL_SECONDS, count)
+    return count
@@ -10,6 +10,7 @@ from pydantic import BaseModel
 class PaginationConditions(BaseModel):
     page: int | None = 1
     page_size: int | None = 10
+    cursor: str | None = None  # when set, keyset pagination is used and page is ignored
 
 
 class SortDirection(StrEnum):
@@ -52,3 +53,4 @@ class BasePaginationList(BaseModel):
     page: int | None = None
     page_size: int | None = None
     total: int
+    next_cursor: str | None = None  # opaque cursor for fetching the page after this one, if any
@@ -9,3 +9,7 @@ POST_REGISTRATION_REDIRECT_URL = os.getenv("POST_REGISTRATION_REDIRECT_URL", "")
 KEYCLOAK_INTERNAL_URL = os.getenv("KEYCLOAK_INTERNAL_URL", "http://localhost:8080")
 KEYCLOAK_PUBLIC_URL = os.getenv("KEYCLOAK_PUBLIC_URL", "http://localhost:8080")
 KEYCLOAK_REALM = os.getenv("KEYCLOAK_REALM", "airm")
+
+# Total counts for cursor-paginated collections are cached for this long to avoid recounting on every page
+COLLECTION_COUNT_CACHE_TTL_SECONDS = float(os.getenv("COLLECTION_COUNT_CACHE_TTL_SECONDS", "30"))
+COLLECTION_COUNT_CACHE_MAX_ENTRIES = int(os.getenv("COLLECTION_COUNT_CACHE_MAX_ENTRIES", "1024"))
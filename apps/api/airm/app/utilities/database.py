@@ -12,6 +12,8 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from app.messaging.sender import MessageSender, get_message_sender
 
+from .request_timing import instrument_engine
+
 engine: AsyncEngine | None = None
 session_maker: AsyncSession | None = None
 
@@ -95,6 +97,7 @@ def create_engine(
         database_connection_string or DATABASE_CONNECTION_STRING,
         **engine_kwargs,
     )
+    instrument_engine(engine)
     session_maker = async_sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
     return engine, session_maker
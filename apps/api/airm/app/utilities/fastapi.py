@@ -8,11 +8,16 @@ FastAPI-specific utilities and exception handlers.
 This module contains exception handlers and other utilities for the FastAPI framework.
 """
 
+from collections.abc import Awaitable, Callable
+from functools import wraps
 from http import HTTPStatus
+from typing import Any
 
+import pydantic_core
 from fastapi import Request
 from fastapi.responses import JSONResponse
 from loguru import logger
+from pydantic import BaseModel
 from sqlalchemy.exc import IntegrityError
 
 from .exceptions import (
@@ -30,6 +35,35 @@ from .exceptions import (
 )
 
 
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by pydantic-core.
+
+    Pydantic models, including their computed fields, are serialized straight to JSON bytes without being
+    converted to dicts first. Endpoints with large payloads built from trusted data return their schema
+    wrapped in this response, which also skips FastAPI's re-validation against the route's response_model.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content, inf_nan_mode="null")
+
+
+def trusted_response[**P](endpoint: Callable[P, Awaitable[BaseModel]]) -> Callable[P, Awaitable[PydanticJSONResponse]]:
+    """
+    Wraps an endpoint so that the schema it returns is sent as a PydanticJSONResponse.
+
+    FastAPI does not validate Response objects against the route's response_model, so only use this for
+    endpoints whose schemas the service layer builds from trusted data. The route still declares
+    response_model for the OpenAPI schema.
+    """
+
+    @wraps(endpoint)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> PydanticJSONResponse:
+        return PydanticJSONResponse(await endpoint(*args, **kwargs))
+
+    return wrapper
+
+
 def not_found_exception_handler(request: Request, exc: NotFoundException) -> JSONResponse:
     """
     Handler for NotFoundException.
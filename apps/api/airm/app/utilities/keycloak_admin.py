@@ -11,6 +11,7 @@ from starlette.datastructures import State
 
 from .config import KEYCLOAK_INTERNAL_URL, KEYCLOAK_PUBLIC_URL, KEYCLOAK_REALM
 from .exceptions import ExternalServiceError
+from .request_timing import instrument_httpx_client
 
 KEYCLOAK_ADMIN_CLIENT_ID = os.environ.get("KEYCLOAK_ADMIN_CLIENT_ID")
 KEYCLOAK_ADMIN_CLIENT_SECRET = os.environ.get("KEYCLOAK_ADMIN_CLIENT_SECRET")
@@ -24,6 +25,7 @@ async def init_keycloak_admin_client() -> KeycloakAdmin:
         server_url=KEYCLOAK_INTERNAL_URL,
         realm_name=KEYCLOAK_REALM,
     )
+    instrument_httpx_client(client.connection.async_s, "keycloak")
     # Asynchronously get server info to ensure the client is operational
     server_info = await client.a_get_server_info()
     logger.info(
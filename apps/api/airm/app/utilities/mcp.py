@@ -0,0 +1,43 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+MCP (Model Context Protocol) server for the API.
+
+FastApiMCP converts the OpenAPI schema of every route into MCP tools when it is created. For this API that is a
+noticeable part of the import time, which every pod pays on startup even though MCP clients are rare.
+"""
+
+import time
+
+from fastapi_mcp import FastApiMCP
+from loguru import logger
+from mcp.server.lowlevel.server import Server
+
+
+class LazyFastApiMCP(FastApiMCP):
+    """
+    FastApiMCP that builds its MCP server and tools on first use rather than when it is created.
+
+    The SSE endpoints registered by mount() only read the server while handling a request, so the tools are generated
+    on the first MCP request. Calling setup_server() again discards them, and the next request regenerates them from
+    the routes of the app at that time.
+    """
+
+    _server: Server | None = None
+
+    def setup_server(self) -> None:
+        self._server = None
+
+    @property
+    def server(self) -> Server:
+        if self._server is None:
+            start = time.perf_counter()
+            super().setup_server()
+            logger.info(f"Generated {len(self.tools)} MCP tools in {time.perf_counter() - start:.2f}s")
+        return self._server
+
+    @server.setter
+    def server(self, server: Server) -> None:
+        self._server = server
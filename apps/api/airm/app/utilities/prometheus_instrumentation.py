@@ -15,6 +15,7 @@ from ..clusters.repository import get_cluster_nodes
 from ..projects.repository import get_projects
 from ..quotas.utils import set_allocated_gpus_metric_samples, set_allocated_vram_metric_samples
 from .database import session_scope
+from .request_timing import RequestTimingMiddleware
 
 _asyncio_event_loop: asyncio.AbstractEventLoop | None = None
 METRICS_PORT = os.environ.get("PROMETHEUS_METRICS_PORT", "9009")
@@ -67,3 +68,5 @@ def start_metrics_server():
 def setup_instrumentation(app):
     instrumentator = Instrumentator().instrument(app)
     instrumentator.registry.register(GPUQuotaMetricsCollector())
+    # Break request durations down into database queries and external calls, see request_timing
+    app.add_middleware(RequestTimingMiddleware)
@@ -0,0 +1,221 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Per-request timing of database queries and calls to external services.
+
+RequestTimingMiddleware starts a RequestTimings collector for every HTTP request. Database queries are
+recorded by the SQLAlchemy engine events installed by instrument_engine, HTTP clients by instrument_httpx_client,
+and any other call by wrapping it in `with timed(<dependency>)`. When the response starts, the collected timings are:
+
+- sent back in a `Server-Timing` header, so browser dev tools show where the time of a request went;
+- observed in per-route Prometheus histograms of call counts and durations per dependency;
+- logged for a sample of slow requests, and of requests that run many queries (N+1 patterns), together with
+  the slowest statement.
+"""
+
+import os
+import random
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from loguru import logger
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+DB = "db"
+
+SLOW_REQUEST_SECONDS = float(os.environ.get("SLOW_REQUEST_SECONDS", "1.0"))
+SLOW_REQUEST_QUERY_COUNT = int(os.environ.get("SLOW_REQUEST_QUERY_COUNT", "50"))
+SLOW_REQUEST_LOG_SAMPLE_RATE = float(os.environ.get("SLOW_REQUEST_LOG_SAMPLE_RATE", "0.1"))
+
+REQUEST_DEPENDENCY_CALLS = Histogram(
+    "http_request_dependency_calls",
+    "Number of database queries or external calls made by one HTTP request",
+    labelnames=["method", "handler", "dependency"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250, 500),
+)
+REQUEST_DEPENDENCY_DURATION = Histogram(
+    "http_request_dependency_duration_seconds",
+    "Total time one HTTP request spent in database queries or external calls",
+    labelnames=["method", "handler", "dependency"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+
+@dataclass
+class DependencyTiming:
+    """Calls a request made to one dependency."""
+
+    count: int = 0
+    seconds: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest: str | None = None
+
+
+@dataclass
+class RequestTimings:
+    """Timings of the database queries and external calls of one request."""
+
+    dependencies: dict[str, DependencyTiming] = field(default_factory=dict)
+
+    def record(self, dependency: str, seconds: float, detail: str | None = None) -> None:
+        timing = self.dependencies.setdefault(dependency, DependencyTiming())
+        timing.count += 1
+        timing.seconds += seconds
+        if seconds >= timing.slowest_seconds:
+            timing.slowest_seconds = seconds
+            timing.slowest = detail
+
+    def server_timing(self, total_seconds: float) -> str:
+        """Format the timings as a Server-Timing header value, with durations in milliseconds."""
+        metrics = [
+            f'{name};dur={timing.seconds * 1000:.1f};desc="{timing.count} call{"" if timing.count == 1 else "s"}"'
+            for name, timing in self.dependencies.items()
+        ]
+        metrics.append(f"total;dur={total_seconds * 1000:.1f}")
+        return ", ".join(metrics)
+
+
+_request_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def get_request_timings() -> RequestTimings | None:
+    """Return the timings of the current request, or None outside of a request."""
+    return _request_timings.get()
+
+
+def record_timing(dependency: str, seconds: float, detail: str | None = None) -> None:
+    """Record a call to a dependency in the current request, if any."""
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.record(dependency, seconds, detail)
+
+
+@contextmanager
+def collect_timings() -> Iterator[RequestTimings]:
+    """Collect the timings of the calls made inside the block, e.g. while processing a queue message."""
+    timings = RequestTimings()
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _request_timings.reset(token)
+
+
+@contextmanager
+def timed(dependency: str, detail: str | None = None) -> Iterator[None]:
+    """Record the duration of the wrapped call to a dependency in the current request.
+
+    Usable around awaits too: `with timed("prometheus"): await query(...)`.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(dependency, time.perf_counter() - start, detail)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Record every statement executed by the engine in the timings of the current request."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        conn.info.setdefault("request_timing_starts", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        starts = conn.info.get("request_timing_starts")
+        if starts:
+            record_timing(DB, time.perf_counter() - starts.pop(), statement)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _handle_error(context: Any) -> None:
+        # The statement failed, so after_cursor_execute does not run for it
+        starts = context.connection.info.get("request_timing_starts") if context.connection else None
+        if starts:
+            record_timing(DB, time.perf_counter() - starts.pop(), context.statement)
+
+
+def instrument_httpx_client(client: httpx.AsyncClient, dependency: str) -> None:
+    """Record every request sent by the client in the timings of the current request."""
+
+    async def _on_request(request: httpx.Request) -> None:
+        request.extensions["request_timing_start"] = time.perf_counter()
+
+    async def _on_response(response: httpx.Response) -> None:
+        start = response.request.extensions.get("request_timing_start")
+        if start is not None:
+            record_timing(
+                dependency, time.perf_counter() - start, f"{response.request.method} {response.request.url.path}"
+            )
+
+    hooks = client.event_hooks
+    client.event_hooks = {
+        "request": [*hooks.get("request", []), _on_request],
+        "response": [*hooks.get("response", []), _on_response],
+    }
+
+
+class RequestTimingMiddleware:
+    """ASGI middleware collecting the timings of each HTTP request."""
+
+    def __init__(self, app: ASGIApp, sample: Callable[[], float] = random.random) -> None:
+        self.app = app
+        self.sample = sample
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timings(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append(
+                    "Server-Timing", timings.server_timing(time.perf_counter() - start)
+                )
+            await send(message)
+
+        with collect_timings() as timings:
+            try:
+                await self.app(scope, receive, send_with_timings)
+            finally:
+                self._report(scope, timings, time.perf_counter() - start, status_code)
+
+    def _report(self, scope: Scope, timings: RequestTimings, total_seconds: float, status_code: int) -> None:
+        # The router stores the matched route in the scope; unmatched paths share one label to bound cardinality
+        route = scope.get("route")
+        handler = getattr(route, "path", "none")
+        method = scope["method"]
+        for dependency, timing in timings.dependencies.items():
+            REQUEST_DEPENDENCY_CALLS.labels(method, handler, dependency).observe(timing.count)
+            REQUEST_DEPENDENCY_DURATION.labels(method, handler, dependency).observe(timing.seconds)
+
+        queries = timings.dependencies.get(DB, DependencyTiming()).count
+        if total_seconds < SLOW_REQUEST_SECONDS and queries < SLOW_REQUEST_QUERY_COUNT:
+            return
+        if self.sample() >= SLOW_REQUEST_LOG_SAMPLE_RATE:
+            return
+        details = "; ".join(
+            f"{name}: {timing.count} calls in {timing.seconds:.3f}s, slowest {timing.slowest_seconds:.3f}s"
+            + (f" ({timing.slowest[:200]})" if timing.slowest else "")
+            for name, timing in timings.dependencies.items()
+        )
+        logger.warning(
+            f"Slow request {method} {handler} ({status_code}) took {total_seconds:.3f}s"
+            + (f" - {details}" if details else "")
+        )
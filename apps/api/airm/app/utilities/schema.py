@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
+from typing import Any
 from uuid import UUID
 
 from pydantic import AwareDatetime, BaseModel
@@ -21,3 +22,14 @@ class DeleteOverlaysBatchRequest(BaseModel):
     """Request to delete multiple entities by ID."""
 
     ids: list[UUID]
+
+
+def validate_from_attributes[ModelT: BaseModel](model: type[ModelT], obj: Any, **values: Any) -> ModelT:
+    """
+    Builds a schema from the attributes of an object, such as an ORM entity, and additional field values.
+
+    The schema is validated in a single pass, without creating an intermediate schema and dumping it to a dict.
+    Values take precedence over the attributes of obj.
+    """
+    attributes = {name: getattr(obj, name) for name in model.model_fields if name not in values and hasattr(obj, name)}
+    return model.model_validate({**attributes, **values})
@@ -0,0 +1,100 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+YAML parsing and dumping of manifests and values files.
+
+PyYAML parses and dumps in pure Python unless it is asked for the loaders and dumpers of its libyaml bindings, which
+are several times faster. This module uses them whenever PyYAML is built with libyaml and falls back to the pure
+Python ones otherwise; both produce the same documents.
+
+- load_async and load_all_async parse content larger than YAML_OFF_LOOP_THRESHOLD_BYTES in a worker thread, so a
+  large manifest does not block the event loop;
+- load_all_cached shares the documents parsed from identical content between callers that only read them, such as
+  schemas that derive fields from the stored manifest of every listed workload.
+
+Parse errors are raised as YAMLError, the base class of all PyYAML errors.
+"""
+
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Any
+
+import yaml
+
+YAMLError = yaml.YAMLError
+
+SafeLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper: type[yaml.SafeDumper] = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+OFF_LOOP_THRESHOLD_BYTES = int(os.environ.get("YAML_OFF_LOOP_THRESHOLD_BYTES", str(64 * 1024)))
+CACHE_SIZE = int(os.environ.get("YAML_CACHE_SIZE", "512"))
+
+_cache: OrderedDict[bytes, tuple[Any, ...]] = OrderedDict()
+_cache_lock = Lock()
+
+
+def load(content: str | bytes) -> Any:
+    """Parse a single YAML document."""
+    return yaml.load(content, Loader=SafeLoader)
+
+
+def load_all(content: str | bytes) -> list[Any]:
+    """Parse all documents of a YAML stream, such as a multi-document manifest."""
+    return list(yaml.load_all(content, Loader=SafeLoader))
+
+
+def dump(data: Any, **options: Any) -> str:
+    """Dump a document with plain Python types to YAML. Options are passed to yaml.dump."""
+    return yaml.dump(data, Dumper=SafeDumper, **options)
+
+
+def dump_all(documents: list[Any], **options: Any) -> str:
+    """Dump documents with plain Python types to a multi-document YAML stream. Options are passed to yaml.dump_all."""
+    return yaml.dump_all(documents, Dumper=SafeDumper, **options)
+
+
+async def load_async(content: str | bytes) -> Any:
+    """Parse a single YAML document, in a worker thread if the content is large."""
+    if len(content) < OFF_LOOP_THRESHOLD_BYTES:
+        return load(content)
+    return await asyncio.to_thread(load, content)
+
+
+async def load_all_async(content: str | bytes) -> list[Any]:
+    """Parse all documents of a YAML stream, in a worker thread if the content is large."""
+    if len(content) < OFF_LOOP_THRESHOLD_BYTES:
+        return load_all(content)
+    return await asyncio.to_thread(load_all, content)
+
+
+def load_all_cached(content: str) -> tuple[Any, ...]:
+    """
+    Parse all documents of a YAML stream, reusing the documents of an earlier call with identical content.
+
+    The documents are shared with every other caller that passes the same content, so they must not be modified.
+    The CACHE_SIZE most recently used results are kept, keyed by the SHA-256 of the content.
+    """
+    key = hashlib.sha256(content.encode()).digest()
+    with _cache_lock:
+        documents = _cache.get(key)
+        if documents is not None:
+            _cache.move_to_end(key)
+            return documents
+
+    documents = tuple(load_all(content))
+    with _cache_lock:
+        _cache[key] = documents
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return documents
+
+
+def clear_cache() -> None:
+    """Drop the documents kept by load_all_cached."""
+    with _cache_lock:
+        _cache.clear()
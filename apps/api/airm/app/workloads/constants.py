@@ -27,6 +27,13 @@ PROJECT_ID_LABEL = "airm.silogen.ai/project-id"
 KUEUE_MANAGED_LABEL = "kueue-managed"
 KUEUE_QUEUE_NAME_LABEL = "kueue.x-k8s.io/queue-name"
 
+MAX_MANIFEST_SIZE = 2 * 1024 * 1024
+MAX_WORKLOADS_PER_BATCH = 500
+# Total size of the manifests of a batch, so that a full batch of the largest manifests is rejected
+MAX_BATCH_MANIFESTS_SIZE = 16 * 1024 * 1024
+# Alphanumeric characters, spaces and some special characters
+DISPLAY_NAME_PATTERN = r"^[a-zA-Z0-9 _\-\.,:\(\)\[\]\+@#]+$"
+
 WORKLOAD_STATS_STATUSES = [
     WorkloadStatus.COMPLETE,
     WorkloadStatus.FAILED,
@@ -39,12 +39,12 @@ class Workload(BaseEntity):
     __table_args__ = (
         Index("ix_workloads_project_id_status", project_id, status),
         Index("ix_workloads_cluster_id_status_project_id", cluster_id, status, project_id),
-        Index("ix_workloads_project_id_created_at", project_id, "created_at"),
+        Index("ix_workloads_project_id_created_at", project_id, "created_at", "id"),
         Index("ix_workloads_project_id_type", project_id, type),
         Index("ix_workloads_project_id_display_name", project_id, display_name),
         Index("ix_workloads_cluster_id_type", cluster_id, type),
         Index("ix_workloads_cluster_id_display_name", cluster_id, display_name),
-        Index("ix_workloads_cluster_id_created_at", cluster_id, "created_at"),
+        Index("ix_workloads_cluster_id_created_at", cluster_id, "created_at", "id"),
     )
 
 
@@ -5,7 +5,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, select, text
+from sqlalchemy import Select, func, select, text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import case
@@ -14,17 +14,21 @@ from ..clusters.models import Cluster
 from ..messaging.schemas import CommonComponentStatus, WorkloadComponentStatus, WorkloadStatus
 from ..projects.models import Project
 from ..utilities.collections.queries import (
+    KeysetColumn,
     apply_filter_to_query,
+    apply_keyset_pagination_to_query,
     apply_pagination_to_query,
     apply_sorting_to_query,
+    get_cached_count,
     get_count_query,
+    resolve_keyset_columns,
 )
 from ..utilities.collections.schemas import FilterCondition, PaginationConditions, SortCondition
-from ..utilities.exceptions import ConflictException
+from ..utilities.exceptions import ConflictException, ValidationException
 from ..utilities.models import set_updated_fields
 from .enums import WorkloadType
 from .models import Workload, WorkloadComponent, WorkloadTimeSummary
-from .schemas import WorkloadComponentIn
+from .schemas import WorkloadComponentIn, WorkloadSubmission
 
 
 async def create_workload(
@@ -52,6 +56,31 @@ async def create_workload(
     return workload
 
 
+async def create_workloads(
+    session: AsyncSession,
+    cluster_id: UUID,
+    project_id: UUID,
+    status: str,
+    creator: str,
+    submissions: list[WorkloadSubmission],
+) -> list[Workload]:
+    workloads = [
+        Workload(
+            cluster_id=cluster_id,
+            project_id=project_id,
+            status=status,
+            created_by=creator,
+            updated_by=creator,
+            type=submission.workload_type.value,
+            display_name=submission.display_name,
+        )
+        for submission in submissions
+    ]
+    session.add_all(workloads)
+    await session.flush()
+    return workloads
+
+
 async def get_workload_by_id_in_cluster(session: AsyncSession, workload_id: UUID, cluster_id: UUID) -> Workload | None:
     result = await session.execute(
         select(Workload).where(Workload.cluster_id == cluster_id, Workload.id == workload_id)
@@ -315,6 +344,19 @@ async def insert_workload_time_summary(
         raise e
 
 
+def _apply_keyset_pagination[T](
+    query: Select[T], keyset_columns: list[KeysetColumn], pagination_params: PaginationConditions
+) -> Select[T]:
+    try:
+        return apply_keyset_pagination_to_query(query, keyset_columns, pagination_params)
+    except ValueError as e:
+        raise ValidationException(str(e))
+
+
+def is_sorted_by_run_time(sort_params: list[SortCondition]) -> bool:
+    return any(sort.field == "run_time" for sort in sort_params or [])
+
+
 async def get_workloads_with_running_time_in_project(
     session: AsyncSession,
     project_id: UUID,
@@ -341,15 +383,22 @@ async def get_workloads_with_running_time_in_project(
     )
 
     filter_query = apply_filter_to_query(stmt, filter_conditions, [Workload, WorkloadTimeSummary])
-    sorted_query = apply_sorting_to_query(
-        filter_query, sort_params, [Workload, WorkloadTimeSummary], {"run_time": text("run_time")}
-    )
-
-    paginated_query = apply_pagination_to_query(sorted_query, pagination_params)
-
     count_query = get_count_query(filter_query)
-    count_result = await session.execute(count_query)
-    total_count = count_result.scalar_one()
+
+    if pagination_params and pagination_params.cursor:
+        if is_sorted_by_run_time(sort_params):
+            # run_time keeps growing for running workloads, so a position in that order is not stable across requests
+            raise ValidationException("Cursor pagination is not supported when sorting by run_time")
+        keyset_columns = resolve_keyset_columns(sort_params, [Workload, WorkloadTimeSummary])
+        paginated_query = _apply_keyset_pagination(filter_query, keyset_columns, pagination_params)
+        total_count = await get_cached_count(session, count_query)
+    else:
+        sorted_query = apply_sorting_to_query(
+            filter_query, sort_params, [Workload, WorkloadTimeSummary], {"run_time": text("run_time")}
+        ).order_by(Workload.id)  # tiebreaker, so next_cursor from an offset page matches the keyset order
+        paginated_query = apply_pagination_to_query(sorted_query, pagination_params)
+        count_result = await session.execute(count_query)
+        total_count = count_result.scalar_one()
 
     result = await session.execute(paginated_query)
     workloads_with_running_time = [(workload, int(run_time or 0)) for workload, run_time in result.all()]
@@ -385,14 +434,19 @@ async def get_workloads_in_cluster(
     stmt = select(Workload).where(Workload.cluster_id == cluster_id)
 
     filter_query = apply_filter_to_query(stmt, filter_conditions, [Workload])
-    pagainated_query = apply_pagination_to_query(filter_query, pagination_params)
-    sorted_query = apply_sorting_to_query(pagainated_query, sort_params, [Workload])
-
     count_query = get_count_query(filter_query)
-    count_result = await session.execute(count_query)
-    total_count = count_result.scalar_one()
 
-    result = await session.execute(sorted_query)
+    if pagination_params and pagination_params.cursor:
+        keyset_columns = resolve_keyset_columns(sort_params, [Workload])
+        paginated_query = _apply_keyset_pagination(filter_query, keyset_columns, pagination_params)
+        total_count = await get_cached_count(session, count_query)
+    else:
+        pagainated_query = apply_pagination_to_query(filter_query, pagination_params)
+        paginated_query = apply_sorting_to_query(pagainated_query, sort_params, [Workload]).order_by(Workload.id)
+        count_result = await session.execute(count_query)
+        total_count = count_result.scalar_one()
+
+    result = await session.execute(paginated_query)
     workloads = result.scalars().all()
 
     return workloads, total_count
@@ -4,7 +4,6 @@
 
 from uuid import UUID
 
-import yaml
 from fastapi import APIRouter, Depends, File, Path, Query, UploadFile, status
 from prometheus_api_client import PrometheusConnect
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,6 +23,7 @@ from ..users.models import User
 from ..utilities.database import get_session
 from ..utilities.enums import Roles
 from ..utilities.exceptions import NotFoundException, UnhealthyException, ValidationException
+from ..utilities.fastapi import trusted_response
 from ..utilities.security import (
     BearerToken,
     auth_token_claimset,
@@ -34,11 +34,22 @@ from ..utilities.security import (
     is_user_in_role,
     validate_and_get_project_from_query,
 )
+from ..utilities.yaml_codec import YAMLError
+from .constants import DISPLAY_NAME_PATTERN, MAX_BATCH_MANIFESTS_SIZE, MAX_MANIFEST_SIZE, MAX_WORKLOADS_PER_BATCH
 from .enums import WorkloadType
 from .repository import get_workload_by_id, get_workload_by_id_and_user_membership
-from .schemas import WorkloadMetricsDetailsResponse, WorkloadResponse, Workloads, WorkloadsStats, WorkloadWithComponents
+from .schemas import (
+    WorkloadBatchSubmission,
+    WorkloadBatchSubmissionResponse,
+    WorkloadMetricsDetailsResponse,
+    WorkloadResponse,
+    Workloads,
+    WorkloadsStats,
+    WorkloadWithComponents,
+)
 from .service import create_and_submit_workload as submit_workload_to_cluster
 from .service import (
+    create_and_submit_workload_batch,
     get_stats_for_workloads,
     get_stats_for_workloads_in_accessible_clusters,
     get_workload_with_components,
@@ -79,10 +90,10 @@ async def submit_workload(
         description="display name for the workload.",
         min_length=2,
         max_length=256,
-        pattern=r"^[a-zA-Z0-9 _\-\.,:\(\)\[\]\+@#]+$",  # Allow alphanumeric, spaces, and some special characters
+        pattern=DISPLAY_NAME_PATTERN,
     ),
 ) -> WorkloadResponse:
-    if manifest.size > 2 * 1024 * 1024:
+    if manifest.size > MAX_MANIFEST_SIZE:
         raise ValidationException("File size too large. Max size is 2 MB.")
 
     if ClusterResponse.model_validate(project.cluster).status is not ClusterStatus.HEALTHY:
@@ -90,13 +101,42 @@ async def submit_workload(
 
     try:
         yml_content = await validate_and_parse_workload_manifest(manifest)
-    except yaml.YAMLError as ymlErr:
+    except YAMLError as ymlErr:
         raise ValidationException(f"Invalid YAML content in workload manifest: {ymlErr}")
     return await submit_workload_to_cluster(
         session, project, yml_content, user, token, workload_type, display_name, message_sender
     )
 
 
+@router.post(
+    "/workloads/batch",
+    operation_id="submit_workloads",
+    summary="Submit a batch of workloads",
+    description=f"""
+        Deploy up to {MAX_WORKLOADS_PER_BATCH} workloads, such as the jobs of a hyper-parameter sweep, to the GPU
+        cluster of a project in one request. Each manifest can be up to {MAX_MANIFEST_SIZE} characters, and the
+        manifests of a batch up to {MAX_BATCH_MANIFESTS_SIZE} characters in total; larger batches are rejected as a
+        whole and must be split. The project and cluster are checked once for the whole batch. Each manifest is
+        validated on its own: the response lists, in submission order, the created workload or the reason a workload
+        was rejected.
+    """,
+    status_code=status.HTTP_200_OK,
+    response_model=WorkloadBatchSubmissionResponse,
+)
+async def submit_workloads(
+    batch: WorkloadBatchSubmission,
+    user: str = Depends(get_user_email),
+    message_sender: MessageSender = Depends(get_message_sender),
+    session: AsyncSession = Depends(get_session),
+    token: str = Depends(BearerToken),
+    project: Project = Depends(validate_and_get_project_from_query),
+) -> WorkloadBatchSubmissionResponse:
+    if ClusterResponse.model_validate(project.cluster).status is not ClusterStatus.HEALTHY:
+        raise UnhealthyException(f"Cannot submit workload to cluster '{project.cluster.name}' - cluster is not healthy")
+
+    return await create_and_submit_workload_batch(session, project, batch.workloads, user, token, message_sender)
+
+
 @router.delete(
     "/workloads/{workload_id}",
     operation_id="delete_workload",
@@ -162,6 +202,7 @@ async def get_workload_stats(
     status_code=status.HTTP_200_OK,
     response_model=GpuDeviceSingleMetricResponse,
 )
+@trusted_response
 async def get_workload_gpu_device_vram_utilization(
     workload_id: UUID = Path(description="The ID of the workload"),
     time_range: MetricsTimeRange = Depends(),
@@ -184,6 +225,7 @@ async def get_workload_gpu_device_vram_utilization(
     status_code=status.HTTP_200_OK,
     response_model=GpuDeviceSingleMetricResponse,
 )
+@trusted_response
 async def get_workload_gpu_device_junction_temperature(
     workload_id: UUID = Path(description="The ID of the workload"),
     time_range: MetricsTimeRange = Depends(),
@@ -206,6 +248,7 @@ async def get_workload_gpu_device_junction_temperature(
     status_code=status.HTTP_200_OK,
     response_model=GpuDeviceSingleMetricResponse,
 )
+@trusted_response
 async def get_workload_gpu_device_power_usage(
     workload_id: UUID = Path(description="The ID of the workload"),
     time_range: MetricsTimeRange = Depends(),
@@ -4,10 +4,11 @@
 
 from uuid import UUID
 
-from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, model_validator
 
 from ..messaging.schemas import WorkloadComponentKind, WorkloadComponentStatus, WorkloadStatus
 from ..utilities.schema import BaseEntityPublic
+from .constants import DISPLAY_NAME_PATTERN, MAX_BATCH_MANIFESTS_SIZE, MAX_MANIFEST_SIZE, MAX_WORKLOADS_PER_BATCH
 from .enums import WorkloadType
 
 
@@ -25,6 +26,39 @@ class Workloads(BaseModel):
     data: list[WorkloadResponse]
 
 
+class WorkloadSubmission(BaseModel):
+    manifest: str = Field(description="The Kubernetes YAML manifest of the workload.", max_length=MAX_MANIFEST_SIZE)
+    display_name: str = Field(
+        description="The display name for the workload.",
+        min_length=2,
+        max_length=256,
+        pattern=DISPLAY_NAME_PATTERN,
+    )
+    workload_type: WorkloadType = Field(WorkloadType.CUSTOM, description="The type of the workload.")
+
+
+class WorkloadBatchSubmission(BaseModel):
+    workloads: list[WorkloadSubmission] = Field(
+        description="The workloads to submit.", min_length=1, max_length=MAX_WORKLOADS_PER_BATCH
+    )
+
+    @model_validator(mode="after")
+    def validate_manifests_size(self) -> "WorkloadBatchSubmission":
+        if sum(len(workload.manifest) for workload in self.workloads) > MAX_BATCH_MANIFESTS_SIZE:
+            raise ValueError(f"the manifests of a batch must not exceed {MAX_BATCH_MANIFESTS_SIZE} characters in total")
+        return self
+
+
+class WorkloadSubmissionResult(BaseModel):
+    index: int = Field(description="The position of the workload in the submitted batch.")
+    workload: WorkloadResponse | None = Field(None, description="The submitted workload, if it was accepted.")
+    error: str | None = Field(None, description="Why the workload was rejected, if it was.")
+
+
+class WorkloadBatchSubmissionResponse(BaseModel):
+    data: list[WorkloadSubmissionResult] = Field(description="The result of each workload, in submission order.")
+
+
 class WorkloadComponent(BaseEntityPublic):
     name: str = Field(description="The name of the component.")
     kind: WorkloadComponentKind = Field(description="The kind of the component.")
@@ -23,13 +23,15 @@ from ..messaging.schemas import (
 from ..messaging.sender import MessageSender
 from ..metrics.service import get_gpu_and_node_counts_for_workload
 from ..projects.models import Project
-from ..utilities.exceptions import ConflictException
+from ..utilities.exceptions import ConflictException, ValidationException
+from ..utilities.yaml_codec import YAMLError
 from .constants import WORKLOAD_STATS_STATUSES
 from .enums import WorkloadType
 from .models import Workload
 from .repository import create_workload as create_workload_in_db
 from .repository import create_workload_component as create_workload_component_in_db
 from .repository import create_workload_components as create_workload_components_in_db
+from .repository import create_workloads as create_workloads_in_db
 from .repository import (
     get_workload_by_id_in_cluster,
     get_workload_component_by_id,
@@ -48,6 +50,7 @@ from .repository import get_workloads_by_project as get_workloads_by_project_in_
 from .repository import update_workload_component_status as update_workload_component_status_in_db
 from .repository import update_workload_status as update_workload_status_in_db
 from .schemas import (
+    WorkloadBatchSubmissionResponse,
     WorkloadComponent,
     WorkloadComponentIn,
     WorkloadMetricsDetailsResponse,
@@ -56,6 +59,8 @@ from .schemas import (
     WorkloadsStats,
     WorkloadStatusCount,
     WorkloadStatusStats,
+    WorkloadSubmission,
+    WorkloadSubmissionResult,
     WorkloadWithComponents,
 )
 from .utils import (
@@ -63,6 +68,7 @@ from .utils import (
     get_workload_component_for_status_update,
     inject_workload_metadata_to_manifest,
     resolve_workload_status,
+    validate_and_parse_workload_manifest,
 )
 
 
@@ -120,6 +126,75 @@ async def create_and_submit_workload(
     return WorkloadResponse.model_validate(workload)
 
 
+async def create_and_submit_workload_batch(
+    session: AsyncSession,
+    project: Project,
+    submissions: list[WorkloadSubmission],
+    creator: str,
+    token: str,
+    message_sender: MessageSender,
+) -> WorkloadBatchSubmissionResponse:
+    """
+    Submit a batch of workloads to the cluster of a project.
+
+    Each manifest is validated on its own, and a workload with an invalid manifest is rejected without affecting the
+    rest of the batch. The accepted workloads and all their components are created with one INSERT each, and one
+    workload message per workload is queued for the cluster.
+    """
+    results: list[WorkloadSubmissionResult] = []
+    accepted: list[tuple[int, WorkloadSubmission, list[dict]]] = []
+    for index, submission in enumerate(submissions):
+        try:
+            manifest = await validate_and_parse_workload_manifest(submission.manifest)
+        except YAMLError as e:
+            results.append(
+                WorkloadSubmissionResult(index=index, error=f"Invalid YAML content in workload manifest: {e}")
+            )
+            continue
+        except ValidationException as e:
+            results.append(WorkloadSubmissionResult(index=index, error=e.message))
+            continue
+        if not manifest:
+            results.append(
+                WorkloadSubmissionResult(index=index, error="The manifest must contain at least one resource")
+            )
+            continue
+        accepted.append((index, submission, manifest))
+
+    if accepted:
+        workloads = await create_workloads_in_db(
+            session=session,
+            cluster_id=project.cluster_id,
+            project_id=project.id,
+            status=WorkloadStatus.PENDING,
+            creator=creator,
+            submissions=[submission for _, submission, _ in accepted],
+        )
+        components_with_manifests = [
+            extract_workload_components_from_manifest(manifest, workload.id)
+            for workload, (_, _, manifest) in zip(workloads, accepted, strict=True)
+        ]
+        db_components = iter(
+            await create_workload_components_in_db(
+                session=session,
+                components=[component for items in components_with_manifests for component, _ in items],
+                creator=creator,
+            )
+        )
+
+        for workload, items, (index, _, _) in zip(workloads, components_with_manifests, accepted, strict=True):
+            # The components were created in the order of the workloads and their manifests
+            db_components_with_manifests = [(next(db_components), manifest) for _, manifest in items]
+            workload_manifest = inject_workload_metadata_to_manifest(workload.id, project, db_components_with_manifests)
+            message = WorkloadMessage(
+                message_type="workload", manifest=workload_manifest, user_token=token, workload_id=workload.id
+            )
+            await message_sender.enqueue(project.cluster_id, message)
+            results.append(WorkloadSubmissionResult(index=index, workload=WorkloadResponse.model_validate(workload)))
+
+    return WorkloadBatchSubmissionResponse(data=sorted(results, key=lambda result: result.index))
+
+
 async def submit_delete_workload(
     session: AsyncSession, workload: Workload, user: str, message_sender: MessageSender
 ) -> None:
@@ -5,8 +5,6 @@
 from typing import Any
 from uuid import UUID
 
-import yaml
-
 from ..messaging.schemas import (
     CommonComponentStatus,
     WorkloadComponentKind,
@@ -15,6 +13,7 @@ from ..messaging.schemas import (
 )
 from ..projects.models import Project
 from ..utilities.exceptions import ValidationException
+from ..utilities.yaml_codec import dump_all, load_all_async
 from .constants import (
     COMPONENT_ID_LABEL,
     COMPONENT_SPECIFIC_COMPLETED_STATUSES,
@@ -36,7 +35,7 @@ async def validate_and_parse_workload_manifest(yml: Any | str) -> list[dict]:
     else:
         yml_content_raw = await yml.read()
         yml_content = yml_content_raw.decode()
-    manifest = list(yaml.safe_load_all(yml_content))
+    manifest = await load_all_async(yml_content)
 
     for item in manifest:
         kind = item.get("kind")
@@ -150,7 +149,7 @@ def inject_workload_metadata_to_manifest(
             spec["clusterQueue"] = project.name
         manifest_items.append(item)
 
-    return yaml.dump_all(manifest_items)
+    return dump_all(manifest_items)
 
 
 def extract_workload_components_from_manifest(
@@ -0,0 +1,11 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmark suite for the AIRM API at synthetic scale.
+
+Seeds a PostgreSQL database with the tests/factory.py helpers, stands in stubs for Prometheus and Keycloak,
+drives the main list, metrics and message ingestion paths, and compares the results with a stored baseline.
+See benchmarks/README.md for usage.
+"""
@@ -0,0 +1,100 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Run the AIRM benchmark suite.
+
+Usage (from apps/api/airm, with a PostgreSQL database dedicated to benchmarking):
+
+    uv run python -m benchmarks --scale small
+    uv run python -m benchmarks --scale large --reuse-database --update-baseline
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+from pathlib import Path
+
+from loguru import logger
+
+from .measure import ScenarioResult, compare_with_baseline, configure_logging, load_baseline, measure, save_baseline
+from .scenarios import benchmark_client, build_scenarios
+from .seed import add_database_arguments, benchmark_database
+from .stubs import StubKeycloakAdmin, StubPrometheus
+
+BASELINES_DIR = Path(__file__).parent / "baselines"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n\n")[0].strip())
+    add_database_arguments(parser)
+    parser.add_argument("--iterations", type=int, default=50, help="Measured calls per scenario")
+    parser.add_argument("--warmup", type=int, default=5, help="Unmeasured calls per scenario before measuring")
+    parser.add_argument("-k", "--filter", default="", help="Only run scenarios whose name contains this text")
+    parser.add_argument("--prometheus-latency", type=float, default=0.02, help="Seconds per stub Prometheus query")
+    parser.add_argument("--keycloak-latency", type=float, default=0.02, help="Seconds per stub Keycloak call")
+    parser.add_argument("--baseline", type=Path, help="Baseline file, defaults to benchmarks/baselines/<scale>.json")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Allowed relative increase of latency and memory over baseline"
+    )
+    return parser.parse_args(argv)
+
+
+def print_results(results: dict[str, ScenarioResult], baseline: dict[str, ScenarioResult] | None) -> None:
+    header = f"{'scenario':<40} {'p50 ms':>10} {'p95 ms':>10} {'queries':>8} {'peak KiB':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        print(
+            f"{name:<40} {result.p50_ms:>10.2f} {result.p95_ms:>10.2f} {result.queries:>8} {result.peak_memory_kib:>10.1f}"
+        )
+        expected = baseline.get(name) if baseline else None
+        if expected:
+            print(
+                f"{'  baseline':<40} {expected.p50_ms:>10.2f} {expected.p95_ms:>10.2f} {expected.queries:>8} "
+                f"{expected.peak_memory_kib:>10.1f}"
+            )
+
+
+async def run(args: argparse.Namespace) -> int:
+    async with benchmark_database(args) as data:
+        rng = random.Random(0)
+        prometheus = StubPrometheus(data, latency=args.prometheus_latency)
+        keycloak = StubKeycloakAdmin(data, latency=args.keycloak_latency)
+        results = {}
+        async with benchmark_client(data, prometheus, keycloak) as client:
+            for scenario in build_scenarios(client, data, rng):
+                if args.filter not in scenario.name:
+                    continue
+                logger.info(f"Running {scenario.name}")
+                results[scenario.name] = await measure(scenario.call, iterations=args.iterations, warmup=args.warmup)
+
+    baseline_path = args.baseline or BASELINES_DIR / f"{args.scale}.json"
+    baseline = load_baseline(baseline_path)
+    print_results(results, baseline)
+
+    if args.update_baseline:
+        save_baseline(baseline_path, args.scale, {**(baseline or {}), **results})
+        logger.info(f"Stored baseline in {baseline_path}")
+        return 0
+    if baseline is None:
+        logger.warning(f"No baseline in {baseline_path}, run with --update-baseline to store one")
+        return 0
+
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+    for regression in regressions:
+        logger.error(f"Regression: {regression}")
+    return 1 if regressions else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    configure_logging()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
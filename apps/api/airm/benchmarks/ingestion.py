@@ -0,0 +1,405 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Throughput benchmark of the cluster message ingestion path.
+
+Replays a synthetic or recorded stream of cluster messages through the real queue consumer handler, with an in-process
+stand-in for RabbitMQ, and reports messages per second, database statements per message and latency per message type.
+
+Usage (from apps/api/airm, with a PostgreSQL database dedicated to benchmarking):
+
+    uv run python -m benchmarks.ingestion --scale small --messages 10000
+    uv run python -m benchmarks.ingestion --reuse-database --stream recorded.jsonl --concurrency 4
+
+A recorded stream is a JSON Lines file with one message per line: {"user_id": "<cluster ID>", "body": {...}}, where
+body is the message as the cluster agent publishes it.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from loguru import logger
+from starlette.datastructures import State
+
+from app.messaging.consumer import __process_message as process_message
+from app.utilities.request_timing import DB, collect_timings
+
+from .measure import configure_logging, percentile
+from .seed import (
+    NODE_CPU_MILLI_CORES,
+    NODE_EPHEMERAL_STORAGE_BYTES,
+    NODE_GPU_COUNT,
+    NODE_GPU_PRODUCT_NAME,
+    NODE_GPU_TYPE,
+    NODE_GPU_VRAM_BYTES,
+    NODE_MEMORY_BYTES,
+    QUOTA_CPU_MILLI_CORES,
+    QUOTA_EPHEMERAL_STORAGE_BYTES,
+    QUOTA_GPU_COUNT,
+    QUOTA_MEMORY_BYTES,
+    SeededData,
+    add_database_arguments,
+    benchmark_database,
+)
+from .stubs import InProcessBroker, StubKeycloakAdmin
+
+BASELINES_DIR = Path(__file__).parent / "baselines"
+
+# Share of each message type in a synthetic stream, roughly as seen from a busy cluster
+DEFAULT_MIX = {
+    "workload_component_status_update": 60,
+    "workload_status_update": 15,
+    "heartbeat": 15,
+    "cluster_nodes": 5,
+    "cluster_quotas_status": 5,
+}
+
+
+class BenchmarkMessage:
+    """The parts of an aio_pika AbstractIncomingMessage the queue consumer uses."""
+
+    def __init__(self, body: dict, user_id: str) -> None:
+        self.message_type = body["message_type"]
+        self.body = json.dumps(body).encode()
+        self.user_id = user_id
+
+    @asynccontextmanager
+    async def process(self, requeue: bool = False) -> AsyncIterator[None]:
+        yield
+
+
+class SyntheticMessages:
+    """Builds cluster messages that address the seeded clusters, nodes, quotas and workloads."""
+
+    def __init__(self, data: SeededData, rng: random.Random, *, node_not_ready_rate: float = 0.1) -> None:
+        self.data = data
+        self.rng = rng
+        self.node_not_ready_rate = node_not_ready_rate
+        self.projects_by_cluster: dict[str, list[str]] = defaultdict(list)
+        for name, cluster_id in zip(data.project_names, data.project_cluster_ids):
+            self.projects_by_cluster[str(cluster_id)].append(name)
+
+    def _cluster(self) -> tuple[str, str]:
+        index = self.rng.randrange(len(self.data.cluster_ids))
+        return str(self.data.cluster_ids[index]), self.data.cluster_names[index]
+
+    def heartbeat(self) -> BenchmarkMessage:
+        cluster_id, cluster_name = self._cluster()
+        body = {
+            "message_type": "heartbeat",
+            "last_heartbeat_at": datetime.now(UTC).isoformat(),
+            "cluster_name": cluster_name,
+        }
+        return BenchmarkMessage(body, cluster_id)
+
+    def cluster_nodes(self) -> BenchmarkMessage:
+        """The full node list of a cluster, where a node occasionally turns not ready, or ready again."""
+        index = self.rng.randrange(len(self.data.cluster_ids))
+        cluster_id = self.data.cluster_ids[index]
+        nodes = []
+        for name in self.data.cluster_node_names.get(cluster_id, []):
+            is_ready = self.rng.random() >= self.node_not_ready_rate
+            nodes.append(
+                {
+                    "name": name,
+                    "cpu_milli_cores": NODE_CPU_MILLI_CORES,
+                    "memory_bytes": NODE_MEMORY_BYTES,
+                    "ephemeral_storage_bytes": NODE_EPHEMERAL_STORAGE_BYTES,
+                    "gpu_information": {
+                        "count": NODE_GPU_COUNT,
+                        "type": NODE_GPU_TYPE,
+                        "vendor": "AMD",
+                        "vram_bytes_per_device": NODE_GPU_VRAM_BYTES,
+                        "product_name": NODE_GPU_PRODUCT_NAME,
+                    },
+                    "status": "Ready" if is_ready else "NotReady",
+                    "is_ready": is_ready,
+                }
+            )
+        body = {"message_type": "cluster_nodes", "cluster_nodes": nodes, "updated_at": datetime.now(UTC).isoformat()}
+        return BenchmarkMessage(body, str(cluster_id))
+
+    def cluster_quotas_status(self) -> BenchmarkMessage:
+        """The quotas a cluster reports for its projects, matching the seeded quotas."""
+        cluster_id, _ = self._cluster()
+        allocations = [
+            {
+                "cpu_milli_cores": QUOTA_CPU_MILLI_CORES,
+                "gpu_count": QUOTA_GPU_COUNT,
+                "memory_bytes": QUOTA_MEMORY_BYTES,
+                "ephemeral_storage_bytes": QUOTA_EPHEMERAL_STORAGE_BYTES,
+                "quota_name": project_name,
+                "namespaces": [project_name],
+            }
+            for project_name in self.projects_by_cluster[cluster_id]
+        ]
+        body = {
+            "message_type": "cluster_quotas_status",
+            "updated_at": datetime.now(UTC).isoformat(),
+            "quota_allocations": allocations,
+        }
+        return BenchmarkMessage(body, cluster_id)
+
+    def workload_status(self) -> BenchmarkMessage:
+        index = self.rng.randrange(len(self.data.workload_ids))
+        body = {
+            "message_type": "workload_status_update",
+            "workload_id": str(self.data.workload_ids[index]),
+            "status": self.rng.choice(["Pending", "Running", "Complete"]),
+            "status_reason": None,
+            "updated_at": datetime.now(UTC).isoformat(),
+        }
+        return BenchmarkMessage(body, str(self.data.workload_cluster_ids[index]))
+
+    def workload_component_status(self) -> BenchmarkMessage:
+        index = self.rng.randrange(len(self.data.workload_component_ids))
+        body = {
+            "message_type": "workload_component_status_update",
+            "id": str(self.data.workload_component_ids[index]),
+            "name": self.data.workload_component_names[index],
+            "kind": "Job",
+            "api_version": "batch/v1",
+            "workload_id": str(self.data.workload_ids[index]),
+            "status": self.rng.choice(["Pending", "Running", "Complete"]),
+            "status_reason": None,
+            "updated_at": datetime.now(UTC).isoformat(),
+        }
+        return BenchmarkMessage(body, str(self.data.workload_cluster_ids[index]))
+
+    def stream(self, count: int, mix: dict[str, int] | None = None) -> list[BenchmarkMessage]:
+        """A stream of count messages of the given types, in random order, in proportion to their weights."""
+        builders: dict[str, Callable[[], BenchmarkMessage]] = {
+            "heartbeat": self.heartbeat,
+            "cluster_nodes": self.cluster_nodes,
+            "cluster_quotas_status": self.cluster_quotas_status,
+            "workload_status_update": self.workload_status,
+            "workload_component_status_update": self.workload_component_status,
+        }
+        mix = mix or DEFAULT_MIX
+        unknown = set(mix) - set(builders)
+        if unknown:
+            raise ValueError(f"Cannot build messages of type {', '.join(sorted(unknown))}")
+        types = self.rng.choices(list(mix), weights=list(mix.values()), k=count)
+        return [builders[message_type]() for message_type in types]
+
+
+def load_stream(path: Path) -> list[BenchmarkMessage]:
+    """Read a recorded stream from a JSON Lines file."""
+    messages = []
+    with path.open() as file:
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                messages.append(BenchmarkMessage(record["body"], record["user_id"]))
+    return messages
+
+
+@dataclass
+class MessageTypeResult:
+    """Latency and database statements of the messages of one type."""
+
+    messages: int
+    p50_ms: float
+    p95_ms: float
+    statements_per_message: float
+
+
+@dataclass
+class IngestionResult:
+    messages: int
+    seconds: float
+    messages_per_second: float
+    errors: int
+    published: int
+    types: dict[str, MessageTypeResult] = field(default_factory=dict)
+
+
+async def replay(messages: list[BenchmarkMessage], app_state: State, *, concurrency: int = 1) -> IngestionResult:
+    """
+    Process the messages through the queue consumer handler and summarise the run.
+
+    The consumer takes one message at a time from the queue (prefetch 1), so concurrency corresponds to the number of
+    consumers processing the stream side by side. Errors are counted from the error logs of the handlers, since the
+    consumer logs and swallows exceptions.
+    """
+    durations: dict[str, list[float]] = defaultdict(list)
+    statements: dict[str, int] = defaultdict(int)
+    errors = 0
+
+    def count_error(_: object) -> None:
+        nonlocal errors
+        errors += 1
+
+    queue: asyncio.Queue[BenchmarkMessage] = asyncio.Queue()
+    for message in messages:
+        queue.put_nowait(message)
+
+    async def consume() -> None:
+        while not queue.empty():
+            message = queue.get_nowait()
+            start = time.perf_counter()
+            with collect_timings() as timings:
+                await process_message(message, app_state)
+            durations[message.message_type].append(time.perf_counter() - start)
+            db = timings.dependencies.get(DB)
+            statements[message.message_type] += db.count if db else 0
+
+    broker = InProcessBroker()
+    handler_id = logger.add(count_error, level="ERROR")
+    try:
+        with broker.installed():
+            start = time.perf_counter()
+            await asyncio.gather(*(consume() for _ in range(concurrency)))
+            seconds = time.perf_counter() - start
+    finally:
+        logger.remove(handler_id)
+
+    return IngestionResult(
+        messages=len(messages),
+        seconds=round(seconds, 3),
+        messages_per_second=round(len(messages) / seconds, 1) if seconds else 0.0,
+        errors=errors,
+        published=len(broker.published),
+        types={
+            message_type: MessageTypeResult(
+                messages=len(values),
+                p50_ms=round(percentile(values, 50) * 1000, 2),
+                p95_ms=round(percentile(values, 95) * 1000, 2),
+                statements_per_message=round(statements[message_type] / len(values), 2),
+            )
+            for message_type, values in sorted(durations.items())
+        },
+    )
+
+
+def load_baseline(path: Path) -> IngestionResult | None:
+    if not path.exists():
+        return None
+    content = json.loads(path.read_text())
+    types = {name: MessageTypeResult(**result) for name, result in content.pop("types").items()}
+    return IngestionResult(**content, types=types)
+
+
+def save_baseline(path: Path, result: IngestionResult) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(asdict(result), indent=2) + "\n")
+
+
+def compare_with_baseline(result: IngestionResult, baseline: IngestionResult, tolerance: float) -> list[str]:
+    """
+    Return a description of every regression against the baseline.
+
+    Throughput may drop and latency may grow by the tolerance fraction before they count as a regression. Statements
+    per message depend on the stream only, so any increase is a regression.
+    """
+    regressions = []
+    if result.messages_per_second < baseline.messages_per_second * (1 - tolerance):
+        regressions.append(
+            f"messages per second {result.messages_per_second} below baseline {baseline.messages_per_second}"
+        )
+    for message_type, actual in result.types.items():
+        expected = baseline.types.get(message_type)
+        if expected is None:
+            continue
+        if actual.p95_ms > expected.p95_ms * (1 + tolerance):
+            regressions.append(f"{message_type}: p95_ms {actual.p95_ms} exceeds baseline {expected.p95_ms}")
+        if actual.statements_per_message > expected.statements_per_message:
+            regressions.append(
+                f"{message_type}: statements per message {actual.statements_per_message} "
+                f"exceeds baseline {expected.statements_per_message}"
+            )
+    return regressions
+
+
+def print_result(result: IngestionResult) -> None:
+    print(
+        f"{result.messages} messages in {result.seconds:.2f}s: {result.messages_per_second:.1f} messages/s, "
+        f"{result.errors} errors, {result.published} messages published to clusters"
+    )
+    header = f"{'message type':<36} {'messages':>9} {'p50 ms':>9} {'p95 ms':>9} {'statements':>11}"
+    print(header)
+    print("-" * len(header))
+    for message_type, type_result in result.types.items():
+        print(
+            f"{message_type:<36} {type_result.messages:>9} {type_result.p50_ms:>9.2f} {type_result.p95_ms:>9.2f} "
+            f"{type_result.statements_per_message:>11.2f}"
+        )
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    """Parse a mix like 'heartbeat=1,cluster_nodes=2' into weights per message type."""
+    try:
+        return {name.strip(): int(weight) for name, weight in (item.split("=") for item in value.split(","))}
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"Invalid mix '{value}', expected type=weight,...") from e
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.ingestion", description=__doc__.split("\n\n")[1])
+    add_database_arguments(parser)
+    parser.add_argument("--messages", type=int, default=10_000, help="Number of synthetic messages to replay")
+    parser.add_argument("--mix", type=parse_mix, help="Weights of the synthetic message types, as type=weight,...")
+    parser.add_argument("--stream", type=Path, help="Replay a recorded JSON Lines stream instead")
+    parser.add_argument("--warmup", type=int, default=100, help="Unmeasured messages replayed before measuring")
+    parser.add_argument("--concurrency", type=int, default=1, help="Consumers processing the stream side by side")
+    parser.add_argument(
+        "--baseline", type=Path, help="Baseline file, defaults to benchmarks/baselines/ingestion-<scale>.json"
+    )
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Allowed relative drop of throughput and increase of latency"
+    )
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace) -> int:
+    async with benchmark_database(args) as data:
+        app_state = State()
+        app_state.keycloak_admin_client = StubKeycloakAdmin(data)
+        synthetic = SyntheticMessages(data, random.Random(0))
+        # Built first, so that the messages of the measured stream are newer and not dropped as outdated
+        warmup = synthetic.stream(args.warmup, args.mix)
+        messages = load_stream(args.stream) if args.stream else synthetic.stream(args.messages, args.mix)
+
+        if warmup:
+            await replay(warmup, app_state, concurrency=args.concurrency)
+        logger.info(f"Replaying {len(messages)} messages with {args.concurrency} consumers")
+        result = await replay(messages, app_state, concurrency=args.concurrency)
+
+    print_result(result)
+    baseline_path = args.baseline or BASELINES_DIR / f"ingestion-{args.scale}.json"
+    if args.update_baseline:
+        save_baseline(baseline_path, result)
+        logger.info(f"Stored baseline in {baseline_path}")
+        return 0
+    baseline = load_baseline(baseline_path)
+    if baseline is None:
+        logger.warning(f"No baseline in {baseline_path}, run with --update-baseline to store one")
+        return 0
+
+    regressions = compare_with_baseline(result, baseline, args.tolerance)
+    for regression in regressions:
+        logger.error(f"Regression: {regression}")
+    return 1 if regressions else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    configure_logging()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
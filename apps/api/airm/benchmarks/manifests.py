@@ -0,0 +1,206 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Micro-benchmark of parsing and dumping workload manifests.
+
+Usage (from apps/api/airm, no database needed):
+
+    uv run python -m benchmarks.manifests
+    uv run python -m benchmarks.manifests --iterations 50
+
+For each manifest shape it compares the pure Python PyYAML loader and dumper with app.utilities.yaml_codec, and times
+a repeated parse served by load_all_cached. The shapes are:
+
+- deployment: a Deployment, Service and HTTPRoute, like a chart-rendered inference workload;
+- many documents: 200 small ConfigMaps and Services in one stream;
+- large config: one ConfigMap with about 2 MB of data, the largest manifest the API accepts.
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import yaml
+
+from app.utilities import yaml_codec
+
+from .measure import percentile
+
+MAX_MANIFEST_BYTES = 2 * 1024 * 1024
+
+
+@dataclass
+class ManifestResult:
+    """Median timings in milliseconds of parsing and dumping one manifest."""
+
+    manifest_bytes: int
+    documents: int
+    parse_python_ms: float
+    parse_codec_ms: float
+    parse_cached_ms: float
+    dump_python_ms: float
+    dump_codec_ms: float
+
+
+def deployment_manifest() -> list[dict[str, Any]]:
+    labels = {"app": "llm-inference", "app.kubernetes.io/managed-by": "helm"}
+    container = {
+        "name": "server",
+        "image": "rocm/vllm:latest",
+        "args": ["--model", "/models/llama", "--tensor-parallel-size", "8", "--max-model-len", "32768"],
+        "env": [{"name": f"VAR_{index}", "value": f"value-{index}"} for index in range(20)],
+        "ports": [{"containerPort": 8000, "name": "http"}],
+        "resources": {
+            "limits": {"amd.com/gpu": 8, "cpu": "64", "memory": "512Gi"},
+            "requests": {"amd.com/gpu": 8, "cpu": "32", "memory": "256Gi"},
+        },
+        "readinessProbe": {"httpGet": {"path": "/health", "port": 8000}, "periodSeconds": 10},
+        "volumeMounts": [{"name": "models", "mountPath": "/models"}, {"name": "shm", "mountPath": "/dev/shm"}],
+    }
+    return [
+        {
+            "apiVersion": "apps/v1",
+            "kind": "Deployment",
+            "metadata": {"name": "llm-inference", "labels": labels},
+            "spec": {
+                "replicas": 1,
+                "selector": {"matchLabels": labels},
+                "template": {
+                    "metadata": {"labels": labels},
+                    "spec": {
+                        "containers": [container],
+                        "volumes": [
+                            {"name": "models", "persistentVolumeClaim": {"claimName": "models"}},
+                            {"name": "shm", "emptyDir": {"medium": "Memory", "sizeLimit": "64Gi"}},
+                        ],
+                    },
+                },
+            },
+        },
+        {
+            "apiVersion": "v1",
+            "kind": "Service",
+            "metadata": {"name": "llm-inference", "labels": labels},
+            "spec": {"selector": labels, "ports": [{"port": 80, "targetPort": 8000, "name": "http"}]},
+        },
+        {
+            "apiVersion": "gateway.networking.k8s.io/v1",
+            "kind": "HTTPRoute",
+            "metadata": {"name": "llm-inference", "labels": labels},
+            "spec": {
+                "parentRefs": [{"name": "https", "namespace": "kgateway-system"}],
+                "rules": [
+                    {
+                        "matches": [{"path": {"type": "PathPrefix", "value": "/project/llm-inference/"}}],
+                        "backendRefs": [{"name": "llm-inference", "port": 80}],
+                    }
+                ],
+            },
+        },
+    ]
+
+
+def many_documents_manifest(count: int = 200) -> list[dict[str, Any]]:
+    documents: list[dict[str, Any]] = []
+    for index in range(count // 2):
+        documents.append(
+            {
+                "apiVersion": "v1",
+                "kind": "ConfigMap",
+                "metadata": {"name": f"config-{index}", "labels": {"app": "pipeline"}},
+                "data": {f"key-{key}": f"value-{key}" for key in range(10)},
+            }
+        )
+        documents.append(
+            {
+                "apiVersion": "v1",
+                "kind": "Service",
+                "metadata": {"name": f"service-{index}", "labels": {"app": "pipeline"}},
+                "spec": {"selector": {"app": f"stage-{index}"}, "ports": [{"port": 80, "targetPort": 8080}]},
+            }
+        )
+    return documents
+
+
+def large_config_manifest(rng: random.Random, size_bytes: int = MAX_MANIFEST_BYTES - 64 * 1024) -> list[dict[str, Any]]:
+    value_bytes = 1024
+    alphabet = string.ascii_letters + string.digits
+    data = {
+        f"entry-{index}": "".join(rng.choices(alphabet, k=value_bytes)) for index in range(size_bytes // value_bytes)
+    }
+    return [{"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "large-config"}, "data": data}]
+
+
+def _time(call: Callable[[], Any], iterations: int) -> float:
+    durations = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        call()
+        durations.append((time.perf_counter() - started) * 1000)
+    return percentile(durations, 50)
+
+
+def benchmark_manifest(documents: list[dict[str, Any]], iterations: int) -> ManifestResult:
+    content = yaml.dump_all(documents, Dumper=yaml.SafeDumper)
+    if yaml_codec.load_all(content) != list(yaml.safe_load_all(content)):
+        raise AssertionError("The codec parses the manifest into different documents")
+
+    yaml_codec.clear_cache()
+    yaml_codec.load_all_cached(content)
+    return ManifestResult(
+        manifest_bytes=len(content.encode()),
+        documents=len(documents),
+        parse_python_ms=_time(lambda: list(yaml.safe_load_all(content)), iterations),
+        parse_codec_ms=_time(lambda: yaml_codec.load_all(content), iterations),
+        parse_cached_ms=_time(lambda: yaml_codec.load_all_cached(content), iterations),
+        dump_python_ms=_time(lambda: yaml.dump_all(documents, Dumper=yaml.SafeDumper), iterations),
+        dump_codec_ms=_time(lambda: yaml_codec.dump_all(documents), iterations),
+    )
+
+
+def print_results(results: dict[str, ManifestResult]) -> None:
+    print(f"libyaml: {yaml.__with_libyaml__}")
+    header = (
+        f"{'manifest':<16} {'KiB':>8} {'docs':>6} {'parse ms':>10} {'codec':>8} {'cached':>8} "
+        f"{'dump ms':>10} {'codec':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        print(
+            f"{name:<16} {result.manifest_bytes / 1024:>8.0f} {result.documents:>6} {result.parse_python_ms:>10.2f} "
+            f"{result.parse_codec_ms:>8.2f} {result.parse_cached_ms:>8.3f} {result.dump_python_ms:>10.2f} "
+            f"{result.dump_codec_ms:>8.2f}"
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.manifests", description=__doc__.split("\n\n")[0].strip()
+    )
+    parser.add_argument("--iterations", type=int, default=10, help="Measured runs per path")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    rng = random.Random(0)
+    print_results(
+        {
+            "deployment": benchmark_manifest(deployment_manifest(), args.iterations),
+            "many documents": benchmark_manifest(many_documents_manifest(), args.iterations),
+            "large config": benchmark_manifest(large_config_manifest(rng), args.iterations),
+        }
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
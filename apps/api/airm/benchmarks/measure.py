@@ -0,0 +1,122 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Measurement of benchmark scenarios and comparison with a stored baseline."""
+
+import json
+import re
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from app.utilities.request_timing import DB
+
+SERVER_TIMING_CALLS = re.compile(r'(?P<name>[\w-]+);dur=[\d.]+;desc="(?P<count>\d+) calls?"')
+
+
+@dataclass
+class ScenarioResult:
+    """Latency percentiles, database queries and peak memory of one scenario."""
+
+    p50_ms: float
+    p95_ms: float
+    queries: int
+    peak_memory_kib: float
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Return the percentile of the values, interpolating linearly between the closest ranks."""
+    if not values:
+        raise ValueError("Cannot compute a percentile of no values")
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * percent / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def calls_from_server_timing(header: str) -> dict[str, int]:
+    """Parse the call counts per dependency from a Server-Timing header set by RequestTimingMiddleware."""
+    return {match["name"]: int(match["count"]) for match in SERVER_TIMING_CALLS.finditer(header)}
+
+
+async def measure(call: Callable[[], Awaitable[dict[str, int]]], *, iterations: int, warmup: int) -> ScenarioResult:
+    """
+    Run a scenario call repeatedly and summarise its latency, database queries and memory.
+
+    The call returns the number of calls it made per dependency. Latency is measured without tracemalloc, which slows
+    allocation-heavy code down considerably; peak memory comes from one extra traced run.
+    """
+    for _ in range(warmup):
+        await call()
+
+    durations = []
+    queries = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        calls = await call()
+        durations.append(time.perf_counter() - start)
+        queries = max(queries, calls.get(DB, 0))
+
+    tracemalloc.start()
+    try:
+        await call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return ScenarioResult(
+        p50_ms=round(percentile(durations, 50) * 1000, 2),
+        p95_ms=round(percentile(durations, 95) * 1000, 2),
+        queries=queries,
+        peak_memory_kib=round(peak / 1024, 1),
+    )
+
+
+def load_baseline(path: Path) -> dict[str, ScenarioResult] | None:
+    if not path.exists():
+        return None
+    scenarios = json.loads(path.read_text())["scenarios"]
+    return {name: ScenarioResult(**result) for name, result in scenarios.items()}
+
+
+def save_baseline(path: Path, scale: str, results: dict[str, ScenarioResult]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = {"scale": scale, "scenarios": {name: asdict(result) for name, result in sorted(results.items())}}
+    path.write_text(json.dumps(content, indent=2) + "\n")
+
+
+def compare_with_baseline(
+    results: dict[str, ScenarioResult], baseline: dict[str, ScenarioResult], tolerance: float
+) -> list[str]:
+    """
+    Return a description of every regression against the baseline.
+
+    Latency and memory may grow by the tolerance fraction before they count as a regression, as they vary between
+    runs. The number of queries is deterministic, so any increase is a regression.
+    """
+    regressions = []
+    for name, result in sorted(results.items()):
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        for metric in ("p50_ms", "p95_ms", "peak_memory_kib"):
+            actual, limit = getattr(result, metric), getattr(expected, metric) * (1 + tolerance)
+            if actual > limit:
+                regressions.append(f"{name}: {metric} {actual} exceeds baseline {getattr(expected, metric)}")
+        if result.queries > expected.queries:
+            regressions.append(f"{name}: queries {result.queries} exceeds baseline {expected.queries}")
+    return regressions
+
+
+def configure_logging() -> None:
+    """Keep the info logs of the app out of the report; they are still formatted, as in production."""
+    logger.remove()
+    logger.add(sys.stderr, level="INFO", filter=lambda record: record["name"].startswith("benchmarks"))
+    logger.add(sys.stderr, level="WARNING", filter=lambda record: not record["name"].startswith("benchmarks"))
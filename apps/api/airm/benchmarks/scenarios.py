@@ -0,0 +1,130 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""The list, metrics and ingestion scenarios driven by the benchmark."""
+
+import random
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+import httpx
+from fastapi import Request
+
+from app import app
+from app.messaging.consumer import __process_message as process_message
+from app.utilities.request_timing import collect_timings
+from app.utilities.security import Roles, auth_token_claimset
+
+from .ingestion import BenchmarkMessage, SyntheticMessages
+from .measure import calls_from_server_timing
+from .seed import BENCHMARK_USER_EMAIL, SeededData
+from .stubs import StubKeycloakAdmin, StubPrometheus
+
+ADMIN = "admin"
+MEMBER = "member"
+MEMBER_PROJECTS = 10
+
+
+@dataclass
+class Scenario:
+    """A named call to benchmark, returning the number of calls it made per dependency."""
+
+    name: str
+    call: Callable[[], Awaitable[dict[str, int]]]
+
+
+def _claimsets(data: SeededData) -> dict[str, dict]:
+    base = {"email": BENCHMARK_USER_EMAIL, "sub": data.benchmark_keycloak_user_id, "iat": 1_700_000_000}
+    return {
+        ADMIN: {**base, "realm_access": {"roles": [Roles.PLATFORM_ADMINISTRATOR.value]}, "groups": []},
+        MEMBER: {**base, "realm_access": {"roles": []}, "groups": data.project_names[:MEMBER_PROJECTS]},
+    }
+
+
+@asynccontextmanager
+async def benchmark_client(data: SeededData, prometheus: StubPrometheus, keycloak: StubKeycloakAdmin):
+    """
+    Yield an HTTP client for the app with its external services stubbed out.
+
+    Requests are authenticated as the user named in the X-Benchmark-User header, ADMIN or MEMBER, instead of by JWT.
+    """
+    claimsets = _claimsets(data)
+
+    def claimset(request: Request) -> dict:
+        return claimsets[request.headers["X-Benchmark-User"]]
+
+    app.state.prometheus_client = prometheus
+    app.state.keycloak_admin_client = keycloak
+    app.dependency_overrides[auth_token_claimset] = claimset
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://airm") as client:
+            yield client
+    finally:
+        app.dependency_overrides.pop(auth_token_claimset, None)
+
+
+def build_scenarios(client: httpx.AsyncClient, data: SeededData, rng: random.Random) -> list[Scenario]:
+    member_project_ids = data.project_ids[:MEMBER_PROJECTS]
+
+    def get(user: str, path: Callable[[], str], params: Callable[[], dict] | None = None):
+        async def call() -> dict[str, int]:
+            response = await client.get(path(), params=params() if params else None, headers={"X-Benchmark-User": user})
+            response.raise_for_status()
+            return calls_from_server_timing(response.headers["Server-Timing"])
+
+        return call
+
+    def last_day() -> dict:
+        end = datetime.now(UTC)
+        return {"start": (end - timedelta(days=1)).isoformat(), "end": end.isoformat()}
+
+    def ingest(message: Callable[[], BenchmarkMessage]):
+        async def call() -> dict[str, int]:
+            with collect_timings() as timings:
+                await process_message(message(), app.state)
+            return {name: timing.count for name, timing in timings.dependencies.items()}
+
+        return call
+
+    messages = SyntheticMessages(data, rng)
+
+    return [
+        Scenario("list clusters (admin)", get(ADMIN, lambda: "/v1/clusters")),
+        Scenario("list projects (admin)", get(ADMIN, lambda: "/v1/projects")),
+        Scenario("list users (admin)", get(ADMIN, lambda: "/v1/users")),
+        Scenario("cluster stats (member)", get(MEMBER, lambda: "/v1/clusters/stats")),
+        Scenario("list workloads (member)", get(MEMBER, lambda: "/v1/workloads")),
+        Scenario(
+            "list project workloads (member)",
+            get(MEMBER, lambda: "/v1/workloads", lambda: {"project_id": str(rng.choice(member_project_ids))}),
+        ),
+        Scenario(
+            "project workloads metrics (member)",
+            get(
+                MEMBER,
+                lambda: f"/v1/projects/{rng.choice(member_project_ids)}/workloads/metrics",
+                lambda: {"page_size": 20},
+            ),
+        ),
+        Scenario(
+            "project GPU utilization 24h (member)",
+            get(
+                MEMBER,
+                lambda: f"/v1/projects/{rng.choice(member_project_ids)}/metrics/gpu_device_utilization",
+                last_day,
+            ),
+        ),
+        Scenario(
+            "cluster GPU utilization 24h (admin)",
+            get(ADMIN, lambda: f"/v1/clusters/{rng.choice(data.cluster_ids)}/metrics/gpu_device_utilization", last_day),
+        ),
+        Scenario(
+            "workload details metrics (admin)",
+            get(ADMIN, lambda: f"/v1/workloads/{rng.choice(data.workload_ids)}/metrics"),
+        ),
+        Scenario("ingest heartbeat", ingest(messages.heartbeat)),
+        Scenario("ingest workload status", ingest(messages.workload_status)),
+    ]
@@ -0,0 +1,302 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Micro-benchmark of building and serializing the largest AIRM responses.
+
+Usage (from apps/api/airm, no database needed):
+
+    uv run python -m benchmarks.serialization
+    uv run python -m benchmarks.serialization --clusters 1000 --series 200 --days 7
+
+For the cluster list and a project timeseries it compares two paths on the same input:
+
+- validated: schemas built one model at a time, or through an intermediate schema, then validated against the
+  response_model and encoded with json.dumps, the way FastAPI handles a returned model;
+- fast: schemas validated in one pass from plain data and serialized by PydanticJSONResponse, as the API does now.
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from app.clusters.models import Cluster
+from app.clusters.schemas import ClusterResources, ClusterResponse, Clusters, ClusterWithResources, GPUInfo
+from app.messaging.schemas import GPUVendor
+from app.metrics.constants import PROJECT_ID_METRIC_LABEL
+from app.metrics.schemas import Datapoint, DatapointsWithMetadata, MetricsTimeseries, ProjectDatapointMetadata
+from app.metrics.utils import map_timeseries_split_by_project
+from app.projects.enums import ProjectStatus
+from app.projects.models import Project
+from app.projects.schemas import ProjectResponse
+from app.utilities.fastapi import PydanticJSONResponse
+from app.utilities.schema import validate_from_attributes
+
+from .measure import percentile
+from .seed import (
+    CREATOR,
+    NODE_CPU_MILLI_CORES,
+    NODE_EPHEMERAL_STORAGE_BYTES,
+    NODE_GPU_COUNT,
+    NODE_GPU_PRODUCT_NAME,
+    NODE_GPU_TYPE,
+    NODE_GPU_VRAM_BYTES,
+    NODE_MEMORY_BYTES,
+)
+
+TIMESERIES_STEP_SECONDS = 300
+
+
+@dataclass
+class PayloadResult:
+    """Median timings in milliseconds of building and rendering one payload along both paths."""
+
+    response_bytes: int
+    build_validated_ms: float
+    build_fast_ms: float
+    render_validated_ms: float
+    render_fast_ms: float
+
+    @property
+    def speedup(self) -> float:
+        return (self.build_validated_ms + self.render_validated_ms) / (self.build_fast_ms + self.render_fast_ms)
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def make_clusters(count: int, rng: random.Random) -> list[Cluster]:
+    now = datetime.now(UTC)
+    return [
+        Cluster(
+            id=_uuid(rng),
+            name=f"cluster-{index}",
+            workloads_base_url=f"https://cluster-{index}.example.com",
+            kube_api_url=f"https://api.cluster-{index}.example.com:6443",
+            last_heartbeat_at=now - timedelta(seconds=rng.randint(0, 600)),
+            created_at=now - timedelta(days=30),
+            updated_at=now,
+            created_by=CREATOR,
+            updated_by=CREATOR,
+        )
+        for index in range(count)
+    ]
+
+
+def make_projects(count: int, rng: random.Random) -> list[Project]:
+    now = datetime.now(UTC)
+    return [
+        Project(
+            id=_uuid(rng),
+            name=f"project-{index}",
+            description=f"Project {index}",
+            cluster_id=_uuid(rng),
+            status=ProjectStatus.READY,
+            status_reason=None,
+            keycloak_group_id=str(_uuid(rng)),
+            created_at=now - timedelta(days=30),
+            updated_at=now,
+            created_by=CREATOR,
+            updated_by=CREATOR,
+        )
+        for index in range(count)
+    ]
+
+
+def make_timeseries_results(
+    projects: list[Project], start: datetime, end: datetime, rng: random.Random
+) -> list[dict[str, Any]]:
+    """Prometheus range query results with one series per project and the series without a project label."""
+    timestamps = range(int(start.timestamp()), int(end.timestamp()) + 1, TIMESERIES_STEP_SECONDS)
+    labels = [{}, *({PROJECT_ID_METRIC_LABEL: str(project.id)} for project in projects)]
+    return [
+        {"metric": metric, "values": [[timestamp, f"{rng.uniform(0, 100):.3f}"] for timestamp in timestamps]}
+        for metric in labels
+    ]
+
+
+def _cluster_resources(rng: random.Random) -> dict[str, Any]:
+    nodes = 4
+    return {
+        "available_resources": ClusterResources(
+            cpu_milli_cores=nodes * NODE_CPU_MILLI_CORES,
+            memory_bytes=nodes * NODE_MEMORY_BYTES,
+            ephemeral_storage_bytes=nodes * NODE_EPHEMERAL_STORAGE_BYTES,
+            gpu_count=nodes * NODE_GPU_COUNT,
+        ),
+        "allocated_resources": ClusterResources(
+            cpu_milli_cores=rng.randint(0, nodes * NODE_CPU_MILLI_CORES),
+            memory_bytes=rng.randint(0, nodes * NODE_MEMORY_BYTES),
+            ephemeral_storage_bytes=rng.randint(0, nodes * NODE_EPHEMERAL_STORAGE_BYTES),
+            gpu_count=rng.randint(0, nodes * NODE_GPU_COUNT),
+        ),
+        "gpu_info": GPUInfo(
+            vendor=GPUVendor.AMD,
+            type=NODE_GPU_TYPE,
+            memory_bytes_per_device=NODE_GPU_VRAM_BYTES,
+            name=NODE_GPU_PRODUCT_NAME,
+        ),
+        "total_node_count": nodes,
+        "available_node_count": nodes,
+        "assigned_quota_count": rng.randint(0, 20),
+    }
+
+
+def _time(call: Callable[[], Any], iterations: int) -> tuple[float, Any]:
+    durations = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = call()
+        durations.append((time.perf_counter() - started) * 1000)
+    return percentile(durations, 50), result
+
+
+def _render_validated(response_model: type[BaseModel], content: BaseModel) -> JSONResponse:
+    """Validate and encode the content like FastAPI does for a route with a response_model."""
+    adapter = TypeAdapter(response_model)
+    return JSONResponse(adapter.dump_python(adapter.validate_python(content, from_attributes=True), mode="json"))
+
+
+def compare(
+    response_model: type[BaseModel],
+    build_validated: Callable[[], BaseModel],
+    build_fast: Callable[[], BaseModel],
+    iterations: int,
+) -> PayloadResult:
+    build_validated_ms, validated = _time(build_validated, iterations)
+    build_fast_ms, fast = _time(build_fast, iterations)
+    render_validated_ms, validated_response = _time(lambda: _render_validated(response_model, validated), iterations)
+    render_fast_ms, fast_response = _time(lambda: PydanticJSONResponse(fast), iterations)
+
+    if json.loads(validated_response.body) != json.loads(fast_response.body):
+        raise AssertionError(f"The fast path renders a different {response_model.__name__} response")
+    return PayloadResult(
+        response_bytes=len(fast_response.body),
+        build_validated_ms=build_validated_ms,
+        build_fast_ms=build_fast_ms,
+        render_validated_ms=render_validated_ms,
+        render_fast_ms=render_fast_ms,
+    )
+
+
+def benchmark_cluster_list(clusters: int, iterations: int, rng: random.Random) -> PayloadResult:
+    entities = make_clusters(clusters, rng)
+    resources = {cluster.id: _cluster_resources(rng) for cluster in entities}
+
+    def build_validated() -> Clusters:
+        return Clusters(
+            data=[
+                ClusterWithResources(
+                    **ClusterResponse.model_validate(cluster).model_dump(exclude={"status"}), **resources[cluster.id]
+                )
+                for cluster in entities
+            ]
+        )
+
+    def build_fast() -> Clusters:
+        return Clusters(
+            data=[
+                validate_from_attributes(ClusterWithResources, cluster, **resources[cluster.id]) for cluster in entities
+            ]
+        )
+
+    return compare(Clusters, build_validated, build_fast, iterations)
+
+
+def benchmark_timeseries(series: int, days: int, iterations: int, rng: random.Random) -> PayloadResult:
+    end = datetime.now(UTC).replace(microsecond=0)
+    start = end - timedelta(days=days)
+    projects = make_projects(series, rng)
+    results = make_timeseries_results(projects, start, end, rng)
+
+    # Both paths parse the Prometheus results the same way, so only the construction of the schemas is compared.
+    parsed = map_timeseries_split_by_project(results, projects, start, end, TIMESERIES_STEP_SECONDS, "utilization")
+    series_values = [
+        (project, [(point.timestamp, point.value) for point in series.values])
+        for project, series in zip(projects, parsed.data, strict=True)
+    ]
+
+    def build_validated() -> MetricsTimeseries:
+        return MetricsTimeseries(
+            data=[
+                DatapointsWithMetadata(
+                    metadata=ProjectDatapointMetadata(
+                        project=ProjectResponse.model_validate(project), label="utilization"
+                    ),
+                    values=[Datapoint(timestamp=timestamp, value=value) for timestamp, value in values],
+                )
+                for project, values in series_values
+            ],
+            range=parsed.range,
+        )
+
+    def build_fast() -> MetricsTimeseries:
+        return MetricsTimeseries.model_validate(
+            {
+                "data": [
+                    {
+                        "metadata": ProjectDatapointMetadata(
+                            project=ProjectResponse.model_validate(project), label="utilization"
+                        ),
+                        "values": [{"timestamp": timestamp, "value": value} for timestamp, value in values],
+                    }
+                    for project, values in series_values
+                ],
+                "range": parsed.range,
+            }
+        )
+
+    return compare(MetricsTimeseries, build_validated, build_fast, iterations)
+
+
+def print_results(results: dict[str, PayloadResult]) -> None:
+    header = f"{'payload':<24} {'KiB':>8} {'build ms':>10} {'fast':>8} {'render ms':>10} {'fast':>8} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        print(
+            f"{name:<24} {result.response_bytes / 1024:>8.0f} {result.build_validated_ms:>10.2f} "
+            f"{result.build_fast_ms:>8.2f} {result.render_validated_ms:>10.2f} {result.render_fast_ms:>8.2f} "
+            f"{result.speedup:>7.1f}x"
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.serialization", description=__doc__.split("\n\n")[0].strip()
+    )
+    parser.add_argument("--clusters", type=int, default=1000, help="Clusters in the cluster list")
+    parser.add_argument("--series", type=int, default=100, help="Project series in the timeseries")
+    parser.add_argument("--days", type=int, default=7, help="Days covered by the timeseries, at a 5 minute step")
+    parser.add_argument("--iterations", type=int, default=20, help="Measured runs per path")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    rng = random.Random(0)
+    print_results(
+        {
+            f"cluster list ({args.clusters})": benchmark_cluster_list(args.clusters, args.iterations, rng),
+            f"timeseries ({args.series}x{args.days}d)": benchmark_timeseries(
+                args.series, args.days, args.iterations, rng
+            ),
+        }
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
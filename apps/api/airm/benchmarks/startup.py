@@ -0,0 +1,107 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Profile the import and startup time of the AIRM API.
+
+Usage (from apps/api/airm):
+
+    uv run python -m benchmarks.startup
+    uv run python -m benchmarks.startup --startup --max-import-seconds 3
+
+Reports the time to import the app in a fresh interpreter, the modules imported by the app package that take the
+longest according to `python -X importtime`, and the time to generate the MCP tools, which happens on the first MCP request. With
+--startup it also runs the application startup against the database, Keycloak, Prometheus and RabbitMQ configured
+in the environment.
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+APP_ROOT = Path(__file__).parent.parent
+
+IMPORT_APP = "import time; start = time.perf_counter(); import app; print(time.perf_counter() - start)"
+PROFILE_MCP = "import time; import app; start = time.perf_counter(); app.mcp.server; print(time.perf_counter() - start)"
+PROFILE_STARTUP = """
+import asyncio, time
+import app
+
+async def main():
+    start = time.perf_counter()
+    async with app.app.router.lifespan_context(app.app):
+        print(time.perf_counter() - start)
+
+asyncio.run(main())
+"""
+
+# Lines of `python -X importtime` output: "import time: <self us> | <cumulative us> | <indented module name>"
+IMPORT_TIME_LINE = re.compile(
+    r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|(?P<indent> +)(?P<module>\S+)$"
+)
+
+
+def _run(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code], cwd=APP_ROOT, capture_output=True, text=True, check=True
+    )
+
+
+def _seconds(completed: subprocess.CompletedProcess[str]) -> float:
+    return float(completed.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(importtime_output: str, count: int) -> list[tuple[str, float]]:
+    """Return the modules imported by the app package with the largest cumulative import time, in seconds."""
+    imported = []
+    for line in importtime_output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        # The name is indented by one space for `import app` itself and two more for each level of nesting
+        if match and len(match["indent"]) == 3:
+            imported.append((match["module"], int(match["cumulative"]) / 1_000_000))
+    return sorted(imported, key=lambda item: item[1], reverse=True)[:count]
+
+
+def profile_imports(runs: int, count: int) -> tuple[float, list[tuple[str, float]]]:
+    """Return the median time to import the app in a fresh interpreter, and the slowest imports of one run."""
+    median = statistics.median(_seconds(_run(IMPORT_APP)) for _ in range(runs))
+    profile = _run("import app", "-X", "importtime")
+    return median, slowest_imports(profile.stderr, count)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to time the import in")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    parser.add_argument(
+        "--startup", action="store_true", help="Also run the application startup against the configured services"
+    )
+    parser.add_argument(
+        "--max-import-seconds", type=float, help="Exit with status 1 if the median import time exceeds this"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    import_seconds, imports = profile_imports(args.runs, args.top)
+    print(f"{'import app (median of ' + str(args.runs) + ')':<48} {import_seconds:>8.3f} s")
+    for module, seconds in imports:
+        print(f"  {module:<46} {seconds:>8.3f} s")
+    print(f"{'MCP tools, on first MCP request':<48} {_seconds(_run(PROFILE_MCP)):>8.3f} s")
+    if args.startup:
+        print(f"{'application startup':<48} {_seconds(_run(PROFILE_STARTUP)):>8.3f} s")
+
+    if args.max_import_seconds is not None and import_seconds > args.max_import_seconds:
+        print(f"Importing the app took {import_seconds:.3f} s, more than {args.max_import_seconds} s", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
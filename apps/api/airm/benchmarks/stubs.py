@@ -0,0 +1,161 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Stand-ins for the external services of AIRM with realistic payload sizes and latencies.
+
+AIRM does not call the Kubernetes API itself: clusters report their state over RabbitMQ, so the cluster side is
+stood in for by the queue messages of the ingestion scenarios instead of a stub here.
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any
+from unittest.mock import patch
+
+from app.messaging import sender
+from app.metrics.constants import (
+    CLUSTER_NAME_METRIC_LABEL,
+    GPU_ID_METRIC_LABEL,
+    GPU_UUID_METRIC_LABEL,
+    HOSTNAME_METRIC_LABEL,
+    PROJECT_ID_METRIC_LABEL,
+    WORKLOAD_ID_METRIC_LABEL,
+)
+from app.utilities.request_timing import timed
+
+from .seed import SeededData
+
+
+class StubPrometheus:
+    """
+    Answers the PrometheusConnect queries AIRM makes with synthetic GPU series.
+
+    Every query returns series_per_query series labelled with seeded clusters, nodes, projects and workloads, so the
+    mapping code in app.metrics does the same amount of work as against a busy cluster. Calls block their worker
+    thread for latency seconds, as the real client does.
+    """
+
+    def __init__(self, data: SeededData, *, series_per_query: int = 64, latency: float = 0.02, seed: int = 0) -> None:
+        self.data = data
+        self.series_per_query = series_per_query
+        self.latency = latency
+        self.rng = random.Random(seed)
+
+    def _labels(self, index: int) -> dict[str, str]:
+        data = self.data
+        return {
+            "__name__": "gpu_gfx_activity",
+            CLUSTER_NAME_METRIC_LABEL: data.cluster_names[index % len(data.cluster_names)],
+            HOSTNAME_METRIC_LABEL: data.node_hostnames[index % len(data.node_hostnames)],
+            GPU_ID_METRIC_LABEL: str(index % 8),
+            GPU_UUID_METRIC_LABEL: f"GPU-{index:08x}-0000-0000-0000-000000000000",
+            PROJECT_ID_METRIC_LABEL: str(data.project_ids[index % len(data.project_ids)]),
+            WORKLOAD_ID_METRIC_LABEL: str(data.workload_ids[index % len(data.workload_ids)]),
+            "card_model": "Instinct MI300X",
+            "job": "amd-device-metrics-exporter",
+        }
+
+    def custom_query(self, query: str, params: dict | None = None) -> list[dict[str, Any]]:
+        time.sleep(self.latency)
+        now = time.time()
+        return [
+            {"metric": self._labels(i), "value": [now, f"{self.rng.uniform(0, 100):.2f}"]}
+            for i in range(self.series_per_query)
+        ]
+
+    def custom_query_range(
+        self, query: str, start_time: datetime, end_time: datetime, step: str, params: dict | None = None
+    ) -> list[dict[str, Any]]:
+        time.sleep(self.latency)
+        start = int(start_time.timestamp())
+        end = int(end_time.timestamp())
+        timestamps = range(start, end + 1, max(int(float(step)), 1))
+        return [
+            {"metric": self._labels(i), "values": [[t, f"{self.rng.uniform(0, 100):.2f}"] for t in timestamps]}
+            for i in range(self.series_per_query)
+        ]
+
+
+class StubKeycloakAdmin:
+    """
+    Answers the KeycloakAdmin calls of the benchmarked paths with user representations for the seeded users.
+
+    Calls are recorded as "keycloak" timings, like the instrumented HTTP client of the real admin client does.
+    """
+
+    def __init__(self, data: SeededData, *, latency: float = 0.02, platform_administrators: int = 5) -> None:
+        self.latency = latency
+        self.users = [
+            {
+                "id": keycloak_user_id,
+                "username": f"user-{i}@example.com",
+                "email": f"user-{i}@example.com",
+                "firstName": f"First{i}",
+                "lastName": f"Last{i}",
+                "emailVerified": True,
+                "enabled": True,
+                "createdTimestamp": 1_700_000_000_000 + i,
+                "totp": False,
+                "attributes": {"locale": ["en"]},
+                "requiredActions": [],
+                "notBefore": 0,
+                "access": {
+                    "manageGroupMembership": True,
+                    "view": True,
+                    "mapRoles": True,
+                    "impersonate": False,
+                    "manage": True,
+                },
+            }
+            for i, keycloak_user_id in enumerate(data.keycloak_user_ids)
+        ]
+        self.users_by_id = {user["id"]: user for user in self.users}
+        self.platform_administrators = self.users[:platform_administrators]
+
+    async def _call(self, name: str, result: Any) -> Any:
+        with timed("keycloak", name):
+            await asyncio.sleep(self.latency)
+        return result
+
+    async def a_get_users(self, query: dict | None = None) -> list[dict]:
+        return await self._call("GET /users", self.users)
+
+    async def a_get_user(self, user_id: str) -> dict:
+        return await self._call("GET /users/{id}", self.users_by_id.get(user_id))
+
+    async def a_get_realm_role_members(self, role_name: str, query: dict | None = None) -> list[dict]:
+        return await self._call("GET /roles/{role-name}/users", self.platform_administrators)
+
+
+class InProcessBroker:
+    """
+    Stands in for RabbitMQ where the handlers publish messages to clusters, keeping the published messages.
+
+    Publishing is recorded as "rabbitmq" timings, like the real publisher does.
+    """
+
+    def __init__(self) -> None:
+        self.published: list[tuple[str, str]] = []
+
+    async def get_connection_to_cluster_vhost(self, cluster_id: Any, *args: Any) -> tuple[None, None]:
+        return None, None
+
+    async def publish_message_to_queue(
+        self, connection: Any, queue_name: str, message_body: str, user_id: str, channel: Any = None
+    ) -> None:
+        with timed("rabbitmq", queue_name):
+            self.published.append((queue_name, message_body))
+
+    @contextmanager
+    def installed(self) -> Iterator["InProcessBroker"]:
+        with (
+            patch.object(sender, "get_connection_to_cluster_vhost", self.get_connection_to_cluster_vhost),
+            patch.object(sender, "publish_message_to_queue", self.publish_message_to_queue),
+        ):
+            yield self
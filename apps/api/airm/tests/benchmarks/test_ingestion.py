@@ -0,0 +1,132 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+import json
+import random
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from benchmarks import ingestion
+from benchmarks.ingestion import (
+    IngestionResult,
+    MessageTypeResult,
+    SyntheticMessages,
+    compare_with_baseline,
+    load_stream,
+    parse_mix,
+    replay,
+)
+from benchmarks.seed import SeededData
+from loguru import logger
+from starlette.datastructures import State
+
+from app.messaging import sender
+from app.messaging.schemas import MessageAdapter
+from app.utilities.request_timing import record_timing
+
+
+def _seeded_data() -> SeededData:
+    cluster_id = uuid4()
+    return SeededData(
+        cluster_ids=[cluster_id],
+        cluster_names=["cluster-0"],
+        project_ids=[uuid4(), uuid4()],
+        project_names=["project-0", "project-1"],
+        project_cluster_ids=[cluster_id, cluster_id],
+        workload_ids=[uuid4()],
+        workload_cluster_ids=[cluster_id],
+        workload_component_ids=[uuid4()],
+        workload_component_names=["workload-0"],
+        node_hostnames=["cluster-0-node-0"],
+        cluster_node_names={cluster_id: ["cluster-0-node-0"]},
+    )
+
+
+def test_synthetic_stream_contains_valid_messages_in_mix():
+    data = _seeded_data()
+    messages = SyntheticMessages(data, random.Random(0)).stream(200)
+
+    assert {message.message_type for message in messages} == set(ingestion.DEFAULT_MIX)
+    for message in messages:
+        assert message.user_id == str(data.cluster_ids[0])
+        MessageAdapter.validate_json(message.body.decode())
+
+    quotas = next(message for message in messages if message.message_type == "cluster_quotas_status")
+    assert [allocation["quota_name"] for allocation in json.loads(quotas.body)["quota_allocations"]] == [
+        "project-0",
+        "project-1",
+    ]
+
+
+def test_synthetic_stream_rejects_unknown_message_types():
+    with pytest.raises(ValueError, match="workload"):
+        SyntheticMessages(_seeded_data(), random.Random(0)).stream(10, {"workload": 1})
+
+
+def test_load_stream(tmp_path: Path):
+    path = tmp_path / "stream.jsonl"
+    path.write_text(json.dumps({"user_id": "cluster-id", "body": {"message_type": "heartbeat"}}) + "\n\n")
+
+    [message] = load_stream(path)
+
+    assert message.user_id == "cluster-id"
+    assert message.message_type == "heartbeat"
+
+
+def test_parse_mix():
+    assert parse_mix("heartbeat=3, cluster_nodes=1") == {"heartbeat": 3, "cluster_nodes": 1}
+
+
+@pytest.mark.asyncio
+async def test_replay_reports_statements_errors_and_published_messages(monkeypatch: pytest.MonkeyPatch):
+    async def process_message(message, app_state):
+        record_timing("db", 0.001, "SELECT clusters")
+        if message.message_type == "cluster_nodes":
+            record_timing("db", 0.001, "UPDATE cluster_nodes")
+            await sender.publish_message_to_queue(None, message.user_id, "{}", "airm")
+        if message.message_type == "heartbeat":
+            logger.error("Cluster not found")
+
+    monkeypatch.setattr(ingestion, "process_message", process_message)
+    messages = SyntheticMessages(_seeded_data(), random.Random(0)).stream(
+        30, {"heartbeat": 1, "cluster_nodes": 1, "workload_status_update": 1}
+    )
+
+    result = await replay(messages, State(), concurrency=3)
+
+    counts = {message_type: 0 for message_type in result.types}
+    for message in messages:
+        counts[message.message_type] += 1
+    assert result.messages == 30
+    assert {message_type: r.messages for message_type, r in result.types.items()} == counts
+    assert result.types["cluster_nodes"].statements_per_message == 2
+    assert result.types["heartbeat"].statements_per_message == 1
+    assert result.errors == counts["heartbeat"]
+    assert result.published == counts["cluster_nodes"]
+
+
+def test_compare_with_baseline():
+    baseline = IngestionResult(
+        messages=100,
+        seconds=1.0,
+        messages_per_second=100.0,
+        errors=0,
+        published=0,
+        types={"heartbeat": MessageTypeResult(messages=100, p50_ms=5.0, p95_ms=10.0, statements_per_message=2.0)},
+    )
+    slower = IngestionResult(
+        messages=100,
+        seconds=1.5,
+        messages_per_second=70.0,
+        errors=0,
+        published=0,
+        types={"heartbeat": MessageTypeResult(messages=100, p50_ms=5.0, p95_ms=11.0, statements_per_message=3.0)},
+    )
+
+    assert compare_with_baseline(baseline, baseline, tolerance=0.2) == []
+    assert compare_with_baseline(slower, baseline, tolerance=0.2) == [
+        "messages per second 70.0 below baseline 100.0",
+        "heartbeat: statements per message 3.0 exceeds baseline 2.0",
+    ]
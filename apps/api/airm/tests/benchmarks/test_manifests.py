@@ -0,0 +1,25 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+import random
+
+import pytest
+from benchmarks.manifests import (
+    benchmark_manifest,
+    deployment_manifest,
+    large_config_manifest,
+    many_documents_manifest,
+)
+
+
+@pytest.mark.parametrize(
+    "documents",
+    [deployment_manifest(), many_documents_manifest(10), large_config_manifest(random.Random(0), size_bytes=4096)],
+    ids=["deployment", "many documents", "large config"],
+)
+def test_codec_parses_manifest_shapes_like_pure_python_loader(documents):
+    result = benchmark_manifest(documents, iterations=1)
+
+    assert result.documents == len(documents)
+    assert result.manifest_bytes > 0
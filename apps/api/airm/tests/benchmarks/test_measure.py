@@ -0,0 +1,67 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+from pathlib import Path
+
+import pytest
+from benchmarks.measure import (
+    ScenarioResult,
+    calls_from_server_timing,
+    compare_with_baseline,
+    load_baseline,
+    measure,
+    percentile,
+    save_baseline,
+)
+
+
+def test_percentile_interpolates_between_ranks():
+    values = [4.0, 1.0, 3.0, 2.0, 5.0]
+
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 95) == pytest.approx(4.8)
+    assert percentile([7.0], 95) == 7.0
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+def test_calls_from_server_timing():
+    header = 'db;dur=5.0;desc="12 calls", keycloak;dur=10.0;desc="1 call", total;dur=100.0'
+
+    assert calls_from_server_timing(header) == {"db": 12, "keycloak": 1}
+
+
+@pytest.mark.asyncio
+async def test_measure_reports_most_queries_of_any_call():
+    counts = iter([{"db": 3}, {"db": 5}, {"db": 4}, {}])
+
+    async def call() -> dict[str, int]:
+        return next(counts, {"db": 1})
+
+    result = await measure(call, iterations=3, warmup=1)
+
+    assert result.queries == 5
+    assert result.p50_ms <= result.p95_ms
+    assert result.peak_memory_kib >= 0
+
+
+def test_compare_with_baseline(tmp_path: Path):
+    path = tmp_path / "baselines" / "small.json"
+    save_baseline(
+        path, "small", {"list clusters": ScenarioResult(p50_ms=10.0, p95_ms=20.0, queries=4, peak_memory_kib=100.0)}
+    )
+    baseline = load_baseline(path)
+
+    within_tolerance = {"list clusters": ScenarioResult(p50_ms=11.0, p95_ms=23.0, queries=4, peak_memory_kib=110.0)}
+    assert compare_with_baseline(within_tolerance, baseline, tolerance=0.2) == []
+
+    regressed = {
+        "list clusters": ScenarioResult(p50_ms=11.0, p95_ms=30.0, queries=5, peak_memory_kib=100.0),
+        "new scenario": ScenarioResult(p50_ms=1.0, p95_ms=1.0, queries=1, peak_memory_kib=1.0),
+    }
+    assert compare_with_baseline(regressed, baseline, tolerance=0.2) == [
+        "list clusters: p95_ms 30.0 exceeds baseline 20.0",
+        "list clusters: queries 5 exceeds baseline 4",
+    ]
+    assert load_baseline(tmp_path / "missing.json") is None
@@ -0,0 +1,19 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+import random
+
+from benchmarks.serialization import benchmark_cluster_list, benchmark_timeseries
+
+
+def test_cluster_list_paths_render_the_same_response():
+    result = benchmark_cluster_list(5, iterations=1, rng=random.Random(0))
+
+    assert result.response_bytes > 0
+
+
+def test_timeseries_paths_render_the_same_response():
+    result = benchmark_timeseries(3, days=1, iterations=1, rng=random.Random(0))
+
+    assert result.response_bytes > 0
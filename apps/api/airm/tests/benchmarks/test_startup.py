@@ -0,0 +1,20 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+from benchmarks.startup import slowest_imports
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 | site
+import time:       300 |        300 |     pydantic.main
+import time:       500 |        800 |   pydantic
+import time:      2000 |       2000 |   fastapi
+import time:      1000 |       1000 |     app.clusters
+import time:       400 |       1400 |   app.clusters.router
+import time:       100 |       4300 | app
+"""
+
+
+def test_slowest_imports_lists_modules_imported_by_the_app_package():
+    assert slowest_imports(IMPORTTIME_OUTPUT, 2) == [("fastapi", 0.002), ("app.clusters.router", 0.0014)]
@@ -353,6 +353,7 @@ async def global_init_dependencies(monkeypatch):
         patch("app.configure_queues_for_common_vhost", autospec=True),
         patch("app.start_consuming_from_common_feedback_queue", autospec=True),
         patch("app.start_metrics_server", autospec=True),
+        patch("app.start_gpu_usage_rollups", autospec=True),
         patch("app.init_keycloak_admin_client") as mock_init_kc,
         patch("app.init_prometheus_client") as mock_init_prometheus,
     ):
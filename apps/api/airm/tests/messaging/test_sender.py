@@ -57,6 +57,58 @@ async def test_message_sender_flush_sends_all_messages():
         assert len(sender._messages) == 0
 
 
+@pytest.mark.asyncio
+async def test_message_sender_flush_connects_once_per_cluster_run():
+    """Test that consecutive messages for a cluster are published over one connection, in order."""
+    with (
+        patch("app.messaging.sender.get_connection_to_cluster_vhost") as mock_connect,
+        patch("app.messaging.sender.publish_message_to_queue") as mock_publish,
+    ):
+        mock_connect.return_value = (object(), object())
+        mock_publish.return_value = None
+
+        sender = MessageSender()
+        cluster_id = uuid4()
+        for index in range(3):
+            message = MagicMock()
+            message.json.return_value = f'{{"index": {index}}}'
+            await sender.enqueue(cluster_id, message)
+
+        await sender.flush()
+
+        mock_connect.assert_awaited_once()
+        assert [call.args[2] for call in mock_publish.await_args_list] == [
+            '{"index": 0}',
+            '{"index": 1}',
+            '{"index": 2}',
+        ]
+        assert len(sender._messages) == 0
+
+
+@pytest.mark.asyncio
+async def test_message_sender_flush_keeps_failed_and_remaining_messages():
+    """Test that a failed publish raises and leaves the failed and unsent messages queued."""
+    with (
+        patch("app.messaging.sender.get_connection_to_cluster_vhost") as mock_connect,
+        patch("app.messaging.sender.publish_message_to_queue") as mock_publish,
+    ):
+        mock_connect.return_value = (object(), object())
+        mock_publish.side_effect = [None, ConnectionError("channel closed"), None]
+
+        sender = MessageSender()
+        cluster_id1 = uuid4()
+        cluster_id2 = uuid4()
+        sent, failed, remaining = MagicMock(), MagicMock(), MagicMock()
+        await sender.enqueue(cluster_id1, sent)
+        await sender.enqueue(cluster_id1, failed)
+        await sender.enqueue(cluster_id2, remaining)
+
+        with pytest.raises(ConnectionError):
+            await sender.flush()
+
+        assert sender._messages == [(cluster_id1, failed), (cluster_id2, remaining)]
+
+
 @pytest.mark.asyncio
 async def test_message_sender_scope_sends_on_success():
     """Test that message_sender_scope sends messages on successful exit."""
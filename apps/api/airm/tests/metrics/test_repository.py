@@ -0,0 +1,104 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.metrics.repository import (
+    get_latest_gpu_usage_hour,
+    get_project_gpu_usage_totals,
+    get_workload_gpu_usage_totals,
+    upsert_project_gpu_usage,
+    upsert_workload_gpu_usage,
+)
+from tests import factory  # type: ignore[attr-defined]
+
+HOUR = datetime(2025, 3, 10, 12, 0, 0, tzinfo=UTC)
+
+
+def _project_row(project_id, hour: datetime, allocated: float, utilized: float) -> dict:
+    return {
+        "project_id": project_id,
+        "hour": hour,
+        "allocated_gpu_hours": allocated,
+        "utilized_gpu_hours": utilized,
+        "allocated_vram_mb_hours": allocated * 1000,
+        "utilized_vram_mb_hours": utilized * 500,
+    }
+
+
+@pytest.mark.asyncio
+async def test_upsert_project_gpu_usage_replaces_existing_hour(db_session: AsyncSession) -> None:
+    env = await factory.create_basic_test_environment(db_session)
+
+    await upsert_project_gpu_usage(db_session, [_project_row(env.project.id, HOUR, 4, 1)])
+    await upsert_project_gpu_usage(db_session, [_project_row(env.project.id, HOUR, 4, 2)])
+
+    totals = await get_project_gpu_usage_totals(db_session, env.project.id, HOUR, HOUR + timedelta(hours=1))
+    assert totals.utilized_gpu_hours == 2
+    assert await get_latest_gpu_usage_hour(db_session) == HOUR
+
+
+@pytest.mark.asyncio
+async def test_get_project_gpu_usage_totals_over_range(db_session: AsyncSession) -> None:
+    env = await factory.create_basic_test_environment(db_session)
+    await upsert_project_gpu_usage(
+        db_session,
+        [
+            _project_row(env.project.id, HOUR, 4, 1),
+            _project_row(env.project.id, HOUR + timedelta(hours=1), 4, 4),
+            _project_row(env.project.id, HOUR + timedelta(hours=2), 0, 0),
+            _project_row(env.project.id, HOUR + timedelta(hours=3), 4, 0),
+        ],
+    )
+
+    totals = await get_project_gpu_usage_totals(db_session, env.project.id, HOUR, HOUR + timedelta(hours=3))
+
+    assert totals.allocated_gpu_hours == 8
+    assert totals.utilized_gpu_hours == 5
+    assert totals.allocated_vram_mb_hours == 8000
+    # 3/4 of the first hour idle, the fully utilized and unallocated hours add nothing
+    assert totals.idle_seconds == pytest.approx(2700)
+
+
+@pytest.mark.asyncio
+async def test_get_project_gpu_usage_totals_empty(db_session: AsyncSession) -> None:
+    totals = await get_project_gpu_usage_totals(db_session, uuid4(), HOUR, HOUR + timedelta(days=30))
+
+    assert totals.allocated_gpu_hours == 0
+    assert totals.idle_seconds == 0
+
+
+@pytest.mark.asyncio
+async def test_get_workload_gpu_usage_totals(db_session: AsyncSession) -> None:
+    env = await factory.create_basic_test_environment(db_session)
+    busy_workload_id = uuid4()
+    quiet_workload_id = uuid4()
+    await upsert_workload_gpu_usage(
+        db_session,
+        [
+            {
+                "project_id": env.project.id,
+                "workload_id": workload_id,
+                "hour": HOUR + timedelta(hours=offset),
+                "utilized_gpu_hours": gpu_hours,
+                "utilized_vram_mb_hours": 100,
+            }
+            for workload_id, offset, gpu_hours in (
+                (busy_workload_id, 0, 2),
+                (busy_workload_id, 1, 2),
+                (quiet_workload_id, 0, 1),
+            )
+        ],
+    )
+
+    totals = await get_workload_gpu_usage_totals(db_session, env.project.id, HOUR, HOUR + timedelta(hours=2))
+
+    assert [(row.workload_id, row.utilized_gpu_hours, row.utilized_vram_mb_hours) for row in totals] == [
+        (busy_workload_id, 4, 200),
+        (quiet_workload_id, 1, 100),
+    ]
@@ -0,0 +1,176 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from prometheus_api_client import PrometheusConnect
+
+from app.metrics.rollups import get_last_closed_hour, roll_up_gpu_usage, roll_up_hour
+
+HOUR = datetime(2025, 3, 10, 12, 0, 0, tzinfo=UTC)
+
+
+def _series(value: str, **labels: str) -> dict:
+    return {"metric": labels, "value": [(HOUR + timedelta(hours=1)).timestamp(), value]}
+
+
+def _session(lock_acquired: bool = True) -> AsyncMock:
+    session = AsyncMock()
+    session.scalar.return_value = lock_acquired
+    return session
+
+
+@patch("app.metrics.rollups.GPU_USAGE_ROLLUP_SETTLE_SECONDS", 300)
+def test_get_last_closed_hour_waits_for_settling() -> None:
+    assert get_last_closed_hour(datetime(2025, 3, 10, 13, 4, tzinfo=UTC)) == datetime(2025, 3, 10, 11, tzinfo=UTC)
+    assert get_last_closed_hour(datetime(2025, 3, 10, 13, 6, tzinfo=UTC)) == datetime(2025, 3, 10, 12, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+@patch("app.metrics.rollups.upsert_workload_gpu_usage", autospec=True)
+@patch("app.metrics.rollups.upsert_project_gpu_usage", autospec=True)
+@patch("app.metrics.rollups.a_custom_query", autospec=True)
+async def test_roll_up_hour_builds_project_and_workload_rows(
+    mock_query: AsyncMock, mock_upsert_projects: AsyncMock, mock_upsert_workloads: AsyncMock
+) -> None:
+    project_id = uuid4()
+    idle_project_id = uuid4()
+    workload_id = uuid4()
+
+    def query_results(client: PrometheusConnect, query: str, params: dict) -> list[dict]:
+        assert params == {"time": (HOUR + timedelta(hours=1)).timestamp()}
+        assert query.startswith("sum_over_time((") and query.endswith(")[1h:1m]) / 60")
+        if "workload_id" in query:
+            series = _series("1.5", project_id=str(project_id), workload_id=str(workload_id))
+            unknown_project = _series("3", project_id=str(uuid4()), workload_id=str(uuid4()))
+            return [series, unknown_project]
+        if "allocated_gpus" in query:
+            return [_series("4", project_id=str(project_id))]
+        if "gpu_gfx_activity" in query:
+            return [_series("1.5", project_id=str(project_id)), _series("NaN", project_id="not-a-uuid")]
+        return []
+
+    mock_query.side_effect = query_results
+    session = _session()
+
+    await roll_up_hour(session, MagicMock(spec=PrometheusConnect), HOUR, {project_id, idle_project_id})
+
+    assert mock_query.await_count == 6
+    project_rows = {row["project_id"]: row for row in mock_upsert_projects.call_args.args[1]}
+    assert project_rows[project_id] == {
+        "project_id": project_id,
+        "hour": HOUR,
+        "allocated_gpu_hours": 4.0,
+        "utilized_gpu_hours": 1.5,
+        "allocated_vram_mb_hours": 0.0,
+        "utilized_vram_mb_hours": 0.0,
+    }
+    assert project_rows[idle_project_id]["allocated_gpu_hours"] == 0.0
+    assert mock_upsert_workloads.call_args.args[1] == [
+        {
+            "project_id": project_id,
+            "workload_id": workload_id,
+            "hour": HOUR,
+            "utilized_gpu_hours": 1.5,
+            "utilized_vram_mb_hours": 1.5,
+        }
+    ]
+
+
+class _Rollups:
+    """Stores rolled up hours in memory and hands out one session per transaction, recording committed ones."""
+
+    def __init__(self, lock_acquired: bool = True, fail_at: datetime | None = None) -> None:
+        self.lock_acquired = lock_acquired
+        self.fail_at = fail_at
+        self.stored: list[datetime] = []
+        self.committed: list[AsyncMock] = []
+
+    @asynccontextmanager
+    async def session_scope(self) -> AsyncIterator[AsyncMock]:
+        session = _session(self.lock_acquired)
+        session.pending = []
+        yield session
+        self.stored.extend(session.pending)
+        self.committed.append(session)
+
+    async def roll_up_hour(self, session: AsyncMock, client: PrometheusConnect, hour: datetime, _: set) -> None:
+        if hour == self.fail_at:
+            raise RuntimeError("Prometheus unavailable")
+        session.pending.append(hour)
+
+    async def get_latest_gpu_usage_hour(self, session: AsyncMock) -> datetime | None:
+        return max(self.stored, default=None)
+
+    @contextmanager
+    def patched(self, latest: datetime | None = None) -> Iterator[None]:
+        if latest:
+            self.stored.append(latest)
+        with (
+            patch("app.metrics.rollups.session_scope", self.session_scope),
+            patch("app.metrics.rollups.roll_up_hour", self.roll_up_hour),
+            patch("app.metrics.rollups.get_latest_gpu_usage_hour", self.get_latest_gpu_usage_hour),
+            patch("app.metrics.rollups.get_project_ids", AsyncMock(return_value=[uuid4()])) as get_project_ids,
+        ):
+            self.get_project_ids = get_project_ids
+            yield
+
+
+@pytest.mark.asyncio
+@patch("app.metrics.rollups.GPU_USAGE_ROLLUP_SETTLE_SECONDS", 300)
+async def test_roll_up_gpu_usage_commits_each_hour_after_latest() -> None:
+    rollups = _Rollups()
+
+    with rollups.patched(latest=HOUR):
+        rolled_up = await roll_up_gpu_usage(MagicMock(), now=HOUR + timedelta(hours=4, minutes=10))
+
+    assert rolled_up == 3
+    assert rollups.stored == [HOUR + timedelta(hours=offset) for offset in range(4)]
+    # One transaction per hour, plus the one finding nothing left to roll up
+    assert [session.pending for session in rollups.committed] == [
+        [HOUR + timedelta(hours=1)],
+        [HOUR + timedelta(hours=2)],
+        [HOUR + timedelta(hours=3)],
+        [],
+    ]
+
+
+@pytest.mark.asyncio
+@patch("app.metrics.rollups.GPU_USAGE_ROLLUP_BACKFILL_HOURS", 24)
+async def test_roll_up_gpu_usage_backfill_is_bounded() -> None:
+    rollups = _Rollups()
+
+    with rollups.patched():
+        rolled_up = await roll_up_gpu_usage(MagicMock(), now=HOUR)
+
+    assert rolled_up == 24
+    assert rollups.stored[-1] == get_last_closed_hour(HOUR)
+
+
+@pytest.mark.asyncio
+@patch("app.metrics.rollups.GPU_USAGE_ROLLUP_SETTLE_SECONDS", 300)
+async def test_roll_up_gpu_usage_keeps_hours_before_a_failure() -> None:
+    rollups = _Rollups(fail_at=HOUR + timedelta(hours=2))
+
+    with rollups.patched(latest=HOUR), pytest.raises(RuntimeError):
+        await roll_up_gpu_usage(MagicMock(), now=HOUR + timedelta(hours=4, minutes=10))
+
+    assert rollups.stored == [HOUR, HOUR + timedelta(hours=1)]
+
+
+@pytest.mark.asyncio
+async def test_roll_up_gpu_usage_skips_when_other_replica_holds_lock() -> None:
+    rollups = _Rollups(lock_acquired=False)
+
+    with rollups.patched():
+        rolled_up = await roll_up_gpu_usage(MagicMock(), now=HOUR)
+
+    assert rolled_up == 0
+    rollups.get_project_ids.assert_not_called()
+    assert rollups.stored == []
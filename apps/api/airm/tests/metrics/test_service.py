@@ -42,10 +42,12 @@ from app.metrics.service import (
     get_gpu_device_utilization_timeseries_for_cluster,
     get_gpu_device_utilization_timeseries_for_project,
     get_gpu_device_vram_utilization_for_workload,
+    get_gpu_idle_time_for_project_from_rollups,
     get_gpu_memory_utilization_for_cluster_by_workload_id,
     get_gpu_memory_utilization_for_project_by_workload_id,
     get_gpu_memory_utilization_timeseries,
     get_gpu_memory_utilization_timeseries_for_project,
+    get_gpu_usage_for_project,
     get_node_gpu_devices_with_metrics,
     get_node_gpu_junction_temperature,
     get_node_gpu_memory_temperature,
@@ -63,7 +65,7 @@ from app.projects.enums import ProjectStatus
 from app.projects.models import Project
 from app.projects.schemas import ProjectResponse
 from app.quotas.models import Quota
-from app.utilities.collections.schemas import PaginationConditions
+from app.utilities.collections.schemas import PaginationConditions, SortCondition, SortDirection
 from app.workloads.models import Workload
 
 
@@ -514,6 +516,47 @@ async def test_get_metrics_for_workloads_in_project() -> None:
     assert workload_result.created_by == "tester"
 
 
+@pytest.mark.asyncio
+async def test_get_metrics_for_workloads_in_project_no_cursor_when_sorted_by_run_time() -> None:
+    project = Project(id=uuid4(), name="Test Project", status=ProjectStatus.READY, cluster_id=uuid4())
+    workload = Workload(
+        id=uuid4(),
+        project_id=project.id,
+        cluster_id=uuid4(),
+        status=WorkloadStatus.RUNNING,
+        created_by="tester",
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+        updated_by="tester",
+    )
+    pagination_params = PaginationConditions(page=1, page_size=1)
+
+    with (
+        patch("app.metrics.service.get_workloads_with_running_time_in_project", return_value=([(workload, 300)], 2)),
+        patch("app.metrics.service.get_gpu_device_utilization_for_project_by_workload_id", return_value={}),
+        patch("app.metrics.service.get_gpu_memory_utilization_for_project_by_workload_id", return_value={}),
+    ):
+        by_name = await get_workloads_metrics_by_project(
+            AsyncMock(spec=AsyncSession),
+            project=project,
+            prometheus_client=AsyncMock(spec=PrometheusConnect),
+            pagination_params=pagination_params,
+            sort_params=[SortCondition(field="display_name")],
+            filter_params=[],
+        )
+        by_run_time = await get_workloads_metrics_by_project(
+            AsyncMock(spec=AsyncSession),
+            project=project,
+            prometheus_client=AsyncMock(spec=PrometheusConnect),
+            pagination_params=pagination_params,
+            sort_params=[SortCondition(field="run_time", direction=SortDirection.desc)],
+            filter_params=[],
+        )
+
+    assert by_name.next_cursor is not None
+    assert by_run_time.next_cursor is None
+
+
 @pytest.mark.asyncio
 @patch("app.metrics.service.a_custom_query", autospec=True)
 @patch("app.metrics.service.get_aggregation_lookback_for_metrics", return_value="5m")
@@ -2117,3 +2160,45 @@ async def test_get_node_gpu_memory_temperature_with_step(
     )
     assert mock_query_range.call_args[1]["step"] == "600"
     assert len(result.gpu_devices) == 1
+
+
+@pytest.mark.asyncio
+@patch("app.metrics.service.get_workload_gpu_usage_totals", autospec=True)
+@patch("app.metrics.service.get_project_gpu_usage_totals", autospec=True)
+async def test_get_gpu_usage_for_project(mock_project_totals: AsyncMock, mock_workload_totals: AsyncMock) -> None:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    end = datetime(2024, 2, 1, tzinfo=UTC)
+    workload_id = uuid4()
+    mock_project_totals.return_value = MagicMock(
+        allocated_gpu_hours=10.0,
+        utilized_gpu_hours=12.0,
+        allocated_vram_mb_hours=100.0,
+        utilized_vram_mb_hours=50.0,
+        idle_seconds=0.0,
+    )
+    mock_workload_totals.return_value = [
+        MagicMock(workload_id=workload_id, utilized_gpu_hours=12.0, utilized_vram_mb_hours=50.0)
+    ]
+    project = MagicMock(spec=Project, id=uuid4())
+
+    usage = await get_gpu_usage_for_project(AsyncMock(spec=AsyncSession), start, end, project)
+
+    # Utilization above the allocation (e.g. around quota changes) does not make idle time negative
+    assert usage.idle_gpu_hours == 0
+    assert usage.utilized_gpu_hours == 12.0
+    assert [workload.workload_id for workload in usage.workloads] == [workload_id]
+    assert usage.range == DateRange(start=start, end=end)
+
+
+@pytest.mark.asyncio
+@patch("app.metrics.service.get_project_gpu_usage_totals", autospec=True)
+async def test_get_gpu_idle_time_for_project_from_rollups(mock_project_totals: AsyncMock) -> None:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    end = datetime(2024, 2, 1, tzinfo=UTC)
+    mock_project_totals.return_value = MagicMock(idle_seconds=5400.0)
+
+    result = await get_gpu_idle_time_for_project_from_rollups(
+        AsyncMock(spec=AsyncSession), start, end, MagicMock(spec=Project, id=uuid4())
+    )
+
+    assert result == MetricsScalarWithRange(data=5400.0, range=DateRange(start=start, end=end))
@@ -22,7 +22,9 @@ from app.metrics.schemas import (
     MetricsScalarWithRange,
     MetricsTimeseries,
     ProjectDatapointMetadata,
+    ProjectGpuUsage,
     TimeseriesRange,
+    WorkloadGpuUsage,
     WorkloadsWithMetrics,
     WorkloadWithMetrics,
 )
@@ -1843,6 +1845,92 @@ async def test_get_avg_gpu_idle_time_for_project_not_in_role() -> None:
     assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
+@pytest.mark.asyncio
+@patch("app.projects.router.get_gpu_usage_for_project", new_callable=AsyncMock)
+@patch("app.projects.router.get_project_by_id", new_callable=AsyncMock)
+@override_dependencies(USER_PROJECT_VIEW_OVERRIDES)
+async def test_get_gpu_usage_for_project_success(mock_get_project: AsyncMock, mock_get_usage: AsyncMock) -> None:
+    project_id = uuid4()
+    workload_id = uuid4()
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    end = datetime(2024, 2, 1, tzinfo=UTC)
+    mock_get_usage.return_value = ProjectGpuUsage(
+        allocated_gpu_hours=744,
+        utilized_gpu_hours=500,
+        idle_gpu_hours=244,
+        allocated_vram_mb_hours=1000,
+        utilized_vram_mb_hours=600,
+        workloads=[WorkloadGpuUsage(workload_id=workload_id, utilized_gpu_hours=500, utilized_vram_mb_hours=600)],
+        range=DateRange(start=start, end=end),
+    )
+
+    with TestClient(app) as client:
+        # Ranges are not limited to the recent Prometheus window
+        response = client.get(
+            f"/v1/projects/{project_id}/metrics/gpu_usage?start=2024-01-01T00:00:00Z&end=2024-02-01T00:00:00Z"
+        )
+
+    assert response.status_code == 200
+    assert response.json()["idle_gpu_hours"] == 244
+    assert response.json()["workloads"] == [
+        {"workload_id": str(workload_id), "utilized_gpu_hours": 500, "utilized_vram_mb_hours": 600}
+    ]
+    assert mock_get_usage.call_args.kwargs == {"start": start, "end": end, "project": mock_get_project.return_value}
+
+
+@pytest.mark.asyncio
+@override_dependencies(USER_PROJECT_VIEW_OVERRIDES)
+async def test_get_gpu_usage_for_project_future_end() -> None:
+    project_id = uuid4()
+
+    with TestClient(app) as client:
+        response = client.get(
+            f"/v1/projects/{project_id}/metrics/gpu_usage?start=2024-01-01T00:00:00Z&end=2999-01-01T00:00:00Z"
+        )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+@patch(
+    "app.projects.router.get_gpu_idle_time_for_project_from_rollups",
+    new_callable=AsyncMock,
+    return_value=MetricsScalarWithRange(
+        data=7200,
+        range=DateRange(start=datetime(2024, 1, 1, tzinfo=UTC), end=datetime(2024, 2, 1, tzinfo=UTC)),
+    ),
+)
+@patch("app.projects.router.get_project_by_id", new_callable=AsyncMock)
+@override_dependencies(USER_PROJECT_VIEW_OVERRIDES)
+async def test_get_gpu_idle_time_for_project_success(mock_get_project: AsyncMock, _: AsyncMock) -> None:
+    project_id = uuid4()
+
+    with TestClient(app) as client:
+        response = client.get(
+            f"/v1/projects/{project_id}/metrics/gpu_idle_time?start=2024-01-01T00:00:00Z&end=2024-02-01T00:00:00Z"
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "data": 7200,
+        "range": {"start": "2024-01-01T00:00:00Z", "end": "2024-02-01T00:00:00Z"},
+    }
+
+
+@pytest.mark.asyncio
+@patch("app.projects.router.get_project_by_id", new_callable=AsyncMock, return_value=None)
+@override_dependencies(USER_PROJECT_VIEW_OVERRIDES)
+async def test_get_gpu_idle_time_for_project_project_not_found(_: AsyncMock) -> None:
+    project_id = uuid4()
+
+    with TestClient(app) as client:
+        response = client.get(
+            f"/v1/projects/{project_id}/metrics/gpu_idle_time?start=2024-01-01T00:00:00Z&end=2024-02-01T00:00:00Z"
+        )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 @pytest.mark.asyncio
 @patch("app.projects.router.get_project_storages_in_project")
 @patch("app.projects.router.is_user_in_role", return_value=True)
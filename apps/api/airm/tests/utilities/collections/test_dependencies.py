@@ -36,6 +36,11 @@ class Test_Pagination:
         assert result.page == 0
         assert result.page_size == 10
 
+    def test_get_pagination_query_params_cursor(self):
+        result = get_pagination_query_params(page=1, page_size=25, cursor="abc")
+        assert result.cursor == "abc"
+        assert result.page_size == 25
+
     def test_get_pagination_query_params_none_values(self):
         # Should fallback to None if explicitly passed
         result = get_pagination_query_params(page=None, page_size=None)
@@ -3,14 +3,30 @@
 # SPDX-License-Identifier: MIT
 
 import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from sqlalchemy import Column, Integer, String, select
+from sqlalchemy import Column, DateTime, Integer, String, select
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import declarative_base
 
-from app.utilities.collections.queries import apply_filter_to_query, apply_pagination_to_query, apply_sorting_to_query
-from app.utilities.collections.schemas import FilterCondition, FilterOperator
+from app.utilities.collections import queries
+from app.utilities.collections.queries import (
+    apply_filter_to_query,
+    apply_keyset_pagination_to_query,
+    apply_pagination_to_query,
+    apply_sorting_to_query,
+    decode_cursor,
+    encode_cursor,
+    get_cached_count,
+    get_count_query,
+    get_next_cursor,
+    resolve_keyset_columns,
+)
+from app.utilities.collections.schemas import FilterCondition, FilterOperator, PaginationConditions, SortDirection
 
 Base = declarative_base()
 
@@ -202,3 +218,151 @@ class Test_Pagination_Conditions_Queries:
         pagination = DummyPagination(page=0, page_size=0)
         paginated_query = apply_pagination_to_query(query, pagination)
         assert paginated_query is query
+
+
+class Event(Base):  # type: ignore
+    __tablename__ = "events"
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    description = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True))
+
+
+def compile_pg(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+class Test_Keyset_Pagination_Queries:
+    """Test cursor-based keyset pagination is applied correctly to queries."""
+
+    def test_resolve_keyset_columns_appends_tiebreaker(self):
+        columns = resolve_keyset_columns([SortCondition(field="name", direction="desc")], [Event])
+        assert [(c.name, c.direction) for c in columns] == [("name", SortDirection.desc), ("id", SortDirection.asc)]
+
+    def test_resolve_keyset_columns_ignores_unknown_fields(self):
+        columns = resolve_keyset_columns([SortCondition(field="nonexistent")], [Event])
+        assert [c.name for c in columns] == ["id"]
+
+    def test_first_page_orders_and_limits_without_offset(self):
+        columns = resolve_keyset_columns([SortCondition(field="name")], [Event])
+        query = apply_keyset_pagination_to_query(select(Event), columns, PaginationConditions(page_size=10))
+        sql = compile_pg(query)
+        assert "ORDER BY events.name ASC, events.id ASC" in sql
+        assert "LIMIT" in sql
+        assert "OFFSET" not in sql
+        assert "WHERE" not in sql
+
+    def test_uniform_direction_uses_row_comparison(self):
+        columns = resolve_keyset_columns([SortCondition(field="name", direction="desc")], [Event])
+        columns = [c.__class__(c.name, c.column, SortDirection.desc) for c in columns]
+        cursor = encode_cursor({"name": "b", "id": 5})
+        query = apply_keyset_pagination_to_query(
+            select(Event), columns, PaginationConditions(page_size=10, cursor=cursor)
+        )
+        assert "(events.name, events.id) < (" in compile_pg(query)
+
+    def test_mixed_directions_expand_to_or_conditions(self):
+        columns = resolve_keyset_columns([SortCondition(field="name", direction="desc")], [Event])
+        cursor = encode_cursor({"name": "b", "id": 5})
+        query = apply_keyset_pagination_to_query(
+            select(Event), columns, PaginationConditions(page_size=10, cursor=cursor)
+        )
+        sql = compile_pg(query)
+        assert "events.name < " in sql
+        assert "events.name = " in sql and "events.id > " in sql
+        assert " OR " in sql
+
+    def test_nullable_column_matches_nulls_after_values_ascending(self):
+        columns = resolve_keyset_columns([SortCondition(field="description")], [Event])
+        cursor = encode_cursor({"description": "b", "id": 5})
+        sql = compile_pg(
+            apply_keyset_pagination_to_query(select(Event), columns, PaginationConditions(page_size=10, cursor=cursor))
+        )
+        assert "(events.name" not in sql and "(events.description, events.id)" not in sql
+        assert "events.description > " in sql
+        assert "events.description IS NULL" in sql
+
+    def test_cursor_on_null_value_ascending_only_continues_among_nulls(self):
+        columns = resolve_keyset_columns([SortCondition(field="description")], [Event])
+        cursor = encode_cursor({"description": None, "id": 5})
+        sql = compile_pg(
+            apply_keyset_pagination_to_query(select(Event), columns, PaginationConditions(page_size=10, cursor=cursor))
+        )
+        assert "events.description IS NULL AND events.id > " in sql
+        assert "events.description > " not in sql
+
+    def test_cursor_on_null_value_descending_continues_with_values(self):
+        columns = resolve_keyset_columns([SortCondition(field="description", direction="desc")], [Event])
+        cursor = encode_cursor({"description": None, "id": 5})
+        sql = compile_pg(
+            apply_keyset_pagination_to_query(select(Event), columns, PaginationConditions(page_size=10, cursor=cursor))
+        )
+        assert "events.description IS NOT NULL" in sql
+        assert "events.description IS NULL AND events.id > " in sql
+
+    def test_cursor_values_are_coerced_to_column_types(self):
+        created_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+        columns = resolve_keyset_columns([SortCondition(field="created_at")], [Event])
+        cursor = encode_cursor({"created_at": created_at, "id": 7})
+        query = apply_keyset_pagination_to_query(
+            select(Event), columns, PaginationConditions(page_size=10, cursor=cursor)
+        )
+        params = query.compile(dialect=postgresql.dialect()).params
+        assert created_at in params.values()
+        assert 7 in params.values()
+
+    def test_cursor_not_matching_sort_raises(self):
+        columns = resolve_keyset_columns([SortCondition(field="name")], [Event])
+        cursor = encode_cursor({"id": 5})
+        with pytest.raises(ValueError):
+            apply_keyset_pagination_to_query(select(Event), columns, PaginationConditions(page_size=10, cursor=cursor))
+
+    def test_malformed_cursor_raises(self):
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+    def test_get_next_cursor_for_full_page(self):
+        items = [SimpleNamespace(id=1, name="a"), SimpleNamespace(id=2, name="b")]
+        cursor = get_next_cursor(items, [SortCondition(field="name")], PaginationConditions(page_size=2))
+        assert decode_cursor(cursor) == {"name": "b", "id": 2}
+
+    def test_get_next_cursor_for_last_page(self):
+        items = [SimpleNamespace(id=1, name="a")]
+        assert get_next_cursor(items, [SortCondition(field="name")], PaginationConditions(page_size=2)) is None
+
+
+class Test_Cached_Count:
+    """Test total counts are reused for identical count queries."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self, monkeypatch):
+        monkeypatch.setattr(queries, "_count_cache", {})
+
+    @staticmethod
+    def mock_session(count: int) -> AsyncMock:
+        result = MagicMock()
+        result.scalar_one.return_value = count
+        session = AsyncMock()
+        session.execute.return_value = result
+        return session
+
+    async def test_count_is_cached_per_statement_and_params(self):
+        session = self.mock_session(42)
+        count_query = get_count_query(select(User).where(User.name == "a"))
+
+        assert await get_cached_count(session, count_query) == 42
+        assert await get_cached_count(session, count_query) == 42
+        assert session.execute.await_count == 1
+
+        other_query = get_count_query(select(User).where(User.name == "b"))
+        await get_cached_count(session, other_query)
+        assert session.execute.await_count == 2
+
+    async def test_expired_count_is_recomputed(self, monkeypatch):
+        monkeypatch.setattr(queries, "COLLECTION_COUNT_CACHE_TTL_SECONDS", 0)
+        session = self.mock_session(1)
+        count_query = get_count_query(select(User))
+
+        await get_cached_count(session, count_query)
+        await get_cached_count(session, count_query)
+        assert session.execute.await_count == 2
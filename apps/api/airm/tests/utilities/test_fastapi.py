@@ -0,0 +1,75 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+import math
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from pydantic import BaseModel, computed_field
+
+from app.utilities.fastapi import PydanticJSONResponse, trusted_response
+
+
+class Item(BaseModel):
+    name: str
+    value: float | None
+    created_at: datetime
+
+    @computed_field
+    def label(self) -> str:
+        return self.name.upper()
+
+
+def _make_app() -> FastAPI:
+    app = FastAPI(default_response_class=PydanticJSONResponse)
+
+    @app.get("/items", response_model=list[Item])
+    async def get_items() -> list[Item]:
+        return [Item(name="a", value=1.5, created_at=datetime(2025, 1, 1, tzinfo=UTC))]
+
+    @app.get("/items/trusted", response_model=Item)
+    @trusted_response
+    async def get_trusted_item(name: str) -> Item:
+        return Item.model_construct(name=name, value=math.nan, created_at=datetime(2025, 1, 1, tzinfo=UTC))
+
+    return app
+
+
+async def _get(app: FastAPI, path: str) -> httpx.Response:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get(path)
+
+
+def test_pydantic_json_response_renders_models():
+    item = Item(name="a", value=math.inf, created_at=datetime(2025, 1, 1, tzinfo=UTC))
+
+    response = PydanticJSONResponse({"data": [item]})
+
+    assert response.body == b'{"data":[{"name":"a","value":null,"created_at":"2025-01-01T00:00:00Z","label":"A"}]}'
+    assert response.headers["content-type"] == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_default_response_class_serializes_validated_response():
+    response = await _get(_make_app(), "/items")
+
+    assert response.status_code == 200
+    assert response.json() == [{"name": "a", "value": 1.5, "created_at": "2025-01-01T00:00:00Z", "label": "A"}]
+
+
+@pytest.mark.asyncio
+async def test_trusted_response_serializes_returned_schema():
+    app = _make_app()
+
+    response = await _get(app, "/items/trusted?name=b")
+
+    assert response.status_code == 200
+    assert response.json() == {"name": "b", "value": None, "created_at": "2025-01-01T00:00:00Z", "label": "B"}
+    operation = app.openapi()["paths"]["/items/trusted"]["get"]
+    assert operation["parameters"][0]["name"] == "name"
+    assert operation["responses"]["200"]["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/Item"
+    }
@@ -0,0 +1,45 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+from fastapi import FastAPI
+
+from app.utilities.mcp import LazyFastApiMCP
+
+
+def _make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items", operation_id="get_items")
+    async def get_items() -> list[str]:
+        return ["a"]
+
+    return app
+
+
+def test_tools_are_generated_on_first_use():
+    app = _make_app()
+    mcp = LazyFastApiMCP(app)
+    mcp.mount()
+
+    assert mcp._server is None
+
+    server = mcp.server
+
+    assert [tool.name for tool in mcp.tools] == ["get_items"]
+    assert mcp.server is server
+
+
+def test_setup_server_regenerates_tools_from_current_routes():
+    app = _make_app()
+    mcp = LazyFastApiMCP(app)
+    mcp.server
+
+    @app.get("/other", operation_id="get_other")
+    async def get_other() -> str:
+        return "b"
+
+    mcp.setup_server()
+    mcp.server
+
+    assert sorted(tool.name for tool in mcp.tools) == ["get_items", "get_other"]
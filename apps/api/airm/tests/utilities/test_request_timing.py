@@ -0,0 +1,117 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.utilities import request_timing
+from app.utilities.request_timing import (
+    REQUEST_DEPENDENCY_CALLS,
+    RequestTimingMiddleware,
+    RequestTimings,
+    collect_timings,
+    get_request_timings,
+    instrument_httpx_client,
+    record_timing,
+    timed,
+)
+
+
+def _make_app(sample: float = 0.0) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str) -> dict:
+        record_timing("db", 0.002, "SELECT 1")
+        record_timing("db", 0.004, "SELECT items")
+        with timed("prometheus", "up"):
+            pass
+        return {"id": item_id}
+
+    app.add_middleware(RequestTimingMiddleware, sample=lambda: sample)
+    return app
+
+
+async def _get(app: FastAPI, path: str) -> httpx.Response:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get(path)
+
+
+def test_server_timing_header_value():
+    timings = RequestTimings()
+    timings.record("db", 0.002, "SELECT 1")
+    timings.record("db", 0.003, "SELECT 2")
+    timings.record("keycloak", 0.01)
+
+    assert timings.server_timing(0.1) == 'db;dur=5.0;desc="2 calls", keycloak;dur=10.0;desc="1 call", total;dur=100.0'
+    assert timings.dependencies["db"].slowest == "SELECT 2"
+
+
+def test_record_timing_outside_request_is_ignored():
+    assert get_request_timings() is None
+    record_timing("db", 1.0, "SELECT 1")
+    with timed("prometheus"):
+        pass
+    assert get_request_timings() is None
+
+
+@pytest.mark.asyncio
+async def test_middleware_adds_server_timing_header_and_observes_route_metrics():
+    before = REQUEST_DEPENDENCY_CALLS.labels("GET", "/items/{item_id}", "db")._sum.get()
+
+    response = await _get(_make_app(), "/items/1")
+
+    assert response.status_code == 200
+    server_timing = response.headers["server-timing"]
+    assert 'db;dur=6.0;desc="2 calls"' in server_timing
+    assert "prometheus;dur=" in server_timing
+    assert "total;dur=" in server_timing
+    # Metrics are labelled with the route template, not the concrete path
+    assert REQUEST_DEPENDENCY_CALLS.labels("GET", "/items/{item_id}", "db")._sum.get() == before + 2
+
+
+@pytest.mark.asyncio
+async def test_middleware_logs_sample_of_requests_with_many_queries(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(request_timing, "SLOW_REQUEST_QUERY_COUNT", 2)
+    monkeypatch.setattr(request_timing, "SLOW_REQUEST_LOG_SAMPLE_RATE", 0.5)
+
+    with patch.object(request_timing, "logger") as mock_logger:
+        await _get(_make_app(sample=0.9), "/items/1")
+        mock_logger.warning.assert_not_called()
+
+        await _get(_make_app(sample=0.1), "/items/1")
+        mock_logger.warning.assert_called_once()
+        message = mock_logger.warning.call_args.args[0]
+        assert "GET /items/{item_id}" in message
+        assert "db: 2 calls" in message
+        assert "SELECT items" in message
+
+
+@pytest.mark.asyncio
+async def test_instrument_httpx_client_records_requests():
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})))
+    instrument_httpx_client(client, "keycloak")
+    token = request_timing._request_timings.set(RequestTimings())
+    try:
+        await client.get("http://keycloak/admin/realms/airm/users")
+        timings = get_request_timings()
+    finally:
+        request_timing._request_timings.reset(token)
+
+    assert timings.dependencies["keycloak"].count == 1
+    assert timings.dependencies["keycloak"].slowest == "GET /admin/realms/airm/users"
+
+
+def test_collect_timings_outside_request():
+    with collect_timings() as timings:
+        record_timing("db", 0.001, "UPDATE workloads")
+        with timed("rabbitmq", "cluster-1"):
+            pass
+
+    assert timings.dependencies["db"].count == 1
+    assert timings.dependencies["rabbitmq"].count == 1
+    assert get_request_timings() is None
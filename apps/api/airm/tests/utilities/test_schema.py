@@ -0,0 +1,35 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.messaging.schemas import WorkloadStatus
+from app.metrics.schemas import WorkloadWithMetrics
+from app.utilities.schema import validate_from_attributes
+from app.workloads.enums import WorkloadType
+
+
+def test_validate_from_attributes():
+    now = datetime.now(UTC)
+    workload = SimpleNamespace(
+        id=uuid4(),
+        project_id=uuid4(),
+        cluster_id=uuid4(),
+        status=WorkloadStatus.RUNNING,
+        display_name="workload",
+        type=WorkloadType.INFERENCE,
+        created_at=now,
+        updated_at=now,
+        created_by="user@example.com",
+        updated_by="user@example.com",
+        last_status_transition_at=now,
+    )
+
+    result = validate_from_attributes(WorkloadWithMetrics, workload, gpu_count=2, vram=1024.0, created_by="other")
+
+    expected = WorkloadWithMetrics(**{**vars(workload), "created_by": "other"}, gpu_count=2, vram=1024.0)
+    assert result == expected
+    assert result.model_dump_json() == expected.model_dump_json()
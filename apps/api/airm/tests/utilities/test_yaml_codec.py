@@ -0,0 +1,89 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+import yaml
+
+from app.utilities import yaml_codec
+
+MANIFEST = """\
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: app
+spec:
+  replicas: 2
+---
+apiVersion: v1
+kind: Service
+metadata:
+  name: app
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    yaml_codec.clear_cache()
+    yield
+    yaml_codec.clear_cache()
+
+
+def test_load_all_matches_pure_python_loader():
+    assert yaml_codec.load_all(MANIFEST) == list(yaml.safe_load_all(MANIFEST))
+
+
+def test_dump_all_round_trips():
+    documents = yaml_codec.load_all(MANIFEST)
+
+    assert yaml_codec.load_all(yaml_codec.dump_all(documents)) == documents
+
+
+def test_load_raises_yaml_error():
+    with pytest.raises(yaml_codec.YAMLError):
+        yaml_codec.load("key: [unclosed")
+
+
+def test_load_refuses_python_tags():
+    with pytest.raises(yaml_codec.YAMLError):
+        yaml_codec.load("!!python/object/apply:os.system ['true']")
+
+
+@pytest.mark.asyncio
+async def test_load_all_async_parses_large_content_in_a_thread(monkeypatch):
+    monkeypatch.setattr(yaml_codec, "OFF_LOOP_THRESHOLD_BYTES", 10)
+
+    assert await yaml_codec.load_all_async(MANIFEST) == yaml_codec.load_all(MANIFEST)
+
+
+@pytest.mark.asyncio
+async def test_load_async_parses_small_content():
+    assert await yaml_codec.load_async("a: 1") == {"a": 1}
+
+
+def test_load_all_cached_reuses_documents_of_identical_content():
+    first = yaml_codec.load_all_cached(MANIFEST)
+
+    assert yaml_codec.load_all_cached(MANIFEST.encode().decode()) is first
+    assert list(first) == yaml_codec.load_all(MANIFEST)
+
+
+def test_load_all_cached_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(yaml_codec, "CACHE_SIZE", 2)
+    first = yaml_codec.load_all_cached("a: 1")
+    yaml_codec.load_all_cached("b: 2")
+    yaml_codec.load_all_cached("a: 1")
+    yaml_codec.load_all_cached("c: 3")
+
+    assert yaml_codec.load_all_cached("a: 1") is first
+    assert yaml_codec._cache.keys() == {
+        yaml_codec.hashlib.sha256(b"a: 1").digest(),
+        yaml_codec.hashlib.sha256(b"c: 3").digest(),
+    }
+
+
+def test_load_all_cached_does_not_cache_errors():
+    with pytest.raises(yaml_codec.YAMLError):
+        yaml_codec.load_all_cached("key: [unclosed")
+
+    assert not yaml_codec._cache
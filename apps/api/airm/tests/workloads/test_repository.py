@@ -9,12 +9,15 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.messaging.schemas import CommonComponentStatus, WorkloadComponentKind, WorkloadStatus
+from app.utilities.collections.queries import get_next_cursor
 from app.utilities.collections.schemas import FilterCondition, PaginationConditions, SortCondition, SortDirection
+from app.utilities.exceptions import ValidationException
 from app.workloads.enums import WorkloadType
 from app.workloads.repository import (
     create_workload,
     create_workload_component,
     create_workload_components,
+    create_workloads,
     get_average_pending_time_for_workloads_in_project_created_between,
     get_workload_by_id,
     get_workload_by_id_and_user_membership,
@@ -27,6 +30,7 @@ from app.workloads.repository import (
     get_workloads_accessible_to_user,
     get_workloads_by_ids_in_cluster,
     get_workloads_by_project,
+    get_workloads_in_cluster,
     get_workloads_in_clusters_with_status_count,
     get_workloads_with_running_time_in_project,
     get_workloads_with_status_count,
@@ -35,7 +39,7 @@ from app.workloads.repository import (
     update_workload_component_status,
     update_workload_status,
 )
-from app.workloads.schemas import WorkloadComponentIn
+from app.workloads.schemas import WorkloadComponentIn, WorkloadSubmission
 from tests import factory  # type: ignore[attr-defined]
 
 
@@ -66,6 +70,31 @@ async def test_create_workload(db_session: AsyncSession) -> None:
     assert workload.status == WorkloadStatus.PENDING.value
 
 
+@pytest.mark.asyncio
+async def test_create_workloads(db_session: AsyncSession) -> None:
+    """Test creating several workloads at once"""
+    env = await factory.create_basic_test_environment(db_session)
+    submissions = [
+        WorkloadSubmission(manifest="", display_name=f"sweep {index}", workload_type=WorkloadType.FINE_TUNING)
+        for index in range(3)
+    ]
+
+    workloads = await create_workloads(
+        db_session,
+        cluster_id=env.cluster.id,
+        project_id=env.project.id,
+        status=WorkloadStatus.PENDING.value,
+        creator="test@example.com",
+        submissions=submissions,
+    )
+
+    assert [workload.display_name for workload in workloads] == ["sweep 0", "sweep 1", "sweep 2"]
+    assert len({workload.id for workload in workloads}) == 3
+    for workload in workloads:
+        assert workload.type == WorkloadType.FINE_TUNING.value
+        assert await get_workload_by_id_in_cluster(db_session, workload.id, env.cluster.id) is workload
+
+
 @pytest.mark.asyncio
 async def test_get_workload_by_id_and_user_membership(db_session: AsyncSession) -> None:
     """Test getting workload with user membership validation."""
@@ -680,6 +709,89 @@ async def test_get_workloads_with_running_time_in_project_sorting_by_run_time(db
     assert second_workload_asc.id == workload2.id
 
 
+@pytest.mark.asyncio
+async def test_get_workloads_in_cluster_keyset_pagination(db_session: AsyncSession) -> None:
+    """Test that following next_cursor visits every workload exactly once, in sort order."""
+    env = await factory.create_basic_test_environment(db_session)
+    names = ["workload-a", "workload-b", "workload-b", "workload-c", "workload-d"]
+    for name in names:
+        await factory.create_workload(db_session, env.cluster, env.project, display_name=name)
+
+    sort_params = [SortCondition(field="display_name", direction=SortDirection.desc)]
+    pagination_params = PaginationConditions(page=1, page_size=2)
+
+    seen = []
+    while True:
+        workloads, count = await get_workloads_in_cluster(
+            db_session, env.cluster.id, pagination_params, sort_params, []
+        )
+        assert count == len(names)
+        seen.extend(workloads)
+        cursor = get_next_cursor(workloads, sort_params, pagination_params)
+        if cursor is None:
+            break
+        pagination_params = PaginationConditions(page_size=2, cursor=cursor)
+
+    assert [w.display_name for w in seen] == sorted(names, reverse=True)
+    assert len({w.id for w in seen}) == len(names)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("direction", [SortDirection.asc, SortDirection.desc])
+async def test_get_workloads_in_cluster_keyset_pagination_with_null_sort_values(
+    db_session: AsyncSession, direction: SortDirection
+) -> None:
+    """Test that pages keep workloads without a display name, also when a cursor points at one."""
+    env = await factory.create_basic_test_environment(db_session)
+    names = ["workload-a", None, "workload-b", None, None, "workload-c"]
+    for name in names:
+        await factory.create_workload(db_session, env.cluster, env.project, display_name=name)
+
+    sort_params = [SortCondition(field="display_name", direction=direction)]
+    pagination_params = PaginationConditions(page=1, page_size=2)
+
+    seen = []
+    while True:
+        workloads, _ = await get_workloads_in_cluster(db_session, env.cluster.id, pagination_params, sort_params, [])
+        seen.extend(workloads)
+        cursor = get_next_cursor(workloads, sort_params, pagination_params)
+        if cursor is None:
+            break
+        pagination_params = PaginationConditions(page_size=2, cursor=cursor)
+
+    named = sorted(name for name in names if name)
+    # PostgreSQL sorts NULLs last ascending and first descending
+    expected = named + [None] * 3 if direction == SortDirection.asc else [None] * 3 + named[::-1]
+    assert [w.display_name for w in seen] == expected
+    assert len({w.id for w in seen}) == len(names)
+
+
+@pytest.mark.asyncio
+async def test_get_workloads_in_cluster_invalid_cursor(db_session: AsyncSession) -> None:
+    """Test that a malformed cursor is rejected."""
+    env = await factory.create_basic_test_environment(db_session)
+
+    with pytest.raises(ValidationException):
+        await get_workloads_in_cluster(
+            db_session, env.cluster.id, PaginationConditions(page_size=2, cursor="invalid"), [], []
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_workloads_with_running_time_in_project_cursor_rejected_for_run_time(
+    db_session: AsyncSession,
+) -> None:
+    """Test that a cursor is rejected when sorting by run_time, which changes between requests."""
+    env = await factory.create_basic_test_environment(db_session)
+    sort_params = [SortCondition(field="run_time", direction=SortDirection.desc)]
+    cursor = get_next_cursor([{"run_time": 1, "id": "x"}], sort_params, PaginationConditions(page_size=1), dict.get)
+
+    with pytest.raises(ValidationException):
+        await get_workloads_with_running_time_in_project(
+            db_session, env.project.id, PaginationConditions(page_size=1, cursor=cursor), sort_params, []
+        )
+
+
 @pytest.mark.asyncio
 async def test_get_average_pending_time_for_workloads_in_project_created_between(db_session: AsyncSession) -> None:
     """Test getting average pending time for workloads in project."""
@@ -37,10 +37,12 @@ from app.utilities.security import (
 from app.workloads.enums import WorkloadType
 from app.workloads.models import Workload as WorkloadModel
 from app.workloads.schemas import (
+    WorkloadBatchSubmissionResponse,
     WorkloadComponent,
     WorkloadMetricsDetailsResponse,
     Workloads,
     WorkloadsStats,
+    WorkloadSubmissionResult,
     WorkloadWithComponents,
 )
 from app.workloads.schemas import WorkloadResponse as WorkloadSchema
@@ -341,6 +343,123 @@ async def test_submit_workload_display_name(mock_submit_workload_to_cluster: Mag
     assert args[6] == "Sample FineTuning"  # display_name
 
 
+def _project_with_healthy_cluster(project_id: str, cluster_id: str) -> Project:
+    return Project(
+        id=project_id,
+        name="project1",
+        cluster_id=cluster_id,
+        created_at=datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC),
+        updated_at=datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC),
+        created_by="test@example.com",
+        updated_by="test@example.com",
+        cluster=Cluster(
+            id=cluster_id,
+            name="TestCluster",
+            workloads_base_url="http://test-cluster.example.com",
+            last_heartbeat_at=datetime.now(UTC),
+            created_at=datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC),
+            updated_at=datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC),
+            created_by="test@example.com",
+            updated_by="test@example.com",
+        ),
+    )
+
+
+@pytest.mark.asyncio
+@patch("app.workloads.router.create_and_submit_workload_batch")
+async def test_submit_workloads_returns_result_per_workload(mock_submit_batch: MagicMock) -> None:
+    project_id = "8afa9fb8-2e96-4b23-b4fd-7f9cc58fb9aa"
+    cluster_id = "99a3f8c2-a23d-4ac6-b2a9-502305925ff3"
+    mock_submit_batch.return_value = WorkloadBatchSubmissionResponse(
+        data=[
+            WorkloadSubmissionResult(
+                index=0,
+                workload=WorkloadSchema(
+                    id="0aa18e92-002c-45b7-a06e-dcdb0277974c",
+                    cluster_id=cluster_id,
+                    project_id=project_id,
+                    status="Pending",
+                    type=WorkloadType.FINE_TUNING,
+                    display_name="sweep lr 0.1",
+                    created_at=datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC),
+                    updated_at=datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC),
+                    created_by="test@example.com",
+                    updated_by="test@example.com",
+                ),
+            ),
+            WorkloadSubmissionResult(index=1, error="Each manifest item must specify a 'kind'"),
+        ]
+    )
+    app.dependency_overrides[get_session] = lambda: MagicMock()
+    app.dependency_overrides[BearerToken] = lambda: "token"
+    app.dependency_overrides[get_user_email] = lambda: "test@example.com"
+    app.dependency_overrides[validate_and_get_project_from_query] = lambda: _project_with_healthy_cluster(
+        project_id, cluster_id
+    )
+
+    with TestClient(app) as client:
+        response = client.post(
+            f"/v1/workloads/batch?project_id={project_id}",
+            json={
+                "workloads": [
+                    {"manifest": yml_content, "display_name": "sweep lr 0.1", "workload_type": "FINE_TUNING"},
+                    {"manifest": "metadata: {}", "display_name": "sweep lr 0.2"},
+                ]
+            },
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()["data"]
+    assert results[0]["workload"]["id"] == "0aa18e92-002c-45b7-a06e-dcdb0277974c"
+    assert results[0]["error"] is None
+    assert results[1] == {"index": 1, "workload": None, "error": "Each manifest item must specify a 'kind'"}
+
+    args, __ = mock_submit_batch.call_args
+    submissions = args[2]
+    assert [submission.workload_type for submission in submissions] == [WorkloadType.FINE_TUNING, WorkloadType.CUSTOM]
+    assert args[3] == "test@example.com"
+    assert args[4] == "token"
+
+
+@pytest.mark.asyncio
+@patch("app.workloads.router.create_and_submit_workload_batch")
+async def test_submit_workloads_rejects_empty_batch(mock_submit_batch: MagicMock) -> None:
+    project_id = "8afa9fb8-2e96-4b23-b4fd-7f9cc58fb9aa"
+    app.dependency_overrides[get_session] = lambda: MagicMock()
+    app.dependency_overrides[BearerToken] = lambda: "token"
+    app.dependency_overrides[get_user_email] = lambda: "test@example.com"
+    app.dependency_overrides[validate_and_get_project_from_query] = lambda: _project_with_healthy_cluster(
+        project_id, "99a3f8c2-a23d-4ac6-b2a9-502305925ff3"
+    )
+
+    with TestClient(app) as client:
+        response = client.post(f"/v1/workloads/batch?project_id={project_id}", json={"workloads": []})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    mock_submit_batch.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("app.workloads.schemas.MAX_BATCH_MANIFESTS_SIZE", 100)
+@patch("app.workloads.router.create_and_submit_workload_batch")
+async def test_submit_workloads_rejects_batch_exceeding_total_manifests_size(mock_submit_batch: MagicMock) -> None:
+    project_id = "8afa9fb8-2e96-4b23-b4fd-7f9cc58fb9aa"
+    app.dependency_overrides[get_session] = lambda: MagicMock()
+    app.dependency_overrides[BearerToken] = lambda: "token"
+    app.dependency_overrides[get_user_email] = lambda: "test@example.com"
+    app.dependency_overrides[validate_and_get_project_from_query] = lambda: _project_with_healthy_cluster(
+        project_id, "99a3f8c2-a23d-4ac6-b2a9-502305925ff3"
+    )
+    workloads = [{"manifest": "a" * 60, "display_name": f"sweep-{i}"} for i in range(2)]
+
+    with TestClient(app) as client:
+        response = client.post(f"/v1/workloads/batch?project_id={project_id}", json={"workloads": workloads})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert "must not exceed 100 characters in total" in response.text
+    mock_submit_batch.assert_not_called()
+
+
 @pytest.mark.asyncio
 @patch("app.workloads.router.submit_delete_workload", return_value=MagicMock())
 @patch(
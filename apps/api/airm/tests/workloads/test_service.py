@@ -25,10 +25,13 @@ from app.workloads.enums import WorkloadType
 from app.workloads.repository import (
     get_workload_by_id_in_cluster,
     get_workload_component_by_id,
+    get_workload_components_by_workload_id,
     get_workload_time_summary_by_workload_id_and_status,
 )
+from app.workloads.schemas import WorkloadSubmission
 from app.workloads.service import (
     create_and_submit_workload,
+    create_and_submit_workload_batch,
     extract_components_and_submit_workload,
     get_stats_for_workloads,
     get_stats_for_workloads_in_accessible_clusters,
@@ -98,6 +101,45 @@ async def test_create_and_submit_workload_success(db_session: AsyncSession) -> N
     assert await get_workload_by_id_in_cluster(db_session, result.id, result.cluster_id) is not None
 
 
+@pytest.mark.asyncio
+async def test_create_and_submit_workload_batch(db_session: AsyncSession) -> None:
+    """Test that valid workloads of a batch are created and queued, and invalid ones rejected."""
+    env = await factory.create_basic_test_environment(db_session)
+    job_manifest = (
+        "apiVersion: batch/v1\nkind: Job\nmetadata:\n  name: sweep-{index}\n"
+        "spec:\n  template:\n    spec:\n      containers: []\n"
+    )
+    submissions = [
+        WorkloadSubmission(manifest=job_manifest.format(index=0), display_name="sweep 0", workload_type="FINE_TUNING"),
+        WorkloadSubmission(manifest="key: [unclosed", display_name="broken yaml"),
+        WorkloadSubmission(manifest="apiVersion: v1\nmetadata:\n  name: no-kind\n", display_name="no kind"),
+        WorkloadSubmission(manifest=job_manifest.format(index=3), display_name="sweep 3", workload_type="FINE_TUNING"),
+    ]
+    mock_message_sender = AsyncMock()
+
+    result = await create_and_submit_workload_batch(
+        db_session, env.project, submissions, "test@example.com", "test-token", mock_message_sender
+    )
+
+    assert [item.index for item in result.data] == [0, 1, 2, 3]
+    assert result.data[1].error.startswith("Invalid YAML content in workload manifest")
+    assert result.data[2].error == "Each manifest item must specify a 'kind'"
+
+    accepted = [result.data[0].workload, result.data[3].workload]
+    assert [workload.display_name for workload in accepted] == ["sweep 0", "sweep 3"]
+    assert all(workload.type == WorkloadType.FINE_TUNING for workload in accepted)
+    for workload in accepted:
+        assert await get_workload_by_id_in_cluster(db_session, workload.id, env.cluster.id) is not None
+        components = await get_workload_components_by_workload_id(db_session, workload.id)
+        assert [component.kind for component in components] == [WorkloadComponentKind.JOB]
+
+    assert mock_message_sender.enqueue.await_count == 2
+    messages = [call.args[1] for call in mock_message_sender.enqueue.await_args_list]
+    assert [message.workload_id for message in messages] == [workload.id for workload in accepted]
+    assert "name: sweep-3" in messages[1].manifest
+    assert f"namespace: {env.project.name}" in messages[1].manifest
+
+
 @pytest.mark.asyncio
 async def test_submit_delete_workload_success(db_session: AsyncSession) -> None:
     """Test successful workload deletion submission."""
@@ -6,6 +6,7 @@
 import asyncio
 import os
 import sys
+import time
 import warnings
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -58,7 +59,9 @@ from api_common.fastapi import (
     value_error_handler,
 )
 from api_common.health.router import router as health_router
+from api_common.request_timing import RequestTimingMiddleware
 
+from .aims.catalog import start_aim_catalog, stop_aim_catalog
 from .aims.router import router as aims_router
 from .aims.syncer import sync_aim_services
 from .apikeys.router import router as apikeys_router
@@ -68,18 +71,26 @@ from .cluster_auth.client import init_cluster_auth_client
 from .config import LOG_LEVEL
 from .datasets.router import router as datasets_router
 from .dispatch import poller
-from .dispatch.config import load_k8s_config
+from .dispatch.config import EVENT_INDEX_ENABLED, load_k8s_config
+from .dispatch.discovery import start_resource_resolver, stop_resource_resolver
+from .dispatch.events import start_event_index, stop_event_index
 from .dispatch.kube_client import close_dynamic_client, init_kube_client
+from .dispatch.metrics import start_metrics_server
 from .logs.client import close_loki_client, init_loki_client
+from .logs.tail import close_tail_multiplexer
 from .metrics.client import init_prometheus_client
 from .minio import init_minio_client
+from .minio.deletion import cancel_background_deletions
 from .models.router import router as models_router
 from .namespaces.config import DEFAULT_NAMESPACE as DEFAULT_NAMESPACE
 from .namespaces.router import router as namespaces_router
 from .overlays.router import router as overlays_router
 from .secrets.router import router as secrets_router
+from .workloads.constants import WORKLOAD_RESOURCES
 from .workloads.router import router as workloads_router
 from .workloads.syncer import sync_workloads
+from .workspaces.config import WORKSPACE_POOL_SIZES
+from .workspaces.pool import sync_workspace_pool
 from .workspaces.router import router as workspaces_router
 
 load_dotenv(override=False)
@@ -103,6 +114,14 @@ async def init_services(app_state: FastAPI) -> None:
         logger.error("Application cannot start without Kubernetes connection")
         os._exit(1)
 
+    # Discover the kinds of workload resources in the background, so applying and deleting workloads finds them cached
+    start_resource_resolver((resource.api_version, resource.kind) for resource in WORKLOAD_RESOURCES)
+    # Keep the cluster-wide AIM catalog in sync in the background; readers fall back to the API until it is loaded
+    start_aim_catalog(app_state.kube_client)
+    # Same for the event index, which serves the events of workload and AIM service detail views
+    if EVENT_INDEX_ENABLED:
+        start_event_index(app_state.kube_client.core_v1)
+
     try:
         # Initialize Prometheus Client and store in app.state
         app_state.prometheus_client = init_prometheus_client()
@@ -127,6 +146,8 @@ async def start_pollers() -> None:
     """Start all background pollers."""
     poller.register_syncer(sync_aim_services)
     poller.register_syncer(sync_workloads)
+    if WORKSPACE_POOL_SIZES:
+        poller.register_syncer(sync_workspace_pool)
     await poller.start_poller()
 
 
@@ -138,6 +159,8 @@ async def lifespan(app_lifespan: FastAPI) -> AsyncIterator[None]:
 
 
 async def startup_event(app_lifespan: FastAPI) -> None:
+    start = time.perf_counter()
+
     # Set logging level
     logger.remove()
     logger.add(sys.stderr, level=LOG_LEVEL)
@@ -151,6 +174,13 @@ async def startup_event(app_lifespan: FastAPI) -> None:
     await init_services(app_lifespan.state)
     await start_pollers()
 
+    try:
+        start_metrics_server()
+    except Exception as e:
+        logger.exception("Failed to expose metrics", e)
+
+    logger.info(f"Startup completed in {time.perf_counter() - start:.2f}s")
+
 
 async def shutdown_event(app_lifespan: FastAPI) -> None:
     # Sync cleanups (instant)
@@ -163,8 +193,13 @@ async def shutdown_event(app_lifespan: FastAPI) -> None:
 
     close_tasks = [
         poller.stop_poller(),
+        stop_aim_catalog(),
+        stop_event_index(),
+        stop_resource_resolver(),
+        cancel_background_deletions(),
         _close_cluster_auth(),
         close_loki_client(),
+        close_tail_multiplexer(),
         app_lifespan.state.kube_client.close(),
         dispose_db(),
     ]
@@ -205,6 +240,9 @@ api_secured_router.include_router(apikeys_router, prefix="/v1")
 app.include_router(api_unsecured_router)
 app.include_router(api_secured_router)
 
+# Report database and external call timings of each request in Server-Timing headers, metrics and slow-request logs
+app.add_middleware(RequestTimingMiddleware)
+
 # Register exception handlers
 # Note: More specific exception handlers must be registered before generic ones
 app.add_exception_handler(ApiException, api_exception_handler)
@@ -0,0 +1,200 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Cluster-wide cache of AIMClusterModel resources.
+
+AIMClusterModels are cluster-scoped, change rarely and are read on nearly every AIM request, by the
+AIMService syncer and by the chattable filter of every namespace listing. The catalog lists them once,
+keeps them current through a watch and maintains secondary indexes by name, status and chat capability.
+Readers fall back to the API server whenever the catalog is not in sync.
+"""
+
+import asyncio
+from collections import defaultdict
+
+from kubernetes_asyncio import watch
+from kubernetes_asyncio.client import ApiException
+from loguru import logger
+
+from ..dispatch.kube_client import KubernetesClient
+from ..dispatch.utils import get_resource_version
+from .config import AIM_CATALOG_RETRY_SECONDS, AIM_CATALOG_WATCH_TIMEOUT_SECONDS
+from .constants import AIM_API_GROUP, AIM_CLUSTER_MODEL_PLURAL, CHAT_TAG_VALUE
+from .crds import AIMClusterModelResource
+from .enums import AIMClusterModelStatus
+
+
+class AIMCatalog:
+    """Indexed in-memory view of all AIMClusterModels, fed by a list followed by a watch.
+
+    The returned resources are shared between callers and must not be modified.
+    """
+
+    def __init__(self) -> None:
+        self.resource_version: str | None = None
+        self.ready = False
+        self._by_name: dict[str, AIMClusterModelResource] = {}
+        self._by_status: defaultdict[AIMClusterModelStatus, set[str]] = defaultdict(set)
+        self._chattable: set[str] = set()
+        self._task: asyncio.Task | None = None
+
+    # Index maintenance
+
+    def _index(self, aim: AIMClusterModelResource) -> None:
+        name = aim.metadata.name
+        self._unindex(name)
+        self._by_name[name] = aim
+        self._by_status[aim.status.status].add(name)
+        if CHAT_TAG_VALUE in aim.status.image_metadata.model.tags:
+            self._chattable.add(name)
+
+    def _unindex(self, name: str) -> None:
+        aim = self._by_name.pop(name, None)
+        if aim is None:
+            return
+        self._discard(self._by_status, aim.status.status, name)
+        self._chattable.discard(name)
+
+    @staticmethod
+    def _discard(index: defaultdict, key: object, name: str) -> None:
+        names = index.get(key)
+        if names is not None:
+            names.discard(name)
+            if not names:
+                del index[key]
+
+    def replace(self, aims: list[AIMClusterModelResource], resource_version: str | None) -> None:
+        """Replace the whole catalog content, e.g. after a (re)list."""
+        self._by_name.clear()
+        self._by_status.clear()
+        self._chattable.clear()
+        for aim in aims:
+            self._index(aim)
+        self.resource_version = resource_version
+        self.ready = True
+
+    def apply_event(self, event_type: str, obj: dict) -> None:
+        """Apply a single watch event (ADDED, MODIFIED, DELETED or BOOKMARK) to the catalog."""
+        metadata = obj.get("metadata", {})
+        if metadata.get("resourceVersion"):
+            self.resource_version = metadata["resourceVersion"]
+        if event_type == "BOOKMARK":
+            return
+        if event_type == "DELETED":
+            self._unindex(metadata.get("name", ""))
+            return
+        try:
+            self._index(AIMClusterModelResource.model_validate(obj))
+        except Exception as e:
+            logger.warning(f"Failed to parse AIMClusterModel {metadata.get('name')} from watch event: {e}")
+
+    # Reads
+
+    def get(self, name: str) -> AIMClusterModelResource | None:
+        return self._by_name.get(name)
+
+    def list_aims(self, statuses: list[AIMClusterModelStatus] | None = None) -> list[AIMClusterModelResource]:
+        if statuses:
+            names = set().union(*(self._by_status.get(status, set()) for status in statuses))
+        else:
+            names = self._by_name.keys()
+        return [self._by_name[name] for name in sorted(names)]
+
+    def is_chattable(self, name: str) -> bool:
+        return name in self._chattable
+
+    # Feeding
+
+    async def _list(self, kube_client: KubernetesClient, version: str) -> None:
+        result = await kube_client.custom_objects.list_cluster_custom_object(
+            group=AIM_API_GROUP,
+            version=version,
+            plural=AIM_CLUSTER_MODEL_PLURAL,
+        )
+        aims = []
+        for item in result.get("items", []):
+            try:
+                aims.append(AIMClusterModelResource.model_validate(item))
+            except Exception as e:
+                logger.warning(f"Failed to parse AIMClusterModel {item.get('metadata', {}).get('name')}: {e}")
+        self.replace(aims, result.get("metadata", {}).get("resourceVersion"))
+        logger.info(f"AIM catalog loaded {len(aims)} AIMClusterModels")
+
+    async def _watch(self, kube_client: KubernetesClient, version: str) -> None:
+        """Stream changes since the last seen resource version until the server closes the watch.
+
+        ERROR events are raised by the watch as ApiException, e.g. 410 when the resource version expired.
+        """
+        async with watch.Watch() as watcher:
+            async for event in watcher.stream(
+                kube_client.custom_objects.list_cluster_custom_object,
+                group=AIM_API_GROUP,
+                version=version,
+                plural=AIM_CLUSTER_MODEL_PLURAL,
+                resource_version=self.resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=AIM_CATALOG_WATCH_TIMEOUT_SECONDS,
+            ):
+                self.apply_event(event["type"], event["raw_object"])
+
+    async def run(self, kube_client: KubernetesClient) -> None:
+        """List and then watch AIMClusterModels until cancelled, relisting whenever the watch cannot resume."""
+        needs_list = True
+        while True:
+            try:
+                version = await get_resource_version(AIM_API_GROUP, AIM_CLUSTER_MODEL_PLURAL)
+                if not version:
+                    logger.warning("AIMClusterModel CRD not found in cluster, AIM catalog disabled until it appears")
+                    self.ready = False
+                    await asyncio.sleep(AIM_CATALOG_RETRY_SECONDS)
+                    continue
+                if needs_list:
+                    await self._list(kube_client, version)
+                    needs_list = False
+                await self._watch(kube_client, version)
+            except asyncio.CancelledError:
+                raise
+            except ApiException as e:
+                # 410 Gone: the resource version is too old to resume from, so the catalog must be rebuilt
+                needs_list = True
+                if e.status != 410:
+                    logger.warning(f"AIM catalog watch failed: {e}")
+                    self.ready = False
+                    await asyncio.sleep(AIM_CATALOG_RETRY_SECONDS)
+            except Exception as e:
+                logger.warning(f"AIM catalog watch failed: {e}")
+                needs_list = True
+                self.ready = False
+                await asyncio.sleep(AIM_CATALOG_RETRY_SECONDS)
+
+    def start(self, kube_client: KubernetesClient) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(kube_client))
+
+    async def stop(self) -> None:
+        self.ready = False
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_aim_catalog = AIMCatalog()
+
+
+def get_aim_catalog() -> AIMCatalog:
+    return _aim_catalog
+
+
+def start_aim_catalog(kube_client: KubernetesClient) -> None:
+    """Start feeding the AIM catalog in the background."""
+    _aim_catalog.start(kube_client)
+
+
+async def stop_aim_catalog() -> None:
+    await _aim_catalog.stop()
+    logger.info("AIM catalog stopped")
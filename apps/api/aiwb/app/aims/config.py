@@ -9,3 +9,8 @@ import os
 AIM_CLUSTER_RUNTIME_CONFIG_NAME = os.getenv("AIM_CLUSTER_RUNTIME_CONFIG_NAME", "default")
 AIM_GATEWAY_NAMESPACE = os.getenv("AIM_GATEWAY_NAMESPACE", "kgateway-system")
 AIM_GATEWAY_NAME = os.getenv("AIM_GATEWAY_NAME", "https")
+
+# AIMClusterModel catalog cache: seconds before the watch is re-established and
+# seconds to wait before relisting after a failure
+AIM_CATALOG_WATCH_TIMEOUT_SECONDS = int(os.getenv("AIM_CATALOG_WATCH_TIMEOUT_SECONDS", "300"))
+AIM_CATALOG_RETRY_SECONDS = float(os.getenv("AIM_CATALOG_RETRY_SECONDS", "5"))
@@ -19,6 +19,7 @@ HTTP_ROUTE_PLURAL = "httproutes"
 # KServe definitions
 KSERVE_API_GROUP = "serving.kserve.io"
 KSERVE_INFERENCE_SERVICE_PLURAL = "inferenceservices"
+KSERVE_INFERENCE_SERVICE_RESOURCE = "InferenceService"
 
 # Tag to identify chattable AIM deployments
 CHAT_TAG_VALUE = "chat"
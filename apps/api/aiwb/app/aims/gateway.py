@@ -4,14 +4,18 @@
 
 """Gateway for accessing AIMClusterModel resources from Kubernetes."""
 
+from collections.abc import Callable
 from typing import Any
 from uuid import UUID
 
 from loguru import logger
 
+from api_common.collections import list_all_items
+
 from ..dispatch.kube_client import KubernetesClient
 from ..dispatch.utils import get_resource_version
 from ..workloads.constants import WORKLOAD_ID_LABEL
+from .catalog import get_aim_catalog
 from .constants import (
     AIM_API_GROUP,
     AIM_CLUSTER_MODEL_LABEL,
@@ -36,7 +40,11 @@ async def list_aims(
     kube_client: KubernetesClient,
     statuses: list[AIMClusterModelStatus] | None = None,
 ) -> list[AIMClusterModelResource]:
-    """Get all AIMClusterModels from Kubernetes."""
+    """Get all AIMClusterModels, from the AIM catalog when it is in sync and from Kubernetes otherwise."""
+    catalog = get_aim_catalog()
+    if catalog.ready:
+        return catalog.list_aims(statuses)
+
     aim_version = await get_resource_version(AIM_API_GROUP, AIM_CLUSTER_MODEL_PLURAL)
     if not aim_version:
         logger.warning("AIMClusterModel CRD not found in cluster")
@@ -68,7 +76,11 @@ async def list_aims(
 
 
 async def get_aim_by_name(kube_client: KubernetesClient, resource_name: str) -> AIMClusterModelResource | None:
-    """Get a specific AIMClusterModel from Kubernetes by resource name."""
+    """Get a specific AIMClusterModel by resource name, from the AIM catalog when it is in sync."""
+    catalog = get_aim_catalog()
+    if catalog.ready:
+        return catalog.get(resource_name)
+
     aim_version = await get_resource_version(AIM_API_GROUP, AIM_CLUSTER_MODEL_PLURAL)
     if not aim_version:
         logger.warning("AIMClusterModel CRD not found in cluster")
@@ -94,7 +106,7 @@ async def get_aim_by_name(kube_client: KubernetesClient, resource_name: str) ->
 
 def is_aim_service_chattable(
     aim_service: AIMServiceResource,
-    aims_by_name: dict[str, AIMClusterModelResource],
+    is_aim_chattable: Callable[[str], bool],
 ) -> bool:
     """Check if an AIM service is chattable.
 
@@ -109,12 +121,7 @@ def is_aim_service_chattable(
     if not aim_name:
         return False
 
-    aim_crd = aims_by_name.get(aim_name)
-    if not aim_crd:
-        logger.debug(f"AIM {aim_name} not found for service {aim_service.metadata.name}")
-        return False
-
-    return CHAT_TAG_VALUE in aim_crd.status.image_metadata.model.tags
+    return is_aim_chattable(aim_name)
 
 
 async def list_aim_services(
@@ -137,7 +144,8 @@ async def list_aim_services(
         return []
 
     try:
-        result = await kube_client.custom_objects.list_namespaced_custom_object(
+        items = await list_all_items(
+            kube_client.custom_objects.list_namespaced_custom_object,
             group=AIM_API_GROUP,
             version=version,
             namespace=namespace,
@@ -146,10 +154,10 @@ async def list_aim_services(
 
         httproutes = await _get_httproutes_for_aim_services(kube_client, namespace)
         isvc_names = await _get_isvc_names(kube_client, namespace)
-        aims_by_name = await _get_aims_by_name(kube_client) if chattable_only else {}
+        is_aim_chattable = await _get_aim_chat_check(kube_client) if chattable_only else None
 
         aim_services = []
-        for item in result.get("items", []):
+        for item in items:
             try:
                 aim_service = AIMServiceResource.model_validate(item)
 
@@ -158,7 +166,7 @@ async def list_aim_services(
                     continue
 
                 # Apply chattable filter
-                if chattable_only and not is_aim_service_chattable(aim_service, aims_by_name):
+                if is_aim_chattable and not is_aim_service_chattable(aim_service, is_aim_chattable):
                     continue
 
                 if aim_service.status.status == AIMServiceStatusEnum.RUNNING:
@@ -176,6 +184,31 @@ async def list_aim_services(
         return []
 
 
+async def list_all_aim_services(kube_client: KubernetesClient) -> list[AIMServiceResource]:
+    """List AIMService resources across all namespaces in a single call.
+
+    Unlike list_aim_services, the results are not enriched with HTTPRoute or InferenceService names.
+    """
+    version = await get_resource_version(AIM_API_GROUP, AIM_SERVICE_PLURAL)
+    if not version:
+        logger.warning("AIMService CRD not found in cluster")
+        return []
+
+    result = await kube_client.custom_objects.list_cluster_custom_object(
+        group=AIM_API_GROUP,
+        version=version,
+        plural=AIM_SERVICE_PLURAL,
+    )
+
+    aim_services = []
+    for item in result.get("items", []):
+        try:
+            aim_services.append(AIMServiceResource.model_validate(item))
+        except Exception as e:
+            logger.warning(f"Failed to parse AIMService {item.get('metadata', {}).get('name')}: {e}")
+    return aim_services
+
+
 async def get_aim_service_by_id(
     kube_client: KubernetesClient,
     namespace: str,
@@ -214,6 +247,41 @@ async def get_aim_service_by_id(
         return None
 
 
+async def list_aim_services_by_ids(
+    kube_client: KubernetesClient,
+    namespace: str,
+    ids: list[UUID],
+) -> list[AIMServiceResource]:
+    """Get AIMServices for a set of ids with a single set-based label selector query.
+
+    Unlike get_aim_service_by_id, the results are not enriched with HTTPRoute or InferenceService names.
+    """
+    if not ids:
+        return []
+
+    version = await get_resource_version(AIM_API_GROUP, AIM_SERVICE_PLURAL)
+    if not version:
+        logger.warning("AIMService CRD not found in cluster")
+        return []
+
+    label_selector = f"{WORKLOAD_ID_LABEL} in ({','.join(sorted({str(id) for id in ids}))})"
+    result = await kube_client.custom_objects.list_namespaced_custom_object(
+        group=AIM_API_GROUP,
+        version=version,
+        namespace=namespace,
+        plural=AIM_SERVICE_PLURAL,
+        label_selector=label_selector,
+    )
+
+    aim_services = []
+    for item in result.get("items", []):
+        try:
+            aim_services.append(AIMServiceResource.model_validate(item))
+        except Exception as e:
+            logger.warning(f"Failed to parse AIMService {item.get('metadata', {}).get('name')}: {e}")
+    return aim_services
+
+
 async def create_aim_service(
     kube_client: KubernetesClient,
     namespace: str,
@@ -399,15 +467,19 @@ async def patch_aim_service_scaling_policy(
     return AIMServiceResource.model_validate(patched)
 
 
-async def _get_aims_by_name(
-    kube_client: KubernetesClient,
-) -> dict[str, AIMClusterModelResource]:
-    """Get all AIMClusterModels, indexed by name.
+async def _get_aim_chat_check(kube_client: KubernetesClient) -> Callable[[str], bool]:
+    """Get a check whether an AIMClusterModel, by name, has the chat tag.
 
-    Single API call to avoid N+1 queries when checking chattable services.
+    Served from the chat capability index of the AIM catalog when it is in sync, otherwise from a
+    single API call to avoid N+1 queries when checking chattable services.
     """
+    catalog = get_aim_catalog()
+    if catalog.ready:
+        return catalog.is_chattable
+
     aims = await list_aims(kube_client)
-    return {aim.metadata.name: aim for aim in aims}
+    chattable = {aim.metadata.name for aim in aims if CHAT_TAG_VALUE in aim.status.image_metadata.model.tags}
+    return chattable.__contains__
 
 
 async def _get_httproutes_for_aim_services(
@@ -4,9 +4,11 @@
 
 """Repository for AIM-related database operations."""
 
+from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api_common.models import set_updated_fields
@@ -88,3 +90,60 @@ async def update_aim_service_status(
     set_updated_fields(aim_service, updater)
     await session.flush()
     return aim_service
+
+
+async def get_aim_service_statuses(session: AsyncSession) -> dict[UUID, str]:
+    """Get the status of every AIMService record, keyed by ID, without loading full rows."""
+    result = await session.execute(select(AIMService.id, AIMService.status))
+    return {row.id: row.status for row in result}
+
+
+async def bulk_create_aim_services(
+    session: AsyncSession,
+    aim_services: list[dict],
+    submitter: str = "system",
+) -> int:
+    """Insert AIMService records in a single statement, skipping IDs that already exist.
+
+    Args:
+        session: Database session
+        aim_services: Rows with id, namespace, model, status, metric and optionally created_by
+        submitter: Creator recorded for rows without created_by
+
+    Returns:
+        Number of inserted rows
+    """
+    if not aim_services:
+        return 0
+
+    now = datetime.now(UTC)
+    rows = [
+        {
+            "created_by": submitter,
+            **aim_service,
+            "updated_by": aim_service.get("created_by", submitter),
+            "created_at": now,
+            "updated_at": now,
+        }
+        for aim_service in aim_services
+    ]
+    result = await session.execute(
+        insert(AIMService).values(rows).on_conflict_do_nothing(index_elements=[AIMService.id]).returning(AIMService.id)
+    )
+    return len(result.all())
+
+
+async def bulk_update_aim_service_statuses(
+    session: AsyncSession,
+    statuses: dict[UUID, AIMServiceStatus],
+    updater: str = "system",
+) -> None:
+    """Update the status of many AIMService records with one executemany UPDATE by primary key."""
+    if not statuses:
+        return
+
+    now = datetime.now(UTC)
+    await session.execute(
+        update(AIMService),
+        [{"id": id, "status": status, "updated_at": now, "updated_by": updater} for id, status in statuses.items()],
+    )
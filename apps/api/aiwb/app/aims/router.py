@@ -16,6 +16,7 @@ from api_common.schemas import ListResponse
 
 from ..cluster_auth.client import ClusterAuthClient, get_cluster_auth_client
 from ..dispatch.kube_client import KubernetesClient, get_kube_client
+from ..dispatch.schemas import ResourceEvent
 from ..logs.client import get_loki_client
 from ..logs.schemas import LogsQueryRequest, WorkloadLogsResponse
 from ..logs.service import get_logs_by_workload_id
@@ -38,6 +39,7 @@ from .service import (
     deploy_aim,
     get_aim_by_resource_name,
     get_aim_service,
+    get_aim_service_events,
     list_aim_cluster_service_templates,
     list_aim_services,
     list_aim_services_history,
@@ -216,6 +218,20 @@ async def get_aim_service_endpoint(
     return await get_aim_service(kube_client, namespace, id)
 
 
+@router.get(
+    "/namespaces/{namespace}/aims/services/{id}/events",
+    response_model=ListResponse[ResourceEvent],
+    summary="Get AIMService events",
+    description="Get the Kubernetes events of an AIMService and of its InferenceService, most recent first.",
+)
+async def get_aim_service_events_endpoint(
+    id: UUID = Path(description="The UUID of the AIM service"),
+    namespace: str = Depends(ensure_access_to_workbench_namespace),
+    kube_client: KubernetesClient = Depends(get_kube_client),
+) -> ListResponse[ResourceEvent]:
+    return ListResponse(data=await get_aim_service_events(kube_client, namespace, id))
+
+
 @router.post(
     "/namespaces/{namespace}/aims/services/{id}/chat",
     summary="Chat with deployed AIM service",
@@ -15,9 +15,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from api_common.exceptions import ExternalServiceError, NotFoundException, ValidationException
 
 from ..dispatch.kube_client import KubernetesClient
+from ..dispatch.poller import request_sync
+from ..dispatch.schemas import ResourceEvent
+from ..dispatch.utils import get_events_for_objects
 from ..secrets.service import get_secret_details
 from ..workloads.service import stream_downstream
-from .constants import CLUSTER_AUTH_GROUP_ANNOTATION
+from .constants import AIM_SERVICE_RESOURCE, CLUSTER_AUTH_GROUP_ANNOTATION, KSERVE_INFERENCE_SERVICE_RESOURCE
 from .crds import AIMClusterServiceTemplateResource
 from .enums import AIMClusterModelStatus, AIMServiceStatus
 from .gateway import create_aim_service as create_aim_service_in_k8s
@@ -26,6 +29,7 @@ from .gateway import get_aim_by_name
 from .gateway import get_aim_service_by_id as get_aim_service_from_k8s
 from .gateway import list_aim_cluster_service_templates as get_aim_templates_from_k8s
 from .gateway import list_aim_services as get_aim_services_from_k8s
+from .gateway import list_aim_services_by_ids as get_aim_services_by_ids_from_k8s
 from .gateway import list_aims as get_aims_from_k8s
 from .gateway import patch_aim_service_scaling_policy as patch_aim_service_scaling_policy_in_k8s
 from .repository import list_aim_services_history as list_aim_services_history_from_db
@@ -160,6 +164,7 @@ async def deploy_aim(
         cluster_auth_group_id=group_id,
     )
     logger.info(f"Created AIMService {aim_service_name} in namespace {namespace}")
+    await request_sync()
     return AIMServiceResponse.model_validate(created, from_attributes=True)
 
 
@@ -195,6 +200,7 @@ async def undeploy_aim(
 
         service_name = await delete_aim_service_from_k8s(kube_client, namespace, id)
         logger.info(f"Deleted AIMService {service_name} (id: {id}) from namespace {namespace}")
+        await request_sync()
     except ValueError as e:
         raise NotFoundException(str(e))
 
@@ -222,6 +228,32 @@ async def get_aim_service(
     return AIMServiceResponse.model_validate(service, from_attributes=True)
 
 
+async def get_aim_service_events(
+    kube_client: KubernetesClient,
+    namespace: str,
+    id: UUID,
+) -> list[ResourceEvent]:
+    """Get the events of an AIMService and of its InferenceService, most recent first."""
+    service = await get_aim_service_from_k8s(kube_client, namespace, id)
+    if not service:
+        raise NotFoundException(f"AIM service {id} not found in Kubernetes (may be deleted)")
+
+    objects = [(AIM_SERVICE_RESOURCE, service.metadata.name)]
+    if service.inference_service_name:
+        objects.append((KSERVE_INFERENCE_SERVICE_RESOURCE, service.inference_service_name))
+    return await get_events_for_objects(kube_client, namespace, objects)
+
+
+async def get_aim_services_by_ids(
+    kube_client: KubernetesClient,
+    namespace: str,
+    ids: list[UUID],
+) -> list[AIMServiceResponse]:
+    """Get the AIMServices for several IDs in one request. IDs without a matching service are skipped."""
+    services = await get_aim_services_by_ids_from_k8s(kube_client, namespace, ids)
+    return [AIMServiceResponse.model_validate(s, from_attributes=True) for s in services]
+
+
 async def list_aim_services_history(
     session: AsyncSession,
     namespace: str,
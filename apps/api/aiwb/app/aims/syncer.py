@@ -4,6 +4,7 @@
 
 """AIMService syncer for polling framework."""
 
+import asyncio
 from uuid import UUID
 
 from loguru import logger
@@ -11,48 +12,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import SUBMITTER_ANNOTATION
 from ..dispatch.kube_client import KubernetesClient
-from ..namespaces.gateway import get_namespaces
+from ..dispatch.metrics import SYNC_CHANGES, SYNC_OBSERVED_OBJECTS
 from ..workloads.constants import WORKLOAD_ID_LABEL
+from .crds import AIMServiceResource
 from .enums import AIMServiceStatus
-from .gateway import get_aim_by_name, list_aim_services
-from .repository import create_aim_service, list_aim_services_history, update_aim_service_status
+from .gateway import list_aims, list_all_aim_services
+from .repository import bulk_create_aim_services, bulk_update_aim_service_statuses, get_aim_service_statuses
 
+SYNCER_NAME = "sync_aim_services"
+TERMINAL_STATUSES = {AIMServiceStatus.DELETED, AIMServiceStatus.FAILED}
 
-async def sync_aim_services(session: AsyncSession, kube_client: KubernetesClient) -> None:
-    """Sync AIMServices between K8s and DB.
-
-    This syncer performs the following tasks:
-    1. Lists all DB objects (using repository functions with models)
-    2. Lists all K8s objects (using gateway functions with CRDs)
-    3. Updates status of existing objects in DB
-    4. Creates new objects in DB that exist in K8s but not in DB
-    5. Marks objects as deleted that exist in DB but not in K8s
-    """
 
-    # 1. List all DB objects
-    db_aim_services = await list_aim_services_history(session=session)
-    # Filter to only non-terminal statuses for status updates
-    active_db_services = [
-        service
-        for service in db_aim_services
-        if service.status not in [AIMServiceStatus.DELETED, AIMServiceStatus.FAILED]
-    ]
-    # Map active services by ID for status updates
-    db_services_by_id = {service.id: service for service in active_db_services}
-    # Map ALL services by ID to prevent duplicate creation
-    all_db_services_by_id = {service.id: service for service in db_aim_services}
-
-    # 2. List all K8s objects
-    # Get all accessible namespaces (workbench namespaces with project-id label)
-    # In standalone mode, this returns only the default namespace
-    accessible_namespaces = await get_namespaces(kube_client)
-    k8s_aim_services = []
-    for namespace in accessible_namespaces:
-        services = await list_aim_services(kube_client, namespace.name)
-        k8s_aim_services.extend(services)
-
-    # Map by id from labels
-    # Only process services that have been labeled by Kyverno/AIRM
+def _index_by_workload_id(k8s_aim_services: list[AIMServiceResource]) -> dict[UUID, AIMServiceResource]:
+    """Map AIMServices by the id label. Only services labeled by Kyverno/AIRM are included."""
     k8s_services_by_id = {}
     for k8s_aim_service in k8s_aim_services:
         id_str = k8s_aim_service.metadata.labels.get(WORKLOAD_ID_LABEL)
@@ -65,66 +37,123 @@ async def sync_aim_services(session: AsyncSession, kube_client: KubernetesClient
             continue
 
         try:
-            service_id = UUID(id_str)
-            k8s_services_by_id[service_id] = k8s_aim_service
+            k8s_services_by_id[UUID(id_str)] = k8s_aim_service
         except ValueError:
             logger.warning(
                 f"Invalid workload-id UUID in K8s service "
                 f"{k8s_aim_service.metadata.namespace}/{k8s_aim_service.metadata.name}: {id_str}"
             )
+    return k8s_services_by_id
 
-    logger.debug(
-        f"AIMService sync: {len(db_aim_services)} total in DB "
-        f"({len(active_db_services)} active), {len(k8s_services_by_id)} in K8s"
+
+def _new_aim_service_row(service_id: UUID, service: AIMServiceResource, aim_names: set[str]) -> dict | None:
+    """Build the DB row for a service discovered in K8s, or None if it cannot be recorded yet."""
+    if not service.metadata.namespace:
+        logger.debug(f"Skipping AIMService {service.metadata.name} - missing namespace")
+        return None
+
+    model_name = service.status.resolved_model.name if service.status.resolved_model else None
+    if not model_name:
+        logger.debug(f"Skipping AIMService {service.metadata.name} - missing resolved model")
+        return None
+
+    if model_name not in aim_names:
+        logger.debug(f"Skipping AIMService {service.metadata.name} - AIM {model_name} not found")
+        return None
+
+    return {
+        "id": service_id,
+        "namespace": service.metadata.namespace,
+        "model": model_name,
+        "status": service.status.status,
+        "metric": service.spec.overrides.get("metric"),
+        "created_by": service.metadata.annotations.get(SUBMITTER_ANNOTATION, "system"),
+    }
+
+
+async def _create_aim_services(session: AsyncSession, rows: list[dict]) -> int:
+    """Insert new AIMService rows in savepoints, so that a failing row cannot discard the status updates.
+
+    If the bulk insert fails, the rows are inserted one by one and failing rows are retried on the next cycle.
+    """
+    if not rows:
+        return 0
+    try:
+        async with session.begin_nested():
+            return await bulk_create_aim_services(session, rows)
+    except Exception as e:
+        logger.warning(f"Bulk insert of {len(rows)} AIMService(s) failed, inserting one by one: {e}")
+
+    created = 0
+    for row in rows:
+        try:
+            async with session.begin_nested():
+                created += await bulk_create_aim_services(session, [row])
+        except Exception as e:
+            logger.exception(f"Failed to create AIMService {row['id']} in DB: {e}")
+    return created
+
+
+async def sync_aim_services(session: AsyncSession, kube_client: KubernetesClient) -> int:
+    """Sync AIMServices between K8s and DB.
+
+    This syncer performs the following tasks:
+    1. Loads the status of all DB objects, all K8s objects (cluster-wide, one call) and the AIM names
+       concurrently
+    2. Diffs K8s against DB, looking at active (non-terminal) DB objects only for status changes
+    3. Applies status changes, including objects no longer in K8s being marked as deleted, as one bulk update
+    4. Creates objects that exist in K8s but not in DB with one bulk insert, in a savepoint so that a failing
+       insert does not discard the status updates
+
+    Returns the number of changed and created objects.
+    """
+    db_statuses, k8s_aim_services, aims = await asyncio.gather(
+        get_aim_service_statuses(session),
+        list_all_aim_services(kube_client),
+        list_aims(kube_client),
     )
+    k8s_services_by_id = _index_by_workload_id(k8s_aim_services)
+    active_db_statuses = {
+        service_id: status for service_id, status in db_statuses.items() if status not in TERMINAL_STATUSES
+    }
 
-    # 3. Update status of existing objects in DB
-    for service_id, k8s_aim_service in k8s_services_by_id.items():
-        db_aim_service = db_services_by_id.get(service_id)
-        if db_aim_service:
-            k8s_status = k8s_aim_service.status.status
-            if db_aim_service.status != k8s_status:
-                logger.info(f"Updating service {service_id} status: {db_aim_service.status} -> {k8s_status}")
-                await update_aim_service_status(session, db_aim_service, k8s_status, updater="system")
+    logger.debug(
+        f"AIMService sync: {len(db_statuses)} total in DB "
+        f"({len(active_db_statuses)} active), {len(k8s_services_by_id)} in K8s"
+    )
 
-    # 4. Create new objects in DB (exist in K8s but not in DB)
+    # Status changes of existing objects, and objects that disappeared from K8s
+    status_changes: dict[UUID, AIMServiceStatus] = {}
+    for service_id, db_status in active_db_statuses.items():
+        k8s_aim_service = k8s_services_by_id.get(service_id)
+        if k8s_aim_service is None:
+            logger.info(f"Service {service_id} not found in K8s - marking as Deleted")
+            status_changes[service_id] = AIMServiceStatus.DELETED
+        elif db_status != k8s_aim_service.status.status:
+            logger.info(f"Updating service {service_id} status: {db_status} -> {k8s_aim_service.status.status}")
+            status_changes[service_id] = k8s_aim_service.status.status
+
+    # New objects (exist in K8s but not in DB)
+    aim_names = {aim.metadata.name for aim in aims}
+    new_rows = []
     for service_id, service in k8s_services_by_id.items():
-        if service_id not in all_db_services_by_id:
-            # Validate required fields
-            if not service.metadata.namespace:
-                logger.debug(f"Skipping AIMService {service.metadata.name} - missing namespace")
-                continue
-
-            model_name = service.status.resolved_model.name if service.status.resolved_model else None
-            if not model_name:
-                logger.debug(f"Skipping AIMService {service.metadata.name} - missing resolved model")
-                continue
-
-            try:
-                aim_crd = await get_aim_by_name(kube_client, model_name)
-                if not aim_crd:
-                    logger.debug(f"Skipping AIMService {service.metadata.name} - AIM {model_name} not found")
-                    continue
-
-                await create_aim_service(
-                    session=session,
-                    namespace=service.metadata.namespace,
-                    model=model_name,
-                    status=service.status.status,
-                    metric=service.spec.overrides.get("metric"),
-                    submitter=service.metadata.annotations.get(SUBMITTER_ANNOTATION, "system"),
-                    id=service_id,
-                )
-                logger.info(f"Created new AIMService {service.metadata.namespace}/{service.metadata.name}")
-            except Exception as e:
-                logger.error(f"Failed to create AIMService {service.metadata.name}: {e}")
-
-    # 5. Mark objects as deleted (exist in DB but not in K8s)
-    for service_id, db_aim_service in db_services_by_id.items():
-        if service_id not in k8s_services_by_id:
-            logger.info(
-                f"Service {service_id} (namespace: {db_aim_service.namespace}) not found in K8s - marking as Deleted"
-            )
-            await update_aim_service_status(session, db_aim_service, AIMServiceStatus.DELETED, updater="system")
+        if service_id not in db_statuses:
+            row = _new_aim_service_row(service_id, service, aim_names)
+            if row:
+                new_rows.append(row)
 
+    await bulk_update_aim_service_statuses(session, status_changes, updater="system")
+    created = await _create_aim_services(session, new_rows)
     await session.commit()
+
+    deleted = sum(1 for status in status_changes.values() if status == AIMServiceStatus.DELETED)
+    SYNC_OBSERVED_OBJECTS.labels(syncer=SYNCER_NAME).observe(len(k8s_services_by_id))
+    SYNC_CHANGES.labels(syncer=SYNCER_NAME, change="updated").inc(len(status_changes) - deleted)
+    SYNC_CHANGES.labels(syncer=SYNCER_NAME, change="deleted").inc(deleted)
+    SYNC_CHANGES.labels(syncer=SYNCER_NAME, change="created").inc(created)
+    if status_changes or created:
+        logger.info(
+            f"AIMService sync applied {len(status_changes) - deleted} status update(s), "
+            f"{deleted} deletion(s) and {created} creation(s)"
+        )
+    return len(status_changes) + created
@@ -35,6 +35,7 @@ from .service import (
     delete_api_key_from_cluster_auth,
     delete_group_from_cluster_auth,
     get_api_key_details_from_cluster_auth,
+    list_api_key_details_for_namespace,
     list_api_keys_for_namespace,
     renew_api_key_in_cluster_auth,
     unbind_api_key_from_group_in_cluster_auth,
@@ -100,6 +101,29 @@ async def create_api_key(
     )
 
 
+@router.get(
+    "/namespaces/{namespace}/api-keys/details",
+    operation_id="get_api_keys_details",
+    summary="List API keys with details for a namespace",
+    description=dedent("""List all API keys for a namespace including their Cluster Auth metadata.
+
+    Returns the same information as the per-key details endpoint for every key, looked up in one batch.
+    Keys that no longer exist in Cluster Auth are omitted. Requires namespace access."""),
+    status_code=status.HTTP_200_OK,
+    response_model=ListResponse[ApiKeyDetails],
+)
+async def get_api_keys_details(
+    namespace: str = Depends(ensure_access_to_workbench_namespace),
+    session: AsyncSession = Depends(get_session),
+    cluster_auth_client: ClusterAuthClient = Depends(get_cluster_auth_client),
+) -> ListResponse[ApiKeyDetails]:
+    """
+    Get all API keys for a namespace with their Cluster Auth metadata.
+    """
+    api_keys = await list_api_key_details_for_namespace(session, namespace, cluster_auth_client)
+    return ListResponse(data=api_keys)
+
+
 @router.get(
     "/namespaces/{namespace}/api-keys/{api_key_id}",
     operation_id="get_api_key_details",
@@ -12,9 +12,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from api_common.exceptions import ExternalServiceError, NotFoundException
 
 from ..aims.constants import CLUSTER_AUTH_GROUP_ANNOTATION
-from ..aims.service import get_aim_service
+from ..aims.service import get_aim_services_by_ids
 from ..cluster_auth.client import ClusterAuthClient
 from ..dispatch.kube_client import KubernetesClient
+from .models import ApiKey
 from .repository import create_api_key, delete_api_key, get_api_key_by_id, get_api_keys_for_namespace
 from .schemas import ApiKeyCreate, ApiKeyDetails, ApiKeyResponse, ApiKeyUpdate, ApiKeyWithFullKey, GroupResponse
 
@@ -51,7 +52,7 @@ async def _bind_api_key_to_aim_groups(
 
     logger.info(f"Resolved {len(aim_ids)} AIM(s) to {len(group_ids)} group ID(s)")
 
-    # Create tasks for all bind operations
+    # Create tasks for all bind operations; the client bounds how many run at once and retries transient failures
     bind_tasks = [cluster_auth_client.bind_api_key_to_group(cluster_auth_key_id, group_id) for group_id in group_ids]
 
     # Run all bind operations concurrently
@@ -72,8 +73,8 @@ async def _get_group_ids_for_aim_ids(
     """
     Get cluster-auth group IDs for deployed AIMs.
 
-    Fetches AIMService resources from Kubernetes by their IDs and extracts
-    the cluster-auth group ID from the "cluster-auth/allowed-group" annotation.
+    Fetches the AIMService resources for all IDs with a single Kubernetes list call
+    and extracts the cluster-auth group ID from the "cluster-auth/allowed-group" annotation.
 
     Args:
         kube_client: Kubernetes client instance
@@ -87,31 +88,37 @@ async def _get_group_ids_for_aim_ids(
     if not aim_ids:
         return []
 
-    group_ids_set: set[str] = set()
-
-    # Fetch each AIMService and extract its group ID from spec.routing.annotations
+    aim_uuids: list[UUID] = []
     for aim_id_str in aim_ids:
         try:
-            aim_uuid = UUID(aim_id_str)
-            aim_service = await get_aim_service(kube_client, namespace, aim_uuid)
-
-            # Extract group ID from spec.routing.annotations
-            routing_annotations = aim_service.spec.routing.get("annotations", {})
-            group_id = routing_annotations.get(CLUSTER_AUTH_GROUP_ANNOTATION)
-            if group_id:
-                group_ids_set.add(group_id)
-                logger.debug(f"Found group ID {group_id} for AIMService {aim_id_str}")
-            else:
-                logger.warning(
-                    f"AIMService {aim_id_str} does not have '{CLUSTER_AUTH_GROUP_ANNOTATION}' in spec.routing.annotations"
-                )
-
+            aim_uuids.append(UUID(aim_id_str))
         except ValueError as e:
             logger.error(f"Invalid UUID format for AIM ID {aim_id_str}: {e}")
-        except NotFoundException:
-            logger.warning(f"AIMService {aim_id_str} not found in namespace {namespace}")
-        except Exception as e:
-            logger.error(f"Failed to fetch AIMService {aim_id_str}: {e}")
+
+    try:
+        aim_services = await get_aim_services_by_ids(kube_client, namespace, aim_uuids)
+    except Exception as e:
+        logger.error(f"Failed to fetch AIMServices {[str(aim_uuid) for aim_uuid in aim_uuids]}: {e}")
+        return []
+
+    group_ids_set: set[str] = set()
+    found_ids: set[str] = set()
+    for aim_service in aim_services:
+        found_ids.add(str(aim_service.id))
+        # Extract group ID from spec.routing.annotations
+        routing_annotations = (aim_service.spec.routing or {}).get("annotations", {})
+        group_id = routing_annotations.get(CLUSTER_AUTH_GROUP_ANNOTATION)
+        if group_id:
+            group_ids_set.add(group_id)
+            logger.debug(f"Found group ID {group_id} for AIMService {aim_service.id}")
+        else:
+            logger.warning(
+                f"AIMService {aim_service.id} does not have '{CLUSTER_AUTH_GROUP_ANNOTATION}' in spec.routing.annotations"
+            )
+
+    for aim_uuid in aim_uuids:
+        if str(aim_uuid) not in found_ids:
+            logger.warning(f"AIMService {aim_uuid} not found in namespace {namespace}")
 
     return list(group_ids_set)
 
@@ -260,9 +267,6 @@ async def create_api_key_with_cluster_auth(
             creator=user,
         )
 
-        # Fetch ttl, expires_at, renewable, and num_uses from cluster-auth (source of truth)
-        cluster_auth_data = await cluster_auth_client.lookup_api_key(cluster_auth_key_id)
-
         # Bind API key to AIM groups if specified
         if api_key_in.aim_ids:
             await _bind_api_key_to_aim_groups(
@@ -272,8 +276,10 @@ async def create_api_key_with_cluster_auth(
                 aim_ids=api_key_in.aim_ids,
                 cluster_auth_client=cluster_auth_client,
             )
-            # Refresh cluster auth data to get updated groups
-            cluster_auth_data = await cluster_auth_client.lookup_api_key(cluster_auth_key_id)
+
+        # Fetch ttl, expires_at, renewable, and num_uses from cluster-auth (source of truth),
+        # once all bindings are in place so the groups are current
+        cluster_auth_data = await cluster_auth_client.lookup_api_key(cluster_auth_key_id)
 
     except Exception:
         # DB insert, cluster-auth lookup, or binding failed - revoke the key to prevent orphaning
@@ -401,6 +407,58 @@ async def list_api_keys_for_namespace(
     ]
 
 
+def _to_api_key_details(api_key: ApiKey, cluster_auth_data: dict) -> ApiKeyDetails:
+    return ApiKeyDetails(
+        id=api_key.id,
+        name=api_key.name,
+        truncated_key=api_key.truncated_key,
+        namespace=api_key.namespace,
+        renewable=cluster_auth_data.get("renewable", True),
+        num_uses=cluster_auth_data.get("num_uses", 0),
+        created_at=api_key.created_at,
+        updated_at=api_key.updated_at,
+        created_by=api_key.created_by,
+        updated_by=api_key.updated_by,
+        ttl=cluster_auth_data.get("ttl"),
+        expires_at=cluster_auth_data.get("expire_time"),
+        groups=cluster_auth_data.get("groups", []),
+        entity_id=cluster_auth_data.get("entity_id"),
+        meta=cluster_auth_data.get("meta", {}),
+    )
+
+
+async def list_api_key_details_for_namespace(
+    session: AsyncSession,
+    namespace: str,
+    cluster_auth_client: ClusterAuthClient,
+) -> list[ApiKeyDetails]:
+    """
+    List all API keys for a namespace with their cluster-auth metadata.
+
+    All keys are looked up in one batch, so the number of round trips does not grow
+    with the number of keys beyond the client's concurrency limit.
+
+    Args:
+        session: Database session
+        namespace: The namespace
+        cluster_auth_client: Cluster-auth client instance
+
+    Returns:
+        Detailed API key information; keys no longer known to cluster-auth are omitted
+    """
+    api_keys = await get_api_keys_for_namespace(session, namespace)
+    if not api_keys:
+        return []
+
+    cluster_auth_data = await cluster_auth_client.lookup_api_keys([key.cluster_auth_key_id for key in api_keys])
+
+    return [
+        _to_api_key_details(key, cluster_auth_data[key.cluster_auth_key_id])
+        for key in api_keys
+        if key.cluster_auth_key_id in cluster_auth_data
+    ]
+
+
 async def get_api_key_details_from_cluster_auth(
     session: AsyncSession,
     namespace: str,
@@ -437,23 +495,7 @@ async def get_api_key_details_from_cluster_auth(
             f"API key with ID {api_key_id} not found - orphaned database record has been cleaned up"
         )
 
-    return ApiKeyDetails(
-        id=api_key.id,
-        name=api_key.name,
-        truncated_key=api_key.truncated_key,
-        namespace=api_key.namespace,
-        renewable=cluster_auth_data.get("renewable", True),
-        num_uses=cluster_auth_data.get("num_uses", 0),
-        created_at=api_key.created_at,
-        updated_at=api_key.updated_at,
-        created_by=api_key.created_by,
-        updated_by=api_key.updated_by,
-        ttl=cluster_auth_data.get("ttl"),
-        expires_at=cluster_auth_data.get("expire_time"),
-        groups=cluster_auth_data.get("groups", []),
-        entity_id=cluster_auth_data.get("entity_id"),
-        meta=cluster_auth_data.get("meta", {}),
-    )
+    return _to_api_key_details(api_key, cluster_auth_data)
 
 
 async def delete_api_key_from_cluster_auth(
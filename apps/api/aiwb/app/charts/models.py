@@ -39,6 +39,8 @@ class Chart(BaseEntity):
     featured_image: Mapped[str | None] = mapped_column(String, nullable=True)
     required_resources: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
     external_url: Mapped[str | None] = mapped_column(String, nullable=True)
+    # Hash of the registered workload content, cleared by API updates so that registration reapplies the workload
+    content_hash: Mapped[str | None] = mapped_column(String, nullable=True)
 
     __table_args__ = (Index("chart_name_key", func.lower(name), unique=True),)
 
@@ -2,7 +2,10 @@
 #
 # SPDX-License-Identifier: MIT
 
+import hashlib
+import json
 from contextlib import asynccontextmanager
+from typing import Any
 
 import yaml
 from loguru import logger
@@ -11,17 +14,26 @@ from api_common.database import get_session
 from workloads_manager.core.workloads import get_registerable_workloads
 from workloads_manager.models import OverlayData
 
-from ..overlays.repository import list_overlays
+from ..overlays.repository import get_overlay_content_hashes
 from ..overlays.schemas import OverlayUpdate
 from ..overlays.service import create_overlay, update_overlay
-from .repository import create_chart, select_chart, update_chart
+from .repository import create_chart, get_chart_content_hashes, update_chart
 from .schemas import ChartCreate, ChartUpdate
 
 session_ctx = asynccontextmanager(get_session)
 
 
+def content_hash(value: Any) -> str:
+    """SHA-256 of the canonical JSON form of a value."""
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+
+
 async def register_workloads() -> None:
-    """Register workloads in the system."""
+    """Register workloads in the system.
+
+    Charts and overlays whose content hash matches the one stored at their last registration are skipped, so the
+    database is only written for workloads that changed since then.
+    """
     registerable_workloads = get_registerable_workloads()
 
     if len(registerable_workloads) == 0:
@@ -34,8 +46,12 @@ async def register_workloads() -> None:
     logger.info(f"Registering {len(registerable_workloads)} workloads.")
     created = 0
     updated = 0
+    unchanged = 0
+    overlays_written = 0
     async with session_ctx() as session:
         try:
+            charts = await get_chart_content_hashes(session)
+            overlays = await get_overlay_content_hashes(session)
             for workload in registerable_workloads:
                 # Register workload to create or update charts
                 form_data: dict[str, str | list | dict | None] = {"name": workload.chart_name, "type": workload.type}
@@ -44,52 +60,78 @@ async def register_workloads() -> None:
 
                 form_data.update(metadata)
                 form_data.update(normalize_api_files(api_files))
-                chart = await select_chart(session, chart_name=workload.chart_name)
-                if chart:
+                # Hash what would be stored, i.e. the parsed signature and the file contents, not the file paths.
+                # The chart data is built once and reused for the write.
+                create_schema = ChartCreate(**form_data)
+                chart_data = await create_schema.to_data()
+                chart_hash = content_hash(chart_data)
+                existing_chart = charts.get(workload.chart_name)
+                if existing_chart is None:
+                    created += 1
+                    chart = await create_chart(
+                        session,
+                        chart_schema=create_schema,
+                        creator="system",
+                        content_hash=chart_hash,
+                        chart_data=chart_data,
+                    )
+                    chart_id = chart.id
+                elif existing_chart[1] != chart_hash:
                     updated += 1
-                    schema = ChartUpdate(**form_data)
-                    chart = await update_chart(session, chart_id=chart.id, update_schema=schema, creator="system")
-                    pass
+                    chart_id = existing_chart[0]
+                    await update_chart(
+                        session,
+                        chart_id=chart_id,
+                        update_schema=ChartUpdate(**form_data),
+                        creator="system",
+                        content_hash=chart_hash,
+                        chart_data=as_update_data(chart_data),
+                    )
                 else:
-                    created += 1
-                    schema = ChartCreate(**form_data)
-                    chart = await create_chart(session, chart_schema=schema, creator="system")
-                    pass
+                    unchanged += 1
+                    chart_id = existing_chart[0]
                 # Register workload files
                 overlay_files = workload.get_overlay_files()
                 for file_path, rel_path_str in overlay_files:
                     content = file_path.read_text(encoding="utf-8")
+                    overlay_hash = content_hash(content)
                     canonical_name = None
                     raw_data = yaml.safe_load(content)
                     if raw_data and isinstance(raw_data, dict):
                         overlay_data = OverlayData(**raw_data)
                         canonical_name = overlay_data.canonical_name
                     # Find existing overlay by chart_id AND canonical_name
-                    existing_overlays = await list_overlays(
-                        session=session, chart_id=chart.id, canonical_name=canonical_name
-                    )
-                    overlay_schema = {"chart_id": chart.id}
+                    existing_overlay = overlays.get((chart_id, canonical_name))
+                    if existing_overlay and existing_overlay[1] == overlay_hash:
+                        continue
+                    overlay_schema = {"chart_id": chart_id}
                     if raw_data:
                         overlay_schema["overlay"] = raw_data
-                    if existing_overlays:
+                    if existing_overlay:
                         # Update the existing overlay with matching canonical_name
-                        overlay = existing_overlays[0]  # Should only be one due to unique constraint
-                        await update_overlay(
+                        overlay = await update_overlay(
                             session=session,
-                            overlay_id=overlay.id,
+                            overlay_id=existing_overlay[0],
                             overlay_update=OverlayUpdate(**overlay_schema, updated_by="system"),
+                            content_hash=overlay_hash,
                         )
                     else:
                         if not raw_data:
                             raise ValueError("Overlay data is required for creating an overlay.")
-                        await create_overlay(
+                        overlay = await create_overlay(
                             session=session,
-                            chart_id=chart.id,
+                            chart_id=chart_id,
                             overlay_data=raw_data,
                             canonical_name=canonical_name,
                             creator="system",
+                            content_hash=overlay_hash,
                         )
-            logger.info(f"Registration complete: {created} created, {updated} updated workloads")
+                    overlays[(chart_id, canonical_name)] = (overlay.id, overlay_hash)
+                    overlays_written += 1
+            logger.info(
+                f"Registration complete: {created} created, {updated} updated, {unchanged} unchanged workloads, "
+                f"{overlays_written} overlays written"
+            )
         except Exception as e:
             await session.rollback()
             logger.exception("Registration failed")
@@ -102,3 +144,8 @@ def normalize_api_files(files: dict) -> dict[str, str]:
     if isinstance(signature, list) and signature:
         signature = signature[0]
     return {"files": files["files"], "signature": signature}
+
+
+def as_update_data(chart_data: dict) -> dict:
+    """Convert ChartCreate.to_data() output into the ChartUpdate.to_data() form, which leaves unset fields as is."""
+    return {key: value for key, value in chart_data.items() if value is not None or key in ("signature", "files")}
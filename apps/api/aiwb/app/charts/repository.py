@@ -2,12 +2,14 @@
 #
 # SPDX-License-Identifier: MIT
 
+from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from api_common.exceptions import ConflictException, NotFoundException
 from api_common.models import set_updated_fields
@@ -17,12 +19,21 @@ from .models import Chart, ChartFile
 from .schemas import ChartCreate, ChartUpdate
 
 
-async def create_chart(session: AsyncSession, chart_schema: ChartCreate, creator: str) -> Chart:
-    """Create a new chart with associated files."""
-    data = await chart_schema.to_data()
+async def create_chart(
+    session: AsyncSession,
+    chart_schema: ChartCreate,
+    creator: str,
+    content_hash: str | None = None,
+    chart_data: dict | None = None,
+) -> Chart:
+    """Create a new chart with associated files.
+
+    chart_data is the result of chart_schema.to_data() when the caller already built it.
+    """
+    data = dict(chart_data) if chart_data is not None else await chart_schema.to_data()
     files_data = data.pop("files", [])  # Files need to be added as separate records
 
-    db_chart = Chart(**data, created_by=creator, updated_by=creator)
+    db_chart = Chart(**data, content_hash=content_hash, created_by=creator, updated_by=creator)
     session.add(db_chart)
     try:
         await session.flush()  # Flush to get the chart ID
@@ -78,31 +89,92 @@ async def select_chart(
     return result.scalars().first()
 
 
-async def update_chart(session: AsyncSession, chart_id: UUID, update_schema: ChartUpdate, creator: str) -> Chart:
-    """Update an existing chart with the provided fields."""
+async def get_chart_content_hashes(session: AsyncSession) -> dict[str, tuple[UUID, str | None]]:
+    """Map chart names to their ID and registered content hash, without loading chart files."""
+    result = await session.execute(select(Chart.name, Chart.id, Chart.content_hash))
+    return {name: (chart_id, content_hash) for name, chart_id, content_hash in result.all()}
+
+
+async def update_chart(
+    session: AsyncSession,
+    chart_id: UUID,
+    update_schema: ChartUpdate,
+    creator: str,
+    content_hash: str | None = None,
+    chart_data: dict | None = None,
+) -> Chart:
+    """Update an existing chart with the provided fields.
+
+    The content hash is replaced as well, so updates outside of workload registration clear it. chart_data is the
+    result of update_schema.to_data() when the caller already built it.
+    """
     chart = await select_chart(session, chart_id=chart_id)
     if not chart:
         raise NotFoundException(f"Chart with ID {chart_id} not found")
 
-    data = await update_schema.to_data()
+    data = dict(chart_data) if chart_data is not None else await update_schema.to_data()
     files_data = data.pop("files", None)
 
     # Update chart fields (excluding files)
     for field, value in data.items():
         setattr(chart, field, value)
 
-    # Files are replaced completely for simplicity
     if files_data is not None:
-        await delete_chart_files(session, chart_id)
-        if files_data:  # Only create records if there are files
-            await create_file_records(session, chart_id, files_data, creator)
+        await sync_chart_files(session, chart, files_data, creator)
 
+    chart.content_hash = content_hash
     set_updated_fields(chart, creator)
 
     await session.flush()
     return chart
 
 
+async def sync_chart_files(session: AsyncSession, chart: Chart, files: list[dict], creator: str) -> None:
+    """Replace the files of a chart, diffing them by path against the loaded chart files.
+
+    Removed, changed and new files are written with at most one DELETE, one UPDATE and one INSERT statement;
+    unchanged files are not written at all.
+    """
+    existing = {file.path: file for file in chart.files}
+    contents = {file["path"]: file["content"] for file in files}
+    removed_ids = [file.id for path, file in existing.items() if path not in contents]
+    changed = [
+        existing[path] for path, content in contents.items() if path in existing and existing[path].content != content
+    ]
+    added = [path for path in contents if path not in existing]
+
+    if removed_ids:
+        await session.execute(delete(ChartFile).where(ChartFile.id.in_(removed_ids)))
+    if changed:
+        now = datetime.now(UTC)
+        await session.execute(
+            update(ChartFile),
+            [
+                {"id": file.id, "content": contents[file.path], "updated_at": now, "updated_by": creator}
+                for file in changed
+            ],
+        )
+        for file in changed:
+            # The bulk update does not touch loaded objects
+            set_committed_value(file, "content", contents[file.path])
+    if added:
+        await session.execute(
+            insert(ChartFile),
+            [
+                {
+                    "chart_id": chart.id,
+                    "path": path,
+                    "content": contents[path],
+                    "created_by": creator,
+                    "updated_by": creator,
+                }
+                for path in added
+            ],
+        )
+    if removed_ids or added:
+        await session.refresh(chart, attribute_names=["files"])
+
+
 async def delete_chart_files(session: AsyncSession, chart_id: UUID) -> None:
     """Delete specific files from a chart."""
     query = select(ChartFile).where(ChartFile.chart_id == chart_id)
@@ -2,11 +2,39 @@
 #
 # SPDX-License-Identifier: MIT
 
+import asyncio
+import time
+
 import httpx
 from fastapi import Request
 from loguru import logger
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential
+
+from api_common.request_timing import instrument_httpx_client
+
+from .config import (
+    CLUSTER_AUTH_ADMIN_TOKEN,
+    CLUSTER_AUTH_LOOKUP_CACHE_MAX_ENTRIES,
+    CLUSTER_AUTH_LOOKUP_CACHE_TTL_SECONDS,
+    CLUSTER_AUTH_MAX_ATTEMPTS,
+    CLUSTER_AUTH_MAX_CONCURRENCY,
+    CLUSTER_AUTH_MAX_WAIT,
+    CLUSTER_AUTH_MIN_WAIT,
+    CLUSTER_AUTH_URL,
+)
+
 
-from .config import CLUSTER_AUTH_ADMIN_TOKEN, CLUSTER_AUTH_URL
+def _is_retryable(error: BaseException) -> bool:
+    """Transport failures, throttling and server errors are worth retrying; client errors are not."""
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429 or error.response.status_code >= 500
+    return False
+
+
+def _is_not_found(error: BaseException) -> bool:
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 404
 
 
 class ClusterAuthClient:
@@ -14,24 +42,65 @@ class ClusterAuthClient:
     Client for cluster-auth API service for API key management.
 
     This client communicates with the cluster-auth service which manages
-    API keys, entities, and groups.
+    API keys, entities, and groups. Requests share one pooled connection set and
+    at most `max_concurrency` of them are in flight at once. Key lookups are cached
+    for a short TTL in a cache bounded to `lookup_cache_max_entries`, and the cache
+    entry is dropped whenever the key is changed through this client.
     """
 
-    def __init__(self, base_url: str, admin_token: str):
+    def __init__(
+        self,
+        base_url: str,
+        admin_token: str,
+        max_concurrency: int = CLUSTER_AUTH_MAX_CONCURRENCY,
+        lookup_cache_ttl: float = CLUSTER_AUTH_LOOKUP_CACHE_TTL_SECONDS,
+        lookup_cache_max_entries: int = CLUSTER_AUTH_LOOKUP_CACHE_MAX_ENTRIES,
+    ):
         """
         Initialize the cluster-auth client.
 
         Args:
             base_url: Base URL of the cluster-auth service
             admin_token: Admin token for authentication
+            max_concurrency: Maximum number of concurrent requests to cluster-auth
+            lookup_cache_ttl: Seconds a key lookup result is reused (0 disables caching)
+            lookup_cache_max_entries: Maximum number of cached key lookups
         """
         self.base_url = base_url.rstrip("/")
         self.admin_token = admin_token
+        self.lookup_cache_ttl = lookup_cache_ttl
+        self.lookup_cache_max_entries = lookup_cache_max_entries
         self.client = httpx.AsyncClient(
             base_url=self.base_url,
             headers={"X-Admin-Token": self.admin_token},
             timeout=30.0,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+        )
+        instrument_httpx_client(self.client, "cluster-auth")
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._lookup_cache: dict[str, tuple[float, dict]] = {}
+
+    async def _post(self, path: str, payload: dict) -> httpx.Response:
+        async with self._semaphore:
+            response = await self.client.post(path, json=payload)
+        response.raise_for_status()
+        return response
+
+    async def _post_with_retry(self, path: str, payload: dict) -> httpx.Response:
+        """POST an idempotent request, retrying transient failures with exponential backoff."""
+        retrying = AsyncRetrying(
+            retry=retry_if_exception(_is_retryable),
+            wait=wait_exponential(
+                multiplier=CLUSTER_AUTH_MIN_WAIT, min=CLUSTER_AUTH_MIN_WAIT, max=CLUSTER_AUTH_MAX_WAIT
+            ),
+            stop=stop_after_attempt(CLUSTER_AUTH_MAX_ATTEMPTS),
+            reraise=True,
         )
+        return await retrying(self._post, path, payload)
+
+    def invalidate_lookup(self, key_id: str) -> None:
+        """Drop the cached lookup result for a key."""
+        self._lookup_cache.pop(key_id, None)
 
     async def create_api_key(
         self,
@@ -69,8 +138,7 @@ class ClusterAuthClient:
             "explicit_max_ttl": explicit_max_ttl,
         }
 
-        response = await self.client.post("/apikey/create", json=payload)
-        response.raise_for_status()
+        response = await self._post("/apikey/create", payload)
         return response.json()
 
     async def revoke_api_key(self, key_id: str) -> None:
@@ -84,8 +152,8 @@ class ClusterAuthClient:
             httpx.HTTPStatusError: If the request fails
         """
         payload = {"key_id": key_id}
-        response = await self.client.post("/apikey/revoke", json=payload)
-        response.raise_for_status()
+        self.invalidate_lookup(key_id)
+        await self._post("/apikey/revoke", payload)
 
     async def renew_api_key(self, key_id: str) -> dict:
         """
@@ -101,13 +169,13 @@ class ClusterAuthClient:
             httpx.HTTPStatusError: If the request fails
         """
         payload = {"key_id": key_id}
-        response = await self.client.post("/apikey/renew", json=payload)
-        response.raise_for_status()
+        self.invalidate_lookup(key_id)
+        response = await self._post("/apikey/renew", payload)
         return response.json()
 
     async def lookup_api_key(self, key_id: str) -> dict:
         """
-        Get API key metadata.
+        Get API key metadata, served from the lookup cache when fresh.
 
         Args:
             key_id: The accessor/key_id of the API key
@@ -118,10 +186,55 @@ class ClusterAuthClient:
         Raises:
             httpx.HTTPStatusError: If the request fails
         """
+        cached = self._lookup_cache.get(key_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
         payload = {"key_id": key_id}
-        response = await self.client.post("/apikey/lookup", json=payload)
-        response.raise_for_status()
-        return response.json()
+        response = await self._post("/apikey/lookup", payload)
+        data = response.json()
+        if self.lookup_cache_ttl > 0:
+            self._cache_lookup(key_id, data)
+        return data
+
+    def _cache_lookup(self, key_id: str, data: dict) -> None:
+        now = time.monotonic()
+        self._lookup_cache.pop(key_id, None)
+        if len(self._lookup_cache) >= self.lookup_cache_max_entries:
+            for expired_key in [k for k, (expires_at, _) in self._lookup_cache.items() if expires_at <= now]:
+                del self._lookup_cache[expired_key]
+            if len(self._lookup_cache) >= self.lookup_cache_max_entries:
+                self._lookup_cache.pop(next(iter(self._lookup_cache)))
+        self._lookup_cache[key_id] = (now + self.lookup_cache_ttl, data)
+
+    async def lookup_api_keys(self, key_ids: list[str]) -> dict[str, dict]:
+        """
+        Get metadata for several API keys at once.
+
+        Duplicate IDs are looked up once, cached entries are reused, and the remaining
+        lookups run concurrently within the client's concurrency limit.
+
+        Args:
+            key_ids: The accessors/key_ids of the API keys
+
+        Returns:
+            dict mapping key_id to key metadata; keys unknown to cluster-auth are omitted
+
+        Raises:
+            httpx.HTTPStatusError: If a lookup fails for a reason other than the key not existing
+        """
+        unique_ids = list(dict.fromkeys(key_ids))
+        results = await asyncio.gather(*(self.lookup_api_key(key_id) for key_id in unique_ids), return_exceptions=True)
+
+        found: dict[str, dict] = {}
+        for key_id, result in zip(unique_ids, results):
+            if isinstance(result, BaseException):
+                if _is_not_found(result):
+                    logger.warning(f"API key {key_id} not found in cluster-auth")
+                    continue
+                raise result
+            found[key_id] = result
+        return found
 
     async def create_group(self, name: str, group_id: str | None = None) -> dict:
         """
@@ -141,8 +254,7 @@ class ClusterAuthClient:
         if group_id:
             payload["id"] = group_id
 
-        response = await self.client.post("/apikey/group", json=payload)
-        response.raise_for_status()
+        response = await self._post("/apikey/group", payload)
         return response.json()
 
     async def delete_group(self, group_id: str) -> None:
@@ -156,13 +268,16 @@ class ClusterAuthClient:
             httpx.HTTPStatusError: If the request fails
         """
         payload = {"id": group_id}
-        response = await self.client.request("DELETE", "/apikey/group", json=payload)
+        async with self._semaphore:
+            response = await self.client.request("DELETE", "/apikey/group", json=payload)
         response.raise_for_status()
 
     async def bind_api_key_to_group(self, key_id: str, group_id: str) -> dict:
         """
         Bind an API key to a group by adding the key's entity to the group.
 
+        Transient failures are retried with exponential backoff.
+
         Args:
             key_id: The accessor/key_id of the API key
             group_id: The ID of the group
@@ -174,14 +289,18 @@ class ClusterAuthClient:
             httpx.HTTPStatusError: If the request fails
         """
         payload = {"key_id": key_id, "group_id": group_id}
-        response = await self.client.post("/apikey/bind", json=payload)
-        response.raise_for_status()
+        try:
+            response = await self._post_with_retry("/apikey/bind", payload)
+        finally:
+            self.invalidate_lookup(key_id)
         return response.json()
 
     async def unbind_api_key_from_group(self, key_id: str, group_id: str) -> dict:
         """
         Unbind an API key from a group by removing the key's entity from the group.
 
+        Transient failures are retried with exponential backoff.
+
         Args:
             key_id: The accessor/key_id of the API key
             group_id: The ID of the group
@@ -193,12 +312,15 @@ class ClusterAuthClient:
             httpx.HTTPStatusError: If the request fails
         """
         payload = {"key_id": key_id, "group_id": group_id}
-        response = await self.client.post("/apikey/unbind", json=payload)
-        response.raise_for_status()
+        try:
+            response = await self._post_with_retry("/apikey/unbind", payload)
+        finally:
+            self.invalidate_lookup(key_id)
         return response.json()
 
     async def close(self) -> None:
         """Close the HTTP client."""
+        self._lookup_cache.clear()
         await self.client.aclose()
 
 
@@ -11,3 +11,9 @@ import os
 # ============================================================================
 CLUSTER_AUTH_URL = os.getenv("CLUSTER_AUTH_URL", "http://localhost:48012")
 CLUSTER_AUTH_ADMIN_TOKEN = os.getenv("CLUSTER_AUTH_ADMIN_TOKEN", "")
+CLUSTER_AUTH_MAX_CONCURRENCY = int(os.getenv("CLUSTER_AUTH_MAX_CONCURRENCY", "8"))
+CLUSTER_AUTH_LOOKUP_CACHE_TTL_SECONDS = float(os.getenv("CLUSTER_AUTH_LOOKUP_CACHE_TTL_SECONDS", "5"))
+CLUSTER_AUTH_LOOKUP_CACHE_MAX_ENTRIES = int(os.getenv("CLUSTER_AUTH_LOOKUP_CACHE_MAX_ENTRIES", "1024"))
+CLUSTER_AUTH_MAX_ATTEMPTS = int(os.getenv("CLUSTER_AUTH_MAX_ATTEMPTS", "3"))
+CLUSTER_AUTH_MIN_WAIT = float(os.getenv("CLUSTER_AUTH_MIN_WAIT", "0.2"))
+CLUSTER_AUTH_MAX_WAIT = float(os.getenv("CLUSTER_AUTH_MAX_WAIT", "2"))
@@ -14,6 +14,28 @@ USE_LOCAL_KUBE_CONTEXT = os.getenv("USE_LOCAL_KUBE_CONTEXT", "false").lower() ==
 
 # Polling configuration for all syncers (workloads, aims)
 POLLING_INTERVAL_SECONDS = int(os.getenv("SYNCER_POLLING_INTERVAL_SECONDS", "5"))
+# Syncers that find nothing to do back off by this factor per idle run, up to the maximum interval
+SYNCER_BACKOFF_FACTOR = float(os.getenv("SYNCER_BACKOFF_FACTOR", "2"))
+SYNCER_MAX_POLLING_INTERVAL_SECONDS = int(os.getenv("SYNCER_MAX_POLLING_INTERVAL_SECONDS", "60"))
+
+# Leader election: each syncer only runs in the replica holding its PostgreSQL advisory lock
+SYNCER_LEADER_ELECTION_ENABLED = os.getenv("SYNCER_LEADER_ELECTION_ENABLED", "true").lower() == "true"
+SYNCER_LEADER_LOCK_NAMESPACE = int(os.getenv("SYNCER_LEADER_LOCK_NAMESPACE", "1095325506"))
+# TCP keepalive on the lock connection, bounds how long a crashed leader keeps its locks
+SYNCER_LEADER_KEEPALIVE_SECONDS = int(os.getenv("SYNCER_LEADER_KEEPALIVE_SECONDS", "5"))
+SYNCER_WAKEUP_CHANNEL = os.getenv("SYNCER_WAKEUP_CHANNEL", "aiwb_syncer_wakeup")
+
+# Cluster event index: whether to watch events at all, events kept per involved object, seconds before the watch is
+# re-established and seconds to wait before relisting after a failure
+EVENT_INDEX_ENABLED = os.getenv("EVENT_INDEX_ENABLED", "true").lower() == "true"
+EVENT_INDEX_MAX_EVENTS_PER_OBJECT = int(os.getenv("EVENT_INDEX_MAX_EVENTS_PER_OBJECT", "50"))
+EVENT_INDEX_WATCH_TIMEOUT_SECONDS = int(os.getenv("EVENT_INDEX_WATCH_TIMEOUT_SECONDS", "300"))
+EVENT_INDEX_RETRY_SECONDS = float(os.getenv("EVENT_INDEX_RETRY_SECONDS", "5"))
+
+# Discovery for the dynamic client: snapshot of the discovery documents, kept across restarts when the file is on a
+# persistent volume (defaults to a file in the temp directory), and seconds an unknown kind is not looked up again
+KUBE_DISCOVERY_CACHE_FILE = os.getenv("KUBE_DISCOVERY_CACHE_FILE") or None
+KUBE_DISCOVERY_NEGATIVE_TTL_SECONDS = float(os.getenv("KUBE_DISCOVERY_NEGATIVE_TTL_SECONDS", "30"))
 
 
 async def load_k8s_config() -> None:
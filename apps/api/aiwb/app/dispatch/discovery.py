@@ -0,0 +1,135 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Async resolution of API resources for the dynamic client.
+
+The sync DynamicClient discovers the API resource of a kind on the calling thread, and its discoverer drops and
+reloads the whole discovery cache from /api and /apis whenever a kind is not found. Applying and deleting workloads
+resolves several kinds per request, so the resolver keeps the resolved resources in memory, runs discovery in a
+worker thread one lookup at a time, shares a lookup between concurrent callers of the same kind and remembers
+unknown kinds for KUBE_DISCOVERY_NEGATIVE_TTL_SECONDS. The discoverer itself keeps a snapshot of the discovery
+documents in KUBE_DISCOVERY_CACHE_FILE, so restarted pods do not need to rediscover the whole cluster.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterable
+
+from kubernetes.dynamic import Resource
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+from loguru import logger
+
+from .config import KUBE_DISCOVERY_NEGATIVE_TTL_SECONDS
+from .kube_client import get_dynamic_client
+
+# API version and kind
+ResourceKey = tuple[str, str]
+
+
+class ResourceResolver:
+    """In-memory cache of the API resources of the dynamic client, keyed by API version and kind."""
+
+    def __init__(self, negative_ttl_seconds: float = KUBE_DISCOVERY_NEGATIVE_TTL_SECONDS) -> None:
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._resources: dict[ResourceKey, Resource] = {}
+        # Unknown kinds, with the time until which they are not looked up again
+        self._missing: dict[ResourceKey, tuple[float, ResourceNotFoundError]] = {}
+        self._lookups: dict[ResourceKey, asyncio.Task[Resource]] = {}
+        # The discoverer updates its cache in place and is not thread-safe
+        self._discovery_lock = threading.Lock()
+        self._task: asyncio.Task | None = None
+
+    def _discover(self, key: ResourceKey, refresh: bool) -> Resource:
+        with self._discovery_lock:
+            discoverer = get_dynamic_client().resources
+            if refresh:
+                discoverer.invalidate_cache()
+            return discoverer.get(api_version=key[0], kind=key[1])
+
+    async def _lookup(self, key: ResourceKey, refresh: bool) -> Resource:
+        try:
+            resource = await asyncio.to_thread(self._discover, key, refresh)
+        except ResourceNotFoundError as e:
+            self._missing[key] = (time.monotonic() + self.negative_ttl_seconds, e)
+            raise
+        self._resources[key] = resource
+        self._missing.pop(key, None)
+        return resource
+
+    async def _resolve(self, key: ResourceKey, refresh: bool) -> Resource:
+        lookup = self._lookups.get(key)
+        if lookup is None:
+            lookup = asyncio.create_task(self._lookup(key, refresh))
+            self._lookups[key] = lookup
+            lookup.add_done_callback(lambda _: self._lookups.pop(key, None))
+        # Shielded, so a cancelled caller does not cancel the lookup shared with the others
+        return await asyncio.shield(lookup)
+
+    async def get(self, api_version: str, kind: str) -> Resource:
+        """Return the API resource of a kind, discovering it in a worker thread if it is not cached.
+
+        Raises:
+            ResourceNotFoundError: If the cluster does not serve the kind.
+        """
+        key = (api_version, kind)
+        if (resource := self._resources.get(key)) is not None:
+            return resource
+        missing = self._missing.get(key)
+        if missing is not None and missing[0] > time.monotonic():
+            raise missing[1]
+        return await self._resolve(key, refresh=False)
+
+    async def refresh(self, api_version: str, kind: str) -> Resource:
+        """Rediscover a kind after the API server answered 404 for it, e.g. after its CRD was reinstalled."""
+        key = (api_version, kind)
+        self._resources.pop(key, None)
+        self._missing.pop(key, None)
+        return await self._resolve(key, refresh=True)
+
+    async def warm_up(self, keys: Iterable[ResourceKey]) -> None:
+        """Resolve the given kinds ahead of the first request that needs them."""
+        for api_version, kind in keys:
+            try:
+                await self.get(api_version, kind)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Could not discover {kind} ({api_version or 'core'}): {e}")
+        logger.info(f"Resource resolver warmed up with {len(self._resources)} API resources")
+
+    def start(self, keys: Iterable[ResourceKey]) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.warm_up(list(keys)))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_resource_resolver = ResourceResolver()
+
+
+async def resolve_resource(api_version: str, kind: str) -> Resource:
+    """Return the dynamic client API resource of a kind without blocking the event loop on discovery."""
+    return await _resource_resolver.get(api_version, kind)
+
+
+async def refresh_resource(api_version: str, kind: str) -> Resource:
+    """Rediscover the dynamic client API resource of a kind, dropping the cached discovery documents."""
+    return await _resource_resolver.refresh(api_version, kind)
+
+
+def start_resource_resolver(keys: Iterable[ResourceKey]) -> None:
+    """Discover the given kinds in the background, so the first requests find them cached."""
+    _resource_resolver.start(keys)
+
+
+async def stop_resource_resolver() -> None:
+    await _resource_resolver.stop()
@@ -0,0 +1,215 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Cluster-wide index of recent Kubernetes events.
+
+Workload and AIM service detail views show the events of the objects they are made of. Listing all events of a
+namespace per view and filtering them in Python loads the API server in busy namespaces, which hold thousands of
+events. The index lists events once, keeps them current through a watch and groups them by the namespace, kind and
+name of their involved object, keeping the most recent EVENT_INDEX_MAX_EVENTS_PER_OBJECT per object. Readers query
+the API server with a field selector whenever the index is not in sync.
+"""
+
+import asyncio
+from collections import defaultdict
+from datetime import UTC, datetime
+from typing import Any
+
+from kubernetes_asyncio import client, watch
+from kubernetes_asyncio.client import ApiException, CoreV1Event
+from loguru import logger
+
+from .config import EVENT_INDEX_MAX_EVENTS_PER_OBJECT, EVENT_INDEX_RETRY_SECONDS, EVENT_INDEX_WATCH_TIMEOUT_SECONDS
+
+# Events requested per list call when (re)building the index
+EVENT_LIST_CHUNK_SIZE = 500
+
+ObjectKey = tuple[str, str, str]
+
+
+def format_event(event: CoreV1Event) -> dict[str, Any]:
+    """Convert a Kubernetes event into the dict returned to API clients."""
+    return {
+        "type": event.type,
+        "reason": event.reason,
+        "message": event.message,
+        "timestamp": event.last_timestamp or event.event_time,
+        "count": event.count,
+        "source": event.source.component if event.source else None,
+    }
+
+
+def sort_events(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Sort formatted events by timestamp, most recent first and events without a timestamp last."""
+    return sorted(events, key=_event_sort_key, reverse=True)
+
+
+def _event_sort_key(event: dict[str, Any]) -> tuple[bool, datetime]:
+    timestamp = event["timestamp"]
+    if not isinstance(timestamp, datetime):
+        return (False, datetime.min.replace(tzinfo=UTC))
+    return (True, timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=UTC))
+
+
+class EventIndex:
+    """In-memory view of recent events in all namespaces, fed by a list followed by a watch.
+
+    The returned events are shared between callers and must not be modified.
+    """
+
+    def __init__(self, max_events_per_object: int = EVENT_INDEX_MAX_EVENTS_PER_OBJECT) -> None:
+        self.max_events_per_object = max_events_per_object
+        self.resource_version: str | None = None
+        self.ready = False
+        # Formatted events by involved object, keyed by event UID
+        self._by_object: dict[ObjectKey, dict[str, dict[str, Any]]] = {}
+        self._object_by_uid: dict[str, ObjectKey] = {}
+        self._kinds: defaultdict[tuple[str, str], set[str]] = defaultdict(set)
+        self._task: asyncio.Task | None = None
+
+    # Index maintenance
+
+    def _index(self, event: CoreV1Event) -> None:
+        uid = event.metadata.uid
+        involved = event.involved_object
+        key = (event.metadata.namespace or involved.namespace or "", involved.kind or "", involved.name or "")
+        self._unindex(uid)
+        events = self._by_object.setdefault(key, {})
+        events[uid] = format_event(event)
+        self._object_by_uid[uid] = key
+        self._kinds[(key[0], key[2])].add(key[1])
+        if len(events) > self.max_events_per_object:
+            oldest = min(events, key=lambda event_uid: _event_sort_key(events[event_uid]))
+            self._unindex(oldest)
+
+    def _unindex(self, uid: str) -> None:
+        key = self._object_by_uid.pop(uid, None)
+        if key is None:
+            return
+        events = self._by_object[key]
+        events.pop(uid, None)
+        if not events:
+            del self._by_object[key]
+            kinds = self._kinds[(key[0], key[2])]
+            kinds.discard(key[1])
+            if not kinds:
+                del self._kinds[(key[0], key[2])]
+
+    def replace(self, events: list[CoreV1Event], resource_version: str | None) -> None:
+        """Replace the whole index content, e.g. after a (re)list."""
+        self._by_object.clear()
+        self._object_by_uid.clear()
+        self._kinds.clear()
+        for event in events:
+            self._index(event)
+        self.resource_version = resource_version
+        self.ready = True
+
+    def apply_event(self, event: dict[str, Any]) -> None:
+        """Apply a single watch event (ADDED, MODIFIED, DELETED or BOOKMARK) to the index.
+
+        The watch leaves the object of a BOOKMARK undecoded, so its resource version is read from the raw object.
+        """
+        resource_version = event["raw_object"].get("metadata", {}).get("resourceVersion")
+        if resource_version:
+            self.resource_version = resource_version
+        if event["type"] == "BOOKMARK":
+            return
+        if event["type"] == "DELETED":
+            self._unindex(event["object"].metadata.uid)
+            return
+        self._index(event["object"])
+
+    # Reads
+
+    def get_events(self, namespace: str, name: str, kind: str | None = None) -> list[dict[str, Any]]:
+        """Return the indexed events of an object, most recent first. Without a kind, objects of all kinds match."""
+        kinds = [kind] if kind else self._kinds.get((namespace, name), ())
+        events = [
+            event for object_kind in kinds for event in self._by_object.get((namespace, object_kind, name), {}).values()
+        ]
+        return sort_events(events)
+
+    # Feeding
+
+    async def _list(self, core_v1: client.CoreV1Api) -> None:
+        events: list[CoreV1Event] = []
+        continue_token = None
+        while True:
+            result = await core_v1.list_event_for_all_namespaces(limit=EVENT_LIST_CHUNK_SIZE, _continue=continue_token)
+            events.extend(result.items)
+            continue_token = result.metadata._continue
+            if not continue_token:
+                break
+        self.replace(events, result.metadata.resource_version)
+        logger.info(f"Event index loaded {len(events)} events")
+
+    async def _watch(self, core_v1: client.CoreV1Api) -> None:
+        """Stream changes since the last seen resource version until the server closes the watch.
+
+        ERROR events are raised by the watch as ApiException, e.g. 410 when the resource version expired.
+        """
+        async with watch.Watch() as watcher:
+            async for event in watcher.stream(
+                core_v1.list_event_for_all_namespaces,
+                resource_version=self.resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=EVENT_INDEX_WATCH_TIMEOUT_SECONDS,
+            ):
+                self.apply_event(event)
+
+    async def run(self, core_v1: client.CoreV1Api) -> None:
+        """List and then watch events until cancelled, relisting whenever the watch cannot resume."""
+        needs_list = True
+        while True:
+            try:
+                if needs_list:
+                    await self._list(core_v1)
+                    needs_list = False
+                await self._watch(core_v1)
+            except asyncio.CancelledError:
+                raise
+            except ApiException as e:
+                # 410 Gone: the resource version is too old to resume from, so the index must be rebuilt
+                needs_list = True
+                if e.status != 410:
+                    logger.warning(f"Event index watch failed: {e}")
+                    self.ready = False
+                    await asyncio.sleep(EVENT_INDEX_RETRY_SECONDS)
+            except Exception as e:
+                logger.warning(f"Event index watch failed: {e}")
+                needs_list = True
+                self.ready = False
+                await asyncio.sleep(EVENT_INDEX_RETRY_SECONDS)
+
+    def start(self, core_v1: client.CoreV1Api) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(core_v1))
+
+    async def stop(self) -> None:
+        self.ready = False
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_event_index = EventIndex()
+
+
+def get_event_index() -> EventIndex:
+    return _event_index
+
+
+def start_event_index(core_v1: client.CoreV1Api) -> None:
+    """Start feeding the event index in the background."""
+    _event_index.start(core_v1)
+
+
+async def stop_event_index() -> None:
+    await _event_index.stop()
+    logger.info("Event index stopped")
@@ -4,9 +4,11 @@
 
 """Core Kubernetes API client - shared across all domains."""
 
+import asyncio
 import sys
 import threading
 from typing import Any
+from urllib.parse import urlsplit
 
 from kubernetes import client as sync_client
 from kubernetes import config as sync_config
@@ -15,6 +17,8 @@ from kubernetes_asyncio import client
 from kubernetes_asyncio.client import ApiException
 from loguru import logger
 
+from api_common.request_timing import timed
+
 from ..aims.constants import (
     AIM_API_GROUP,
     AIM_CLUSTER_MODEL_PLURAL,
@@ -23,7 +27,8 @@ from ..aims.constants import (
     HTTP_ROUTE_API_GROUP,
     HTTP_ROUTE_PLURAL,
 )
-from .config import USE_LOCAL_KUBE_CONTEXT
+from .config import KUBE_DISCOVERY_CACHE_FILE, USE_LOCAL_KUBE_CONTEXT
+from .events import format_event, get_event_index, sort_events
 
 # Required CRDs for the service to function
 REQUIRED_CRDS = [
@@ -33,6 +38,9 @@ REQUIRED_CRDS = [
     f"{HTTP_ROUTE_PLURAL}.{HTTP_ROUTE_API_GROUP}",
 ]
 
+# Media type of a list with only the metadata of each object
+PARTIAL_OBJECT_METADATA_LIST = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
+
 
 class KubernetesClient:
     """Core Kubernetes client providing access to standard K8s APIs.
@@ -52,6 +60,7 @@ class KubernetesClient:
         # Create API client and all API instances
         # Configuration must already be loaded by this point
         self._api_client = client.ApiClient()
+        _time_async_requests(self._api_client)
         self.core_v1 = client.CoreV1Api(self._api_client)
         self.apps_v1 = client.AppsV1Api(self._api_client)
         self.batch_v1 = client.BatchV1Api(self._api_client)
@@ -67,15 +76,19 @@ class KubernetesClient:
 
         Exits the process if any required CRDs are missing.
         """
-        missing_crds = []
-        for crd_name in REQUIRED_CRDS:
+
+        async def is_installed(crd_name: str) -> bool:
             try:
                 await self.api_extensions.read_custom_resource_definition(crd_name)
             except ApiException as e:
                 if e.status == 404:
-                    missing_crds.append(crd_name)
-                else:
-                    raise
+                    return False
+                raise
+            return True
+
+        # The CRDs are independent, so read them concurrently rather than paying one round trip each at startup
+        installed = await asyncio.gather(*(is_installed(crd_name) for crd_name in REQUIRED_CRDS))
+        missing_crds = [crd_name for crd_name, found in zip(REQUIRED_CRDS, installed, strict=True) if not found]
 
         if missing_crds:
             logger.error(f"Required CRDs not found in cluster: {missing_crds}")
@@ -112,6 +125,24 @@ class KubernetesClient:
             logger.error(f"Failed to get {plural}/{name} in {namespace}: {e}")
             raise
 
+    async def list_namespaced_secret_metadata(self, namespace: str) -> client.V1SecretList:
+        """List the Secrets in a namespace without their data.
+
+        The API server returns only the metadata of each Secret when the request accepts a PartialObjectMetadataList,
+        so large TLS bundles and docker configs are not downloaded. CoreV1Api always sets its own Accept header, so
+        the request is made through the ApiClient. The items are V1Secret objects with only metadata set.
+        """
+        return await self._api_client.call_api(
+            "/api/v1/namespaces/{namespace}/secrets",
+            "GET",
+            path_params={"namespace": namespace},
+            # Servers that cannot return partial metadata fall back to full Secrets
+            header_params={"Accept": f"{PARTIAL_OBJECT_METADATA_LIST},application/json"},
+            response_types_map={200: "V1SecretList"},
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True,
+        )
+
     async def get_events_for_resource(
         self,
         namespace: str,
@@ -120,45 +151,55 @@ class KubernetesClient:
     ) -> list[dict[str, Any]]:
         """Get events for a specific resource.
 
+        Reads the cluster event index when it is in sync, and otherwise lists the events of the resource with a
+        field selector on the involved object.
+
         Args:
             namespace: Kubernetes namespace
             resource_name: Name of the resource
             resource_kind: Optional kind filter (e.g., 'Pod', 'Job', 'Deployment')
 
         Returns:
-            List of event dictionaries with type, reason, message, timestamp
+            List of event dictionaries with type, reason, message, timestamp, most recent first
         """
+        event_index = get_event_index()
+        if event_index.ready:
+            return event_index.get_events(namespace, resource_name, resource_kind)
+
+        field_selector = f"involvedObject.name={resource_name}"
+        if resource_kind:
+            field_selector += f",involvedObject.kind={resource_kind}"
         try:
-            events = await self.core_v1.list_namespaced_event(namespace=namespace)
-
-            resource_events = []
-
-            for event in events.items:
-                # Match by involved object name
-                if event.involved_object.name == resource_name:
-                    if resource_kind and event.involved_object.kind != resource_kind:
-                        continue
-
-                    resource_events.append(
-                        {
-                            "type": event.type,
-                            "reason": event.reason,
-                            "message": event.message,
-                            "timestamp": event.last_timestamp or event.event_time,
-                            "count": event.count,
-                            "source": event.source.component if event.source else None,
-                        }
-                    )
-
-            # Sort by timestamp, most recent first
-            resource_events.sort(key=lambda e: e["timestamp"] or "", reverse=True)
-            return resource_events
+            events = await self.core_v1.list_namespaced_event(namespace=namespace, field_selector=field_selector)
+            return sort_events([format_event(event) for event in events.items])
 
         except ApiException as e:
             logger.error(f"Failed to get events for {resource_name} in {namespace}: {e}")
             return []
 
 
+def _time_async_requests(api_client: client.ApiClient) -> None:
+    """Record the Kubernetes API requests of an async API client in the timings of the current HTTP request."""
+    request = api_client.request
+
+    async def timed_request(method: str, url: str, *args: Any, **kwargs: Any) -> Any:
+        with timed("kubernetes", f"{method} {urlsplit(url).path}"):
+            return await request(method, url, *args, **kwargs)
+
+    api_client.request = timed_request  # type: ignore[method-assign]
+
+
+def _time_sync_requests(api_client: sync_client.ApiClient) -> None:
+    """Record the Kubernetes API requests of a sync API client in the timings of the current HTTP request."""
+    request = api_client.request
+
+    def timed_request(method: str, url: str, *args: Any, **kwargs: Any) -> Any:
+        with timed("kubernetes", f"{method} {urlsplit(url).path}"):
+            return request(method, url, *args, **kwargs)
+
+    api_client.request = timed_request  # type: ignore[method-assign]
+
+
 # Global client instances
 _kube_client: KubernetesClient | None = None
 _dynamic_client: dynamic.DynamicClient | None = None
@@ -205,6 +246,7 @@ def get_dynamic_client() -> dynamic.DynamicClient:
 
     This uses the sync kubernetes library's DynamicClient since kubernetes_asyncio
     doesn't have an async dynamic client equivalent. Should be used with asyncio.to_thread.
+    Async code resolves API resources with resolve_resource from .discovery instead.
 
     The client is cached globally and reused across all calls for efficiency.
     Thread-safe initialization using double-check locking pattern.
@@ -234,7 +276,8 @@ def get_dynamic_client() -> dynamic.DynamicClient:
 
                 # Create API client and dynamic client (cached globally)
                 _sync_api_client = sync_client.ApiClient()
-                _dynamic_client = dynamic.DynamicClient(_sync_api_client)
+                _time_sync_requests(_sync_api_client)
+                _dynamic_client = dynamic.DynamicClient(_sync_api_client, cache_file=KUBE_DISCOVERY_CACHE_FILE)
                 logger.debug("Created and cached DynamicClient instance")
             except Exception as e:
                 logger.error(f"Failed to initialize dynamic Kubernetes client: {e}")
@@ -0,0 +1,121 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""PostgreSQL advisory lock leader election for the resource poller.
+
+Every replica runs the poller, but a syncer only runs in the replica holding that syncer's advisory lock. The locks are
+session-level locks held on one dedicated connection, so they are released as soon as that connection ends: explicitly
+on shutdown, or by PostgreSQL once the TCP keepalives of a crashed replica's connection fail. Non-leaders retry on every
+base polling interval and take over on the first attempt after the lock is released.
+
+The same connection LISTENs for wakeup notifications, so a mutation handled by any replica reaches the leader.
+"""
+
+import asyncio
+import zlib
+from collections.abc import Callable
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from .config import SYNCER_LEADER_KEEPALIVE_SECONDS, SYNCER_LEADER_LOCK_NAMESPACE, SYNCER_WAKEUP_CHANNEL
+
+
+def lock_key(name: str) -> int:
+    """Stable signed 32-bit advisory lock key for a syncer name."""
+    key = zlib.crc32(name.encode())
+    return key - 2**32 if key >= 2**31 else key
+
+
+class LeaderElector:
+    """Holds one advisory lock per led syncer on a dedicated database connection."""
+
+    def __init__(self, engine: AsyncEngine, on_wakeup: Callable[[], None]) -> None:
+        self._engine = engine
+        self._on_wakeup = on_wakeup
+        self._connection: AsyncConnection | None = None
+        self._held: set[str] = set()
+        # asyncpg connections do not support concurrent operations
+        self._lock = asyncio.Lock()
+
+    @property
+    def held(self) -> frozenset[str]:
+        return frozenset(self._held)
+
+    def _notified(self, *_: object) -> None:
+        self._on_wakeup()
+
+    async def _connect(self) -> AsyncConnection:
+        if self._connection is not None:
+            return self._connection
+
+        connection = await self._engine.connect()
+        try:
+            # Lock calls must not leave a transaction open on the long-lived connection
+            connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+            for setting, value in (
+                ("tcp_keepalives_idle", SYNCER_LEADER_KEEPALIVE_SECONDS),
+                ("tcp_keepalives_interval", SYNCER_LEADER_KEEPALIVE_SECONDS),
+                ("tcp_keepalives_count", 3),
+            ):
+                await connection.execute(
+                    text("SELECT set_config(:setting, :value, false)"), {"setting": setting, "value": str(value)}
+                )
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.add_listener(SYNCER_WAKEUP_CHANNEL, self._notified)
+        except Exception:
+            await connection.invalidate()
+            raise
+        self._connection = connection
+        return connection
+
+    async def _reset(self) -> None:
+        held, self._held = self._held, set()
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            try:
+                # Closing the connection instead of returning it to the pool releases its locks and listener
+                await connection.invalidate()
+            except Exception as e:
+                logger.warning(f"Error closing leader election connection: {e}")
+        if held:
+            logger.info(f"Released leadership of syncers: {', '.join(sorted(held))}")
+
+    async def is_leader(self, name: str) -> bool:
+        """Take or confirm leadership of a syncer.
+
+        Returns False if another replica leads the syncer or the database cannot be reached.
+        """
+        async with self._lock:
+            try:
+                connection = await self._connect()
+                if name in self._held:
+                    # The lock lives as long as the connection does
+                    await connection.execute(text("SELECT 1"))
+                    return True
+                result = await connection.execute(
+                    text("SELECT pg_try_advisory_lock(:namespace, :key)"),
+                    {"namespace": SYNCER_LEADER_LOCK_NAMESPACE, "key": lock_key(name)},
+                )
+                acquired = bool(result.scalar())
+            except Exception as e:
+                logger.warning(f"Leader election connection failed: {e}")
+                await self._reset()
+                return False
+
+            if acquired:
+                self._held.add(name)
+                logger.info(f"Acquired leadership of syncer {name}")
+            return acquired
+
+    async def notify(self) -> None:
+        """Wake up the pollers of all replicas, including this one."""
+        async with self._lock:
+            connection = await self._connect()
+            await connection.execute(text("SELECT pg_notify(:channel, '')"), {"channel": SYNCER_WAKEUP_CHANNEL})
+
+    async def close(self) -> None:
+        async with self._lock:
+            await self._reset()
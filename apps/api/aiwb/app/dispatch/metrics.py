@@ -0,0 +1,43 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Prometheus metrics for the resource poller and its syncers."""
+
+import os
+
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+METRICS_PORT = os.environ.get("PROMETHEUS_METRICS_PORT", "9009")
+
+SYNC_CYCLE_DURATION = Histogram(
+    "aiwb_syncer_cycle_duration_seconds",
+    "Duration of a single syncer run",
+    labelnames=["syncer"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+SYNC_CHANGES = Counter(
+    "aiwb_syncer_changes_total",
+    "Number of database rows changed by a syncer, by kind of change",
+    labelnames=["syncer", "change"],
+)
+SYNC_OBSERVED_OBJECTS = Histogram(
+    "aiwb_syncer_observed_objects",
+    "Number of Kubernetes objects observed by a syncer in one run",
+    labelnames=["syncer"],
+    buckets=(0, 10, 50, 100, 250, 500, 1000, 2500, 5000, 10000),
+)
+SYNC_LEADER = Gauge(
+    "aiwb_syncer_leader",
+    "Whether this replica runs the syncer (1) or leaves it to the leading replica (0)",
+    labelnames=["syncer"],
+)
+SYNC_INTERVAL = Gauge(
+    "aiwb_syncer_interval_seconds",
+    "Current adaptive polling interval of a syncer",
+    labelnames=["syncer"],
+)
+
+
+def start_metrics_server() -> None:
+    start_http_server(int(METRICS_PORT))
@@ -33,22 +33,67 @@ When writing syncers, follow these guidelines:
 
 6. **Idempotency**: Syncers may be called multiple times. Ensure they
    handle repeated calls safely without duplicating work or data.
+
+7. **Change Reporting**: Syncers may return the number of changes they
+   applied. A syncer returning 0 is backed off up to
+   SYNCER_MAX_POLLING_INTERVAL_SECONDS; any other result, including None,
+   keeps it at POLLING_INTERVAL_SECONDS. Call request_sync() after
+   user-initiated mutations to poll all syncers again right away.
+
+## Multiple Replicas
+
+With leader election enabled, each syncer only runs in the replica holding
+its PostgreSQL advisory lock (see leader.py). Other replicas serve requests
+from the shared database state and take over when the leader goes away.
 """
 
 import asyncio
+import contextlib
+import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 
 from loguru import logger
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api_common import database
 
-from ..dispatch.config import POLLING_INTERVAL_SECONDS
+from ..dispatch.config import (
+    POLLING_INTERVAL_SECONDS,
+    SYNCER_BACKOFF_FACTOR,
+    SYNCER_LEADER_ELECTION_ENABLED,
+    SYNCER_MAX_POLLING_INTERVAL_SECONDS,
+    SYNCER_WAKEUP_CHANNEL,
+)
 from .kube_client import KubernetesClient, get_kube_client
+from .leader import LeaderElector
+from .metrics import SYNC_CYCLE_DURATION, SYNC_INTERVAL, SYNC_LEADER
 
-# Type alias for resource sync functions
-ResourceSyncer = Callable[[AsyncSession, KubernetesClient], Awaitable[None]]
+# Type alias for resource sync functions, optionally returning the number of applied changes
+ResourceSyncer = Callable[[AsyncSession, KubernetesClient], Awaitable[int | None]]
+
+
+@dataclass
+class SyncerSchedule:
+    """Adaptive polling interval of a single syncer."""
+
+    interval: float = 0.0
+    next_run: float = 0.0
+
+    def advance(self, changes: int | None) -> None:
+        """Back off while the syncer finds nothing to do, return to the base interval once it does."""
+        if changes == 0:
+            backed_off = max(self.interval, POLLING_INTERVAL_SECONDS) * SYNCER_BACKOFF_FACTOR
+            self.interval = max(min(backed_off, SYNCER_MAX_POLLING_INTERVAL_SECONDS), POLLING_INTERVAL_SECONDS)
+        else:
+            self.interval = POLLING_INTERVAL_SECONDS
+        self.next_run = time.monotonic() + self.interval
+
+    def reset(self) -> None:
+        """Run on the next cycle and continue at the base interval."""
+        self.interval = POLLING_INTERVAL_SECONDS
+        self.next_run = 0.0
 
 
 @dataclass
@@ -58,6 +103,9 @@ class PollerState:
     running: bool = False
     polling_task: asyncio.Task | None = None
     syncers: list[ResourceSyncer] = field(default_factory=list)
+    schedules: dict[str, SyncerSchedule] = field(default_factory=dict)
+    elector: LeaderElector | None = None
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
 
 
 # Module-level state instance
@@ -91,10 +139,15 @@ async def start_poller() -> None:
         return
 
     _state.running = True
+    if SYNCER_LEADER_ELECTION_ENABLED and database.engine:
+        _state.elector = LeaderElector(database.engine, on_wakeup=_wake)
 
     # Start polling task (initial sync will happen in background)
     _state.polling_task = asyncio.create_task(_polling_loop())
-    logger.info(f"Started resource poller ({POLLING_INTERVAL_SECONDS}-second interval, {len(_state.syncers)} syncers)")
+    logger.info(
+        f"Started resource poller ({POLLING_INTERVAL_SECONDS}-{SYNCER_MAX_POLLING_INTERVAL_SECONDS}-second interval, "
+        f"{len(_state.syncers)} syncers, leader election {'enabled' if _state.elector else 'disabled'})"
+    )
 
 
 async def _polling_loop() -> None:
@@ -107,7 +160,7 @@ async def _polling_loop() -> None:
 
     while _state.running:
         try:
-            await asyncio.sleep(POLLING_INTERVAL_SECONDS)
+            await _wait_for_next_run()
 
             if not _state.running:
                 break
@@ -118,23 +171,81 @@ async def _polling_loop() -> None:
             logger.exception(f"Error in polling loop: {e}")
 
 
+def _schedule(syncer: ResourceSyncer) -> SyncerSchedule:
+    return _state.schedules.setdefault(syncer.__name__, SyncerSchedule())
+
+
+def _wake() -> None:
+    for schedule in _state.schedules.values():
+        schedule.reset()
+    _state.wakeup.set()
+
+
+async def _wait_for_next_run() -> None:
+    """Sleep until the next syncer is due, or until a sync is requested."""
+    next_run = min((_schedule(syncer).next_run for syncer in _state.syncers), default=0.0)
+    delay = max(next_run - time.monotonic(), 0.0)
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(_state.wakeup.wait(), timeout=delay)
+    _state.wakeup.clear()
+
+
 async def _poll_resources() -> None:
-    """Poll all registered resources and sync their status from K8s."""
+    """Poll all due resources and sync their status from K8s."""
     if not database.session_maker:
         return
 
     kube_client = get_kube_client()
+    now = time.monotonic()
+    due_syncers = [syncer for syncer in _state.syncers if _schedule(syncer).next_run <= now]
 
     # Run all syncers concurrently, each with its own database session
     # This prevents session sharing issues when syncers run in parallel
     async def run_syncer_with_session(syncer: ResourceSyncer) -> None:
+        schedule = _schedule(syncer)
+        if _state.elector and not await _state.elector.is_leader(syncer.__name__):
+            # Check back at the base interval so that leadership is taken over quickly
+            SYNC_LEADER.labels(syncer=syncer.__name__).set(0)
+            schedule.advance(None)
+            return
+        SYNC_LEADER.labels(syncer=syncer.__name__).set(1)
+
+        started = time.perf_counter()
+        changes = None
         async with database.session_maker() as session:
             try:
-                await syncer(session, kube_client)
+                changes = await syncer(session, kube_client)
             except Exception as e:
                 logger.error(f"Error in syncer {syncer.__name__}: {e}")
+        SYNC_CYCLE_DURATION.labels(syncer=syncer.__name__).observe(time.perf_counter() - started)
+        schedule.advance(changes)
+        SYNC_INTERVAL.labels(syncer=syncer.__name__).set(schedule.interval)
+
+    await asyncio.gather(*[run_syncer_with_session(syncer) for syncer in due_syncers])
+
 
-    await asyncio.gather(*[run_syncer_with_session(syncer) for syncer in _state.syncers])
+async def request_sync(session: AsyncSession | None = None) -> None:
+    """Poll all syncers right away, in whichever replicas lead them.
+
+    Called after user-initiated mutations, so that their effect is picked up without waiting out a backed-off
+    interval. Never raises: a lost request only delays the sync until the next regular run.
+
+    Args:
+        session: Session of the transaction making the mutation. The request is then sent as a notification in that
+                 transaction, which PostgreSQL only delivers once it commits and the change is visible to syncers.
+    """
+    if not _state.elector:
+        _wake()
+        return
+
+    try:
+        if session is not None:
+            await session.execute(select(func.pg_notify(SYNCER_WAKEUP_CHANNEL, "")))
+        else:
+            await _state.elector.notify()
+    except Exception as e:
+        logger.warning(f"Failed to request sync from leading replicas: {e}")
+        _wake()
 
 
 async def stop_poller() -> None:
@@ -154,6 +265,11 @@ async def stop_poller() -> None:
             pass
         _state.polling_task = None
 
+    # Release leadership right away so that another replica can take over
+    if _state.elector:
+        await _state.elector.close()
+        _state.elector = None
+
     logger.info("Stopped resource poller")
 
 
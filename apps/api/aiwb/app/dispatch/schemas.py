@@ -0,0 +1,20 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ResourceEvent(BaseModel):
+    """A Kubernetes event about one of the objects a workload or AIM service is made of."""
+
+    kind: str = Field(description="Kind of the object the event is about, e.g. Pod or Deployment")
+    name: str = Field(description="Name of the object the event is about")
+    type: str | None = Field(default=None, description="Event type, Normal or Warning")
+    reason: str | None = Field(default=None, description="Short, machine readable reason for the event")
+    message: str | None = Field(default=None, description="Human readable description of the event")
+    timestamp: datetime | None = Field(default=None, description="When the event was last seen")
+    count: int | None = Field(default=None, description="Number of times the event occurred")
+    source: str | None = Field(default=None, description="Component that reported the event")
@@ -4,10 +4,14 @@
 
 """Utility functions for dispatch operations."""
 
+import asyncio
+
 from kubernetes_asyncio import client
 from loguru import logger
 
-from .kube_client import get_kube_client
+from .events import sort_events
+from .kube_client import KubernetesClient, get_kube_client
+from .schemas import ResourceEvent
 
 
 async def get_resource_version(group: str, plural: str) -> str | None:
@@ -95,3 +99,18 @@ def sanitize_label_value(value: str, max_length: int = 63) -> str:
     sanitized = sanitized[:max_length]
 
     return sanitized or "unknown"
+
+
+async def get_events_for_objects(
+    kube_client: KubernetesClient, namespace: str, objects: list[tuple[str, str]]
+) -> list[ResourceEvent]:
+    """Get the events of several objects of a namespace, given as (kind, name) pairs, most recent first."""
+    results = await asyncio.gather(
+        *(kube_client.get_events_for_resource(namespace, name, kind) for kind, name in objects)
+    )
+    events = [
+        {**event, "kind": kind, "name": name}
+        for (kind, name), object_events in zip(objects, results, strict=True)
+        for event in object_events
+    ]
+    return [ResourceEvent.model_validate(event) for event in sort_events(events)]
@@ -8,6 +8,8 @@ import httpx
 from fastapi import Request
 from loguru import logger
 
+from api_common.request_timing import instrument_httpx_client
+
 from .config import LOKI_TIMEOUT_SECONDS, LOKI_URL
 
 _loki_client: httpx.AsyncClient | None = None
@@ -23,6 +25,7 @@ def init_loki_client() -> httpx.AsyncClient:
     _loki_client = httpx.AsyncClient(
         base_url=LOKI_URL, timeout=httpx.Timeout(LOKI_TIMEOUT_SECONDS), headers={"Content-Type": "application/json"}
     )
+    instrument_httpx_client(_loki_client, "loki")
 
     logger.info(f"Loki client initialized with base URL: {LOKI_URL}")
     return _loki_client
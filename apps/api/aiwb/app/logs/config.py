@@ -15,3 +15,12 @@ LOKI_URL = os.getenv("LOKI_URL") or os.getenv(
 LOKI_TIMEOUT_SECONDS = int(os.getenv("LOKI_TIMEOUT_SECONDS", "30"))
 LOKI_KEEPALIVE_TIMEOUT_SECONDS = int(os.getenv("LOKI_KEEPALIVE_TIMEOUT_SECONDS", "30"))
 LOKI_DEFAULT_TIME_RANGE_DAYS = int(os.getenv("LOKI_DEFAULT_TIME_RANGE_DAYS", "15"))
+# Per-subscriber buffer of a shared log tail; the oldest entries are dropped when a subscriber falls behind
+LOKI_TAIL_SUBSCRIBER_BUFFER_SIZE = int(os.getenv("LOKI_TAIL_SUBSCRIBER_BUFFER_SIZE", "1000"))
+# Recent entries of a shared log tail replayed to subscribers that join after it was opened
+LOKI_TAIL_REPLAY_SIZE = int(os.getenv("LOKI_TAIL_REPLAY_SIZE", "1000"))
+# Bulk log exports are split into time shards queried concurrently
+LOKI_EXPORT_SHARD_MINUTES = int(os.getenv("LOKI_EXPORT_SHARD_MINUTES", "15"))
+LOKI_EXPORT_MAX_CONCURRENCY = int(os.getenv("LOKI_EXPORT_MAX_CONCURRENCY", "4"))
+LOKI_EXPORT_PAGE_LIMIT = int(os.getenv("LOKI_EXPORT_PAGE_LIMIT", "5000"))
+LOKI_EXPORT_MAX_RANGE_DAYS = int(os.getenv("LOKI_EXPORT_MAX_RANGE_DAYS", "31"))
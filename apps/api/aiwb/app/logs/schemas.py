@@ -7,7 +7,7 @@
 from datetime import UTC, datetime
 from enum import StrEnum
 
-from pydantic import AwareDatetime, BaseModel
+from pydantic import AwareDatetime, BaseModel, Field
 
 from api_common.schemas import PaginationMetadataResponse, TimeRangePaginationRequest
 
@@ -116,6 +116,16 @@ class WorkloadLogsResponse(BaseModel):
     pagination: PaginationMetadataResponse
 
 
+class LogsExportRequest(BaseModel):
+    """Query request for the bulk logs export endpoint"""
+
+    start: AwareDatetime = Field(..., description="Start of the time range")
+    end: AwareDatetime = Field(..., description="End of the time range")
+    level: LogLevel | None = Field(default=None, description="Filter logs at this level and above")
+    log_type: LogType = Field(default=LogType.WORKLOAD, description="Type of logs: 'workload' or 'event'")
+    compress: bool = Field(default=False, description="Gzip-compress the NDJSON stream")
+
+
 class LogsQueryRequest(TimeRangePaginationRequest):
     """Query request for logs endpoints"""
 
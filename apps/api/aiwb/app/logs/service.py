@@ -3,7 +3,10 @@
 # SPDX-License-Identifier: MIT
 
 import asyncio
+import heapq
 import json
+import zlib
+from collections import deque
 from collections.abc import AsyncGenerator
 from datetime import UTC, datetime, timedelta
 from urllib.parse import urlencode, urlparse
@@ -15,8 +18,17 @@ from loguru import logger
 
 from api_common.schemas import PaginationDirection, PaginationMetadataResponse
 
-from .config import LOKI_DEFAULT_TIME_RANGE_DAYS, LOKI_KEEPALIVE_TIMEOUT_SECONDS, LOKI_URL
+from .config import (
+    LOKI_DEFAULT_TIME_RANGE_DAYS,
+    LOKI_EXPORT_MAX_CONCURRENCY,
+    LOKI_EXPORT_MAX_RANGE_DAYS,
+    LOKI_EXPORT_PAGE_LIMIT,
+    LOKI_EXPORT_SHARD_MINUTES,
+    LOKI_KEEPALIVE_TIMEOUT_SECONDS,
+    LOKI_URL,
+)
 from .schemas import LogEntry, LogLevel, LogType, WorkloadLogsResponse
+from .tail import get_tail_multiplexer
 
 
 async def create_websocket_connection(
@@ -218,6 +230,135 @@ async def get_logs_by_workload_id(
         )
 
 
+def _split_into_shards(start_ns: int, end_ns: int, shard_ns: int) -> list[tuple[int, int]]:
+    """Split [start_ns, end_ns) into consecutive half-open time shards of at most shard_ns."""
+    return [(shard_start, min(shard_start + shard_ns, end_ns)) for shard_start in range(start_ns, end_ns, shard_ns)]
+
+
+async def _fetch_log_shard(
+    loki_client: httpx.AsyncClient, query: str, start_ns: int, end_ns: int, page_limit: int
+) -> list[LogEntry]:
+    """Fetch all log entries in [start_ns, end_ns) in timestamp order, paging forward within the shard."""
+    entries: list[LogEntry] = []
+    cursor_ns = start_ns
+    # Entries already returned at cursor_ns; the next page starts at that timestamp inclusively
+    seen_at_cursor: set[tuple[int, str]] = set()
+
+    while True:
+        params = {
+            "query": query,
+            "start": cursor_ns,
+            "end": end_ns,
+            "limit": page_limit,
+            "direction": PaginationDirection.FORWARD,
+        }
+        response = await loki_client.get("/loki/api/v1/query_range", params=params)
+        response.raise_for_status()
+
+        # Each stream is sorted by timestamp; merge them into a single ordered page
+        streams = [
+            [
+                (int(timestamp_ns), message, stream.get("stream", {}))
+                for timestamp_ns, message in stream.get("values", [])
+            ]
+            for stream in response.json().get("data", {}).get("result", [])
+        ]
+        page = list(heapq.merge(*streams, key=lambda value: value[0]))
+
+        new_values = [value for value in page if value[0] < end_ns and (value[0], value[1]) not in seen_at_cursor]
+        entries.extend(
+            LogEntry.from_loki(str(timestamp_ns), message, labels) for timestamp_ns, message, labels in new_values
+        )
+
+        if len(page) < page_limit or not new_values:
+            return entries
+
+        cursor_ns = page[-1][0]
+        seen_at_cursor = {(value[0], value[1]) for value in page if value[0] == cursor_ns}
+
+
+async def _stream_log_export(
+    loki_client: httpx.AsyncClient,
+    query: str,
+    shards: list[tuple[int, int]],
+    compress: bool,
+) -> AsyncGenerator[bytes]:
+    """Fetch shards with bounded parallelism and yield them in time order as NDJSON.
+
+    At most LOKI_EXPORT_MAX_CONCURRENCY shards are in flight or buffered at once, so memory is bounded by
+    the shard size rather than by the total volume of the export.
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None  # wbits=31 produces a gzip container
+    pending: deque[asyncio.Task[list[LogEntry]]] = deque()
+    remaining = iter(shards)
+
+    def schedule_next() -> None:
+        shard = next(remaining, None)
+        if shard is not None:
+            pending.append(asyncio.create_task(_fetch_log_shard(loki_client, query, *shard, LOKI_EXPORT_PAGE_LIMIT)))
+
+    def encode(chunk: bytes) -> bytes:
+        return compressor.compress(chunk) if compressor else chunk
+
+    try:
+        for _ in range(LOKI_EXPORT_MAX_CONCURRENCY):
+            schedule_next()
+
+        while pending:
+            try:
+                entries = await pending.popleft()
+            except Exception as e:
+                logger.error(f"Log export query '{query}' failed: {e}")
+                yield encode(json.dumps({"error": str(e)}).encode() + b"\n")
+                break
+
+            # Keep the next shards fetching while this one is written out
+            schedule_next()
+            if entries:
+                chunk = "".join(f"{entry.model_dump_json()}\n" for entry in entries).encode()
+                if data := encode(chunk):
+                    yield data
+
+        if compressor:
+            yield compressor.flush()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def export_workload_logs(
+    workload_id: str,
+    loki_client: httpx.AsyncClient,
+    start_date: datetime,
+    end_date: datetime,
+    level_filter: LogLevel | None = None,
+    log_type: LogType = LogType.WORKLOAD,
+    compress: bool = False,
+) -> AsyncGenerator[bytes]:
+    """Export all logs of a workload in a time range as an NDJSON (optionally gzip) byte stream.
+
+    The range is split into LOKI_EXPORT_SHARD_MINUTES shards that are queried concurrently and written
+    out in timestamp order. The range is validated eagerly so errors surface before the response starts.
+
+    Raises:
+        ValueError: If the time range is empty or longer than LOKI_EXPORT_MAX_RANGE_DAYS
+    """
+    if start_date >= end_date:
+        raise ValueError(f"Invalid time range: start_date ({start_date}) >= end_date ({end_date})")
+    if end_date - start_date > timedelta(days=LOKI_EXPORT_MAX_RANGE_DAYS):
+        raise ValueError(f"Log export time range cannot exceed {LOKI_EXPORT_MAX_RANGE_DAYS} days")
+
+    query = _build_loki_query(workload_id, level_filter, log_type)
+    start_ns = int(start_date.timestamp() * 1_000_000_000)
+    end_ns = int(end_date.timestamp() * 1_000_000_000)
+    shards = _split_into_shards(start_ns, end_ns, LOKI_EXPORT_SHARD_MINUTES * 60 * 1_000_000_000)
+    # Shards are half-open; extend the last one so entries at end_date are included
+    shards[-1] = (shards[-1][0], end_ns + 1)
+    logger.info(f"Exporting logs for workload {workload_id} in {len(shards)} shards")
+
+    return _stream_log_export(loki_client, query, shards, compress)
+
+
 async def stream_workload_logs_sse(
     workload_id: str,
     start_time: datetime | None = None,
@@ -264,6 +405,8 @@ async def stream_workload_logs(
 ) -> AsyncGenerator[str]:
     """Stream logs for a workload using Loki's WebSocket tail API.
 
+    Concurrent streams with the same query and delay share a single upstream tail.
+
     Yields:
         LogEntry serialized as JSON string
     """
@@ -271,48 +414,27 @@ async def stream_workload_logs(
     query = _build_loki_query(workload_id, level_filter, log_type)
     logger.info(f"Starting log stream for workload {workload_id}")
 
-    if start_time is not None and start_time.tzinfo is None:
-        start_time = start_time.replace(tzinfo=UTC)
-    else:
+    if start_time is None:
         start_time = datetime.now(UTC) - timedelta(days=LOKI_DEFAULT_TIME_RANGE_DAYS)
+    elif start_time.tzinfo is None:
+        start_time = start_time.replace(tzinfo=UTC)
 
-    websocket = None
-
-    websocket = await create_websocket_connection(
-        workload_id=UUID(workload_id) if isinstance(workload_id, str) else workload_id,
-        query=query,
-        start_time=start_time,
-        delay_seconds=delay_seconds,
-    )
-
-    logger.info(f"Connected to Loki WebSocket for workload {workload_id}")
+    async def connect() -> websockets.ClientConnection:
+        return await create_websocket_connection(
+            workload_id=UUID(workload_id) if isinstance(workload_id, str) else workload_id,
+            query=query,
+            start_time=start_time,
+            delay_seconds=delay_seconds,
+        )
 
     try:
-        while True:
-            try:
-                async with asyncio.timeout(LOKI_KEEPALIVE_TIMEOUT_SECONDS):
-                    message = await websocket.recv()
-                    tail_data = json.loads(message)
-
-                    if "streams" not in tail_data:
-                        continue
-
-                    for stream in tail_data["streams"]:
-                        labels = stream.get("stream", {})
-                        for timestamp_ns, log_message in stream.get("values", []):
-                            log_entry = LogEntry.from_loki(timestamp_ns, log_message, labels)
-
-                            yield log_entry.model_dump_json()
-
-            except TimeoutError:
-                yield "[HEARTBEAT]"
-                continue
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse WebSocket message: {message[:100]}... Error: {e}")
-                continue
-            except Exception as e:
-                logger.warning(f"Error processing WebSocket message: {e}")
-                continue
+        async with get_tail_multiplexer().subscribe(query, delay_seconds, start_time, connect) as subscription:
+            logger.info(f"Subscribed to Loki tail for workload {workload_id}")
+            while True:
+                try:
+                    yield await subscription.next_entry(timeout=LOKI_KEEPALIVE_TIMEOUT_SECONDS)
+                except TimeoutError:
+                    yield "[HEARTBEAT]"
 
     except asyncio.CancelledError:
         # Client disconnection or request cancellation - handle gracefully
@@ -327,13 +449,7 @@ async def stream_workload_logs(
         # Streaming failed, stopping
         raise
     finally:
-        if websocket:
-            try:
-                await websocket.close()
-                logger.info(f"WebSocket connection closed for workload {workload_id}")
-            except Exception as e:
-                logger.warning(f"Error closing WebSocket connection for workload {workload_id}: {e}")
-            logger.info(f"WebSocket streaming finished for workload {workload_id}")
+        logger.info(f"WebSocket streaming finished for workload {workload_id}")
 
 
 def _build_loki_websocket_url(base_url: str, query: str, start_time: datetime | None, delay_seconds: int) -> str:
@@ -0,0 +1,235 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Shared Loki tail connections.
+
+Loki limits the number of concurrent tails, and every SSE client watching the same workload would otherwise hold
+its own upstream WebSocket with an identical query. The multiplexer keeps one upstream tail per (query, delay),
+parses and serializes each entry once, and fans the JSON out to bounded per-subscriber buffers. A subscriber that
+falls behind loses its oldest buffered entries instead of slowing down the upstream reader or other subscribers.
+
+A tail is shared regardless of the start time of its subscribers. A subscriber joining a running tail receives the
+last LOKI_TAIL_REPLAY_SIZE entries at or after its start time, not the full history since then; complete history
+is available from the non-streaming logs endpoint.
+"""
+
+import asyncio
+import json
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import websockets
+from loguru import logger
+
+from .config import LOKI_TAIL_REPLAY_SIZE, LOKI_TAIL_SUBSCRIBER_BUFFER_SIZE
+from .schemas import LogEntry
+
+TailKey = tuple[str, int]
+
+
+class TailSubscription:
+    """A single consumer of a shared tail. Buffers serialized log entries up to a fixed size."""
+
+    def __init__(self, start_time: datetime | None, buffer_size: int) -> None:
+        self.start_time = start_time
+        self.dropped = 0
+        self._buffer: deque[str] = deque(maxlen=buffer_size)
+        self._ready = asyncio.Event()
+        self._error: BaseException | None = None
+
+    def publish(self, timestamp: datetime, payload: str) -> None:
+        if self.start_time is not None and timestamp < self.start_time:
+            return
+        if len(self._buffer) == self._buffer.maxlen:
+            # deque drops the oldest entry on append when full
+            self.dropped += 1
+        self._buffer.append(payload)
+        self._ready.set()
+
+    def fail(self, error: BaseException) -> None:
+        self._error = error
+        self._ready.set()
+
+    async def next_entry(self, timeout: float) -> str:
+        """Return the next serialized LogEntry.
+
+        Raises:
+            TimeoutError: If no entry arrives within the timeout
+            websockets.WebSocketException: If the upstream tail failed
+        """
+        while not self._buffer:
+            if self._error is not None:
+                raise self._error
+            self._ready.clear()
+            async with asyncio.timeout(timeout):
+                await self._ready.wait()
+        return self._buffer.popleft()
+
+
+class SharedTail:
+    """One upstream Loki tail WebSocket shared by all subscribers of the same (query, delay)."""
+
+    def __init__(self, key: TailKey, websocket: websockets.ClientConnection, replay_size: int) -> None:
+        self.key = key
+        self.websocket = websocket
+        self.subscribers: set[TailSubscription] = set()
+        self.closed = False
+        self.loop = asyncio.get_running_loop()
+        # Recent entries, so that subscribers joining an already running tail still get the initial backfill
+        self._replay: deque[tuple[datetime, str]] = deque(maxlen=replay_size)
+        self._reader = asyncio.create_task(self._read())
+
+    def add_subscriber(self, subscription: TailSubscription) -> None:
+        for timestamp, payload in self._replay:
+            subscription.publish(timestamp, payload)
+        self.subscribers.add(subscription)
+
+    def _publish(self, tail_data: dict) -> None:
+        for stream in tail_data.get("streams", []):
+            labels = stream.get("stream", {})
+            for timestamp_ns, log_message in stream.get("values", []):
+                log_entry = LogEntry.from_loki(timestamp_ns, log_message, labels)
+                # Serialize once per entry, not once per subscriber
+                payload = log_entry.model_dump_json()
+                self._replay.append((log_entry.timestamp, payload))
+                for subscription in self.subscribers:
+                    subscription.publish(log_entry.timestamp, payload)
+
+    async def _read(self) -> None:
+        try:
+            while True:
+                message = await self.websocket.recv()
+                try:
+                    self._publish(json.loads(message))
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Failed to parse WebSocket message: {message[:100]}... Error: {e}")
+                except Exception as e:
+                    logger.warning(f"Error processing WebSocket message: {e}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Loki tail for query {self.key[0]} failed: {e}")
+            error = e if isinstance(e, websockets.WebSocketException) else websockets.WebSocketException(str(e))
+            self.closed = True
+            for subscription in self.subscribers:
+                subscription.fail(error)
+
+    async def close(self) -> None:
+        self.closed = True
+        self._reader.cancel()
+        try:
+            await self._reader
+        except asyncio.CancelledError:
+            pass
+        try:
+            await self.websocket.close()
+        except Exception as e:
+            logger.warning(f"Error closing Loki tail WebSocket for query {self.key[0]}: {e}")
+
+
+class LokiTailMultiplexer:
+    """Reference-counted registry of shared Loki tails keyed by (query, delay)."""
+
+    def __init__(
+        self,
+        buffer_size: int = LOKI_TAIL_SUBSCRIBER_BUFFER_SIZE,
+        replay_size: int = LOKI_TAIL_REPLAY_SIZE,
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.replay_size = replay_size
+        self._tails: dict[TailKey, SharedTail] = {}
+        self._connecting: dict[TailKey, asyncio.Event] = {}
+        self._lock = asyncio.Lock()
+
+    async def _acquire(
+        self,
+        key: TailKey,
+        connect: Callable[[], Awaitable[websockets.ClientConnection]],
+        subscription: TailSubscription,
+    ) -> SharedTail:
+        while True:
+            async with self._lock:
+                tail = self._tails.get(key)
+                if tail is not None and not tail.closed and tail.loop is asyncio.get_running_loop():
+                    logger.info(f"Reusing Loki tail for query {key[0]} ({len(tail.subscribers)} subscribers)")
+                    tail.add_subscriber(subscription)
+                    return tail
+                connecting = self._connecting.get(key)
+                if connecting is None:
+                    connecting = self._connecting[key] = asyncio.Event()
+                    break
+            # Another subscriber is opening this tail; the global lock is not held during the handshake
+            await connecting.wait()
+
+        try:
+            tail = SharedTail(key, await connect(), self.replay_size)
+            tail.add_subscriber(subscription)
+            self._tails[key] = tail
+            return tail
+        finally:
+            # Waiters reuse the new tail, or retry the connection if it failed
+            del self._connecting[key]
+            connecting.set()
+
+    async def _release(self, tail: SharedTail, subscription: TailSubscription) -> None:
+        async with self._lock:
+            tail.subscribers.discard(subscription)
+            if subscription.dropped:
+                logger.warning(f"Slow log stream subscriber dropped {subscription.dropped} entries for {tail.key[0]}")
+            if tail.subscribers:
+                return
+            if self._tails.get(tail.key) is tail:
+                del self._tails[tail.key]
+        await tail.close()
+
+    @asynccontextmanager
+    async def subscribe(
+        self,
+        query: str,
+        delay_seconds: int,
+        start_time: datetime | None,
+        connect: Callable[[], Awaitable[websockets.ClientConnection]],
+    ) -> AsyncIterator[TailSubscription]:
+        """Subscribe to the shared tail for a query, opening the upstream connection if needed.
+
+        If the tail is already running, the backfill is limited to its replay buffer.
+
+        Raises:
+            websockets.WebSocketException: If the upstream connection cannot be established
+        """
+        subscription = TailSubscription(start_time, self.buffer_size)
+        tail = await self._acquire((query, delay_seconds), connect, subscription)
+        try:
+            yield subscription
+        finally:
+            await self._release(tail, subscription)
+
+    async def close(self) -> None:
+        async with self._lock:
+            tails = list(self._tails.values())
+            self._tails.clear()
+        for tail in tails:
+            for subscription in tail.subscribers:
+                subscription.fail(websockets.WebSocketException("Log streaming is shutting down"))
+            await tail.close()
+
+
+_tail_multiplexer: LokiTailMultiplexer | None = None
+
+
+def get_tail_multiplexer() -> LokiTailMultiplexer:
+    global _tail_multiplexer
+    if _tail_multiplexer is None:
+        _tail_multiplexer = LokiTailMultiplexer()
+    return _tail_multiplexer
+
+
+async def close_tail_multiplexer() -> None:
+    global _tail_multiplexer
+    if _tail_multiplexer:
+        await _tail_multiplexer.close()
+        _tail_multiplexer = None
+        logger.info("Loki tail multiplexer closed")
@@ -10,6 +10,7 @@ from typing import Any
 from prometheus_api_client import PrometheusConnect
 
 from api_common.exceptions import ValidationException
+from api_common.request_timing import timed
 
 from .constants import MAX_DAYS_FOR_TIMESERIES, PROMETHEUS_NAN_STRING, SCRAPE_INTERVAL_SECONDS
 from .schemas import Datapoint, DatapointMetadataBase, DatapointsWithMetadata, MetricsTimeseries, TimeseriesRange
@@ -69,16 +70,18 @@ async def a_custom_query_range(
     params: dict | None = None,
 ) -> list[dict[str, Any]]:
     """Async wrapper for custom_query_range."""
-    return await asyncio.to_thread(
-        lambda: client.custom_query_range(
-            query=query, start_time=start_time, end_time=end_time, step=step, params=params
+    with timed("prometheus", query):
+        return await asyncio.to_thread(
+            lambda: client.custom_query_range(
+                query=query, start_time=start_time, end_time=end_time, step=step, params=params
+            )
         )
-    )
 
 
 async def a_custom_query(client: PrometheusConnect, query: str, params: dict | None = None) -> list[dict[str, Any]]:
     """Async wrapper for custom_query."""
-    return await asyncio.to_thread(lambda: client.custom_query(query=query, params=params))
+    with timed("prometheus", query):
+        return await asyncio.to_thread(lambda: client.custom_query(query=query, params=params))
 
 
 def __get_default_datapoints_for_range(start: datetime, end: datetime, step: float) -> dict[datetime, float | None]:
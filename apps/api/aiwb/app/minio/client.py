@@ -3,13 +3,14 @@
 # SPDX-License-Identifier: MIT
 
 import io
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from contextlib import contextmanager
+from itertools import islice
 
 import urllib3
 from loguru import logger
 from minio import Minio
-from minio.deleteobjects import DeleteObject
+from minio.deleteobjects import DeleteError, DeleteObject
 from minio.error import S3Error
 
 from api_common.exceptions import (
@@ -20,7 +21,7 @@ from api_common.exceptions import (
     ValidationException,
 )
 
-from .config import MINIO_ACCESS_KEY, MINIO_SECRET_KEY, MINIO_URL
+from .config import MINIO_ACCESS_KEY, MINIO_DELETE_BATCH_SIZE, MINIO_SECRET_KEY, MINIO_URL
 from .exceptions import S3SyncError
 
 
@@ -72,24 +73,39 @@ class MinioClient:
         self.client.remove_object(bucket_name, object_name)
         logger.info(f"Successfully deleted object {object_name} from bucket {bucket_name}")
 
-    def delete_objects(self, bucket_name: str, prefix: str) -> None:
-        """Delete all objects in prefix from the specified bucket."""
-        objects = list(self.client.list_objects(bucket_name, prefix, recursive=True))
+    def list_object_names(self, bucket_name: str, prefix: str) -> Iterator[str]:
+        """Yield the names of all objects in prefix, listing them page by page as they are consumed."""
+        return (obj.object_name for obj in self.client.list_objects(bucket_name, prefix, recursive=True))
+
+    def delete_object_batch(self, bucket_name: str, object_names: list[str]) -> list[DeleteError]:
+        """Delete objects with DeleteObjects requests of up to 1000 keys and return the objects that failed.
+
+        remove_objects is lazy and only sends the requests while its result is consumed.
+        """
+        return list(self.client.remove_objects(bucket_name, [DeleteObject(name) for name in object_names]))
 
-        if not objects:
+    def delete_objects(self, bucket_name: str, prefix: str) -> None:
+        """Delete all objects in prefix from the specified bucket, one batch at a time.
+
+        Blocks until all batches are deleted; async code should use delete_prefix from .deletion instead.
+        """
+        object_names = self.list_object_names(bucket_name, prefix)
+        deleted = 0
+        errors: list[DeleteError] = []
+        while batch := list(islice(object_names, MINIO_DELETE_BATCH_SIZE)):
+            errors.extend(self.delete_object_batch(bucket_name, batch))
+            deleted += len(batch)
+
+        if not deleted:
             logger.info(f"No objects found with prefix {prefix} in bucket {bucket_name}")
             return
 
-        delete_objects = [DeleteObject(obj.object_name) for obj in objects]
-        errors = self.client.remove_objects(bucket_name, delete_objects)
         if errors:
-            error_messages = [f"Error deleting {error.object_name}: {error.message}" for error in errors]
+            error_messages = [f"Error deleting {error.name}: {error.message}" for error in errors]
             error_message = ", ".join(error_messages)
             logger.error(f"Errors occurred while deleting objects: {error_message}")
             raise ExternalServiceError(message="Failed to delete some objects", detail=error_message)
-        logger.info(
-            f"Successfully deleted {len(delete_objects)} objects with prefix {prefix} from bucket {bucket_name}"
-        )
+        logger.info(f"Successfully deleted {deleted} objects with prefix {prefix} from bucket {bucket_name}")
 
 
 def map_s3_error_to_domain_exception(s3_error: S3Error, context: str) -> BaseApiException:
@@ -16,3 +16,6 @@ MINIO_BUCKET = os.getenv("MINIO_BUCKET", "default-bucket")
 MINIO_MAX_ATTEMPTS = int(os.getenv("MINIO_MAX_ATTEMPTS", "3"))
 MINIO_MIN_WAIT = int(os.getenv("MINIO_MIN_WAIT", "4"))
 MINIO_MAX_WAIT = int(os.getenv("MINIO_MAX_WAIT", "60"))
+# Prefix deletion: keys per DeleteObjects request (at most 1000 in S3) and requests in flight at once
+MINIO_DELETE_BATCH_SIZE = int(os.getenv("MINIO_DELETE_BATCH_SIZE", "1000"))
+MINIO_DELETE_CONCURRENCY = int(os.getenv("MINIO_DELETE_CONCURRENCY", "4"))
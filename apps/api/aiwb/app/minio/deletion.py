@@ -0,0 +1,143 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Deletion of everything under an S3 prefix, such as the weights of a model.
+
+A model can have tens of thousands of objects. delete_prefix streams the listing and deletes the objects in batches
+of MINIO_DELETE_BATCH_SIZE keys, with up to MINIO_DELETE_CONCURRENCY DeleteObjects requests in flight. The blocking
+MinIO calls run in worker threads, so the event loop stays free and only the batches in flight are held in memory.
+start_background_deletion runs a deletion after the request that asked for it has returned.
+"""
+
+import asyncio
+from collections.abc import Coroutine, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any
+
+from loguru import logger
+
+from api_common.exceptions import ExternalServiceError, NotFoundException, ValidationException
+
+from .client import MinioClient
+from .config import MINIO_DELETE_BATCH_SIZE, MINIO_DELETE_CONCURRENCY
+
+# Per-object errors included in the detail of the raised exception
+MAX_REPORTED_ERRORS = 20
+
+
+@dataclass
+class PrefixDeletionProgress:
+    """Progress of a prefix deletion, updated as its batches complete."""
+
+    bucket_name: str
+    prefix: str
+    listed: int = 0
+    deleted: int = 0
+    errors: list[str] = field(default_factory=list)
+    done: bool = False
+
+
+def _next_batch(object_names: Iterator[str], batch_size: int) -> list[str]:
+    return list(islice(object_names, batch_size))
+
+
+async def delete_prefix(
+    client: MinioClient,
+    bucket_name: str,
+    prefix: str,
+    batch_size: int = MINIO_DELETE_BATCH_SIZE,
+    concurrency: int = MINIO_DELETE_CONCURRENCY,
+    progress: PrefixDeletionProgress | None = None,
+) -> PrefixDeletionProgress:
+    """Delete all objects in prefix, listing and deleting them batch by batch off the event loop.
+
+    The prefix is treated as a directory, i.e. "models/a" deletes models/a/... but not models/ab/.... Pass a progress
+    object to follow the deletion while it runs.
+
+    Raises:
+        ValidationException: If the prefix is empty, which would delete the whole bucket.
+        S3Error: If listing fails, or a DeleteObjects request fails as a whole. No further batches are started, and
+            the batches already in flight complete before it is raised.
+        ExternalServiceError: If some objects could not be deleted, after all batches ran.
+    """
+    if not prefix or not prefix.rstrip("/"):
+        raise ValidationException(f"Refusing to delete the empty prefix {prefix!r} of bucket {bucket_name}")
+    prefix = prefix.rstrip("/") + "/"
+    progress = progress or PrefixDeletionProgress(bucket_name=bucket_name, prefix=prefix)
+    object_names = client.list_object_names(bucket_name, prefix)
+    slots = asyncio.Semaphore(concurrency)
+    in_flight: set[asyncio.Task] = set()
+    failure: BaseException | None = None
+
+    async def delete_batch(batch: list[str]) -> None:
+        nonlocal failure
+        try:
+            errors = await asyncio.to_thread(client.delete_object_batch, bucket_name, batch)
+        except Exception as e:
+            failure = failure or e
+            return
+        finally:
+            slots.release()
+        progress.deleted += len(batch) - len(errors)
+        progress.errors.extend(f"Error deleting {error.name}: {error.message}" for error in errors)
+        logger.debug(f"Deleted {progress.deleted} of {progress.listed} objects listed in s3://{bucket_name}/{prefix}")
+
+    try:
+        while batch := await asyncio.to_thread(_next_batch, object_names, batch_size):
+            progress.listed += len(batch)
+            await slots.acquire()
+            if failure:
+                slots.release()
+                break
+            task = asyncio.create_task(delete_batch(batch))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        await asyncio.gather(*in_flight)
+    finally:
+        # Only reached with batches in flight if the deletion itself is cancelled
+        for task in in_flight:
+            task.cancel()
+
+    if failure:
+        raise failure
+    progress.done = True
+    if progress.errors:
+        detail = ", ".join(progress.errors[:MAX_REPORTED_ERRORS])
+        logger.error(f"Failed to delete {len(progress.errors)} objects in s3://{bucket_name}/{prefix}: {detail}")
+        raise ExternalServiceError(message="Failed to delete some objects", detail=detail)
+    logger.info(f"Deleted {progress.deleted} objects in s3://{bucket_name}/{prefix}")
+    return progress
+
+
+_background_deletions: set[asyncio.Task] = set()
+
+
+def start_background_deletion(deletion: Coroutine[Any, Any, Any], description: str) -> asyncio.Task:
+    """Run a deletion in the background, logging its outcome. The task is kept referenced until it is done."""
+
+    async def run() -> None:
+        try:
+            await deletion
+        except NotFoundException:
+            logger.warning(f"Nothing to delete for the {description}, skipping S3 cleanup")
+        except Exception:
+            logger.exception(f"Background deletion of the {description} failed, its objects are left in S3")
+
+    task = asyncio.create_task(run())
+    _background_deletions.add(task)
+    task.add_done_callback(_background_deletions.discard)
+    return task
+
+
+async def cancel_background_deletions() -> None:
+    """Cancel the background deletions still running, e.g. at shutdown."""
+    if not _background_deletions:
+        return
+    logger.warning(f"Cancelling {len(_background_deletions)} background S3 deletion(s), their objects are left in S3")
+    tasks = list(_background_deletions)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -2,29 +2,30 @@
 #
 # SPDX-License-Identifier: MIT
 
+from datetime import UTC, datetime
 from uuid import UUID
 
+from sqlalchemy import case, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from api_common.exceptions import ConflictException, DeletionConflictException, NotFoundException
-from api_common.models import set_updated_fields
 
 from ..workloads.enums import WorkloadStatus
 from ..workloads.models import Workload
 from .models import InferenceModel, OnboardingStatus
 
+# Onboarding status of a model by the status of its latest workload; any other workload status leaves it pending
+WORKLOAD_STATUS_TO_MODEL_STATUS = {
+    WorkloadStatus.COMPLETE: OnboardingStatus.ready,
+    WorkloadStatus.FAILED: OnboardingStatus.failed,
+}
+
 
 def workload_status_to_model_status(status: WorkloadStatus) -> OnboardingStatus:
     """Convert workload status to model onboarding status."""
-    match status:
-        case WorkloadStatus.COMPLETE:
-            return OnboardingStatus.ready
-        case WorkloadStatus.FAILED:
-            return OnboardingStatus.failed
-        case _:
-            return OnboardingStatus.pending
+    return WORKLOAD_STATUS_TO_MODEL_STATUS.get(status, OnboardingStatus.pending)
 
 
 async def select_model(
@@ -117,28 +118,45 @@ async def delete_model_by_id(session: AsyncSession, model_id: UUID, namespace: s
     await session.flush()
 
 
-# TODO: if we have time, we could move this to a syncer
-async def update_onboarding_statuses(session: AsyncSession, namespace: str) -> None:
-    pending_models = await select_models(session, namespace=namespace, onboarding_status=OnboardingStatus.pending)
-    if not pending_models:
-        return
-
-    model_ids = [model.id for model in pending_models]
-
-    pending_workloads = await session.execute(select(Workload).where(Workload.model_id.in_(model_ids)))
-    pending_workloads = pending_workloads.unique().scalars().all()
-
-    related_workloads = {}
-    for workload in pending_workloads:
-        if workload.model_id not in related_workloads:
-            related_workloads[workload.model_id] = workload
-
-    for model in pending_models:
-        if model.id in related_workloads:
-            latest_workload_for_model: Workload = related_workloads[model.id]
-            model.onboarding_status = workload_status_to_model_status(latest_workload_for_model.status)
-        else:
-            model.onboarding_status = OnboardingStatus.failed
-        set_updated_fields(model, "system")
-
-    await session.flush()
+async def update_onboarding_statuses(session: AsyncSession, updater: str = "system") -> int:
+    """
+    Derive the onboarding status of all pending models from their latest workload, in one UPDATE ... FROM.
+
+    Called by the workload syncer after it records workload status changes, so that reads of models never write.
+    A model becomes ready or failed once its latest workload completes or fails, and failed if it has no workload
+    left. Models whose workload is still in progress are not touched.
+
+    Returns the number of models updated.
+    """
+    latest_workloads = (
+        select(
+            InferenceModel.id.label("model_id"),
+            case(
+                (Workload.id.is_(None), OnboardingStatus.failed),
+                *(
+                    (Workload.status == status, model_status)
+                    for status, model_status in WORKLOAD_STATUS_TO_MODEL_STATUS.items()
+                ),
+                else_=OnboardingStatus.pending,
+            ).label("onboarding_status"),
+        )
+        .outerjoin(Workload, Workload.model_id == InferenceModel.id)
+        .where(InferenceModel.onboarding_status == OnboardingStatus.pending)
+        .distinct(InferenceModel.id)
+        .order_by(InferenceModel.id, Workload.created_at.desc())
+        .subquery()
+    )
+    result = await session.execute(
+        update(InferenceModel)
+        .where(
+            InferenceModel.id == latest_workloads.c.model_id,
+            latest_workloads.c.onboarding_status != OnboardingStatus.pending,
+        )
+        .values(
+            onboarding_status=latest_workloads.c.onboarding_status,
+            updated_by=updater,
+            updated_at=datetime.now(UTC),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
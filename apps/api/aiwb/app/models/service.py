@@ -15,8 +15,10 @@ from ..charts.service import get_chart
 from ..charts.utils import render_helm_template
 from ..datasets.repository import select_dataset
 from ..dispatch.kube_client import KubernetesClient
+from ..dispatch.poller import request_sync
 from ..minio.client import MinioClient
 from ..minio.config import MINIO_BUCKET
+from ..minio.deletion import start_background_deletion
 from ..overlays.repository import list_overlays
 from ..secrets.service import get_secret_details
 from ..workloads.enums import WorkloadStatus, WorkloadType
@@ -29,7 +31,6 @@ from .repository import (
     insert_model,
     select_model,
     select_models,
-    update_onboarding_statuses,
 )
 from .schemas import FinetuneCreate, ModelDeployRequest, ModelResponse
 from .utils import delete_from_s3, format_model_path, get_finetuned_model_weights_path
@@ -40,7 +41,6 @@ async def get_model(
     model_id: UUID,
     namespace: str,
 ) -> InferenceModel:
-    await update_onboarding_statuses(session, namespace)
     model = await select_model(session, model_id, namespace=namespace)
     if model is None:
         raise NotFoundException(f"Model {model_id} not found")
@@ -61,7 +61,6 @@ async def list_models(
     onboarding_status: OnboardingStatus | None = None,
     name: str | None = None,
 ) -> list[InferenceModel]:
-    await update_onboarding_statuses(session, namespace)
     return await select_models(
         session=session,
         onboarding_status=onboarding_status,
@@ -71,21 +70,20 @@ async def list_models(
 
 
 async def delete_model(session: AsyncSession, model_id: UUID, namespace: str, minio_client: MinioClient) -> None:
-    """Delete a model record and its S3 weights.
+    """Delete a model record, then its S3 weights in the background.
+
+    The deletion of the record is committed before the weights are deleted, so the request does not wait for the
+    weights, which can be tens of thousands of objects. If deleting the weights fails, they are left in S3 and the
+    failure is logged.
 
     Raises:
         NotFoundException: Model not found in the database.
         DeletionConflictException: Model has active or pending workloads.
-        ExternalServiceError, ForbiddenException, ValidationException:
-            S3 operation failure — the DB transaction rolls back, leaving both
-            the model record and S3 data intact.
     """
     model = await get_model(session, model_id, namespace)
     await delete_model_by_id(session, model_id, namespace)
-    try:
-        await delete_from_s3(model, minio_client)
-    except NotFoundException:
-        logger.warning(f"Model weights not found in S3 for model {model_id}, skipping S3 cleanup.")
+    await session.commit()
+    start_background_deletion(delete_from_s3(model, minio_client), f"weights of model {model_id}")
 
 
 async def run_finetune_model_workload(
@@ -224,6 +222,7 @@ async def run_finetune_model_workload(
         await session.flush()
 
         await apply_manifest(kube_client, manifest, workload, namespace, submitter)
+        await request_sync(session)
         logger.info(f"Successfully deployed finetuning workload {workload.id}")
 
     except Exception as e:
@@ -312,6 +311,7 @@ async def run_model_deployment(
         await session.flush()
 
         await apply_manifest(kube_client, manifest, workload, namespace, submitter)
+        await request_sync(session)
         logger.info(f"Successfully deployed inference workload {workload.id}")
 
     except Exception as e:
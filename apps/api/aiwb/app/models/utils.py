@@ -2,7 +2,6 @@
 #
 # SPDX-License-Identifier: MIT
 
-import asyncio
 import os
 
 from loguru import logger
@@ -14,6 +13,7 @@ from ..datasets.utils import slugify
 from ..minio import MinioClient
 from ..minio.client import handle_s3_operation
 from ..minio.config import MINIO_BUCKET, MINIO_MAX_ATTEMPTS, MINIO_MAX_WAIT, MINIO_MIN_WAIT
+from ..minio.deletion import delete_prefix
 from .models import InferenceModel
 
 
@@ -52,7 +52,10 @@ def get_finetuned_model_weights_path(base_canonical_name: str, finetuning_name:
 async def delete_from_s3(model: InferenceModel, client: MinioClient) -> None:
     """Delete model weights from S3 storage"""
     prefix = model.model_weights_path
+    if not prefix:
+        logger.warning(f"Model {model.id} has no weights path, skipping S3 cleanup")
+        return
 
     with handle_s3_operation("deleting model weights", f"s3://{MINIO_BUCKET}/{prefix}", model.id):
-        await asyncio.to_thread(client.delete_objects, bucket_name=MINIO_BUCKET, prefix=prefix)
-        logger.info(f"Successfully deleted model weight {model.id} from S3: {prefix}")
+        progress = await delete_prefix(client, MINIO_BUCKET, prefix)
+        logger.info(f"Successfully deleted {progress.deleted} model weight objects of {model.id} from S3: {prefix}")
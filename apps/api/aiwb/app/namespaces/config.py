@@ -5,3 +5,5 @@
 import os
 
 DEFAULT_NAMESPACE = os.getenv("DEFAULT_NAMESPACE", "workbench")
+# Seconds the metrics of a namespace are reused across page requests; 0 computes them for every request
+NAMESPACE_METRICS_SNAPSHOT_TTL_SECONDS = float(os.getenv("NAMESPACE_METRICS_SNAPSHOT_TTL_SECONDS", "5"))
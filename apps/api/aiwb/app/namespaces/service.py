@@ -10,7 +10,7 @@ from loguru import logger
 from prometheus_api_client import PrometheusConnect
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api_common.collections import SortDirection, paginate_list, sort_list
+from api_common.collections import SnapshotCache, SortDirection, sort_and_paginate_list
 
 from ..aims.repository import get_aim_service_by_id
 from ..aims.service import list_aim_services, list_chattable_aim_services
@@ -21,6 +21,7 @@ from ..workloads.enums import WorkloadStatus, WorkloadType
 from ..workloads.repository import get_workloads
 from ..workloads.service import list_chattable_workloads
 from ..workloads.utils import get_resource_type
+from .config import NAMESPACE_METRICS_SNAPSHOT_TTL_SECONDS
 from .crds import Namespace
 from .gateway import get_namespaces
 from .schemas import (
@@ -34,6 +35,11 @@ from .schemas import (
 from .security import is_valid_workbench_namespace
 from .utils import AIM_TO_WORKLOAD_STATUS
 
+# Metrics of a namespace per filter combination, shared by the page requests of the dashboard
+_metrics_snapshots: SnapshotCache[list[NamespaceWorkloadMetrics]] = SnapshotCache(
+    NAMESPACE_METRICS_SNAPSHOT_TTL_SECONDS
+)
+
 
 async def get_accessible_namespaces(
     kube_client: KubernetesClient,
@@ -183,6 +189,39 @@ async def _process_workloads_to_metrics(
     return metrics
 
 
+async def _get_namespace_workload_metrics(
+    kube_client: KubernetesClient,
+    session: AsyncSession,
+    namespace: Namespace,
+    prometheus_client: PrometheusConnect,
+    workload_types: list[WorkloadType] | None,
+    status_filter: list[WorkloadStatus] | None,
+) -> list[NamespaceWorkloadMetrics]:
+    """Combine the AIM services and workloads of a namespace that match the filters with their metrics, unsorted."""
+    # Convert user's WorkloadStatus filter to corresponding AIMServiceStatus values
+    aim_status_filter = [
+        aim for aim, ws in AIM_TO_WORKLOAD_STATUS.items() if status_filter is None or ws in status_filter
+    ]
+    workload_status_filter = status_filter if status_filter is not None else ACTIVE_WORKLOAD_STATUSES
+
+    # Fetch all data in parallel
+    aim_services_k8s, workloads_db, gpu_counts, vram_usage = await asyncio.gather(
+        list_aim_services(kube_client, namespace.name, status_filter=aim_status_filter),
+        get_workloads(
+            session, namespace=namespace.name, workload_types=workload_types, status_filter=workload_status_filter
+        ),
+        get_gpu_utilization_by_workload_in_namespace(namespace, prometheus_client),
+        get_gpu_vram_by_workload_in_namespace(namespace, prometheus_client),
+    )
+
+    aim_metrics, workload_metrics = await asyncio.gather(
+        _process_aim_services_to_metrics(aim_services_k8s, session, namespace.name, gpu_counts, vram_usage),
+        _process_workloads_to_metrics(workloads_db, gpu_counts, vram_usage),
+    )
+
+    return aim_metrics + workload_metrics
+
+
 async def get_namespace_workload_metrics_paginated(
     kube_client: KubernetesClient,
     session: AsyncSession,
@@ -197,7 +236,9 @@ async def get_namespace_workload_metrics_paginated(
 ) -> NamespaceWorkloadMetricsListPaginated:
     """Get paginated metrics for all resources in a namespace.
 
-    Combines AIM services and workloads with their metrics.
+    Combines AIM services and workloads with their metrics. The combined list is kept for
+    NAMESPACE_METRICS_SNAPSHOT_TTL_SECONDS per namespace and filters, so the following pages and other sort orders
+    are cut from the same snapshot, and only the items up to the requested page are sorted.
 
     Args:
         kube_client: Kubernetes client for AIM service queries
@@ -211,33 +252,18 @@ async def get_namespace_workload_metrics_paginated(
         sort_by: Optional field to sort by
         sort_order: Sort direction (asc or desc)
     """
-    # Convert user's WorkloadStatus filter to corresponding AIMServiceStatus values
-    aim_status_filter = [
-        aim for aim, ws in AIM_TO_WORKLOAD_STATUS.items() if status_filter is None or ws in status_filter
-    ]
-    workload_status_filter = status_filter if status_filter is not None else ACTIVE_WORKLOAD_STATUSES
-
-    # Fetch all data in parallel
-    aim_services_k8s, workloads_db, gpu_counts, vram_usage = await asyncio.gather(
-        list_aim_services(kube_client, namespace.name, status_filter=aim_status_filter),
-        get_workloads(
-            session, namespace=namespace.name, workload_types=workload_types, status_filter=workload_status_filter
+    metrics = await _metrics_snapshots.get_or_load(
+        (
+            namespace.name,
+            None if workload_types is None else tuple(sorted(workload_types)),
+            None if status_filter is None else tuple(sorted(status_filter)),
+        ),
+        lambda: _get_namespace_workload_metrics(
+            kube_client, session, namespace, prometheus_client, workload_types, status_filter
         ),
-        get_gpu_utilization_by_workload_in_namespace(namespace, prometheus_client),
-        get_gpu_vram_by_workload_in_namespace(namespace, prometheus_client),
-    )
-
-    aim_metrics, workload_metrics = await asyncio.gather(
-        _process_aim_services_to_metrics(aim_services_k8s, session, namespace.name, gpu_counts, vram_usage),
-        _process_workloads_to_metrics(workloads_db, gpu_counts, vram_usage),
     )
 
-    metrics = aim_metrics + workload_metrics
-
-    # Sort the full filtered data list before pagination
-    metrics = sort_list(metrics, sort_by=sort_by, sort_order=sort_order)
-
-    paginated = paginate_list(metrics, page=page, page_size=page_size)
+    paginated = sort_and_paginate_list(metrics, page=page, page_size=page_size, sort_by=sort_by, sort_order=sort_order)
 
     return NamespaceWorkloadMetricsListPaginated(
         data=paginated.items,
@@ -24,5 +24,7 @@ class Overlay(BaseEntity):
         PGUUID(as_uuid=True), ForeignKey("charts.id", ondelete="CASCADE"), nullable=False, index=True
     )
     chart: Mapped[Chart] = relationship(Chart, lazy="joined")
+    # Hash of the registered overlay file, cleared by API updates so that registration reapplies the file
+    content_hash: Mapped[str | None] = mapped_column(String, nullable=True)
 
     __table_args__ = (Index("overlays_chart_id_canonical_name_key", chart_id, canonical_name, unique=True),)
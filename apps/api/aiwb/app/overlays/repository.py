@@ -20,6 +20,7 @@ async def insert_overlay(
     overlay_data: dict[str, Any],
     canonical_name: str | None = None,
     creator: str | None = None,
+    content_hash: str | None = None,
 ) -> Overlay:
     """
     Insert a new overlay record into the database.
@@ -32,6 +33,7 @@ async def insert_overlay(
         canonical_name=canonical_name,
         chart_id=chart_id,
         overlay=overlay_data,
+        content_hash=content_hash,
         created_by=creator,
         updated_by=creator,
     )
@@ -69,6 +71,20 @@ async def list_overlays(
     return result.scalars().unique().all()
 
 
+async def get_overlay_content_hashes(
+    session: AsyncSession, chart_ids: list[UUID] | None = None
+) -> dict[tuple[UUID, str | None], tuple[UUID, str | None]]:
+    """Map (chart_id, canonical_name) to the overlay ID and registered content hash, without loading charts."""
+    query = select(Overlay.chart_id, Overlay.canonical_name, Overlay.id, Overlay.content_hash)
+    if chart_ids is not None:
+        query = query.where(Overlay.chart_id.in_(chart_ids))
+    result = await session.execute(query)
+    return {
+        (chart_id, canonical_name): (overlay_id, content_hash)
+        for chart_id, canonical_name, overlay_id, content_hash in result.all()
+    }
+
+
 async def get_overlay(
     session: AsyncSession,
     overlay_id: UUID,
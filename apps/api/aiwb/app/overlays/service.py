@@ -5,12 +5,12 @@
 import uuid
 from typing import Any
 
-import yaml
 from fastapi import UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api_common.exceptions import NotFoundException, ValidationException
 from api_common.models import set_updated_fields
+from api_common.yaml_codec import YAMLError, load_async
 
 from .models import Overlay
 from .repository import delete_overlay, get_overlay, insert_overlay
@@ -23,6 +23,7 @@ async def create_overlay(
     overlay_data: dict[str, Any],
     canonical_name: str | None = None,
     creator: str | None = None,
+    content_hash: str | None = None,
 ) -> Overlay:
     overlay = await insert_overlay(
         session=session,
@@ -30,6 +31,7 @@ async def create_overlay(
         overlay_data=overlay_data,
         canonical_name=canonical_name,
         creator=creator,
+        content_hash=content_hash,
     )
     return overlay
 
@@ -38,8 +40,9 @@ async def update_overlay(
     session: AsyncSession,
     overlay_id: uuid.UUID,
     overlay_update: OverlayUpdate,
+    content_hash: str | None = None,
 ) -> Overlay:
-    """Update an existing overlay."""
+    """Update an existing overlay. Updates outside of workload registration clear the content hash."""
     overlay = await get_overlay(session, overlay_id)
     if not overlay:
         raise NotFoundException(f"Overlay with ID {overlay_id} not found")
@@ -47,6 +50,7 @@ async def update_overlay(
     # Update the overlay data
     for key, value in overlay_data.items():
         setattr(overlay, key, value)
+    overlay.content_hash = content_hash
 
     set_updated_fields(overlay, overlay_update.updated_by)
 
@@ -62,8 +66,8 @@ async def parse_overlay_file(file: UploadFile) -> dict[str, Any]:
 
     try:
         contents = await file.read()
-        return yaml.safe_load(contents)
-    except yaml.YAMLError as e:
+        return await load_async(contents)
+    except YAMLError as e:
         raise ValidationException(f"Invalid YAML format: {str(e)}")
     finally:
         await file.close()
@@ -44,6 +44,8 @@ async def list_kubernetes_secrets(
 ) -> list[KubernetesSecretResource]:
     """List all Kubernetes Secrets in a namespace.
 
+    Only the metadata of the secrets is fetched, not their data.
+
     Args:
         kube_client: Kubernetes client
         namespace: Namespace to search in
@@ -52,7 +54,7 @@ async def list_kubernetes_secrets(
         List of KubernetesSecretResource CRD models
     """
     try:
-        result = await kube_client.core_v1.list_namespaced_secret(namespace=namespace)
+        result = await kube_client.list_namespaced_secret_metadata(namespace)
 
         secrets = []
         for item in result.items:
@@ -6,6 +6,8 @@
 
 import os
 
+from .enums import DeletionPropagationPolicy
+
 # Time in seconds before a workload with no CRD is marked as DELETED
 WORKLOAD_UPDATE_GRACE_PERIOD = int(os.getenv("SYNCER_PENDING_TIMEOUT_SECONDS", "60"))
 
@@ -14,3 +16,7 @@ CHAT_TIMEOUT = float(os.environ.get("CHAT_TIMEOUT", 1800.0))
 
 # Default chat path
 DEFAULT_CHAT_PATH = os.environ.get("DEFAULT_CHAT_PATH", "/v1/chat/completions")
+
+# Deletion of workload resources: delete-collection calls in flight at once and the default propagation policy
+WORKLOAD_DELETION_CONCURRENCY = int(os.getenv("WORKLOAD_DELETION_CONCURRENCY", "4"))
+WORKLOAD_DELETION_PROPAGATION = DeletionPropagationPolicy(os.getenv("WORKLOAD_DELETION_PROPAGATION", "Background"))
@@ -17,11 +17,15 @@ CHART_ID_LABEL = f"{AIWB_METADATA_PREFIX}/chart-id"
 DISPLAY_NAME_LABEL = f"{AIWB_METADATA_PREFIX}/display-name"
 WORKLOAD_TYPE_LABEL = f"{EAI_APPS_METADATA_PREFIX}/workload-type"
 
+# Submitter of the idle workspaces of the warm pool, until a user claims one
+WORKSPACE_POOL_SUBMITTER = "workspace-pool"
+
 # Workload resource kinds
 DEPLOYMENT_RESOURCE = "Deployment"
 DEPLOYMENT_RESOURCE_PLURAL = "deployments"
 JOB_RESOURCE = "Job"
 JOB_RESOURCE_PLURAL = "jobs"
+POD_RESOURCE = "Pod"
 
 
 @dataclass(frozen=True)
@@ -19,3 +19,10 @@ class WorkloadType(StrEnum):
     INFERENCE = "INFERENCE"
     FINE_TUNING = "FINE_TUNING"
     WORKSPACE = "WORKSPACE"
+
+
+class DeletionPropagationPolicy(StrEnum):
+    """How Kubernetes deletes the dependents of deleted workload resources, such as the pods of a Job."""
+
+    FOREGROUND = "Foreground"
+    BACKGROUND = "Background"
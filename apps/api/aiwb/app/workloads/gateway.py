@@ -6,44 +6,95 @@
 
 import asyncio
 
-from kubernetes_asyncio.client import ApiException
+from kubernetes.client import ApiException
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
 from loguru import logger
 
-from ..dispatch.kube_client import get_dynamic_client
-from .constants import WORKLOAD_ID_LABEL, WORKLOAD_RESOURCES
+from ..dispatch.discovery import resolve_resource
+from .config import WORKLOAD_DELETION_CONCURRENCY, WORKLOAD_DELETION_PROPAGATION
+from .constants import WORKLOAD_ID_LABEL, WORKLOAD_RESOURCES, KubernetesResource
+from .enums import DeletionPropagationPolicy
 
+# Workload IDs per set-based label selector, keeps the URLs of the delete-collection calls short
+MAX_WORKLOAD_IDS_PER_SELECTOR = 50
 
-async def delete_workload_resources(
+
+async def _delete_collection(
+    resource: KubernetesResource,
     namespace: str,
-    workload_id: str,
+    label_selector: str,
+    propagation_policy: DeletionPropagationPolicy,
+    slots: asyncio.Semaphore,
 ) -> None:
-    """Delete all Kubernetes resources with the workload-id label.
-
-    Deletes Deployments, Jobs, and any supporting resources (ConfigMaps, Services, HTTPRoutes)
-    created by AIWB workload manifests.
-
-    Raises:
-        RuntimeError: If any resource deletion fails (excluding 404 not found)
-    """
-    label_selector = f"{WORKLOAD_ID_LABEL}={workload_id}"
-
-    dynamic_client = await asyncio.to_thread(get_dynamic_client)
-
-    for resource in WORKLOAD_RESOURCES:
+    async with slots:
         try:
+            api_resource = await resolve_resource(api_version=resource.api_version, kind=resource.kind)
             await asyncio.to_thread(
-                dynamic_client.resources.get(api_version=resource.api_version, kind=resource.kind).delete,
+                api_resource.delete,
                 namespace=namespace,
                 label_selector=label_selector,
+                propagation_policy=propagation_policy,
             )
             logger.debug(f"Deleted {resource.plural} with label {label_selector} from namespace {namespace}")
+        except ResourceNotFoundError:
+            logger.debug(f"The cluster does not serve {resource.plural}, nothing to delete")
         except ApiException as e:
             if e.status == 404:
                 logger.debug(f"No {resource.plural} found with label {label_selector}")
             else:
                 logger.error(f"Failed to delete {resource.plural}: {e}")
-                raise RuntimeError(
-                    f"Failed to delete Kubernetes resources for workload {workload_id}. Please try again. Error: {e}"
-                ) from e
+                raise
+
+
+async def delete_workloads_resources(
+    namespace: str,
+    workload_ids: list[str],
+    propagation_policy: DeletionPropagationPolicy = WORKLOAD_DELETION_PROPAGATION,
+) -> None:
+    """Delete all Kubernetes resources of several workloads in a namespace.
+
+    Deletes Deployments, Jobs, and any supporting resources (ConfigMaps, Services, HTTPRoutes)
+    created by AIWB workload manifests, with one delete-collection call per resource kind and
+    set-based workload-id label selector. Up to WORKLOAD_DELETION_CONCURRENCY calls run at once.
+
+    Raises:
+        RuntimeError: If any resource deletion fails (excluding 404 not found), after all calls ran
+    """
+    if not workload_ids:
+        return
+
+    selectors = [
+        f"{WORKLOAD_ID_LABEL} in ({','.join(workload_ids[i : i + MAX_WORKLOAD_IDS_PER_SELECTOR])})"
+        for i in range(0, len(workload_ids), MAX_WORKLOAD_IDS_PER_SELECTOR)
+    ]
+    slots = asyncio.Semaphore(WORKLOAD_DELETION_CONCURRENCY)
+    results = await asyncio.gather(
+        *(
+            _delete_collection(resource, namespace, selector, propagation_policy, slots)
+            for selector in selectors
+            for resource in WORKLOAD_RESOURCES
+        ),
+        return_exceptions=True,
+    )
 
-    logger.info(f"Deleted all resources for workload {workload_id} in namespace {namespace}")
+    described = f"workload {workload_ids[0]}" if len(workload_ids) == 1 else f"{len(workload_ids)} workloads"
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        raise RuntimeError(
+            f"Failed to delete Kubernetes resources for {described}. Please try again. Error: {errors[0]}"
+        ) from errors[0]
+
+    logger.info(f"Deleted all resources for {described} in namespace {namespace}")
+
+
+async def delete_workload_resources(
+    namespace: str,
+    workload_id: str,
+    propagation_policy: DeletionPropagationPolicy = WORKLOAD_DELETION_PROPAGATION,
+) -> None:
+    """Delete all Kubernetes resources with the workload-id label.
+
+    Raises:
+        RuntimeError: If any resource deletion fails (excluding 404 not found)
+    """
+    await delete_workloads_resources(namespace, [workload_id], propagation_policy)
@@ -75,12 +75,25 @@ async def get_workload_by_id(session: AsyncSession, workload_id: UUID, namespace
     return result.scalars().first()
 
 
+async def get_workloads_by_ids(
+    session: AsyncSession, workload_ids: list[UUID], namespace: str | None = None
+) -> list[Workload]:
+    """Get the workloads with the given IDs, optionally filtered by namespace. Unknown IDs are skipped."""
+    query = select(Workload).where(Workload.id.in_(workload_ids))
+    if namespace is not None:
+        query = query.where(Workload.namespace == namespace)
+
+    result = await session.execute(query)
+    return result.unique().scalars().all()
+
+
 async def get_workloads(
     session: AsyncSession,
     namespace: str | None = None,
     workload_types: list[WorkloadType] | None = None,
     status_filter: list[WorkloadStatus] | None = None,
     chart_name: str | None = None,
+    exclude_submitter: str | None = None,
 ) -> list[Workload]:
     """
     Get all workloads, optionally filtered by namespace, type, status, and chart.
@@ -91,6 +104,7 @@ async def get_workloads(
         workload_types: Filter by workload type(s)
         status_filter: Include only these statuses
         chart_name: Filter by chart name
+        exclude_submitter: Exclude workloads created by this submitter
 
     Returns:
         List of matching workloads
@@ -105,6 +119,8 @@ async def get_workloads(
         query = query.where(Workload.status.in_(status_filter))
     if chart_name:
         query = query.join(Chart).where(Chart.name == chart_name)
+    if exclude_submitter:
+        query = query.where(Workload.created_by != exclude_submitter)
 
     result = await session.execute(query)
     return result.unique().scalars().all()
@@ -133,6 +149,13 @@ async def update_workload_status(
     return workload
 
 
+async def update_workloads_status(session: AsyncSession, workloads: list[Workload], status: WorkloadStatus) -> None:
+    """Update the status of several loaded workloads with a single flush."""
+    for workload in workloads:
+        workload.status = status
+    await session.flush()
+
+
 async def delete_workload(session: AsyncSession, workload_id: UUID) -> bool:
     """
     Delete a workload from the database.
@@ -13,20 +13,30 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api_common.database import get_session
 from api_common.exceptions import NotFoundException
-from api_common.schemas import ListResponse
+from api_common.schemas import DeleteBatchRequest, ListResponse
 
+from ..dispatch.kube_client import KubernetesClient, get_kube_client
+from ..dispatch.schemas import ResourceEvent
 from ..logs.client import get_loki_client
-from ..logs.schemas import LogLevel, LogsQueryRequest, LogType, WorkloadLogsResponse
-from ..logs.service import get_logs_by_workload_id, stream_workload_logs_sse
+from ..logs.schemas import LogLevel, LogsExportRequest, LogsQueryRequest, LogType, WorkloadLogsResponse
+from ..logs.service import export_workload_logs, get_logs_by_workload_id, stream_workload_logs_sse
 from ..metrics.client import get_prometheus_client
 from ..metrics.enums import MetricName
 from ..metrics.schemas import MetricsScalar, MetricsScalarWithRange, MetricsTimeRange, MetricsTimeseries
 from ..metrics.service import get_metric_by_workload_id
 from ..namespaces.security import ensure_access_to_workbench_namespace
-from .enums import WorkloadStatus, WorkloadType
-from .repository import get_workload_by_id, get_workloads
+from .config import WORKLOAD_DELETION_PROPAGATION
+from .constants import WORKSPACE_POOL_SUBMITTER
+from .enums import DeletionPropagationPolicy, WorkloadStatus, WorkloadType
+from .repository import get_workload_by_id, get_workloads, get_workloads_by_ids
 from .schemas import WorkloadResponse
-from .service import chat_with_workload, delete_workload_components, list_chattable_workloads
+from .service import (
+    chat_with_workload,
+    delete_workload_components,
+    delete_workloads_components,
+    get_workload_events,
+    list_chattable_workloads,
+)
 
 router = APIRouter(tags=["Workloads"])
 
@@ -49,6 +59,7 @@ async def list_namespace_workloads(
         namespace=namespace,
         workload_types=workload_type if workload_type else None,
         status_filter=status_filter if status_filter else None,
+        exclude_submitter=WORKSPACE_POOL_SUBMITTER,
     )
     return ListResponse(data=[WorkloadResponse.model_validate(workload) for workload in workloads])
 
@@ -116,6 +127,26 @@ async def get_workload(
     return WorkloadResponse.model_validate(workload)
 
 
+@router.get(
+    "/namespaces/{namespace}/workloads/{workload_id}/events",
+    response_model=ListResponse[ResourceEvent],
+    status_code=status.HTTP_200_OK,
+    summary="Get workload events",
+    description="Retrieve the Kubernetes events of the resources and pods of a workload, most recent first.",
+)
+async def get_workload_events_endpoint(
+    namespace: str = Depends(ensure_access_to_workbench_namespace),
+    workload_id: UUID = Path(description="The UUID of the workload to get events for"),
+    session: AsyncSession = Depends(get_session),
+    kube_client: KubernetesClient = Depends(get_kube_client),
+) -> ListResponse[ResourceEvent]:
+    workload = await get_workload_by_id(session=session, namespace=namespace, workload_id=workload_id)
+    if not workload:
+        raise NotFoundException(f"Workload {workload_id} not found")
+
+    return ListResponse(data=await get_workload_events(kube_client, workload))
+
+
 @router.delete(
     "/namespaces/{namespace}/workloads/{workload_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -129,6 +160,9 @@ async def get_workload(
 async def delete_workload(
     namespace: str = Depends(ensure_access_to_workbench_namespace),
     workload_id: UUID = Path(description="The UUID of the workload to delete"),
+    propagation_policy: DeletionPropagationPolicy = Query(
+        default=WORKLOAD_DELETION_PROPAGATION, description="How Kubernetes deletes dependents such as pods"
+    ),
     session: AsyncSession = Depends(get_session),
 ) -> None:
     workload = await get_workload_by_id(session=session, workload_id=workload_id, namespace=namespace)
@@ -136,7 +170,34 @@ async def delete_workload(
         raise NotFoundException(f"Workload {workload_id} not found")
 
     # Delete all workload components from Kubernetes and update status in DB
-    await delete_workload_components(namespace, workload_id, session)
+    await delete_workload_components(namespace, workload_id, session, propagation_policy=propagation_policy)
+
+
+@router.post(
+    "/namespaces/{namespace}/workloads/delete",
+    status_code=status.HTTP_200_OK,
+    summary="Bulk delete workloads",
+    description=dedent("""
+        Delete several workloads and all their Kubernetes components at once. Each resource kind
+        is deleted with a single call covering all workloads, using a set-based workload-id label
+        selector. Fails without deleting anything if any workload ID is not found in the namespace.
+    """),
+)
+async def batch_delete_workloads(
+    data: DeleteBatchRequest,
+    namespace: str = Depends(ensure_access_to_workbench_namespace),
+    propagation_policy: DeletionPropagationPolicy = Query(
+        default=WORKLOAD_DELETION_PROPAGATION, description="How Kubernetes deletes dependents such as pods"
+    ),
+    session: AsyncSession = Depends(get_session),
+) -> list[UUID]:
+    workloads = await get_workloads_by_ids(session=session, workload_ids=data.ids, namespace=namespace)
+    missing_ids = set(data.ids) - {workload.id for workload in workloads}
+    if missing_ids:
+        raise NotFoundException(f"Workloads with IDs {list(missing_ids)} not found in this namespace")
+
+    await delete_workloads_components(session, workloads, propagation_policy=propagation_policy)
+    return [workload.id for workload in workloads]
 
 
 @router.get(
@@ -199,6 +260,57 @@ async def get_workload_logs_endpoint(
     )
 
 
+@router.get(
+    "/namespaces/{namespace}/workloads/{workload_id}/logs/export",
+    operation_id="export_workload_logs",
+    summary="Export workload logs",
+    description=dedent("""
+        Export all logs of a workload in a time range as newline-delimited JSON, one log entry per line.
+
+        The range is split into time shards that are queried from Loki concurrently and streamed back in
+        timestamp order. Set `compress=true` to receive a gzip-compressed stream. If a shard query fails
+        mid-stream, a final line with an `error` field is written and the export stops.
+    """),
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "NDJSON stream of log entries",
+            "content": {"application/x-ndjson": {}, "application/gzip": {}},
+        },
+        400: {"description": "Invalid time range (start not before end, or longer than the maximum export range)"},
+        404: {"description": "Workload not found"},
+        422: {"description": "Invalid parameters (e.g., malformed timestamps)"},
+    },
+)
+async def export_workload_logs_endpoint(
+    namespace: str = Depends(ensure_access_to_workbench_namespace),
+    workload_id: UUID = Path(description="The UUID of the workload"),
+    session: AsyncSession = Depends(get_session),
+    params: LogsExportRequest = Depends(),
+    loki_client: object = Depends(get_loki_client),
+) -> StreamingResponse:
+    """Export logs for a workload as a streaming NDJSON or gzip download."""
+    workload = await get_workload_by_id(session=session, workload_id=workload_id, namespace=namespace)
+    if not workload:
+        raise NotFoundException(f"Workload {workload_id} not found")
+
+    content = export_workload_logs(
+        workload_id=str(workload_id),
+        loki_client=loki_client,
+        start_date=params.start,
+        end_date=params.end,
+        level_filter=params.level,
+        log_type=params.log_type,
+        compress=params.compress,
+    )
+    filename = f"workload-{workload_id}-logs.ndjson" + (".gz" if params.compress else "")
+    return StreamingResponse(
+        content,
+        media_type="application/gzip" if params.compress else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get(
     "/namespaces/{namespace}/workloads/{workload_id}/logs/stream",
     operation_id="stream_workload_logs",
@@ -217,6 +329,9 @@ async def get_workload_logs_endpoint(
         - Events sent every 1-30 seconds based on `delay` parameter
         - Connection stays open until client disconnects or error occurs
         - Errors are sent as JSON events with `error` field
+        - Streams of the same workload, filters and delay share one upstream Loki tail. A stream joining a running
+          tail replays at most the last 1000 entries (`LOKI_TAIL_REPLAY_SIZE`) after `start_time`; use the
+          non-streaming logs endpoint for complete history.
 
         **Client Implementation:**
         Use EventSource API or equivalent SSE client library to consume the stream.
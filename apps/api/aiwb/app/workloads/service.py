@@ -4,6 +4,7 @@
 
 """Workload service for creation, deletion, and management."""
 
+from collections import defaultdict
 from uuid import UUID
 
 import httpx
@@ -14,18 +15,29 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.background import BackgroundTask
 
 from api_common.exceptions import NotFoundException, ValidationException
+from api_common.yaml_codec import YAMLError, load_all_cached
 
+from ..dispatch.kube_client import KubernetesClient
+from ..dispatch.poller import request_sync
+from ..dispatch.schemas import ResourceEvent
+from ..dispatch.utils import get_events_for_objects
 from ..overlays.repository import list_overlays
-from .config import CHAT_TIMEOUT, DEFAULT_CHAT_PATH
-from .enums import WorkloadStatus, WorkloadType
-from .gateway import delete_workload_resources
+from .config import CHAT_TIMEOUT, DEFAULT_CHAT_PATH, WORKLOAD_DELETION_PROPAGATION
+from .constants import POD_RESOURCE, WORKLOAD_ID_LABEL
+from .enums import DeletionPropagationPolicy, WorkloadStatus, WorkloadType
+from .gateway import delete_workload_resources, delete_workloads_resources
 from .models import Workload
-from .repository import get_workload_by_id, get_workloads, update_workload_status
+from .repository import get_workload_by_id, get_workloads, update_workload_status, update_workloads_status
 from .schemas import WorkloadResponse
 from .utils import get_workload_internal_url
 
 
-async def delete_workload_components(namespace: str, workload_id: UUID, session: AsyncSession) -> None:
+async def delete_workload_components(
+    namespace: str,
+    workload_id: UUID,
+    session: AsyncSession,
+    propagation_policy: DeletionPropagationPolicy = WORKLOAD_DELETION_PROPAGATION,
+) -> None:
     """Delete all Kubernetes components associated with a workload.
 
     Raises:
@@ -39,11 +51,54 @@ async def delete_workload_components(namespace: str, workload_id: UUID, session:
         return
 
     await update_workload_status(session, workload.id, WorkloadStatus.DELETING, workload.updated_by)
-    await delete_workload_resources(namespace, str(workload.id))
+    await delete_workload_resources(namespace, str(workload.id), propagation_policy=propagation_policy)
     await update_workload_status(session, workload.id, WorkloadStatus.DELETED, workload.updated_by)
+    await request_sync(session)
     logger.info(f"Workload {workload.id} marked as DELETED")
 
 
+async def delete_workloads_components(
+    session: AsyncSession,
+    workloads: list[Workload],
+    propagation_policy: DeletionPropagationPolicy = WORKLOAD_DELETION_PROPAGATION,
+) -> None:
+    """Delete the Kubernetes components of several workloads, with one sweep over the resource kinds per namespace.
+
+    Raises:
+        RuntimeError: If Kubernetes resource deletion fails. Database changes are rolled back.
+    """
+    by_namespace: defaultdict[str, list[Workload]] = defaultdict(list)
+    for workload in workloads:
+        by_namespace[workload.namespace].append(workload)
+
+    await update_workloads_status(session, workloads, WorkloadStatus.DELETING)
+    for namespace, namespace_workloads in by_namespace.items():
+        logger.info(f"Deleting {len(namespace_workloads)} workloads in namespace {namespace}")
+        await delete_workloads_resources(
+            namespace, [str(workload.id) for workload in namespace_workloads], propagation_policy
+        )
+    await update_workloads_status(session, workloads, WorkloadStatus.DELETED)
+    await request_sync(session)
+    logger.info(f"{len(workloads)} workloads marked as DELETED")
+
+
+async def get_workload_events(kube_client: KubernetesClient, workload: Workload) -> list[ResourceEvent]:
+    """Get the events of the objects in a workload manifest and of its pods, most recent first."""
+    objects: list[tuple[str, str]] = []
+    try:
+        for doc in load_all_cached(workload.manifest):
+            if isinstance(doc, dict) and doc.get("kind") and doc.get("metadata", {}).get("name"):
+                objects.append((doc["kind"], doc["metadata"]["name"]))
+    except YAMLError as e:
+        logger.warning(f"Failed to parse the manifest of workload {workload.id}: {e}")
+
+    pods = await kube_client.core_v1.list_namespaced_pod(
+        namespace=workload.namespace, label_selector=f"{WORKLOAD_ID_LABEL}={workload.id}"
+    )
+    objects.extend((POD_RESOURCE, pod.metadata.name) for pod in pods.items)
+    return await get_events_for_objects(kube_client, workload.namespace, objects)
+
+
 async def is_workload_chattable(session: AsyncSession, workload: Workload) -> bool:
     """Check if a workload can be used for chat.
 
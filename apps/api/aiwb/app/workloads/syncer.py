@@ -10,6 +10,7 @@ from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..dispatch.kube_client import KubernetesClient
+from ..models.repository import update_onboarding_statuses
 from .config import WORKLOAD_UPDATE_GRACE_PERIOD
 from .constants import (
     DEPLOYMENT_RESOURCE_PLURAL,
@@ -99,16 +100,35 @@ async def _update_workload_status_from_k8s(
         return None
 
 
-async def sync_workloads(session: AsyncSession, kube_client: KubernetesClient) -> None:
+async def _update_onboarding_statuses(session: AsyncSession) -> int:
+    """Update the onboarding status of pending models in a savepoint, so that a failure keeps the workload updates.
+
+    Also runs when no workload changed, as pending models whose workloads were deleted become failed.
+    """
+    try:
+        async with session.begin_nested():
+            updated = await update_onboarding_statuses(session)
+    except Exception:
+        logger.exception("Error updating model onboarding statuses")
+        return 0
+    if updated:
+        logger.info(f"Updated onboarding status of {updated} model(s)")
+    return updated
+
+
+async def sync_workloads(session: AsyncSession, kube_client: KubernetesClient) -> int:
     """Synchronize workload statuses with Kubernetes cluster state.
 
     Reads status from Deployments/Jobs and updates the database.
     If a resource no longer exists and the workload is not already DELETED, marks it as DELETED.
+    Then derives the onboarding status of pending models from the updated workloads, so that model reads stay
+    read-only.
+
+    Returns the number of workloads and models whose status changed.
     """
     workloads = await get_workloads(session)
-    if not workloads:
-        return
 
+    previous_statuses = {workload.id: workload.status for workload in workloads}
     resource_counts = {DEPLOYMENT_RESOURCE_PLURAL: 0, JOB_RESOURCE_PLURAL: 0}
 
     for workload in workloads:
@@ -119,9 +139,13 @@ async def sync_workloads(session: AsyncSession, kube_client: KubernetesClient) -
         except Exception:
             logger.exception(f"Error synchronizing workload {workload.id}")
 
+    # Count before committing, which expires the loaded workloads
+    changed = sum(1 for workload in workloads if workload.status != previous_statuses[workload.id])
+    changed += await _update_onboarding_statuses(session)
     await session.commit()
 
     logger.debug(
         f"Workload sync: {resource_counts[DEPLOYMENT_RESOURCE_PLURAL]} deployments, "
         f"{resource_counts[JOB_RESOURCE_PLURAL]} jobs in K8s"
     )
+    return changed
@@ -6,12 +6,15 @@ import asyncio
 import time
 from urllib.parse import urljoin
 
-import yaml
 from kubernetes.client import ApiException, V1DeploymentStatus, V1JobStatus
+from kubernetes.dynamic import Resource
 from loguru import logger
 
+from api_common.yaml_codec import YAMLError, load_all_async, load_all_cached
+
 from ..config import CLUSTER_HOST, SUBMITTER_ANNOTATION
-from ..dispatch.kube_client import KubernetesClient, get_dynamic_client
+from ..dispatch.discovery import refresh_resource, resolve_resource
+from ..dispatch.kube_client import KubernetesClient
 from ..dispatch.utils import sanitize_label_value
 from ..namespaces.schemas import ResourceType
 from .constants import (
@@ -46,13 +49,13 @@ def get_resource_type(manifest: str) -> ResourceType:
         ValueError: If the manifest is empty, malformed, or lacks a Deployment/Job.
     """
     try:
-        for doc in yaml.safe_load_all(manifest):
+        for doc in load_all_cached(manifest):
             if not doc or not isinstance(doc, dict):
                 continue
             kind = doc.get("kind")
             if kind in {DEPLOYMENT_RESOURCE, JOB_RESOURCE}:
                 return ResourceType(kind)
-    except yaml.YAMLError as e:
+    except YAMLError as e:
         raise ValueError(f"Malformed manifest YAML: {e}") from e
     raise ValueError("Manifest has no Deployment or Job")
 
@@ -119,6 +122,10 @@ def derive_job_status(status: V1JobStatus | None) -> WorkloadStatus:
     return WorkloadStatus.PENDING
 
 
+async def _create_resource(api_resource: Resource, body: dict, namespace: str) -> None:
+    await asyncio.to_thread(api_resource.create, body=body, namespace=namespace if api_resource.namespaced else None)
+
+
 async def apply_manifest(
     kube_client: KubernetesClient,
     manifest: str,
@@ -143,8 +150,7 @@ async def apply_manifest(
     Raises:
         RuntimeError: If applying manifest fails
     """
-    dyn_client = await asyncio.to_thread(get_dynamic_client)
-    documents = list(yaml.safe_load_all(manifest))
+    documents = await load_all_async(manifest)
 
     for doc in documents:
         if not doc or not isinstance(doc, dict):
@@ -191,8 +197,15 @@ async def apply_manifest(
         logger.debug(f"Applying {kind}/{name} with workload-id {workload.id}")
 
         try:
-            api_resource = dyn_client.resources.get(api_version=api_version, kind=kind)
-            api_resource.create(body=doc, namespace=namespace if api_resource.namespaced else None)
+            api_resource = await resolve_resource(api_version=api_version, kind=kind)
+            try:
+                await _create_resource(api_resource, doc, namespace)
+            except ApiException as e:
+                if e.status != 404:
+                    raise
+                # The kind may have moved since it was discovered, e.g. after its CRD was reinstalled
+                api_resource = await refresh_resource(api_version=api_version, kind=kind)
+                await _create_resource(api_resource, doc, namespace)
             logger.debug(f"Created {kind}/{name}")
         except ApiException as e:
             if e.status == 409:
@@ -258,8 +271,8 @@ def get_workload_host_from_HTTPRoute_manifest(*, manifest: str, cluster_host: st
         return None
 
     try:
-        docs = list(yaml.safe_load_all(manifest))
-    except yaml.YAMLError as e:
+        docs = load_all_cached(manifest)
+    except YAMLError as e:
         logger.error(f"Failed to parse manifest YAML: {e}")
         return None
 
@@ -0,0 +1,63 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Configuration for the warm pool of development workspaces."""
+
+import os
+
+from loguru import logger
+
+from .enums import (
+    WORKSPACE_USAGE_SCOPE_MAPPING,
+    WorkspacePoolPolicy,
+    WorkspaceType,
+    WorkspaceUsageScope,
+    workspace_type_chart_name_mapping,
+)
+
+
+def parse_pool_sizes(value: str, user_agnostic_charts: list[str]) -> dict[WorkspaceType, int]:
+    """Parse pool sizes per workspace type, such as "vscode=2,jupyterlab=1".
+
+    Only user-scoped workspace types can be pooled; namespace-scoped ones allow a single workspace per namespace.
+    Pooled workspaces are rendered before anyone claims them, so a type is only pooled if its chart is listed in
+    user_agnostic_charts.
+    """
+    sizes: dict[WorkspaceType, int] = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        name, _, size = item.partition("=")
+        workspace_type = WorkspaceType(name.strip())
+        if WORKSPACE_USAGE_SCOPE_MAPPING.get(workspace_type) != WorkspaceUsageScope.USER:
+            logger.warning(f"Ignoring warm pool size for {workspace_type}, which is limited to one per namespace")
+            continue
+        chart_name = workspace_type_chart_name_mapping[workspace_type]
+        if chart_name not in user_agnostic_charts:
+            logger.warning(
+                f"Ignoring warm pool size for {workspace_type}, its chart {chart_name} is not listed in "
+                "WORKSPACE_POOL_USER_AGNOSTIC_CHARTS"
+            )
+            continue
+        if int(size) > 0:
+            sizes[workspace_type] = int(size)
+    return sizes
+
+
+# Charts that use metadata.user_id in the labels of their resources at most, and not in names, values or pod
+# templates. Pooled workspaces are rendered for WORKSPACE_POOL_SUBMITTER and only those labels are handed over to the
+# user that claims one, so only workspace types of these charts are pooled.
+WORKSPACE_POOL_USER_AGNOSTIC_CHARTS = [
+    chart.strip() for chart in os.getenv("WORKSPACE_POOL_USER_AGNOSTIC_CHARTS", "").split(",") if chart.strip()
+]
+# Idle workspaces to keep per workspace type and namespace, e.g. "vscode=2,jupyterlab=1". Empty disables the pool.
+WORKSPACE_POOL_SIZES = parse_pool_sizes(os.getenv("WORKSPACE_POOL_SIZES", ""), WORKSPACE_POOL_USER_AGNOSTIC_CHARTS)
+# fixed: keep the full size in every namespace of WORKSPACE_POOL_NAMESPACES
+# demand: keep as many as were created in a namespace during the demand window, up to the size
+WORKSPACE_POOL_POLICY = WorkspacePoolPolicy(os.getenv("WORKSPACE_POOL_POLICY", WorkspacePoolPolicy.DEMAND))
+# Namespaces to keep pools in; required by the fixed policy, and restricts the demand policy if set
+WORKSPACE_POOL_NAMESPACES = [
+    namespace.strip() for namespace in os.getenv("WORKSPACE_POOL_NAMESPACES", "").split(",") if namespace.strip()
+]
+WORKSPACE_POOL_DEMAND_WINDOW_SECONDS = int(os.getenv("WORKSPACE_POOL_DEMAND_WINDOW_SECONDS", str(24 * 3600)))
+# Workspaces the pool syncer deploys per run, which bounds the Helm renders of one run
+WORKSPACE_POOL_MAX_CREATIONS_PER_RUN = int(os.getenv("WORKSPACE_POOL_MAX_CREATIONS_PER_RUN", "5"))
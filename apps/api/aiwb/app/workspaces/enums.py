@@ -40,3 +40,10 @@ WORKSPACE_URL_SUFFIX_MAPPING = {
     COMFYUI_CHART_NAME: "/",
     MLFLOW_CHART_NAME: "/",
 }
+
+
+class WorkspacePoolPolicy(StrEnum):
+    """How the warm pool sizes the idle workspaces kept per workspace type and namespace."""
+
+    FIXED = "fixed"
+    DEMAND = "demand"
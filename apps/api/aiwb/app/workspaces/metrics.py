@@ -0,0 +1,28 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Prometheus metrics for the warm pool of development workspaces."""
+
+from prometheus_client import Counter, Gauge
+
+WORKSPACE_POOL_CLAIMS = Counter(
+    "aiwb_workspace_pool_claims_total",
+    "Workspace requests of a pooled type, by whether an idle pooled workspace served them (hit) or not (miss)",
+    labelnames=["workspace_type", "result"],
+)
+WORKSPACE_POOL_IDLE = Gauge(
+    "aiwb_workspace_pool_idle_workspaces",
+    "Idle pooled workspaces after the last run of the pool syncer",
+    labelnames=["namespace", "workspace_type"],
+)
+WORKSPACE_POOL_TARGET = Gauge(
+    "aiwb_workspace_pool_target_workspaces",
+    "Idle pooled workspaces the sizing policy asks for",
+    labelnames=["namespace", "workspace_type"],
+)
+WORKSPACE_POOL_CHANGES = Counter(
+    "aiwb_workspace_pool_changes_total",
+    "Pooled workspaces deployed or removed by the pool syncer",
+    labelnames=["workspace_type", "change"],
+)
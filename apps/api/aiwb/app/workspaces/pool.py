@@ -0,0 +1,144 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Warm pool of development workspaces.
+
+Creating a workspace renders its chart with Helm and applies the manifest, and the user then waits for the pod to
+start. With WORKSPACE_POOL_SIZES set, the pool syncer keeps idle workspaces of the listed types deployed with the
+chart defaults, owned by WORKSPACE_POOL_SUBMITTER. A request for a workspace with default settings claims one of
+them instead (see claim_pooled_workspace), and the next run of the syncer deploys a replacement.
+
+Pooled workspaces are rendered before anyone claims them, with WORKSPACE_POOL_SUBMITTER as metadata.user_id. Only
+the workspace types whose charts are listed in WORKSPACE_POOL_USER_AGNOSTIC_CHARTS, i.e. use metadata.user_id in
+resource labels at most, are pooled; the claim hands those labels over (see hand_over_workspace).
+"""
+
+from collections import defaultdict
+from datetime import UTC, datetime, timedelta
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..charts.service import get_chart
+from ..dispatch.kube_client import KubernetesClient
+from ..workloads.constants import WORKSPACE_POOL_SUBMITTER
+from ..workloads.enums import WorkloadStatus
+from ..workloads.models import Workload
+from ..workloads.service import delete_workload_components
+from .config import (
+    WORKSPACE_POOL_DEMAND_WINDOW_SECONDS,
+    WORKSPACE_POOL_MAX_CREATIONS_PER_RUN,
+    WORKSPACE_POOL_NAMESPACES,
+    WORKSPACE_POOL_POLICY,
+    WORKSPACE_POOL_SIZES,
+)
+from .enums import WorkspacePoolPolicy, WorkspaceType, workspace_type_chart_name_mapping
+from .metrics import WORKSPACE_POOL_CHANGES, WORKSPACE_POOL_IDLE, WORKSPACE_POOL_TARGET
+from .repository import CLAIMABLE_POOL_STATUSES, count_workspaces_created_since, get_pool_workspaces
+from .service import deploy_development_workspace
+
+PoolKey = tuple[str, WorkspaceType]
+
+
+async def get_pool_targets(session: AsyncSession, now: datetime | None = None) -> dict[PoolKey, int]:
+    """Return the number of idle workspaces to keep per namespace and workspace type, following the sizing policy."""
+    if WORKSPACE_POOL_POLICY == WorkspacePoolPolicy.FIXED:
+        return {
+            (namespace, workspace_type): size
+            for namespace in WORKSPACE_POOL_NAMESPACES
+            for workspace_type, size in WORKSPACE_POOL_SIZES.items()
+        }
+
+    since = (now or datetime.now(UTC)) - timedelta(seconds=WORKSPACE_POOL_DEMAND_WINDOW_SECONDS)
+    created = await count_workspaces_created_since(session, since)
+    targets: dict[PoolKey, int] = {}
+    for workspace_type, size in WORKSPACE_POOL_SIZES.items():
+        chart_name = workspace_type_chart_name_mapping[workspace_type]
+        for (namespace, created_chart_name), count in created.items():
+            if created_chart_name != chart_name:
+                continue
+            if WORKSPACE_POOL_NAMESPACES and namespace not in WORKSPACE_POOL_NAMESPACES:
+                continue
+            targets[(namespace, workspace_type)] = min(size, count)
+    return targets
+
+
+def _group_pool_workspaces(workloads: list[Workload]) -> dict[PoolKey, list[Workload]]:
+    workspace_types = {
+        chart_name: workspace_type for workspace_type, chart_name in workspace_type_chart_name_mapping.items()
+    }
+    grouped: dict[PoolKey, list[Workload]] = defaultdict(list)
+    for workload in workloads:
+        workspace_type = workspace_types.get(workload.chart.name)
+        if workspace_type:
+            grouped[(workload.namespace, workspace_type)].append(workload)
+    return grouped
+
+
+async def _remove(session: AsyncSession, workload: Workload, workspace_type: WorkspaceType, change: str) -> None:
+    await delete_workload_components(workload.namespace, workload.id, session)
+    WORKSPACE_POOL_CHANGES.labels(workspace_type=workspace_type, change=change).inc()
+
+
+async def sync_workspace_pool(session: AsyncSession, kube_client: KubernetesClient) -> int:
+    """Keep the warm pool at the size the sizing policy asks for.
+
+    Per namespace and workspace type, this syncer:
+    1. Removes failed pooled workspaces, which nobody would delete otherwise
+    2. Removes the newest idle workspaces above the target, such as after demand dropped
+    3. Deploys idle workspaces up to the target, at most WORKSPACE_POOL_MAX_CREATIONS_PER_RUN per run
+
+    Pooled workspaces in UNKNOWN status count towards the target but are neither claimed nor removed.
+
+    Returns the number of pooled workspaces deployed or removed.
+    """
+    if not WORKSPACE_POOL_SIZES:
+        return 0
+
+    targets = await get_pool_targets(session)
+    pool = _group_pool_workspaces(await get_pool_workspaces(session))
+    changes = 0
+    creations_left = WORKSPACE_POOL_MAX_CREATIONS_PER_RUN
+
+    for key in sorted(targets.keys() | pool.keys()):
+        namespace, workspace_type = key
+        target = targets.get(key, 0)
+        workloads = pool.get(key, [])
+        try:
+            for workload in [workload for workload in workloads if workload.status == WorkloadStatus.FAILED]:
+                await _remove(session, workload, workspace_type, "removed_failed")
+                workloads.remove(workload)
+                changes += 1
+
+            for workload in reversed(workloads[target:]):
+                if workload.status in CLAIMABLE_POOL_STATUSES:
+                    await _remove(session, workload, workspace_type, "removed_excess")
+                    workloads.remove(workload)
+                    changes += 1
+
+            missing = min(target - len(workloads), creations_left)
+            if missing > 0:
+                chart = await get_chart(session, chart_name=workspace_type_chart_name_mapping[workspace_type])
+                for _ in range(missing):
+                    workloads.append(
+                        await deploy_development_workspace(
+                            session, kube_client, chart, WORKSPACE_POOL_SUBMITTER, namespace, {}, workspace_type
+                        )
+                    )
+                    creations_left -= 1
+                    changes += 1
+                    WORKSPACE_POOL_CHANGES.labels(workspace_type=workspace_type, change="deployed").inc()
+        except Exception:
+            logger.exception(f"Error refilling the {workspace_type} workspace pool in namespace {namespace}")
+
+        WORKSPACE_POOL_TARGET.labels(namespace=namespace, workspace_type=workspace_type).set(target)
+        WORKSPACE_POOL_IDLE.labels(namespace=namespace, workspace_type=workspace_type).set(
+            sum(1 for workload in workloads if workload.status in CLAIMABLE_POOL_STATUSES)
+        )
+
+    await session.commit()
+    if changes:
+        logger.info(f"Workspace pool: {changes} pooled workspace(s) deployed or removed")
+    return changes
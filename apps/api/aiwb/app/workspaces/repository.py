@@ -0,0 +1,73 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..charts.models import Chart
+from ..workloads.constants import WORKSPACE_POOL_SUBMITTER
+from ..workloads.enums import WorkloadStatus, WorkloadType
+from ..workloads.models import Workload
+
+# Pooled workspaces that can be handed over to a user
+CLAIMABLE_POOL_STATUSES = [WorkloadStatus.RUNNING, WorkloadStatus.PENDING]
+
+
+async def select_idle_pool_workspace_id(session: AsyncSession, namespace: str, chart_name: str) -> UUID | None:
+    """
+    Lock an idle pooled workspace of the chart in the namespace and return its ID, preferring running ones.
+
+    The row stays locked until the transaction ends. Locked rows are skipped, so concurrent requests, also in other
+    replicas, never claim the same workspace.
+    """
+    query = (
+        select(Workload.id)
+        .join(Chart, Workload.chart_id == Chart.id)
+        .where(
+            Workload.namespace == namespace,
+            Workload.type == WorkloadType.WORKSPACE,
+            Workload.created_by == WORKSPACE_POOL_SUBMITTER,
+            Workload.status.in_(CLAIMABLE_POOL_STATUSES),
+            Chart.name == chart_name,
+        )
+        .order_by(case((Workload.status == WorkloadStatus.RUNNING, 0), else_=1), Workload.created_at)
+        .limit(1)
+        .with_for_update(of=Workload, skip_locked=True)
+    )
+    result = await session.execute(query)
+    return result.scalar_one_or_none()
+
+
+async def get_pool_workspaces(session: AsyncSession) -> list[Workload]:
+    """Get the pooled workspaces that have not been deleted, oldest first."""
+    query = (
+        select(Workload)
+        .where(
+            Workload.type == WorkloadType.WORKSPACE,
+            Workload.created_by == WORKSPACE_POOL_SUBMITTER,
+            Workload.status.not_in([WorkloadStatus.DELETING, WorkloadStatus.DELETED]),
+        )
+        .order_by(Workload.created_at)
+    )
+    result = await session.execute(query)
+    return result.unique().scalars().all()
+
+
+async def count_workspaces_created_since(session: AsyncSession, since: datetime) -> dict[tuple[str, str], int]:
+    """Count the workspaces created by users since the given time, per namespace and chart name."""
+    query = (
+        select(Workload.namespace, Chart.name, func.count())
+        .join(Chart, Workload.chart_id == Chart.id)
+        .where(
+            Workload.type == WorkloadType.WORKSPACE,
+            Workload.created_by != WORKSPACE_POOL_SUBMITTER,
+            Workload.created_at >= since,
+        )
+        .group_by(Workload.namespace, Chart.name)
+    )
+    result = await session.execute(query)
+    return {(namespace, chart_name): count for namespace, chart_name, count in result.all()}
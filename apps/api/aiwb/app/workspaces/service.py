@@ -2,27 +2,34 @@
 #
 # SPDX-License-Identifier: MIT
 
+from datetime import UTC, datetime
+
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api_common.exceptions import ConflictException
+from api_common.models import set_updated_fields
 
 from ..charts.models import Chart
 from ..charts.service import get_chart
 from ..charts.utils import render_helm_template
 from ..dispatch.kube_client import KubernetesClient
+from ..dispatch.poller import request_sync
 from ..workloads.enums import WorkloadStatus, WorkloadType
 from ..workloads.models import Workload
-from ..workloads.repository import create_workload
+from ..workloads.repository import create_workload, get_workload_by_id
 from ..workloads.utils import apply_manifest, sanitize_user_id
+from .config import WORKSPACE_POOL_SIZES
 from .enums import (
     WORKSPACE_USAGE_SCOPE_MAPPING,
     WorkspaceType,
     WorkspaceUsageScope,
     workspace_type_chart_name_mapping,
 )
+from .metrics import WORKSPACE_POOL_CLAIMS
+from .repository import select_idle_pool_workspace_id
 from .schemas import DevelopmentWorkspaceRequest
-from .utils import check_workspace_availability_per_namespace
+from .utils import check_workspace_availability_per_namespace, hand_over_workspace
 
 
 async def get_chart_by_workspace_type(session: AsyncSession, workspace_type: WorkspaceType) -> Chart:
@@ -63,12 +70,39 @@ async def create_development_workspace(
                 f"Please delete your existing workspace before creating a new one.",
             )
 
-    chart = await get_chart_by_workspace_type(session, workspace_type)
-
     # user_inputs contains what the user explicitly provided (no defaults, no metadata)
     # by_alias=True converts field names using alias (e.g., image_pull_secrets -> imagePullSecrets)
     user_inputs = request.model_dump(exclude_unset=True, exclude_none=True, by_alias=True)
 
+    # Pooled workspaces are deployed with the chart defaults, so only requests without inputs can claim one
+    if workspace_type in WORKSPACE_POOL_SIZES and not user_inputs:
+        workload = await claim_pooled_workspace(session, namespace, workspace_type, submitter, display_name)
+        if workload:
+            return workload
+
+    chart = await get_chart_by_workspace_type(session, workspace_type)
+    workload = await deploy_development_workspace(
+        session, kube_client, chart, submitter, namespace, user_inputs, workspace_type, display_name
+    )
+    await request_sync(session)
+    return workload
+
+
+async def deploy_development_workspace(
+    session: AsyncSession,
+    kube_client: KubernetesClient,
+    chart: Chart,
+    submitter: str,
+    namespace: str,
+    user_inputs: dict,
+    workspace_type: WorkspaceType,
+    display_name: str | None = None,
+) -> Workload:
+    """
+    Create the workload of a development workspace, render its chart and apply the manifest.
+
+    The workload is marked as FAILED and the error re-raised if rendering or applying fails.
+    """
     workload = await create_workload(
         session=session,
         display_name=display_name or f"{workspace_type.value.title()} Workspace",
@@ -118,3 +152,43 @@ async def create_development_workspace(
         raise
 
     return workload
+
+
+async def claim_pooled_workspace(
+    session: AsyncSession,
+    namespace: str,
+    workspace_type: WorkspaceType,
+    submitter: str,
+    display_name: str | None = None,
+) -> Workload | None:
+    """
+    Hand an idle workspace of the warm pool over to the submitter, or return None if the pool has none.
+
+    The workload keeps its ID and Kubernetes resources. Its submitter, display name and creation time become those
+    of the request, and its resources and manifest are handed over to match (see hand_over_workspace). If that fails,
+    the claim is rolled back and the workspace stays in the pool. The pool syncer is woken up to deploy a replacement.
+    """
+    chart_name = workspace_type_chart_name_mapping[workspace_type]
+    try:
+        async with session.begin_nested():
+            workload_id = await select_idle_pool_workspace_id(session, namespace, chart_name)
+            if workload_id is None:
+                WORKSPACE_POOL_CLAIMS.labels(workspace_type=workspace_type, result="miss").inc()
+                return None
+
+            workload = await get_workload_by_id(session, workload_id)
+            workload.display_name = display_name or f"{workspace_type.value.title()} Workspace"
+            workload.created_by = submitter
+            workload.created_at = datetime.now(UTC)
+            set_updated_fields(workload, submitter, workload.created_at)
+            workload.manifest = await hand_over_workspace(workload, submitter)
+            await session.flush()
+    except Exception as e:
+        logger.warning(f"Failed to claim a pooled {workspace_type} workspace in namespace {namespace}: {e}")
+        WORKSPACE_POOL_CLAIMS.labels(workspace_type=workspace_type, result="miss").inc()
+        return None
+
+    WORKSPACE_POOL_CLAIMS.labels(workspace_type=workspace_type, result="hit").inc()
+    logger.info(f"Claimed pooled {workspace_type} workspace {workload.id} in namespace {namespace} for {submitter}")
+    await request_sync(session)
+    return workload
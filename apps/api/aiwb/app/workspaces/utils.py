@@ -2,10 +2,26 @@
 #
 # SPDX-License-Identifier: MIT
 
+import asyncio
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api_common.yaml_codec import dump_all, load_all_async
+
+from ..config import SUBMITTER_ANNOTATION
+from ..dispatch.discovery import resolve_resource
+from ..dispatch.utils import sanitize_label_value
+from ..workloads.constants import (
+    DEPLOYMENT_RESOURCE,
+    DISPLAY_NAME_LABEL,
+    JOB_RESOURCE,
+    WORKLOAD_ID_LABEL,
+    WORKSPACE_POOL_SUBMITTER,
+)
 from ..workloads.enums import WorkloadStatus, WorkloadType
+from ..workloads.models import Workload
 from ..workloads.repository import get_workloads
+from ..workloads.utils import sanitize_user_id
 from .enums import (
     WORKSPACE_USAGE_SCOPE_MAPPING,
     WorkspaceType,
@@ -56,3 +72,46 @@ async def check_workspace_availability_per_namespace(
                 return False
 
     return True
+
+
+async def hand_over_workspace(workload: Workload, submitter: str) -> str:
+    """
+    Hand the resources of a pooled workspace over to the user that claimed it, and return its updated manifest.
+
+    The pool rendered the chart with WORKSPACE_POOL_SUBMITTER as metadata.user_id, which the charts in
+    WORKSPACE_POOL_USER_AGNOSTIC_CHARTS only use in resource labels. Every resource of the manifest, i.e. every
+    resource apply_manifest labelled with the workload ID, gets those labels set to the user ID of the submitter and
+    the submitter annotation, and the Deployment and Job the display name label. Only metadata changes, so pod
+    templates are left alone and the running pod keeps running.
+
+    Raises:
+        ValueError: If the workspace has no manifest to hand over.
+    """
+    if not workload.manifest:
+        raise ValueError(f"Pooled workspace {workload.id} has no manifest")
+
+    pool_user_label = sanitize_label_value(sanitize_user_id(WORKSPACE_POOL_SUBMITTER))
+    user_label = sanitize_label_value(sanitize_user_id(submitter))
+    documents = await load_all_async(workload.manifest)
+    for doc in documents:
+        if not isinstance(doc, dict) or not doc.get("apiVersion") or not doc.get("kind"):
+            continue
+        metadata = doc.setdefault("metadata", {})
+        labels = metadata.get("labels") or {}
+        for key, value in labels.items():
+            if value == pool_user_label:
+                labels[key] = user_label
+
+        patched_labels = {**labels, WORKLOAD_ID_LABEL: str(workload.id)}
+        if doc["kind"] in {DEPLOYMENT_RESOURCE, JOB_RESOURCE}:
+            patched_labels[DISPLAY_NAME_LABEL] = sanitize_label_value(workload.display_name)
+        body = {"metadata": {"labels": patched_labels, "annotations": {SUBMITTER_ANNOTATION: submitter}}}
+        api_resource = await resolve_resource(api_version=doc["apiVersion"], kind=doc["kind"])
+        await asyncio.to_thread(
+            api_resource.patch,
+            body=body,
+            name=metadata.get("name"),
+            namespace=workload.namespace if api_resource.namespaced else None,
+            content_type="application/merge-patch+json",
+        )
+    return dump_all([doc for doc in documents if doc], sort_keys=False)
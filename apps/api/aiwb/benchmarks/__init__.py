@@ -0,0 +1,10 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmarks for the AI Workbench API.
+
+Each module seeds a PostgreSQL database dedicated to benchmarking, drives one API path and exits with status 1 on a
+regression. See benchmarks/README.md for usage.
+"""
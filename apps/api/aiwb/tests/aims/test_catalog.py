@@ -0,0 +1,103 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for the AIMClusterModel catalog cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.aims.catalog import AIMCatalog
+from app.aims.enums import AIMClusterModelStatus
+from app.aims.gateway import _get_aim_chat_check, get_aim_by_name, list_aims
+from tests.factory import make_aim_cluster_model
+
+
+def _event_object(**kwargs) -> dict:
+    obj = make_aim_cluster_model(**kwargs).model_dump(by_alias=True)
+    obj["metadata"]["resourceVersion"] = "42"
+    return obj
+
+
+@pytest.fixture
+def catalog() -> AIMCatalog:
+    catalog = AIMCatalog()
+    catalog.replace(
+        [
+            make_aim_cluster_model(name="llama", image="amd/llama:1", tags=["chat"]),
+            make_aim_cluster_model(name="embed", image="amd/embed:1", tags=["embedding"]),
+            make_aim_cluster_model(name="pending", image="amd/llama:1", status=AIMClusterModelStatus.PENDING),
+        ],
+        resource_version="1",
+    )
+    return catalog
+
+
+def test_catalog_indexes(catalog: AIMCatalog) -> None:
+    """Test the catalog indexes AIMs by name, status and chat capability."""
+    assert catalog.ready
+    assert catalog.get("llama").spec.image == "amd/llama:1"
+    assert catalog.get("missing") is None
+    assert [aim.metadata.name for aim in catalog.list_aims()] == ["embed", "llama", "pending"]
+    assert [aim.metadata.name for aim in catalog.list_aims([AIMClusterModelStatus.READY])] == ["embed", "llama"]
+    assert catalog.is_chattable("llama")
+    assert catalog.is_chattable("pending")
+    assert not catalog.is_chattable("embed")
+
+
+def test_catalog_apply_events_updates_indexes(catalog: AIMCatalog) -> None:
+    """Test watch events move AIMs between index entries and remove deleted AIMs everywhere."""
+    catalog.apply_event(
+        "MODIFIED",
+        _event_object(name="pending", image="amd/llama:2", status=AIMClusterModelStatus.READY, tags=["embedding"]),
+    )
+
+    assert catalog.resource_version == "42"
+    assert catalog.get("pending").spec.image == "amd/llama:2"
+    assert catalog.list_aims([AIMClusterModelStatus.PENDING]) == []
+    assert not catalog.is_chattable("pending")
+
+    catalog.apply_event("DELETED", _event_object(name="llama"))
+    catalog.apply_event("ADDED", _event_object(name="new", tags=["chat"]))
+
+    assert catalog.get("llama") is None
+    assert not catalog.is_chattable("llama")
+    assert catalog.is_chattable("new")
+
+
+@pytest.mark.asyncio
+async def test_gateway_reads_from_ready_catalog(catalog: AIMCatalog) -> None:
+    """Test the gateway serves AIMs from the catalog without calling the API server."""
+    kube_client = MagicMock()
+    kube_client.custom_objects.list_cluster_custom_object = AsyncMock()
+    kube_client.custom_objects.get_cluster_custom_object = AsyncMock()
+
+    with patch("app.aims.gateway.get_aim_catalog", return_value=catalog):
+        aims = await list_aims(kube_client, statuses=[AIMClusterModelStatus.PENDING])
+        aim = await get_aim_by_name(kube_client, "llama")
+        is_aim_chattable = await _get_aim_chat_check(kube_client)
+
+    assert [a.metadata.name for a in aims] == ["pending"]
+    assert aim is not None and aim.metadata.name == "llama"
+    assert is_aim_chattable("llama") and not is_aim_chattable("embed")
+    kube_client.custom_objects.list_cluster_custom_object.assert_not_called()
+    kube_client.custom_objects.get_cluster_custom_object.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_gateway_falls_back_to_api_when_catalog_not_ready() -> None:
+    """Test the gateway queries the API server until the catalog has loaded."""
+    kube_client = MagicMock()
+    kube_client.custom_objects.list_cluster_custom_object = AsyncMock(
+        return_value={"items": [make_aim_cluster_model().model_dump(by_alias=True)]}
+    )
+
+    with (
+        patch("app.aims.gateway.get_aim_catalog", return_value=AIMCatalog()),
+        patch("app.aims.gateway.get_resource_version", return_value="v1alpha1"),
+    ):
+        aims = await list_aims(kube_client)
+
+    assert [a.metadata.name for a in aims] == ["llama3-8b"]
+    kube_client.custom_objects.list_cluster_custom_object.assert_awaited_once()
@@ -10,10 +10,12 @@ from uuid import uuid4
 import pytest
 from kubernetes.client.exceptions import ApiException
 
-from app.aims.crds import AIMClusterModelResource
+from api_common.collections import DEFAULT_LIST_CHUNK_SIZE
+from app.aims.catalog import AIMCatalog
+from app.aims.constants import AIM_SERVICE_PLURAL
 from app.aims.enums import AIMClusterModelStatus, AIMServiceStatus
 from app.aims.gateway import (
-    _get_aims_by_name,
+    _get_aim_chat_check,
     _get_httproutes_for_aim_services,
     create_aim_service,
     delete_aim_service,
@@ -116,6 +118,34 @@ async def test_list_aim_services(kube_client: MagicMock) -> None:
     assert len(result) == 1
 
 
+@pytest.mark.asyncio
+async def test_list_aim_services_follows_continue_tokens(kube_client: MagicMock) -> None:
+    """Test that AIMServices are listed in chunks until the API server returns no continue token."""
+    services = [make_aim_service_k8s(name=f"svc-{i}").model_dump(by_alias=True) for i in range(3)]
+
+    async def list_objects(**kwargs):
+        if kwargs["plural"] != AIM_SERVICE_PLURAL:
+            return {"items": []}
+        if kwargs["_continue"] is None:
+            return {"items": services[:2], "metadata": {"continue": "token-1"}}
+        assert kwargs["_continue"] == "token-1"
+        return {"items": services[2:], "metadata": {}}
+
+    kube_client.custom_objects.list_namespaced_custom_object.side_effect = list_objects
+
+    with patch("app.aims.gateway.get_resource_version", return_value="v1alpha1"):
+        result = await list_aim_services(kube_client, "test-ns")
+
+    assert [service.metadata.name for service in result] == ["svc-0", "svc-1", "svc-2"]
+    service_calls = [
+        call.kwargs
+        for call in kube_client.custom_objects.list_namespaced_custom_object.call_args_list
+        if call.kwargs["plural"] == AIM_SERVICE_PLURAL
+    ]
+    assert [call["_continue"] for call in service_calls] == [None, "token-1"]
+    assert all(call["limit"] == DEFAULT_LIST_CHUNK_SIZE for call in service_calls)
+
+
 @pytest.mark.asyncio
 async def test_get_aim_service_by_id(kube_client: MagicMock) -> None:
     """Test getting AIMService by ID."""
@@ -235,10 +265,8 @@ async def test_patch_aim_service_scaling_policy(kube_client: MagicMock) -> None:
 def test_is_aim_service_chattable_true() -> None:
     """Test service is chattable when RUNNING with chat tag."""
     svc = make_aim_service_k8s(status=AIMServiceStatus.RUNNING, model_ref="llama")
-    aim = make_aim_cluster_model(name="llama", tags=["chat"])
-    aims_by_name = {"llama": aim}
 
-    result = is_aim_service_chattable(svc, aims_by_name)
+    result = is_aim_service_chattable(svc, {"llama"}.__contains__)
 
     assert result is True
 
@@ -246,31 +274,17 @@ def test_is_aim_service_chattable_true() -> None:
 def test_is_aim_service_chattable_false_wrong_status() -> None:
     """Test service not chattable when not RUNNING."""
     svc = make_aim_service_k8s(status=AIMServiceStatus.PENDING, model_ref="llama")
-    aim = make_aim_cluster_model(name="llama", tags=["chat"])
-    aims_by_name = {"llama": aim}
 
-    result = is_aim_service_chattable(svc, aims_by_name)
+    result = is_aim_service_chattable(svc, {"llama"}.__contains__)
 
     assert result is False
 
 
-def test_is_aim_service_chattable_false_no_chat_tag() -> None:
-    """Test service not chattable without chat tag."""
+def test_is_aim_service_chattable_false_aim_not_chattable() -> None:
+    """Test service not chattable when its AIM has no chat tag or is not found."""
     svc = make_aim_service_k8s(status=AIMServiceStatus.RUNNING, model_ref="llama")
-    aim = make_aim_cluster_model(name="llama", tags=["text-generation"])  # No chat tag
-    aims_by_name = {"llama": aim}
 
-    result = is_aim_service_chattable(svc, aims_by_name)
-
-    assert result is False
-
-
-def test_is_aim_service_chattable_false_aim_not_found() -> None:
-    """Test service not chattable when AIM not found."""
-    svc = make_aim_service_k8s(status=AIMServiceStatus.RUNNING, model_ref="missing")
-    aims_by_name: dict[str, AIMClusterModelResource] = {}
-
-    result = is_aim_service_chattable(svc, aims_by_name)
+    result = is_aim_service_chattable(svc, set().__contains__)
 
     assert result is False
 
@@ -401,6 +415,30 @@ async def test_list_aim_services_with_chattable_filter(kube_client: MagicMock) -
     assert len(result) == 1
 
 
+@pytest.mark.asyncio
+async def test_list_aim_services_chattable_filter_uses_catalog(kube_client: MagicMock) -> None:
+    """Test the chattable filter reads the catalog's chat index instead of listing AIMs."""
+    chat_svc = make_aim_service_k8s(name="chat", status=AIMServiceStatus.RUNNING, model_ref="llama")
+    embed_svc = make_aim_service_k8s(name="embed", status=AIMServiceStatus.RUNNING, model_ref="embed")
+    kube_client.custom_objects.list_namespaced_custom_object.return_value = {
+        "items": [chat_svc.model_dump(by_alias=True), embed_svc.model_dump(by_alias=True)]
+    }
+    catalog = AIMCatalog()
+    catalog.replace(
+        [make_aim_cluster_model(name="llama", tags=["chat"]), make_aim_cluster_model(name="embed", tags=["embedding"])],
+        resource_version="1",
+    )
+
+    with (
+        patch("app.aims.gateway.get_aim_catalog", return_value=catalog),
+        patch("app.aims.gateway.get_resource_version", return_value="v1alpha1"),
+    ):
+        result = await list_aim_services(kube_client, "test-ns", chattable_only=True)
+
+    assert [svc.metadata.name for svc in result] == ["chat"]
+    kube_client.custom_objects.list_cluster_custom_object.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_list_aim_services_chattable_filters_out_non_chattable(kube_client: MagicMock) -> None:
     """Test chattable filter excludes non-chattable services."""
@@ -415,22 +453,23 @@ async def test_list_aim_services_chattable_filters_out_non_chattable(kube_client
 
 
 @pytest.mark.asyncio
-async def test_get_aims_by_name(kube_client: MagicMock) -> None:
-    """Test _get_aims_by_name returns AIMs indexed by name."""
-    aim1 = make_aim_cluster_model(name="llama")
-    aim2 = make_aim_cluster_model(name="mistral")
+async def test_get_aim_chat_check(kube_client: MagicMock) -> None:
+    """Test _get_aim_chat_check only accepts AIMs with the chat tag."""
+    aim1 = make_aim_cluster_model(name="llama", tags=["chat"])
+    aim2 = make_aim_cluster_model(name="mistral", tags=["text-generation"])
     kube_client.custom_objects.list_cluster_custom_object.return_value = {
         "items": [aim1.model_dump(by_alias=True), aim2.model_dump(by_alias=True)]
     }
 
-    with patch("app.aims.gateway.get_resource_version", return_value="v1alpha1"):
-        result = await _get_aims_by_name(kube_client)
+    with (
+        patch("app.aims.gateway.get_aim_catalog", return_value=AIMCatalog()),
+        patch("app.aims.gateway.get_resource_version", return_value="v1alpha1"),
+    ):
+        is_aim_chattable = await _get_aim_chat_check(kube_client)
 
-    assert len(result) == 2
-    assert "llama" in result
-    assert "mistral" in result
-    assert result["llama"].metadata.name == "llama"
-    assert result["mistral"].metadata.name == "mistral"
+    assert is_aim_chattable("llama")
+    assert not is_aim_chattable("mistral")
+    assert not is_aim_chattable("missing")
 
 
 @pytest.mark.asyncio
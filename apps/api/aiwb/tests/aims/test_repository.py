@@ -11,8 +11,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.aims.enums import AIMServiceStatus, OptimizationMetric
 from app.aims.repository import (
+    bulk_create_aim_services,
+    bulk_update_aim_service_statuses,
     create_aim_service,
     get_aim_service_by_id,
+    get_aim_service_statuses,
     list_aim_services_history,
     update_aim_service_status,
 )
@@ -136,3 +139,67 @@ async def test_update_aim_service_status(db_session: AsyncSession) -> None:
 
     assert updated.status == AIMServiceStatus.RUNNING
     assert updated.updated_by == "updater"
+
+
+@pytest.mark.asyncio
+async def test_get_aim_service_statuses(db_session: AsyncSession) -> None:
+    """Test statuses are returned for every record keyed by ID."""
+    running = await create_aim_service_db(db_session, status=AIMServiceStatus.RUNNING)
+    deleted = await create_aim_service_db(db_session, status=AIMServiceStatus.DELETED)
+
+    statuses = await get_aim_service_statuses(db_session)
+
+    assert statuses == {running.id: AIMServiceStatus.RUNNING.value, deleted.id: AIMServiceStatus.DELETED.value}
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_aim_services_skips_existing_ids(db_session: AsyncSession) -> None:
+    """Test bulk insert creates new records and ignores IDs that already exist."""
+    existing = await create_aim_service_db(db_session, status=AIMServiceStatus.PENDING)
+    new_id = uuid4()
+
+    created = await bulk_create_aim_services(
+        db_session,
+        [
+            {
+                "id": existing.id,
+                "namespace": "ns",
+                "model": "other",
+                "status": AIMServiceStatus.RUNNING,
+                "metric": None,
+            },
+            {
+                "id": new_id,
+                "namespace": "ns",
+                "model": "llama3-8b",
+                "status": AIMServiceStatus.RUNNING,
+                "metric": None,
+                "created_by": "user@test.com",
+            },
+        ],
+    )
+
+    assert created == 1
+    new_svc = await get_aim_service_by_id(db_session, new_id)
+    assert new_svc is not None
+    assert new_svc.created_by == "user@test.com"
+    await db_session.refresh(existing)
+    assert existing.model == "llama3-8b"
+    assert existing.status == AIMServiceStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_aim_service_statuses(db_session: AsyncSession) -> None:
+    """Test bulk status update changes only the given records."""
+    first = await create_aim_service_db(db_session, status=AIMServiceStatus.PENDING)
+    second = await create_aim_service_db(db_session, status=AIMServiceStatus.RUNNING)
+    untouched = await create_aim_service_db(db_session, status=AIMServiceStatus.PENDING)
+
+    await bulk_update_aim_service_statuses(
+        db_session, {first.id: AIMServiceStatus.RUNNING, second.id: AIMServiceStatus.DELETED}, updater="system"
+    )
+
+    statuses = await get_aim_service_statuses(db_session)
+    assert statuses[first.id] == AIMServiceStatus.RUNNING
+    assert statuses[second.id] == AIMServiceStatus.DELETED
+    assert statuses[untouched.id] == AIMServiceStatus.PENDING
@@ -4,6 +4,7 @@
 
 """Tests for AIMs service layer."""
 
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -20,6 +21,7 @@ from app.aims.service import (
     deploy_aim,
     get_aim_by_resource_name,
     get_aim_service,
+    get_aim_service_events,
     list_aim_cluster_service_templates,
     list_aim_services,
     list_aim_services_history,
@@ -290,6 +292,36 @@ async def test_get_aim_service_not_found(kube_client: MagicMock) -> None:
             await get_aim_service(kube_client, "ns", uuid4())
 
 
+@pytest.mark.asyncio
+async def test_get_aim_service_events(kube_client: MagicMock) -> None:
+    """Test events of the AIMService and its InferenceService are merged, most recent first."""
+    svc = make_aim_service_k8s(name="my-svc")
+    svc.inference_service_name = "my-isvc"
+    events = {
+        "AIMService": [{"type": "Normal", "reason": "Created", "message": "", "timestamp": None, "count": 1}],
+        "InferenceService": [
+            {"type": "Warning", "reason": "Failed", "message": "", "timestamp": datetime.now(UTC), "count": 2}
+        ],
+    }
+    kube_client.get_events_for_resource = AsyncMock(side_effect=lambda namespace, name, kind: events[kind])
+
+    with patch("app.aims.service.get_aim_service_from_k8s", return_value=svc):
+        result = await get_aim_service_events(kube_client, "ns", uuid4())
+
+    assert [(event.kind, event.name, event.reason) for event in result] == [
+        ("InferenceService", "my-isvc", "Failed"),
+        ("AIMService", "my-svc", "Created"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_aim_service_events_not_found(kube_client: MagicMock) -> None:
+    """Test raises when the AIMService does not exist."""
+    with patch("app.aims.service.get_aim_service_from_k8s", return_value=None):
+        with pytest.raises(NotFoundException):
+            await get_aim_service_events(kube_client, "ns", uuid4())
+
+
 @pytest.mark.asyncio
 async def test_list_aim_services_history(db_session: AsyncSession) -> None:
     """Test listing history from DB."""
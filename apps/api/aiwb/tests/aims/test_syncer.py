@@ -4,11 +4,14 @@
 
 """Tests for AIMs syncer."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
+from app.aims.crds import AIMClusterModelResource, AIMServiceResource
 from app.aims.enums import AIMServiceStatus
 from app.aims.syncer import sync_aim_services
 from app.workloads.constants import WORKLOAD_ID_LABEL
@@ -21,140 +24,150 @@ def kube_client() -> MagicMock:
     return MagicMock()
 
 
-def _mock_namespace(name: str) -> MagicMock:
-    """Create mock namespace."""
-    ns = MagicMock()
-    ns.name = name
-    return ns
+def _session() -> AsyncMock:
+    session = AsyncMock()
+    session.begin_nested = MagicMock(return_value=AsyncMock())
+    return session
+
+
+@contextmanager
+def _sync_sources(
+    db_statuses: dict[UUID, str],
+    k8s_services: list[AIMServiceResource],
+    aims: list[AIMClusterModelResource] | None = None,
+) -> Iterator[tuple[AsyncMock, AsyncMock]]:
+    """Patch the DB and K8s sources of the syncer and yield the bulk (update, create) mocks."""
+    with (
+        patch("app.aims.syncer.get_aim_service_statuses", return_value=db_statuses),
+        patch("app.aims.syncer.list_all_aim_services", return_value=k8s_services) as mock_list_services,
+        patch("app.aims.syncer.list_aims", return_value=[make_aim_cluster_model()] if aims is None else aims),
+        patch("app.aims.syncer.bulk_update_aim_service_statuses") as mock_update,
+        patch("app.aims.syncer.bulk_create_aim_services", return_value=0) as mock_create,
+    ):
+        yield mock_update, mock_create
+    mock_list_services.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 async def test_sync_creates_new_db_records(kube_client: MagicMock) -> None:
-    """Test sync creates DB records for K8s services not in DB."""
+    """Test sync creates DB records for K8s services not in DB in one bulk insert."""
     wid = uuid4()
-    k8s_svc = make_aim_service_k8s(workload_id=wid, namespace="test-ns", status=AIMServiceStatus.RUNNING)
-    aim = make_aim_cluster_model()
+    other_wid = uuid4()
+    k8s_svcs = [
+        make_aim_service_k8s(workload_id=wid, namespace="test-ns", status=AIMServiceStatus.RUNNING),
+        make_aim_service_k8s(workload_id=other_wid, namespace="other-ns", status=AIMServiceStatus.PENDING),
+    ]
+    mock_session = _session()
+
+    with _sync_sources({}, k8s_svcs) as (mock_update, mock_create):
+        await sync_aim_services(mock_session, kube_client)
 
-    mock_session = AsyncMock()
+    mock_create.assert_awaited_once()
+    rows = mock_create.call_args.args[1]
+    assert [(row["id"], row["namespace"]) for row in rows] == [(wid, "test-ns"), (other_wid, "other-ns")]
+    assert rows[0]["model"] == "llama3-8b"
+    assert rows[0]["created_by"] == "test@example.com"
+    assert mock_update.call_args.args[1] == {}
+    mock_session.begin_nested.assert_called_once()
+    mock_session.commit.assert_called_once()
 
-    with (
-        patch("app.aims.syncer.get_namespaces", return_value=[_mock_namespace("test-ns")]),
-        patch("app.aims.syncer.list_aim_services", return_value=[k8s_svc]),
-        patch("app.aims.syncer.list_aim_services_history", return_value=[]),
-        patch("app.aims.syncer.get_aim_by_name", return_value=aim),
-        patch("app.aims.syncer.create_aim_service") as mock_create,
-    ):
-        await sync_aim_services(mock_session, kube_client)
 
-    mock_create.assert_called_once()
-    call_kwargs = mock_create.call_args.kwargs
-    assert call_kwargs["id"] == wid
-    assert call_kwargs["namespace"] == "test-ns"
+@pytest.mark.asyncio
+async def test_sync_handles_create_exception(kube_client: MagicMock) -> None:
+    """Test a failing insert keeps the status updates and still creates the rows that can be inserted."""
+    changed = uuid4()
+    good = uuid4()
+    bad = uuid4()
+    k8s_svcs = [
+        make_aim_service_k8s(workload_id=changed, status=AIMServiceStatus.RUNNING),
+        make_aim_service_k8s(workload_id=good),
+        make_aim_service_k8s(workload_id=bad),
+    ]
+    mock_session = _session()
+
+    def create(session: AsyncMock, rows: list[dict]) -> int:
+        if any(row["id"] == bad for row in rows):
+            raise Exception("DB error")
+        return len(rows)
+
+    with _sync_sources({changed: AIMServiceStatus.PENDING.value}, k8s_svcs) as (mock_update, mock_create):
+        mock_create.side_effect = create
+        changes = await sync_aim_services(mock_session, kube_client)
+
+    assert mock_update.call_args.args[1] == {changed: AIMServiceStatus.RUNNING}
+    assert [len(call.args[1]) for call in mock_create.call_args_list] == [2, 1, 1]
+    assert mock_session.begin_nested.call_count == 3
+    mock_session.commit.assert_called_once()
+    assert changes == 2
 
 
 @pytest.mark.asyncio
 async def test_sync_updates_status(kube_client: MagicMock) -> None:
-    """Test sync updates status of existing DB records."""
-    wid = uuid4()
-    db_svc = MagicMock()
-    db_svc.id = wid
-    db_svc.namespace = "test-ns"
-    db_svc.status = AIMServiceStatus.PENDING.value
+    """Test sync updates status of existing DB records and leaves unchanged ones alone."""
+    changed = uuid4()
+    unchanged = uuid4()
+    k8s_svcs = [
+        make_aim_service_k8s(workload_id=changed, status=AIMServiceStatus.RUNNING),
+        make_aim_service_k8s(workload_id=unchanged, status=AIMServiceStatus.RUNNING),
+    ]
+    db_statuses = {changed: AIMServiceStatus.PENDING.value, unchanged: AIMServiceStatus.RUNNING.value}
 
-    k8s_svc = make_aim_service_k8s(workload_id=wid, status=AIMServiceStatus.RUNNING)
+    with _sync_sources(db_statuses, k8s_svcs) as (mock_update, mock_create):
+        changes = await sync_aim_services(_session(), kube_client)
 
-    mock_session = AsyncMock()
-
-    with (
-        patch("app.aims.syncer.get_namespaces", return_value=[_mock_namespace("test-ns")]),
-        patch("app.aims.syncer.list_aim_services", return_value=[k8s_svc]),
-        patch("app.aims.syncer.list_aim_services_history", return_value=[db_svc]),
-        patch("app.aims.syncer.update_aim_service_status") as mock_update,
-    ):
-        await sync_aim_services(mock_session, kube_client)
-
-    mock_update.assert_called_once()
-    call_args = mock_update.call_args
-    assert call_args[0][1] == db_svc
-    assert call_args[0][2] == AIMServiceStatus.RUNNING
+    assert mock_update.call_args.args[1] == {changed: AIMServiceStatus.RUNNING}
+    mock_create.assert_not_awaited()
+    assert changes == 1
 
 
 @pytest.mark.asyncio
 async def test_sync_marks_deleted(kube_client: MagicMock) -> None:
     """Test sync marks services as deleted when not in K8s."""
     wid = uuid4()
-    db_svc = MagicMock()
-    db_svc.id = wid
-    db_svc.namespace = "test-ns"
-    db_svc.status = AIMServiceStatus.RUNNING.value
-
-    mock_session = AsyncMock()
 
-    with (
-        patch("app.aims.syncer.get_namespaces", return_value=[_mock_namespace("test-ns")]),
-        patch("app.aims.syncer.list_aim_services", return_value=[]),
-        patch("app.aims.syncer.list_aim_services_history", return_value=[db_svc]),
-        patch("app.aims.syncer.update_aim_service_status") as mock_update,
-    ):
-        await sync_aim_services(mock_session, kube_client)
+    with _sync_sources({wid: AIMServiceStatus.RUNNING.value}, []) as (mock_update, _):
+        await sync_aim_services(_session(), kube_client)
 
-    mock_update.assert_called_once()
-    call_args = mock_update.call_args
-    assert call_args[0][2] == AIMServiceStatus.DELETED
+    assert mock_update.call_args.args[1] == {wid: AIMServiceStatus.DELETED}
 
 
 @pytest.mark.asyncio
-async def test_sync_skips_already_deleted(kube_client: MagicMock) -> None:
-    """Test sync doesn't update already deleted services."""
-    db_svc = MagicMock()
-    db_svc.id = uuid4()
-    db_svc.namespace = "test-ns"
-    db_svc.status = AIMServiceStatus.DELETED.value  # Already deleted
+async def test_sync_skips_terminal_statuses(kube_client: MagicMock) -> None:
+    """Test sync neither updates nor recreates services that are already deleted or failed."""
+    deleted = uuid4()
+    failed = uuid4()
+    k8s_svcs = [make_aim_service_k8s(workload_id=failed, status=AIMServiceStatus.RUNNING)]
+    db_statuses = {deleted: AIMServiceStatus.DELETED.value, failed: AIMServiceStatus.FAILED.value}
 
-    mock_session = AsyncMock()
+    with _sync_sources(db_statuses, k8s_svcs) as (mock_update, mock_create):
+        await sync_aim_services(_session(), kube_client)
 
-    with (
-        patch("app.aims.syncer.get_namespaces", return_value=[_mock_namespace("test-ns")]),
-        patch("app.aims.syncer.list_aim_services", return_value=[]),
-        patch("app.aims.syncer.list_aim_services_history", return_value=[db_svc]),
-        patch("app.aims.syncer.update_aim_service_status") as mock_update,
-    ):
-        await sync_aim_services(mock_session, kube_client)
-
-    mock_update.assert_not_called()
+    assert mock_update.call_args.args[1] == {}
+    mock_create.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_sync_handles_empty_namespaces(kube_client: MagicMock) -> None:
-    """Test sync handles no accessible namespaces."""
-    mock_session = AsyncMock()
+async def test_sync_handles_empty_cluster(kube_client: MagicMock) -> None:
+    """Test sync handles no AIMServices in the cluster."""
+    mock_session = _session()
 
-    with (
-        patch("app.aims.syncer.get_namespaces", return_value=[]),
-        patch("app.aims.syncer.list_aim_services_history", return_value=[]),
-    ):
-        await sync_aim_services(mock_session, kube_client)
+    with _sync_sources({}, []):
+        changes = await sync_aim_services(mock_session, kube_client)
 
     mock_session.commit.assert_called_once()
+    assert changes == 0
 
 
 @pytest.mark.asyncio
-async def test_sync_skips_services_without_model_ref(kube_client: MagicMock) -> None:
-    """Test sync skips K8s services without model ref."""
+async def test_sync_skips_services_without_resolved_model(kube_client: MagicMock) -> None:
+    """Test sync skips K8s services whose model has not been resolved yet."""
     k8s_svc = make_aim_service_k8s()
-    k8s_svc.spec.model = {}  # No ref
+    k8s_svc.status.resolved_model = None
 
-    mock_session = AsyncMock()
+    with _sync_sources({}, [k8s_svc]) as (_, mock_create):
+        await sync_aim_services(_session(), kube_client)
 
-    with (
-        patch("app.aims.syncer.get_namespaces", return_value=[_mock_namespace("test-ns")]),
-        patch("app.aims.syncer.list_aim_services", return_value=[k8s_svc]),
-        patch("app.aims.syncer.list_aim_services_history", return_value=[]),
-        patch("app.aims.syncer.create_aim_service") as mock_create,
-    ):
-        await sync_aim_services(mock_session, kube_client)
-
-    mock_create.assert_not_called()
+    mock_create.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -163,17 +176,10 @@ async def test_sync_skips_invalid_uuid(kube_client: MagicMock) -> None:
     k8s_svc = make_aim_service_k8s()
     k8s_svc.metadata.labels[WORKLOAD_ID_LABEL] = "invalid-uuid"
 
-    mock_session = AsyncMock()
-
-    with (
-        patch("app.aims.syncer.get_namespaces", return_value=[_mock_namespace("test-ns")]),
-        patch("app.aims.syncer.list_aim_services", return_value=[k8s_svc]),
-        patch("app.aims.syncer.list_aim_services_history", return_value=[]),
-        patch("app.aims.syncer.create_aim_service") as mock_create,
-    ):
-        await sync_aim_services(mock_session, kube_client)
+    with _sync_sources({}, [k8s_svc]) as (_, mock_create):
+        await sync_aim_services(_session(), kube_client)
 
-    mock_create.assert_not_called()
+    mock_create.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -182,54 +188,18 @@ async def test_sync_skips_services_without_namespace(kube_client: MagicMock) ->
     k8s_svc = make_aim_service_k8s()
     k8s_svc.metadata.namespace = None  # type: ignore
 
-    mock_session = AsyncMock()
+    with _sync_sources({}, [k8s_svc]) as (_, mock_create):
+        await sync_aim_services(_session(), kube_client)
 
-    with (
-        patch("app.aims.syncer.get_namespaces", return_value=[_mock_namespace("test-ns")]),
-        patch("app.aims.syncer.list_aim_services", return_value=[k8s_svc]),
-        patch("app.aims.syncer.list_aim_services_history", return_value=[]),
-        patch("app.aims.syncer.create_aim_service") as mock_create,
-    ):
-        await sync_aim_services(mock_session, kube_client)
-
-    mock_create.assert_not_called()
+    mock_create.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 async def test_sync_skips_when_aim_not_found(kube_client: MagicMock) -> None:
-    """Test sync skips when AIM CRD not found."""
-    k8s_svc = make_aim_service_k8s()
+    """Test sync skips services whose AIM is not in the catalog."""
+    k8s_svc = make_aim_service_k8s(model_ref="unknown-model")
 
-    mock_session = AsyncMock()
+    with _sync_sources({}, [k8s_svc], aims=[make_aim_cluster_model(name="llama3-8b")]) as (_, mock_create):
+        await sync_aim_services(_session(), kube_client)
 
-    with (
-        patch("app.aims.syncer.get_namespaces", return_value=[_mock_namespace("test-ns")]),
-        patch("app.aims.syncer.list_aim_services", return_value=[k8s_svc]),
-        patch("app.aims.syncer.list_aim_services_history", return_value=[]),
-        patch("app.aims.syncer.get_aim_by_name", return_value=None),
-        patch("app.aims.syncer.create_aim_service") as mock_create,
-    ):
-        await sync_aim_services(mock_session, kube_client)
-
-    mock_create.assert_not_called()
-
-
-@pytest.mark.asyncio
-async def test_sync_handles_create_exception(kube_client: MagicMock) -> None:
-    """Test sync handles exception during DB create."""
-    k8s_svc = make_aim_service_k8s()
-    aim = make_aim_cluster_model()
-
-    mock_session = AsyncMock()
-
-    with (
-        patch("app.aims.syncer.get_namespaces", return_value=[_mock_namespace("test-ns")]),
-        patch("app.aims.syncer.list_aim_services", return_value=[k8s_svc]),
-        patch("app.aims.syncer.list_aim_services_history", return_value=[]),
-        patch("app.aims.syncer.get_aim_by_name", return_value=aim),
-        patch("app.aims.syncer.create_aim_service", side_effect=Exception("DB error")),
-    ):
-        # Should not raise - exception is caught and logged
-        await sync_aim_services(mock_session, kube_client)
-
-    mock_session.commit.assert_called_once()
+    mock_create.assert_not_awaited()
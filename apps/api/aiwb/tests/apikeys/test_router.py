@@ -106,6 +106,38 @@ def test_get_api_key_details_success() -> None:
     assert response.json()["name"] == "Detailed Key"
 
 
+@override_dependencies(CLUSTER_AUTH_OVERRIDES)
+def test_get_api_keys_details_success() -> None:
+    """Test listing API keys with cluster-auth details for a namespace."""
+    expected_details = [
+        ApiKeyDetails(
+            id=uuid4(),
+            name="Detailed Key",
+            truncated_key="amd_aim_api_key_••••••••9999",
+            namespace="test-namespace",
+            expires_at=None,
+            renewable=True,
+            num_uses=0,
+            ttl="1h",
+            created_at="2025-01-01T00:00:00Z",
+            updated_at="2025-01-01T00:00:00Z",
+            created_by="test@example.com",
+            updated_by="test@example.com",
+            groups=["group-1"],
+            entity_id="entity-123",
+            meta={},
+        )
+    ]
+
+    with patch("app.apikeys.router.list_api_key_details_for_namespace") as mock_service:
+        mock_service.return_value = expected_details
+        with TestClient(app) as client:
+            response = client.get("/v1/namespaces/test-namespace/api-keys/details")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"][0]["groups"] == ["group-1"]
+
+
 @override_dependencies(CLUSTER_AUTH_OVERRIDES)
 def test_delete_api_key_success() -> None:
     """Test deleting an API key."""
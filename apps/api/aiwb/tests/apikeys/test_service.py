@@ -114,20 +114,14 @@ async def test_create_api_key_with_aim_bindings(
         "meta": {},
     }
 
-    # Mock get_aim_service to return AIMService resources with cluster-auth group annotations
-    mock_aim_service_1 = MagicMock()
+    # Mock get_aim_services_by_ids to return AIMService resources with cluster-auth group annotations
+    mock_aim_service_1 = MagicMock(id=aim_id_1)
     mock_aim_service_1.spec.routing = {"annotations": {"cluster-auth/allowed-group": "ca-group-1"}}
-    mock_aim_service_2 = MagicMock()
+    mock_aim_service_2 = MagicMock(id=aim_id_2)
     mock_aim_service_2.spec.routing = {"annotations": {"cluster-auth/allowed-group": "ca-group-2"}}
+    mock_get_aim_services = AsyncMock(return_value=[mock_aim_service_1, mock_aim_service_2])
 
-    async def mock_get_aim_service(kube_client, namespace, aim_id):
-        if str(aim_id) == aim_id_1:
-            return mock_aim_service_1
-        elif str(aim_id) == aim_id_2:
-            return mock_aim_service_2
-        raise NotFoundException(f"AIM {aim_id} not found")
-
-    with patch("app.apikeys.service.get_aim_service", side_effect=mock_get_aim_service):
+    with patch("app.apikeys.service.get_aim_services_by_ids", mock_get_aim_services):
         result = await service.create_api_key_with_cluster_auth(
             session=db_session,
             kube_client=mock_kube_client,
@@ -140,8 +134,9 @@ async def test_create_api_key_with_aim_bindings(
     # Verify binding was called for each AIM group
     assert mock_cluster_auth_client.bind_api_key_to_group.call_count == 2
 
-    # Verify lookup was called twice (once before binding, once after)
-    assert mock_cluster_auth_client.lookup_api_key.call_count == 2
+    # Verify all AIMs were resolved in one call and the key was looked up once, after binding
+    mock_get_aim_services.assert_awaited_once()
+    mock_cluster_auth_client.lookup_api_key.assert_called_once()
 
     assert result.name == "Test Key with AIMs"
 
@@ -208,6 +203,37 @@ async def test_list_api_keys_for_namespace(
     assert all(r.namespace == test_namespace for r in result)
 
 
+@pytest.mark.asyncio
+async def test_list_api_key_details_for_namespace(
+    db_session: AsyncSession,
+    test_namespace: str,
+    mock_cluster_auth_client: AsyncMock,
+) -> None:
+    """Test listing API key details looks up all keys in one batch and skips keys unknown to cluster-auth."""
+    key1 = await factory.create_api_key(db_session, name="Key 1", namespace=test_namespace)
+    key2 = await factory.create_api_key(db_session, name="Key 2", namespace=test_namespace)
+    mock_cluster_auth_client.lookup_api_keys.return_value = {
+        key1.cluster_auth_key_id: {"ttl": "24h", "renewable": False, "num_uses": 3, "groups": ["ca-group-1"]},
+    }
+
+    result = await service.list_api_key_details_for_namespace(
+        session=db_session,
+        namespace=test_namespace,
+        cluster_auth_client=mock_cluster_auth_client,
+    )
+
+    mock_cluster_auth_client.lookup_api_keys.assert_awaited_once()
+    assert set(mock_cluster_auth_client.lookup_api_keys.call_args.args[0]) == {
+        key1.cluster_auth_key_id,
+        key2.cluster_auth_key_id,
+    }
+    mock_cluster_auth_client.lookup_api_key.assert_not_called()
+    assert len(result) == 1
+    assert result[0].id == key1.id
+    assert result[0].renewable is False
+    assert result[0].groups == ["ca-group-1"]
+
+
 @pytest.mark.asyncio
 async def test_get_api_key_details_from_cluster_auth(
     db_session: AsyncSession,
@@ -418,16 +444,11 @@ async def test_update_api_key_bindings_with_cluster_auth(
     # Update to bind to ca-group-2 (should unbind from ca-group-1, bind to ca-group-2)
     api_key_update = ApiKeyUpdate(aim_ids=[aim_id_new])
 
-    # Mock get_aim_service to return AIMService with ca-group-2
-    mock_aim_service = MagicMock()
+    # Mock get_aim_services_by_ids to return AIMService with ca-group-2
+    mock_aim_service = MagicMock(id=aim_id_new)
     mock_aim_service.spec.routing = {"annotations": {"cluster-auth/allowed-group": "ca-group-2"}}
 
-    async def mock_get_aim_service(kube_client, namespace, aim_id):
-        if str(aim_id) == aim_id_new:
-            return mock_aim_service
-        raise NotFoundException(f"AIM {aim_id} not found")
-
-    with patch("app.apikeys.service.get_aim_service", side_effect=mock_get_aim_service):
+    with patch("app.apikeys.service.get_aim_services_by_ids", AsyncMock(return_value=[mock_aim_service])):
         result = await service.update_api_key_bindings_with_cluster_auth(
             session=db_session,
             kube_client=mock_kube_client,
@@ -509,16 +530,11 @@ async def test_update_api_key_bindings_sync_failure(
 
     api_key_update = ApiKeyUpdate(aim_ids=[aim_id])
 
-    # Mock get_aim_service to return AIMService with a group
-    mock_aim_service = MagicMock()
+    # Mock get_aim_services_by_ids to return AIMService with a group
+    mock_aim_service = MagicMock(id=aim_id)
     mock_aim_service.spec.routing = {"annotations": {"cluster-auth/allowed-group": "ca-group-1"}}
 
-    async def mock_get_aim_service(kube_client, namespace, aim_id_arg):
-        if str(aim_id_arg) == aim_id:
-            return mock_aim_service
-        raise NotFoundException(f"AIM {aim_id_arg} not found")
-
-    with patch("app.apikeys.service.get_aim_service", side_effect=mock_get_aim_service):
+    with patch("app.apikeys.service.get_aim_services_by_ids", AsyncMock(return_value=[mock_aim_service])):
         with pytest.raises(ExternalServiceError, match="synchronization failed"):
             await service.update_api_key_bindings_with_cluster_auth(
                 session=db_session,
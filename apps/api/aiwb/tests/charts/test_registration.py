@@ -2,6 +2,8 @@
 #
 # SPDX-License-Identifier: MIT
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
@@ -11,7 +13,8 @@ import pytest
 import yaml
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.charts.registration import normalize_api_files, register_workloads
+from app.charts.registration import content_hash, normalize_api_files, register_workloads
+from app.charts.schemas import ChartCreate
 
 
 def make_session_scope_cm(session: AsyncMock | None = None) -> tuple[AsyncMock, AsyncMock]:
@@ -26,15 +29,17 @@ def make_session_scope_cm(session: AsyncMock | None = None) -> tuple[AsyncMock,
 
 
 def make_workload(
+    tmp_path: Path,
     *,
     chart_name: str,
     chart_type: str = "INFERENCE",
     metadata: dict | None = None,
-    chart_upload_data: dict | None = None,
+    chart_files: dict[str, str] | None = None,
     overlay_files: list[tuple[Path, str]] | None = None,
 ) -> MagicMock:
     """
     Build a MagicMock workload with the minimal API used by register_workloads.
+    - chart files and the signature are written to tmp_path, as they are read to compute the content hash
     - get_overlay_files returns a list of (Path, rel_path_str)
     """
     wl = MagicMock(
@@ -44,9 +49,11 @@ def make_workload(
     wl.chart_name = chart_name
     wl.type = chart_type
     wl.get_metadata_for_api.return_value = metadata or {}
-    wl.get_chart_upload_data.return_value = chart_upload_data or {
-        "signature": ["sig/path.yaml"],  # list to exercise normalize_api_files
-        "files": ["a", "b"],
+    signature = write_overlay(tmp_path, "signature.yaml", "key: value\n")
+    files = [write_overlay(tmp_path, name, content) for name, content in (chart_files or {"Chart.yaml": "v2"}).items()]
+    wl.get_chart_upload_data.return_value = {
+        "signature": [signature],  # list to exercise normalize_api_files
+        "files": files,
     }
     wl.get_overlay_files.return_value = overlay_files or []
     return wl
@@ -58,229 +65,201 @@ def write_overlay(tmp_path: Path, name: str, text: str) -> Path:
     return p
 
 
-@pytest.mark.asyncio
-@patch("app.charts.registration.update_overlay", autospec=True)
-@patch("app.charts.registration.create_overlay", autospec=True)
-@patch("app.charts.registration.list_overlays", autospec=True)
-@patch("app.charts.registration.update_chart", autospec=True)
-@patch("app.charts.registration.create_chart", autospec=True)
-@patch("app.charts.registration.select_chart", autospec=True)
-@patch("app.charts.registration.get_registerable_workloads", autospec=True)
-@patch("app.charts.registration.session_ctx", autospec=True)
-async def test_updates_existing_chart_and_overlay(
-    session_scope_mock: MagicMock,
-    mock_get_registerable_workloads: AsyncMock,
-    mock_select_chart: AsyncMock,
-    mock_create_chart: AsyncMock,
-    mock_update_chart: AsyncMock,
-    mock_list_overlays: AsyncMock,
-    mock_create_overlay: AsyncMock,
-    mock_update_overlay: AsyncMock,
-    tmp_path: Path,
-    db_session: AsyncSession,
-) -> None:
-    cm, _session = make_session_scope_cm(db_session)
-    session_scope_mock.return_value = cm
+@contextmanager
+def registration_mocks(
+    workloads: list[MagicMock],
+    charts: dict | None = None,
+    overlays: dict | None = None,
+) -> Iterator[SimpleNamespace]:
+    """Patch the workload source and the chart and overlay writes of register_workloads."""
+    cm, session = make_session_scope_cm()
+    with (
+        patch("app.charts.registration.session_ctx", return_value=cm),
+        patch("app.charts.registration.get_registerable_workloads", return_value=workloads),
+        patch("app.charts.registration.get_chart_content_hashes", return_value=charts or {}),
+        patch("app.charts.registration.get_overlay_content_hashes", return_value=overlays or {}),
+        patch("app.charts.registration.create_chart", autospec=True) as create_chart,
+        patch("app.charts.registration.update_chart", autospec=True) as update_chart,
+        patch("app.charts.registration.create_overlay", autospec=True) as create_overlay,
+        patch("app.charts.registration.update_overlay", autospec=True) as update_overlay,
+    ):
+        create_chart.return_value = SimpleNamespace(id=uuid4())
+        create_overlay.return_value = SimpleNamespace(id=uuid4())
+        update_overlay.return_value = SimpleNamespace(id=uuid4())
+        yield SimpleNamespace(
+            session=session,
+            create_chart=create_chart,
+            update_chart=update_chart,
+            create_overlay=create_overlay,
+            update_overlay=update_overlay,
+        )
+
 
+@pytest.mark.asyncio
+async def test_updates_existing_chart_and_overlay(tmp_path: Path) -> None:
     chart_id = uuid4()
     overlay_id = uuid4()
 
     # Overlay YAML includes model field; code will use it for canonical_name
     overlay_path = write_overlay(tmp_path, "valid_overlay.yaml", "model: foo/bar\nx: 1\n")
-    wl = make_workload(chart_name="Existing Chart", overlay_files=[(overlay_path, "overlays/valid_overlay.yaml")])
-
-    mock_get_registerable_workloads.return_value = [wl]
-    mock_select_chart.return_value = SimpleNamespace(id=chart_id)
-    mock_update_chart.return_value = SimpleNamespace(id=chart_id)
-    mock_list_overlays.return_value = [SimpleNamespace(id=overlay_id, canonical_name="old/name")]
+    wl = make_workload(tmp_path, chart_name="Existing Chart", overlay_files=[(overlay_path, "overlays/valid.yaml")])
 
-    await register_workloads()
+    charts = {"Existing Chart": (chart_id, "stale")}
+    overlays = {(chart_id, "foo/bar"): (overlay_id, "stale")}
+    with registration_mocks([wl], charts, overlays) as mocks:
+        await register_workloads()
 
-    mock_create_chart.assert_not_awaited()
-    mock_update_chart.assert_awaited_once()
-    mock_create_overlay.assert_not_awaited()
-    mock_update_overlay.assert_awaited_once()
+    mocks.create_chart.assert_not_awaited()
+    mocks.update_chart.assert_awaited_once()
+    assert mocks.update_chart.await_args.kwargs["chart_id"] == chart_id
+    assert mocks.update_chart.await_args.kwargs["content_hash"] not in (None, "stale")
+    mocks.create_overlay.assert_not_awaited()
+    mocks.update_overlay.assert_awaited_once()
 
-    assert mock_update_overlay.await_args is not None
-    args, kwargs = mock_update_overlay.await_args
-    assert args == ()
+    kwargs = mocks.update_overlay.await_args.kwargs
     assert kwargs["overlay_id"] == overlay_id
+    assert kwargs["content_hash"] == content_hash("model: foo/bar\nx: 1\n")
     ov = kwargs["overlay_update"]
     assert str(ov.chart_id) == str(chart_id)
     assert ov.updated_by == "system"
 
 
 @pytest.mark.asyncio
-@patch("app.charts.registration.update_overlay", autospec=True)
-@patch("app.charts.registration.create_overlay", autospec=True)
-@patch("app.charts.registration.list_overlays", autospec=True)
-@patch("app.charts.registration.update_chart", autospec=True)
-@patch("app.charts.registration.create_chart", autospec=True)
-@patch("app.charts.registration.select_chart", autospec=True)
-@patch("app.charts.registration.get_registerable_workloads", autospec=True)
-@patch("app.charts.registration.session_ctx", autospec=True)
-async def test_updates_existing_chart_creates_overlay_when_missing(
-    session_scope_mock: MagicMock,
-    mock_get_registerable_workloads: AsyncMock,
-    mock_select_chart: AsyncMock,
-    mock_create_chart: AsyncMock,
-    mock_update_chart: AsyncMock,
-    mock_list_overlays: AsyncMock,
-    mock_create_overlay: AsyncMock,
-    mock_update_overlay: AsyncMock,
-    tmp_path: Path,
-    db_session: AsyncSession,
-) -> None:
-    cm, _session = make_session_scope_cm(db_session)
-    session_scope_mock.return_value = cm
-
+async def test_updates_existing_chart_creates_overlay_when_missing(tmp_path: Path) -> None:
     chart_id = uuid4()
 
     overlay_dict = {"model": "new/overlay", "a": 1}
     overlay_path = write_overlay(tmp_path, "new_overlay.yaml", yaml.safe_dump(overlay_dict))
-    wl = make_workload(chart_name="Existing Chart", overlay_files=[(overlay_path, "overlays/new_overlay.yaml")])
+    wl = make_workload(tmp_path, chart_name="Existing Chart", overlay_files=[(overlay_path, "overlays/new.yaml")])
+
+    with registration_mocks([wl], {"Existing Chart": (chart_id, None)}) as mocks:
+        await register_workloads()
+
+    mocks.create_chart.assert_not_awaited()
+    mocks.update_chart.assert_awaited_once()
+    mocks.update_overlay.assert_not_awaited()
+    mocks.create_overlay.assert_awaited_once_with(
+        session=ANY,
+        chart_id=chart_id,
+        overlay_data=overlay_dict,
+        canonical_name="new/overlay",
+        creator="system",
+        content_hash=content_hash(yaml.safe_dump(overlay_dict)),
+    )
 
-    mock_get_registerable_workloads.return_value = [wl]
-    mock_select_chart.return_value = SimpleNamespace(id=chart_id)
-    mock_update_chart.return_value = SimpleNamespace(id=chart_id)
-    mock_list_overlays.return_value = []
 
-    await register_workloads()
+@pytest.mark.asyncio
+async def test_skips_unchanged_chart_and_overlay(tmp_path: Path) -> None:
+    """Test a second registration of the same content does not write anything."""
+    overlay_path = write_overlay(tmp_path, "overlay.yaml", "model: foo/bar\nx: 1\n")
+    wl = make_workload(tmp_path, chart_name="Chart", overlay_files=[(overlay_path, "overlays/overlay.yaml")])
 
-    mock_create_chart.assert_not_awaited()
-    mock_update_chart.assert_awaited_once()
-    mock_update_overlay.assert_not_awaited()
-    mock_create_overlay.assert_awaited_once()
+    with registration_mocks([wl]) as first:
+        await register_workloads()
+    chart_id = first.create_chart.return_value.id
+    charts = {"Chart": (chart_id, first.create_chart.await_args.kwargs["content_hash"])}
+    overlays = {(chart_id, "foo/bar"): (uuid4(), first.create_overlay.await_args.kwargs["content_hash"])}
 
-    mock_create_overlay.assert_awaited_once_with(
-        session=ANY, chart_id=chart_id, overlay_data=overlay_dict, canonical_name="new/overlay", creator="system"
-    )
+    with registration_mocks([wl], charts, overlays) as second:
+        await register_workloads()
+
+    second.create_chart.assert_not_awaited()
+    second.update_chart.assert_not_awaited()
+    second.create_overlay.assert_not_awaited()
+    second.update_overlay.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-@patch("app.charts.registration.update_overlay", autospec=True)
-@patch("app.charts.registration.create_overlay", autospec=True)
-@patch("app.charts.registration.list_overlays", autospec=True)
-@patch("app.charts.registration.update_chart", autospec=True)
-@patch("app.charts.registration.create_chart", autospec=True)
-@patch("app.charts.registration.select_chart", autospec=True)
-@patch("app.charts.registration.get_registerable_workloads", autospec=True)
-@patch("app.charts.registration.session_ctx", autospec=True)
-async def test_updates_chart_only_when_no_overlay_files(
-    session_scope_mock: MagicMock,
-    mock_get_registerable_workloads: AsyncMock,
-    mock_select_chart: AsyncMock,
-    mock_create_chart: AsyncMock,
-    mock_update_chart: AsyncMock,
-    mock_list_overlays: AsyncMock,
-    mock_create_overlay: AsyncMock,
-    mock_update_overlay: AsyncMock,
-    db_session: AsyncSession,
-) -> None:
-    cm, _session = make_session_scope_cm(db_session)
-    session_scope_mock.return_value = cm
+async def test_changed_chart_file_updates_only_that_chart(tmp_path: Path) -> None:
+    """Test a changed chart file changes the content hash of its chart."""
+    wl = make_workload(tmp_path, chart_name="Chart", chart_files={"values.yaml": "a: 1"})
+    with registration_mocks([wl]) as first:
+        await register_workloads()
+    chart_id = first.create_chart.return_value.id
+    registered_hash = first.create_chart.await_args.kwargs["content_hash"]
 
-    chart_id = uuid4()
-    wl = make_workload(chart_name="Existing Chart", overlay_files=[])
+    wl = make_workload(tmp_path, chart_name="Chart", chart_files={"values.yaml": "a: 2"})
+    with registration_mocks([wl], {"Chart": (chart_id, registered_hash)}) as second:
+        await register_workloads()
+
+    second.update_chart.assert_awaited_once()
+    assert second.update_chart.await_args.kwargs["content_hash"] != registered_hash
 
-    mock_get_registerable_workloads.return_value = [wl]
-    mock_select_chart.return_value = SimpleNamespace(id=chart_id)
-    mock_update_chart.return_value = SimpleNamespace(id=chart_id)
 
-    await register_workloads()
+@pytest.mark.asyncio
+async def test_chart_data_is_built_once_and_passed_through(tmp_path: Path) -> None:
+    """Test the hashed chart data is the data written, for both creates and updates."""
+    wl = make_workload(tmp_path, chart_name="Chart", metadata={"description": None})
+    with (
+        registration_mocks([wl]) as first,
+        patch("app.charts.registration.ChartCreate.to_data", autospec=True, side_effect=ChartCreate.to_data) as to_data,
+    ):
+        await register_workloads()
 
-    mock_create_chart.assert_not_awaited()
-    mock_update_chart.assert_awaited_once()
-    mock_create_overlay.assert_not_awaited()
-    mock_update_overlay.assert_not_awaited()
-    mock_list_overlays.assert_not_awaited()
+    to_data.assert_awaited_once()
+    kwargs = first.create_chart.await_args.kwargs
+    assert kwargs["content_hash"] == content_hash(kwargs["chart_data"])
 
+    with registration_mocks([wl], {"Chart": (uuid4(), "stale")}) as second:
+        await register_workloads()
 
-@pytest.mark.asyncio
-@patch("app.charts.registration.update_overlay", autospec=True)
-@patch("app.charts.registration.create_overlay", autospec=True)
-@patch("app.charts.registration.list_overlays", autospec=True)
-@patch("app.charts.registration.update_chart", autospec=True)
-@patch("app.charts.registration.create_chart", autospec=True)
-@patch("app.charts.registration.select_chart", autospec=True)
-@patch("app.charts.registration.get_registerable_workloads", autospec=True)
-@patch("app.charts.registration.session_ctx", autospec=True)
-async def test_creates_new_chart_and_overlay(
-    session_scope_mock: MagicMock,
-    mock_get_registerable_workloads: AsyncMock,
-    mock_select_chart: AsyncMock,
-    mock_create_chart: AsyncMock,
-    mock_update_chart: AsyncMock,
-    mock_list_overlays: AsyncMock,
-    mock_create_overlay: AsyncMock,
-    mock_update_overlay: AsyncMock,
-    tmp_path: Path,
-) -> None:
-    cm, _session = make_session_scope_cm()
-    session_scope_mock.return_value = cm
+    update_data = second.update_chart.await_args.kwargs["chart_data"]
+    assert "description" not in update_data
+    assert update_data["files"] == kwargs["chart_data"]["files"]
+    assert update_data["signature"] == kwargs["chart_data"]["signature"]
 
-    new_chart_id = uuid4()
-    overlay_dict = {"model": "brand/new", "z": 9}
-    overlay_path = write_overlay(tmp_path, "brand_new.yaml", yaml.safe_dump(overlay_dict))
-    wl = make_workload(chart_name="Brand New", overlay_files=[(overlay_path, "overlays/brand_new.yaml")])
 
-    mock_get_registerable_workloads.return_value = [wl]
-    mock_select_chart.return_value = None
-    mock_create_chart.return_value = SimpleNamespace(id=new_chart_id)
-    mock_list_overlays.return_value = []
+@pytest.mark.asyncio
+async def test_updates_chart_only_when_no_overlay_files(tmp_path: Path) -> None:
+    chart_id = uuid4()
+    wl = make_workload(tmp_path, chart_name="Existing Chart", overlay_files=[])
+
+    with registration_mocks([wl], {"Existing Chart": (chart_id, None)}) as mocks:
+        await register_workloads()
 
-    await register_workloads()
+    mocks.create_chart.assert_not_awaited()
+    mocks.update_chart.assert_awaited_once()
+    mocks.create_overlay.assert_not_awaited()
+    mocks.update_overlay.assert_not_awaited()
 
-    mock_create_chart.assert_awaited_once()
-    mock_update_chart.assert_not_awaited()
-    mock_update_overlay.assert_not_awaited()
-    mock_create_overlay.assert_awaited_once()
 
-    mock_create_overlay.assert_awaited_once_with(
-        session=ANY, chart_id=new_chart_id, overlay_data=overlay_dict, canonical_name="brand/new", creator="system"
+@pytest.mark.asyncio
+async def test_creates_new_chart_and_overlay(tmp_path: Path) -> None:
+    overlay_dict = {"model": "brand/new", "z": 9}
+    overlay_path = write_overlay(tmp_path, "brand_new.yaml", yaml.safe_dump(overlay_dict))
+    wl = make_workload(tmp_path, chart_name="Brand New", overlay_files=[(overlay_path, "overlays/brand_new.yaml")])
+
+    with registration_mocks([wl]) as mocks:
+        await register_workloads()
+
+    mocks.create_chart.assert_awaited_once()
+    mocks.update_chart.assert_not_awaited()
+    mocks.update_overlay.assert_not_awaited()
+    mocks.create_overlay.assert_awaited_once_with(
+        session=ANY,
+        chart_id=mocks.create_chart.return_value.id,
+        overlay_data=overlay_dict,
+        canonical_name="brand/new",
+        creator="system",
+        content_hash=ANY,
     )
 
 
 @pytest.mark.asyncio
-@patch("app.charts.registration.update_overlay", autospec=True)
-@patch("app.charts.registration.create_overlay", autospec=True)
-@patch("app.charts.registration.list_overlays", autospec=True)
-@patch("app.charts.registration.update_chart", autospec=True)
-@patch("app.charts.registration.create_chart", autospec=True)
-@patch("app.charts.registration.select_chart", autospec=True)
-@patch("app.charts.registration.get_registerable_workloads", autospec=True)
-@patch("app.charts.registration.session_ctx", autospec=True)
-async def test_invalid_overlay_yaml_raises_value_error_when_overlay_missing(
-    session_scope_mock: MagicMock,
-    mock_get_registerable_workloads: AsyncMock,
-    mock_select_chart: AsyncMock,
-    mock_create_chart: AsyncMock,
-    mock_update_chart: AsyncMock,
-    mock_list_overlays: AsyncMock,
-    mock_create_overlay: AsyncMock,
-    mock_update_overlay: AsyncMock,
-    tmp_path: Path,
-) -> None:
-    cm, _session = make_session_scope_cm()
-    session_scope_mock.return_value = cm
-
+async def test_invalid_overlay_yaml_raises_value_error_when_overlay_missing(tmp_path: Path) -> None:
     chart_id = uuid4()
     overlay_path = write_overlay(tmp_path, "bad.yaml", "not: valid: [")
 
-    wl = make_workload(chart_name="Existing Chart", overlay_files=[(overlay_path, "overlays/bad.yaml")])
-
-    mock_get_registerable_workloads.return_value = [wl]
-    mock_select_chart.return_value = SimpleNamespace(id=chart_id)
-    mock_update_chart.return_value = SimpleNamespace(id=chart_id)
-    mock_list_overlays.return_value = []  # go down the "create" path
+    wl = make_workload(tmp_path, chart_name="Existing Chart", overlay_files=[(overlay_path, "overlays/bad.yaml")])
 
-    with patch("app.charts.registration.yaml.safe_load", return_value=None):
-        with pytest.raises(ValueError, match="Overlay data is required for creating an overlay."):
-            await register_workloads()
+    with registration_mocks([wl], {"Existing Chart": (chart_id, None)}) as mocks:
+        with patch("app.charts.registration.yaml.safe_load", return_value=None):
+            with pytest.raises(ValueError, match="Overlay data is required for creating an overlay."):
+                await register_workloads()
 
-    mock_update_chart.assert_awaited_once()
-    mock_create_overlay.assert_not_awaited()
-    mock_update_overlay.assert_not_awaited()
+    mocks.update_chart.assert_awaited_once()
+    mocks.create_overlay.assert_not_awaited()
+    mocks.update_overlay.assert_not_awaited()
 
 
 # Tests for normalize_api_files function
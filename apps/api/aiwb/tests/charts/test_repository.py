@@ -13,6 +13,7 @@ from app.charts.repository import (
     create_file_records,
     delete_chart,
     delete_chart_files,
+    get_chart_content_hashes,
     list_charts,
     select_chart,
     update_chart,
@@ -329,6 +330,41 @@ async def test_update_chart(db_session: AsyncSession) -> None:
     assert await select_chart(db_session, updated_chart.id) is not None
 
 
+@pytest.mark.asyncio
+async def test_update_chart_writes_only_changed_files(db_session: AsyncSession) -> None:
+    """Test chart files are diffed by path: unchanged files are kept as they are."""
+    chart_schema = make_chart_create_schema(
+        name=f"diff-test-{uuid4()}",
+        files=[
+            {"path": "Chart.yaml", "content": "apiVersion: v2"},
+            {"path": "values.yaml", "content": "a: 1"},
+            {"path": "removed.yaml", "content": "b: 2"},
+        ],
+    )
+    chart = await create_chart(db_session, chart_schema, creator="create_user", content_hash="abc")
+    original = {f.path: (f.id, f.updated_at) for f in chart.files}
+
+    update_schema = ChartUpdate(
+        files=make_mock_chart_files(
+            [
+                {"path": "Chart.yaml", "content": "apiVersion: v2"},
+                {"path": "values.yaml", "content": "a: 2"},
+                {"path": "added.yaml", "content": "c: 3"},
+            ]
+        )
+    )
+    updated_chart = await update_chart(db_session, chart.id, update_schema, "update_user")
+
+    files = {f.path: f for f in updated_chart.files}
+    assert set(files) == {"Chart.yaml", "values.yaml", "added.yaml"}
+    assert (files["Chart.yaml"].id, files["Chart.yaml"].updated_at) == original["Chart.yaml"]
+    assert files["values.yaml"].id == original["values.yaml"][0]
+    assert files["values.yaml"].content == "a: 2"
+    assert files["added.yaml"].content == "c: 3"
+    # Updates outside of registration clear the content hash
+    assert (await get_chart_content_hashes(db_session))[chart.name] == (chart.id, None)
+
+
 @pytest.mark.asyncio
 async def test_update_chart_not_found(db_session: AsyncSession) -> None:
     fake_id = uuid4()
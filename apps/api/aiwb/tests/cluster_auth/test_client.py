@@ -0,0 +1,152 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for the cluster-auth client."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.cluster_auth.client import ClusterAuthClient
+
+
+def make_client(handler, **kwargs) -> ClusterAuthClient:
+    client = ClusterAuthClient(base_url="http://cluster-auth", admin_token="token", **kwargs)
+    client.client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_lookup_api_key_is_cached_until_key_changes() -> None:
+    """Test repeated lookups are served from cache and a bind invalidates the cached entry."""
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path == "/apikey/lookup":
+            return httpx.Response(200, json={"groups": [str(calls.count("/apikey/bind"))]})
+        return httpx.Response(200, json={"groups": ["g1"]})
+
+    client = make_client(handler, lookup_cache_ttl=60)
+
+    assert await client.lookup_api_key("key-1") == {"groups": ["0"]}
+    assert await client.lookup_api_key("key-1") == {"groups": ["0"]}
+    assert calls == ["/apikey/lookup"]
+
+    await client.bind_api_key_to_group("key-1", "g1")
+    assert await client.lookup_api_key("key-1") == {"groups": ["1"]}
+    assert calls == ["/apikey/lookup", "/apikey/bind", "/apikey/lookup"]
+
+
+@pytest.mark.asyncio
+async def test_lookup_api_keys_dedupes_and_skips_missing_keys() -> None:
+    """Test batched lookups query each key once and omit keys unknown to cluster-auth."""
+    looked_up: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        key_id = json.loads(request.content)["key_id"]
+        looked_up.append(key_id)
+        if key_id == "missing":
+            return httpx.Response(404, json={"detail": "not found"})
+        return httpx.Response(200, json={"ttl": key_id})
+
+    client = make_client(handler, lookup_cache_ttl=0)
+
+    result = await client.lookup_api_keys(["a", "b", "a", "missing"])
+
+    assert result == {"a": {"ttl": "a"}, "b": {"ttl": "b"}}
+    assert sorted(looked_up) == ["a", "b", "missing"]
+
+
+@pytest.mark.asyncio
+async def test_lookup_api_keys_raises_on_server_error() -> None:
+    """Test batched lookups surface errors other than a missing key."""
+    client = make_client(lambda request: httpx.Response(500), lookup_cache_ttl=0)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.lookup_api_keys(["a"])
+
+
+@pytest.mark.asyncio
+async def test_lookup_api_keys_raises_unexpected_errors() -> None:
+    """Test batched lookups do not treat errors other than HTTP 404 as a missing key."""
+    client = make_client(lambda request: httpx.Response(200, json={}), lookup_cache_ttl=0)
+
+    with patch.object(client, "lookup_api_key", side_effect=KeyError("groups")):
+        with pytest.raises(KeyError):
+            await client.lookup_api_keys(["a"])
+
+
+@pytest.mark.asyncio
+async def test_lookup_cache_is_bounded() -> None:
+    """Test the lookup cache evicts expired entries first, then the oldest one."""
+    client = make_client(lambda request: httpx.Response(200, json={}), lookup_cache_ttl=60, lookup_cache_max_entries=2)
+
+    with patch("app.cluster_auth.client.time.monotonic", return_value=0):
+        await client.lookup_api_key("a")
+        await client.lookup_api_key("b")
+        await client.lookup_api_key("c")
+    assert list(client._lookup_cache) == ["b", "c"]
+
+    with patch("app.cluster_auth.client.time.monotonic", return_value=100):
+        await client.lookup_api_key("d")
+    assert list(client._lookup_cache) == ["d"]
+
+
+@pytest.mark.asyncio
+async def test_requests_are_concurrency_limited() -> None:
+    """Test no more than max_concurrency requests are in flight at once."""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    client = make_client(handler, max_concurrency=2)
+
+    await asyncio.gather(*(client.bind_api_key_to_group("key-1", f"g{i}") for i in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_bind_retries_transient_failures() -> None:
+    """Test bind retries server errors and succeeds once cluster-auth recovers."""
+    responses = [httpx.Response(503), httpx.Response(200, json={"groups": ["g1"]})]
+
+    client = make_client(lambda request: responses.pop(0))
+
+    with (
+        patch("app.cluster_auth.client.CLUSTER_AUTH_MIN_WAIT", 0),
+        patch("app.cluster_auth.client.CLUSTER_AUTH_MAX_WAIT", 0),
+    ):
+        result = await client.bind_api_key_to_group("key-1", "g1")
+
+    assert result == {"groups": ["g1"]}
+    assert responses == []
+
+
+@pytest.mark.asyncio
+async def test_unbind_does_not_retry_client_errors() -> None:
+    """Test unbind fails immediately on 4xx responses."""
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(404)
+
+    client = make_client(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.unbind_api_key_from_group("key-1", "g1")
+    assert calls == 1
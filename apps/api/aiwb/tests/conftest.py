@@ -94,7 +94,11 @@ def global_init_dependencies(monkeypatch):
         patch("app.init_db", autospec=True),
         patch("app.load_k8s_config", autospec=True),
         patch("app.init_kube_client", return_value=mock_kube_client),
+        patch("app.start_aim_catalog", autospec=True),
+        patch("app.start_event_index", autospec=True),
+        patch("app.start_resource_resolver", autospec=True),
         patch("app.start_pollers", autospec=True),
+        patch("app.start_metrics_server", autospec=True),
         patch("app.init_prometheus_client") as mock_init_prometheus,
         patch("app.init_loki_client") as mock_init_loki,
     ):
@@ -0,0 +1,98 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for the async resource resolver of the dynamic client."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+
+from app.dispatch.discovery import ResourceResolver
+
+
+def _dynamic_client() -> MagicMock:
+    dynamic_client = MagicMock()
+    dynamic_client.resources.get.side_effect = lambda api_version, kind: MagicMock(kind=kind)
+    return dynamic_client
+
+
+@pytest.mark.asyncio
+async def test_resolver_caches_resolved_resources() -> None:
+    """Test a kind is discovered once and then served from memory."""
+    dynamic_client = _dynamic_client()
+    resolver = ResourceResolver()
+
+    with patch("app.dispatch.discovery.get_dynamic_client", return_value=dynamic_client):
+        first = await resolver.get("apps/v1", "Deployment")
+        second = await resolver.get("apps/v1", "Deployment")
+
+    assert first is second
+    dynamic_client.resources.get.assert_called_once_with(api_version="apps/v1", kind="Deployment")
+
+
+@pytest.mark.asyncio
+async def test_resolver_shares_concurrent_lookups() -> None:
+    """Test concurrent callers of the same kind wait for a single discovery."""
+    release = threading.Event()
+    dynamic_client = _dynamic_client()
+    dynamic_client.resources.get.side_effect = lambda api_version, kind: release.wait(1) and MagicMock(kind=kind)
+    resolver = ResourceResolver()
+
+    with patch("app.dispatch.discovery.get_dynamic_client", return_value=dynamic_client):
+        lookups = [asyncio.create_task(resolver.get("batch/v1", "Job")) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+        resources = await asyncio.gather(*lookups)
+
+    assert len({id(resource) for resource in resources}) == 1
+    dynamic_client.resources.get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_resolver_remembers_unknown_kinds() -> None:
+    """Test an unknown kind is not rediscovered until the negative TTL expires."""
+    dynamic_client = _dynamic_client()
+    dynamic_client.resources.get.side_effect = ResourceNotFoundError("No matches found")
+    resolver = ResourceResolver(negative_ttl_seconds=60)
+
+    with patch("app.dispatch.discovery.get_dynamic_client", return_value=dynamic_client):
+        for _ in range(3):
+            with pytest.raises(ResourceNotFoundError):
+                await resolver.get("example.com/v1", "Unknown")
+
+    dynamic_client.resources.get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_resolver_refresh_invalidates_discovery() -> None:
+    """Test a refresh drops the discovery cache and replaces the cached resource."""
+    dynamic_client = _dynamic_client()
+    resolver = ResourceResolver()
+
+    with patch("app.dispatch.discovery.get_dynamic_client", return_value=dynamic_client):
+        stale = await resolver.get("gateway.networking.k8s.io/v1", "HTTPRoute")
+        refreshed = await resolver.refresh("gateway.networking.k8s.io/v1", "HTTPRoute")
+        cached = await resolver.get("gateway.networking.k8s.io/v1", "HTTPRoute")
+
+    assert refreshed is not stale
+    assert cached is refreshed
+    dynamic_client.resources.invalidate_cache.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_resolver_warm_up_skips_unknown_kinds() -> None:
+    """Test warming up resolves the known kinds and only logs the unknown ones."""
+    dynamic_client = _dynamic_client()
+    dynamic_client.resources.get.side_effect = lambda api_version, kind: (
+        MagicMock(kind=kind) if kind != "HTTPRoute" else (_ for _ in ()).throw(ResourceNotFoundError(kind))
+    )
+    resolver = ResourceResolver()
+
+    with patch("app.dispatch.discovery.get_dynamic_client", return_value=dynamic_client):
+        await resolver.warm_up([("apps/v1", "Deployment"), ("gateway.networking.k8s.io/v1", "HTTPRoute")])
+
+    assert list(resolver._resources) == [("apps/v1", "Deployment")]
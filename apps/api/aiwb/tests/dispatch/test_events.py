@@ -0,0 +1,123 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for the cluster event index."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from kubernetes_asyncio.client import CoreV1Event, CoreV1EventList, V1ListMeta, V1ObjectMeta, V1ObjectReference
+
+from app.dispatch.events import EventIndex
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _event(
+    uid: str,
+    name: str = "test-pod",
+    kind: str = "Pod",
+    namespace: str = "test-namespace",
+    reason: str = "Started",
+    age_seconds: int = 0,
+    resource_version: str = "1",
+) -> CoreV1Event:
+    return CoreV1Event(
+        metadata=V1ObjectMeta(uid=uid, name=f"{name}.{uid}", namespace=namespace, resource_version=resource_version),
+        involved_object=V1ObjectReference(kind=kind, name=name, namespace=namespace),
+        type="Normal",
+        reason=reason,
+        message=f"{reason} {name}",
+        last_timestamp=NOW - timedelta(seconds=age_seconds),
+        count=1,
+    )
+
+
+def _watch_event(event_type: str, event: CoreV1Event) -> dict:
+    raw_object = {"metadata": {"uid": event.metadata.uid, "resourceVersion": event.metadata.resource_version}}
+    return {"type": event_type, "object": event, "raw_object": raw_object}
+
+
+def test_event_index_groups_events_by_object() -> None:
+    """Test events are looked up by namespace, kind and name, most recent first."""
+    index = EventIndex()
+    index.replace(
+        [
+            _event("1", reason="Scheduled", age_seconds=20),
+            _event("2", reason="Started", age_seconds=10),
+            _event("3", kind="Job", reason="Created"),
+            _event("4", name="other-pod"),
+            _event("5", namespace="other-namespace"),
+        ],
+        resource_version="10",
+    )
+
+    assert index.ready
+    assert [event["reason"] for event in index.get_events("test-namespace", "test-pod", "Pod")] == [
+        "Started",
+        "Scheduled",
+    ]
+    assert [event["reason"] for event in index.get_events("test-namespace", "test-pod")] == [
+        "Created",
+        "Started",
+        "Scheduled",
+    ]
+    assert index.get_events("test-namespace", "missing-pod") == []
+
+
+def test_event_index_applies_watch_events() -> None:
+    """Test watch events add, update and remove indexed events and advance the resource version."""
+    index = EventIndex()
+    index.replace([_event("1", reason="Pulling")], resource_version="1")
+
+    index.apply_event(_watch_event("ADDED", _event("2", reason="Pulled", resource_version="2")))
+    updated = _event("1", reason="Pulling", resource_version="3")
+    updated.count = 3
+    index.apply_event(_watch_event("MODIFIED", updated))
+    index.apply_event(_watch_event("DELETED", _event("2", resource_version="4")))
+    index.apply_event({"type": "BOOKMARK", "object": {}, "raw_object": {"metadata": {"resourceVersion": "5"}}})
+
+    events = index.get_events("test-namespace", "test-pod", "Pod")
+    assert [(event["reason"], event["count"]) for event in events] == [("Pulling", 3)]
+    assert index.resource_version == "5"
+
+
+def test_event_index_bounds_events_per_object() -> None:
+    """Test only the most recent events of an object are kept, and objects without events are forgotten."""
+    index = EventIndex(max_events_per_object=2)
+    index.replace([], resource_version="1")
+
+    for uid, age_seconds in [("1", 30), ("2", 10), ("3", 20)]:
+        index.apply_event(_watch_event("ADDED", _event(uid, reason=f"event-{uid}", age_seconds=age_seconds)))
+
+    assert [event["reason"] for event in index.get_events("test-namespace", "test-pod")] == ["event-2", "event-3"]
+
+    index.apply_event(_watch_event("DELETED", _event("2")))
+    index.apply_event(_watch_event("DELETED", _event("3")))
+    assert index._by_object == {}
+    assert index._kinds == {}
+
+
+@pytest.mark.asyncio
+async def test_event_index_lists_events_in_chunks() -> None:
+    """Test the index is loaded by following the continue tokens of the API server."""
+    core_v1 = MagicMock()
+    core_v1.list_event_for_all_namespaces = AsyncMock(
+        side_effect=[
+            CoreV1EventList(items=[_event("1")], metadata=V1ListMeta(_continue="token-1", resource_version="7")),
+            CoreV1EventList(items=[_event("2", kind="Job")], metadata=V1ListMeta(resource_version="7")),
+        ]
+    )
+    index = EventIndex()
+
+    await index._list(core_v1)
+
+    assert index.ready
+    assert index.resource_version == "7"
+    assert len(index.get_events("test-namespace", "test-pod")) == 2
+    assert [call.kwargs["_continue"] for call in core_v1.list_event_for_all_namespaces.call_args_list] == [
+        None,
+        "token-1",
+    ]
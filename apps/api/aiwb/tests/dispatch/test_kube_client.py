@@ -4,6 +4,7 @@
 
 """Tests for Kubernetes client."""
 
+import json
 import threading
 import time
 from datetime import UTC, datetime
@@ -14,6 +15,7 @@ from kubernetes_asyncio.client import ApiClient, ApiException, CoreV1Event, Core
 
 import app.dispatch.kube_client as kc_module
 from app.dispatch.kube_client import (
+    PARTIAL_OBJECT_METADATA_LIST,
     KubernetesClient,
     close_dynamic_client,
     get_dynamic_client,
@@ -176,19 +178,8 @@ async def test_kube_client_get_events_for_resource_with_kind_filter(kube_client)
     mock_pod_event.count = 1
     mock_pod_event.source = None
 
-    mock_job_event = MagicMock(spec=CoreV1Event)
-    mock_job_event.involved_object.name = "test-resource"
-    mock_job_event.involved_object.kind = "Job"
-    mock_job_event.type = "Normal"
-    mock_job_event.reason = "Created"
-    mock_job_event.message = "Job created"
-    mock_job_event.last_timestamp = None
-    mock_job_event.event_time = None
-    mock_job_event.count = 1
-    mock_job_event.source = None
-
     mock_list = MagicMock(spec=CoreV1EventList)
-    mock_list.items = [mock_pod_event, mock_job_event]
+    mock_list.items = [mock_pod_event]
 
     kube_client.core_v1.list_namespaced_event = AsyncMock(return_value=mock_list)
 
@@ -199,6 +190,26 @@ async def test_kube_client_get_events_for_resource_with_kind_filter(kube_client)
 
     assert len(events) == 1
     assert events[0]["reason"] == "Started"
+    kube_client.core_v1.list_namespaced_event.assert_awaited_once_with(
+        namespace="default", field_selector="involvedObject.name=test-resource,involvedObject.kind=Pod"
+    )
+
+
+@pytest.mark.asyncio
+async def test_kube_client_get_events_for_resource_reads_event_index(kube_client):
+    """Test that events are read from the event index without calling the API server when it is in sync."""
+    event_index = MagicMock(ready=True)
+    event_index.get_events.return_value = [{"reason": "Started"}]
+    kube_client.core_v1.list_namespaced_event = AsyncMock()
+
+    with patch("app.dispatch.kube_client.get_event_index", return_value=event_index):
+        events = await kube_client.get_events_for_resource(
+            namespace="default", resource_name="test-pod", resource_kind="Pod"
+        )
+
+    assert events == [{"reason": "Started"}]
+    event_index.get_events.assert_called_once_with("default", "test-pod", "Pod")
+    kube_client.core_v1.list_namespaced_event.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -213,6 +224,40 @@ async def test_kube_client_get_events_for_resource_api_error(kube_client):
     assert events == []
 
 
+@pytest.mark.asyncio
+async def test_kube_client_list_namespaced_secret_metadata():
+    """Test listing secrets asks for partial object metadata and parses it into V1Secret objects."""
+    body = {
+        "kind": "PartialObjectMetadataList",
+        "apiVersion": "meta.k8s.io/v1",
+        "metadata": {"resourceVersion": "42"},
+        "items": [
+            {
+                "kind": "PartialObjectMetadata",
+                "apiVersion": "meta.k8s.io/v1",
+                "metadata": {"name": "hf-token", "namespace": "team", "labels": {"use-case": "HuggingFace"}},
+            }
+        ],
+    }
+    response = MagicMock(status=200, data=json.dumps(body).encode())
+    response.getheader.return_value = "application/json"
+    kube_client = KubernetesClient()
+    kube_client._api_client.request = AsyncMock(return_value=response)
+
+    secrets = await kube_client.list_namespaced_secret_metadata("team")
+
+    assert [secret.metadata.name for secret in secrets.items] == ["hf-token"]
+    assert secrets.items[0].metadata.labels == {"use-case": "HuggingFace"}
+    assert secrets.items[0].data is None
+    method, url = kube_client._api_client.request.await_args.args
+    assert method == "GET"
+    assert url.endswith("/api/v1/namespaces/team/secrets")
+    assert kube_client._api_client.request.await_args.kwargs["headers"]["Accept"] == (
+        f"{PARTIAL_OBJECT_METADATA_LIST},application/json"
+    )
+    await kube_client.close()
+
+
 # =============================================================================
 # Global client management tests
 # =============================================================================
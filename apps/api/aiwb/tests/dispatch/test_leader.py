@@ -0,0 +1,139 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for advisory lock leader election."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.dispatch.leader import LeaderElector, lock_key
+
+
+@pytest.fixture
+def connection() -> AsyncMock:
+    """Mock dedicated database connection, granting every advisory lock."""
+    connection = AsyncMock()
+    connection.execution_options.return_value = connection
+    connection.execute.return_value = MagicMock(scalar=MagicMock(return_value=True))
+    connection.get_raw_connection.return_value = MagicMock(driver_connection=AsyncMock())
+    return connection
+
+
+@pytest.fixture
+def engine(connection: AsyncMock) -> MagicMock:
+    engine = MagicMock()
+    engine.connect = AsyncMock(return_value=connection)
+    return engine
+
+
+def test_lock_key_is_stable_signed_int32():
+    """Test lock keys are deterministic across processes and fit PostgreSQL's int4."""
+    assert lock_key("sync_workloads") == lock_key("sync_workloads")
+    assert lock_key("sync_workloads") != lock_key("sync_aim_services")
+    for name in ("sync_workloads", "sync_aim_services", "x" * 100):
+        assert -(2**31) <= lock_key(name) < 2**31
+
+
+@pytest.mark.asyncio
+async def test_is_leader_acquires_lock_once(engine: MagicMock, connection: AsyncMock):
+    """Test leadership is acquired with one connection and only confirmed afterwards."""
+    elector = LeaderElector(engine, on_wakeup=MagicMock())
+
+    assert await elector.is_leader("sync_workloads") is True
+    assert await elector.is_leader("sync_workloads") is True
+
+    engine.connect.assert_awaited_once()
+    statements = [str(call.args[0]) for call in connection.execute.call_args_list]
+    assert sum("pg_try_advisory_lock" in statement for statement in statements) == 1
+    assert elector.held == {"sync_workloads"}
+    raw = connection.get_raw_connection.return_value.driver_connection
+    raw.add_listener.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_is_leader_false_when_lock_taken(engine: MagicMock, connection: AsyncMock):
+    """Test a syncer led by another replica is not reported as led."""
+    connection.execute.return_value = MagicMock(scalar=MagicMock(return_value=False))
+    elector = LeaderElector(engine, on_wakeup=MagicMock())
+
+    assert await elector.is_leader("sync_workloads") is False
+    assert elector.held == frozenset()
+
+
+@pytest.mark.asyncio
+async def test_connection_failure_gives_up_leadership(engine: MagicMock, connection: AsyncMock):
+    """Test a broken connection drops all held locks and reconnects on the next attempt."""
+    elector = LeaderElector(engine, on_wakeup=MagicMock())
+    assert await elector.is_leader("sync_workloads") is True
+
+    connection.execute.side_effect = Exception("connection reset")
+    assert await elector.is_leader("sync_workloads") is False
+    assert elector.held == frozenset()
+    connection.invalidate.assert_awaited_once()
+
+    connection.execute.side_effect = None
+    assert await elector.is_leader("sync_workloads") is True
+    assert engine.connect.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_close_releases_locks(engine: MagicMock, connection: AsyncMock):
+    """Test closing the elector closes its connection, which releases the locks."""
+    elector = LeaderElector(engine, on_wakeup=MagicMock())
+    await elector.is_leader("sync_workloads")
+
+    await elector.close()
+
+    connection.invalidate.assert_awaited_once()
+    assert elector.held == frozenset()
+
+
+@pytest.mark.asyncio
+async def test_notification_triggers_wakeup(engine: MagicMock, connection: AsyncMock):
+    """Test notifications on the wakeup channel call the wakeup callback."""
+    on_wakeup = MagicMock()
+    elector = LeaderElector(engine, on_wakeup=on_wakeup)
+    await elector.notify()
+
+    raw = connection.get_raw_connection.return_value.driver_connection
+    listener = raw.add_listener.call_args.args[1]
+    listener(raw, 1234, "aiwb_syncer_wakeup", "")
+
+    on_wakeup.assert_called_once()
+
+
+async def _eventually_leader(elector: LeaderElector, name: str, timeout: float = 5) -> bool:
+    """Retry taking leadership, as PostgreSQL releases the locks of a closed connection asynchronously."""
+    async with asyncio.timeout(timeout):
+        while not await elector.is_leader(name):
+            await asyncio.sleep(0.05)
+    return True
+
+
+@pytest.mark.asyncio
+async def test_leadership_is_exclusive_and_handed_over(engine_and_session_maker: tuple[Any, Any]):
+    """Test against PostgreSQL that one connection leads a syncer until it closes, and notifications arrive."""
+    engine, _ = engine_and_session_maker
+    woken = asyncio.Event()
+    first = LeaderElector(engine, on_wakeup=MagicMock())
+    second = LeaderElector(engine, on_wakeup=woken.set)
+    try:
+        assert await first.is_leader("sync_workloads") is True
+        assert await second.is_leader("sync_workloads") is False
+        assert await second.is_leader("sync_aim_services") is True
+        assert await first.is_leader("sync_workloads") is True
+
+        await first.close()
+        assert await _eventually_leader(second, "sync_workloads")
+        assert await first.is_leader("sync_workloads") is False
+
+        await first.notify()
+        async with asyncio.timeout(5):
+            await woken.wait()
+    finally:
+        await first.close()
+        await second.close()
@@ -12,7 +12,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 import app.dispatch.poller as poller_module
 from app.dispatch.kube_client import KubernetesClient
-from app.dispatch.poller import PollerState, _poll_resources, is_running, register_syncer, start_poller, stop_poller
+from app.dispatch.poller import (
+    PollerState,
+    SyncerSchedule,
+    _poll_resources,
+    is_running,
+    register_syncer,
+    request_sync,
+    start_poller,
+    stop_poller,
+)
 
 
 @pytest.fixture
@@ -24,7 +33,9 @@ def clean_poller_state():
     # Create fresh state
     poller_module._state = PollerState()
 
-    yield poller_module._state
+    # Leader election needs a database connection, it is covered with a mocked elector below
+    with patch("app.dispatch.poller.SYNCER_LEADER_ELECTION_ENABLED", False):
+        yield poller_module._state
 
     # Restore original state
     poller_module._state = original_state
@@ -578,3 +589,160 @@ async def test_concurrent_poller_operations(mock_get_client, mock_session_maker,
     # Should be fully stopped
     assert clean_poller_state.running is False
     assert clean_poller_state.polling_task is None
+
+
+# =============================================================================
+# Adaptive interval tests
+# =============================================================================
+
+
+@patch("app.dispatch.poller.POLLING_INTERVAL_SECONDS", 5)
+@patch("app.dispatch.poller.SYNCER_BACKOFF_FACTOR", 2)
+@patch("app.dispatch.poller.SYNCER_MAX_POLLING_INTERVAL_SECONDS", 30)
+def test_syncer_schedule_backs_off_when_idle():
+    """Test the interval doubles while a syncer reports no changes, up to the maximum."""
+    schedule = SyncerSchedule()
+
+    intervals = []
+    for _ in range(5):
+        schedule.advance(0)
+        intervals.append(schedule.interval)
+
+    assert intervals == [10, 20, 30, 30, 30]
+
+
+@patch("app.dispatch.poller.POLLING_INTERVAL_SECONDS", 5)
+@patch("app.dispatch.poller.SYNCER_MAX_POLLING_INTERVAL_SECONDS", 60)
+def test_syncer_schedule_returns_to_base_interval():
+    """Test changes, unknown results and resets bring the interval back to the base interval."""
+    schedule = SyncerSchedule(interval=40)
+    schedule.advance(3)
+    assert schedule.interval == 5
+
+    schedule.interval = 40
+    schedule.advance(None)
+    assert schedule.interval == 5
+
+    schedule.interval = 40
+    schedule.reset()
+    assert schedule.interval == 5
+    assert schedule.next_run == 0.0
+
+
+@pytest.mark.asyncio
+@patch("app.dispatch.poller.database.session_maker")
+@patch("app.dispatch.poller.get_kube_client")
+async def test_poll_resources_skips_syncers_not_due(mock_get_client, mock_session_maker, clean_poller_state):
+    """Test only syncers whose interval has elapsed are run, and that the syncer result drives the schedule."""
+    mock_session = AsyncMock(spec=AsyncSession)
+    mock_session.__aenter__.return_value = mock_session
+    mock_session_maker.return_value = mock_session
+
+    idle_calls = 0
+
+    async def idle_syncer(session, kube_client):
+        nonlocal idle_calls
+        idle_calls += 1
+        return 0
+
+    register_syncer(idle_syncer)
+
+    await _poll_resources()
+    await _poll_resources()
+
+    assert idle_calls == 1
+    assert clean_poller_state.schedules["idle_syncer"].interval > poller_module.POLLING_INTERVAL_SECONDS
+
+    await request_sync()
+    assert clean_poller_state.wakeup.is_set()
+    await _poll_resources()
+
+    assert idle_calls == 2
+
+
+# =============================================================================
+# Leader election tests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+@patch("app.dispatch.poller.database.session_maker")
+@patch("app.dispatch.poller.get_kube_client")
+async def test_poll_resources_runs_only_led_syncers(mock_get_client, mock_session_maker, clean_poller_state):
+    """Test syncers led by another replica are skipped and retried at the base interval."""
+    mock_session = AsyncMock(spec=AsyncSession)
+    mock_session.__aenter__.return_value = mock_session
+    mock_session_maker.return_value = mock_session
+
+    called = []
+
+    async def led_syncer(session, kube_client):
+        called.append("led_syncer")
+
+    async def other_syncer(session, kube_client):
+        called.append("other_syncer")
+
+    register_syncer(led_syncer)
+    register_syncer(other_syncer)
+    clean_poller_state.elector = MagicMock()
+    clean_poller_state.elector.is_leader = AsyncMock(side_effect=lambda name: name == "led_syncer")
+
+    await _poll_resources()
+
+    assert called == ["led_syncer"]
+    assert clean_poller_state.schedules["other_syncer"].interval == poller_module.POLLING_INTERVAL_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_request_sync_notifies_in_transaction(clean_poller_state):
+    """Test a sync request with a session is sent as a notification within that session's transaction."""
+    clean_poller_state.elector = MagicMock()
+    clean_poller_state.elector.notify = AsyncMock()
+    session = AsyncMock(spec=AsyncSession)
+
+    await request_sync(session)
+
+    session.execute.assert_awaited_once()
+    assert "pg_notify" in str(session.execute.call_args.args[0])
+    clean_poller_state.elector.notify.assert_not_awaited()
+
+    await request_sync()
+
+    clean_poller_state.elector.notify.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_request_sync_falls_back_to_local_wakeup(clean_poller_state):
+    """Test a failing notification still wakes up the local poller."""
+    clean_poller_state.elector = MagicMock()
+    clean_poller_state.elector.notify = AsyncMock(side_effect=Exception("connection lost"))
+
+    await request_sync()
+
+    assert clean_poller_state.wakeup.is_set()
+
+
+@pytest.mark.asyncio
+@patch("app.dispatch.poller._poll_resources")
+async def test_stop_poller_releases_leadership(mock_poll, clean_poller_state):
+    """Test stopping the poller closes the leader elector."""
+
+    async def test_syncer(session, kube_client):
+        pass
+
+    register_syncer(test_syncer)
+    elector = MagicMock()
+    elector.close = AsyncMock()
+
+    with (
+        patch("app.dispatch.poller.SYNCER_LEADER_ELECTION_ENABLED", True),
+        patch("app.dispatch.poller.database.engine", MagicMock()),
+        patch("app.dispatch.poller.LeaderElector", return_value=elector),
+    ):
+        await start_poller()
+        assert clean_poller_state.elector is elector
+
+        await stop_poller()
+
+    elector.close.assert_awaited_once()
+    assert clean_poller_state.elector is None
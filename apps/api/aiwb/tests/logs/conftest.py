@@ -15,3 +15,9 @@ def default_time_range():
     end_date = datetime.now(UTC)
     start_date = end_date - timedelta(hours=1)
     return start_date, end_date
+
+
+@pytest.fixture(autouse=True)
+def reset_tail_multiplexer(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give every test its own tail multiplexer so shared tails never leak between event loops."""
+    monkeypatch.setattr("app.logs.tail._tail_multiplexer", None)
@@ -5,6 +5,7 @@
 """Tests for logs service."""
 
 import asyncio
+import gzip
 import json
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -17,9 +18,12 @@ from api_common.schemas import PaginationDirection
 from app.logs.schemas import LogEntry, LogLevel, LogType
 from app.logs.service import (
     _build_loki_query,
+    _fetch_log_shard,
     _handle_pagination,
     _parse_and_validate_dates,
+    _split_into_shards,
     create_websocket_connection,
+    export_workload_logs,
     get_logs_by_workload_id,
     stream_workload_logs,
 )
@@ -797,3 +801,107 @@ async def test_stream_workload_logs_no_start_time_filter() -> None:
         assert len(logs) == 2
         assert logs[0].message == "Past log message"
         assert logs[1].message == "Another past log"
+
+
+# =============================================================================
+# Bulk log export
+# =============================================================================
+
+
+def _loki_range_response(*streams: list[tuple[int, str]]) -> MagicMock:
+    response = MagicMock(spec=["json", "raise_for_status"])
+    response.json.return_value = {
+        "data": {
+            "result": [
+                {"stream": {"detected_level": "info"}, "values": [[str(ts), message] for ts, message in values]}
+                for values in streams
+            ]
+        }
+    }
+    return response
+
+
+def _loki_range_client(shard_values: list[tuple[int, str]]) -> AsyncMock:
+    """Fake Loki client answering query_range from a fixed set of entries, honouring start/end/limit."""
+
+    async def get(path: str, params: dict) -> MagicMock:
+        values = sorted(v for v in shard_values if params["start"] <= v[0] < params["end"])[: params["limit"]]
+        # Spread entries over two streams to exercise the merge
+        return _loki_range_response(values[0::2], values[1::2])
+
+    client = AsyncMock()
+    client.get = AsyncMock(side_effect=get)
+    return client
+
+
+def test_split_into_shards_covers_range() -> None:
+    assert _split_into_shards(0, 25, 10) == [(0, 10), (10, 20), (20, 25)]
+
+
+@pytest.mark.asyncio
+async def test_fetch_log_shard_merges_streams_and_pages() -> None:
+    values = [(i, f"message-{i}") for i in range(1, 8)] + [(7, "same-timestamp")]
+    client = _loki_range_client(values)
+
+    entries = await _fetch_log_shard(client, "{}", 0, 100, page_limit=3)
+
+    assert [entry.message for entry in entries] == [
+        "message-1",
+        "message-2",
+        "message-3",
+        "message-4",
+        "message-5",
+        "message-6",
+        "message-7",
+        "same-timestamp",
+    ]
+    assert client.get.call_count > 1
+
+
+@pytest.mark.asyncio
+async def test_export_workload_logs_streams_ndjson_in_order(default_time_range: tuple) -> None:
+    start_date, end_date = default_time_range
+    start_ns = int(start_date.timestamp() * 1_000_000_000)
+    minute_ns = 60 * 1_000_000_000
+    values = [(start_ns + i * 7 * minute_ns, f"message-{i}") for i in range(8)]
+    client = _loki_range_client(values)
+
+    with (
+        patch("app.logs.service.LOKI_EXPORT_SHARD_MINUTES", 10),
+        patch("app.logs.service.LOKI_EXPORT_MAX_CONCURRENCY", 2),
+    ):
+        chunks = [chunk async for chunk in export_workload_logs("workload-id", client, start_date, end_date)]
+
+    lines = b"".join(chunks).decode().splitlines()
+    assert [LogEntry.model_validate_json(line).message for line in lines] == [f"message-{i}" for i in range(8)]
+    assert client.get.call_count == 6  # one query per 10 minute shard of the hour
+
+
+@pytest.mark.asyncio
+async def test_export_workload_logs_gzip(default_time_range: tuple) -> None:
+    start_date, end_date = default_time_range
+    client = _loki_range_client([(int(start_date.timestamp() * 1_000_000_000), "compressed")])
+
+    chunks = [chunk async for chunk in export_workload_logs("workload-id", client, start_date, end_date, compress=True)]
+
+    lines = gzip.decompress(b"".join(chunks)).decode().splitlines()
+    assert LogEntry.model_validate_json(lines[0]).message == "compressed"
+
+
+@pytest.mark.asyncio
+async def test_export_workload_logs_writes_error_line_on_failure(default_time_range: tuple) -> None:
+    start_date, end_date = default_time_range
+    client = AsyncMock()
+    client.get = AsyncMock(side_effect=Exception("Loki unavailable"))
+
+    chunks = [chunk async for chunk in export_workload_logs("workload-id", client, start_date, end_date)]
+
+    assert json.loads(b"".join(chunks)) == {"error": "Loki unavailable"}
+
+
+def test_export_workload_logs_invalid_range() -> None:
+    end_date = datetime.now(UTC)
+    with pytest.raises(ValueError, match="Invalid time range"):
+        export_workload_logs("workload-id", AsyncMock(), end_date, end_date)
+    with pytest.raises(ValueError, match="cannot exceed"):
+        export_workload_logs("workload-id", AsyncMock(), end_date - timedelta(days=365), end_date)
@@ -0,0 +1,189 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+import websockets
+
+from app.logs.schemas import LogEntry
+from app.logs.tail import LokiTailMultiplexer, TailSubscription
+
+QUERY = '{workload_id="ab647a92-960b-4dcb-9262-77a9efa062c1", log_type=""}'
+
+
+class FakeTailWebSocket:
+    """Loki tail WebSocket stand-in fed from a queue."""
+
+    def __init__(self) -> None:
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.closed = False
+
+    def push(self, *entries: tuple[datetime, str]) -> None:
+        values = [[str(int(ts.timestamp() * 1_000_000_000)), message] for ts, message in entries]
+        self.messages.put_nowait(json.dumps({"streams": [{"stream": {"detected_level": "info"}, "values": values}]}))
+
+    async def recv(self) -> str:
+        message = await self.messages.get()
+        if isinstance(message, Exception):
+            raise message
+        return message
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_ws() -> FakeTailWebSocket:
+    return FakeTailWebSocket()
+
+
+@pytest.fixture
+def connect(fake_ws: FakeTailWebSocket):
+    calls = []
+
+    async def _connect():
+        calls.append(1)
+        return fake_ws
+
+    _connect.calls = calls
+    return _connect
+
+
+async def test_subscribers_of_same_query_share_upstream(fake_ws: FakeTailWebSocket, connect) -> None:
+    multiplexer = LokiTailMultiplexer()
+    now = datetime.now(UTC)
+
+    async with multiplexer.subscribe(QUERY, 1, None, connect) as first:
+        async with multiplexer.subscribe(QUERY, 1, None, connect) as second:
+            assert len(connect.calls) == 1
+
+            fake_ws.push((now, "hello"))
+            first_entry = LogEntry.model_validate_json(await first.next_entry(timeout=1))
+            second_entry = LogEntry.model_validate_json(await second.next_entry(timeout=1))
+
+            assert first_entry.message == second_entry.message == "hello"
+        assert not fake_ws.closed
+
+    assert fake_ws.closed
+
+
+async def test_different_delay_opens_separate_upstream(connect) -> None:
+    multiplexer = LokiTailMultiplexer()
+
+    async with multiplexer.subscribe(QUERY, 1, None, connect):
+        async with multiplexer.subscribe(QUERY, 5, None, connect):
+            assert len(connect.calls) == 2
+
+
+async def test_entries_serialized_once_per_entry(fake_ws: FakeTailWebSocket, connect) -> None:
+    multiplexer = LokiTailMultiplexer()
+
+    with patch.object(LogEntry, "model_dump_json", autospec=True, side_effect=lambda self: "{}") as dump:
+        async with multiplexer.subscribe(QUERY, 1, None, connect) as first:
+            async with multiplexer.subscribe(QUERY, 1, None, connect) as second:
+                fake_ws.push((datetime.now(UTC), "hello"))
+                await first.next_entry(timeout=1)
+                await second.next_entry(timeout=1)
+
+    assert dump.call_count == 1
+
+
+async def test_late_subscriber_receives_replay_after_start_time(fake_ws: FakeTailWebSocket, connect) -> None:
+    multiplexer = LokiTailMultiplexer()
+    now = datetime.now(UTC)
+
+    async with multiplexer.subscribe(QUERY, 1, None, connect) as first:
+        fake_ws.push((now - timedelta(hours=2), "old"), (now, "new"))
+        await first.next_entry(timeout=1)
+        await first.next_entry(timeout=1)
+
+        async with multiplexer.subscribe(QUERY, 1, now - timedelta(hours=1), connect) as late:
+            entry = LogEntry.model_validate_json(await late.next_entry(timeout=1))
+            assert entry.message == "new"
+            with pytest.raises(TimeoutError):
+                await late.next_entry(timeout=0.01)
+
+
+async def test_slow_subscriber_drops_oldest_entries() -> None:
+    subscription = TailSubscription(start_time=None, buffer_size=2)
+    now = datetime.now(UTC)
+
+    for payload in ["a", "b", "c"]:
+        subscription.publish(now, payload)
+
+    assert subscription.dropped == 1
+    assert await subscription.next_entry(timeout=1) == "b"
+    assert await subscription.next_entry(timeout=1) == "c"
+
+
+async def test_upstream_failure_is_raised_to_subscribers(fake_ws: FakeTailWebSocket, connect) -> None:
+    multiplexer = LokiTailMultiplexer()
+
+    async with multiplexer.subscribe(QUERY, 1, None, connect) as subscription:
+        fake_ws.messages.put_nowait(websockets.ConnectionClosed(None, None))
+        with pytest.raises(websockets.WebSocketException):
+            await subscription.next_entry(timeout=1)
+
+    # A failed tail is replaced on the next subscription
+    async with multiplexer.subscribe(QUERY, 1, None, connect):
+        assert len(connect.calls) == 2
+
+
+async def test_slow_connect_does_not_block_other_queries(fake_ws: FakeTailWebSocket) -> None:
+    multiplexer = LokiTailMultiplexer()
+    handshake = asyncio.Event()
+
+    async def hanging_connect():
+        await handshake.wait()
+        return FakeTailWebSocket()
+
+    async def fast_connect():
+        return fake_ws
+
+    async def subscribe_hanging():
+        async with multiplexer.subscribe(QUERY, 5, None, hanging_connect):
+            pass
+
+    hanging = asyncio.create_task(subscribe_hanging())
+    await asyncio.sleep(0)
+
+    async with asyncio.timeout(1):
+        async with multiplexer.subscribe(QUERY, 1, None, fast_connect):
+            pass
+
+    handshake.set()
+    await hanging
+
+
+async def test_concurrent_subscribers_wait_for_one_connect(fake_ws: FakeTailWebSocket, connect) -> None:
+    multiplexer = LokiTailMultiplexer()
+    handshake = asyncio.Event()
+
+    async def slow_connect():
+        await handshake.wait()
+        return await connect()
+
+    async def subscribe(entered: asyncio.Event, leave: asyncio.Event):
+        async with multiplexer.subscribe(QUERY, 1, None, slow_connect):
+            entered.set()
+            await leave.wait()
+
+    leave = asyncio.Event()
+    entered = [asyncio.Event() for _ in range(3)]
+    tasks = [asyncio.create_task(subscribe(event, leave)) for event in entered]
+    await asyncio.sleep(0)
+    handshake.set()
+    async with asyncio.timeout(1):
+        for event in entered:
+            await event.wait()
+
+    assert len(connect.calls) == 1
+
+    leave.set()
+    await asyncio.gather(*tasks)
+    assert fake_ws.closed
@@ -0,0 +1,161 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for batched S3 prefix deletion."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from minio.deleteobjects import DeleteError
+from minio.error import S3Error
+
+from api_common.exceptions import ExternalServiceError, NotFoundException, ValidationException
+from app.minio import MinioClient
+from app.minio.deletion import PrefixDeletionProgress, delete_prefix, start_background_deletion
+
+
+def _client(object_names: list[str]) -> MagicMock:
+    client = MagicMock(spec=MinioClient)
+    client.list_object_names.side_effect = lambda bucket_name, prefix: iter(object_names)
+    client.delete_object_batch.return_value = []
+    return client
+
+
+@pytest.mark.asyncio
+async def test_delete_prefix_deletes_in_batches() -> None:
+    """Test the listed objects are deleted in batches of the configured size, with progress reported."""
+    names = [f"models/test/{i}" for i in range(7)]
+    client = _client(names)
+    progress = PrefixDeletionProgress(bucket_name="test-bucket", prefix="models/test")
+
+    result = await delete_prefix(client, "test-bucket", "models/test", batch_size=3, progress=progress)
+
+    assert result is progress
+    assert (progress.listed, progress.deleted, progress.done) == (7, 7, True)
+    client.list_object_names.assert_called_once_with("test-bucket", "models/test/")
+    batches = [call.args[1] for call in client.delete_object_batch.call_args_list]
+    assert sorted(name for batch in batches for name in batch) == sorted(names)
+    assert sorted(len(batch) for batch in batches) == [1, 3, 3]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefix", ["", "/", "//"])
+async def test_delete_prefix_refuses_empty_prefix(prefix: str) -> None:
+    """Test an empty prefix, which would match every object of the bucket, is refused before listing."""
+    client = _client(["models/test/0"])
+
+    with pytest.raises(ValidationException, match="empty prefix"):
+        await delete_prefix(client, "test-bucket", prefix)
+
+    client.list_object_names.assert_not_called()
+    client.delete_object_batch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delete_prefix_deletes_only_the_directory() -> None:
+    """Test the prefix is normalised to a directory, so sibling objects sharing its name are not listed."""
+    client = _client([])
+
+    progress = await delete_prefix(client, "test-bucket", "models/test/")
+
+    client.list_object_names.assert_called_once_with("test-bucket", "models/test/")
+    assert progress.prefix == "models/test/"
+
+
+@pytest.mark.asyncio
+async def test_delete_prefix_completes_batches_in_flight_on_failure() -> None:
+    """Test a failed request stops new batches, while the batches already in flight complete."""
+    started = threading.Event()
+
+    def delete_object_batch(bucket_name: str, names: list[str]) -> list[DeleteError]:
+        if names == ["models/test/0"]:
+            started.wait(timeout=1)
+            time.sleep(0.02)
+            return []
+        started.set()
+        raise S3Error("InternalError", "boom", "", "", "", MagicMock())
+
+    client = _client([f"models/test/{i}" for i in range(10)])
+    client.delete_object_batch.side_effect = delete_object_batch
+    progress = PrefixDeletionProgress(bucket_name="test-bucket", prefix="models/test")
+
+    with pytest.raises(S3Error):
+        await delete_prefix(client, "test-bucket", "models/test", batch_size=1, concurrency=2, progress=progress)
+
+    assert progress.deleted == 1
+    assert progress.listed < 10
+
+
+@pytest.mark.asyncio
+async def test_delete_prefix_bounds_batches_in_flight() -> None:
+    """Test batches are deleted concurrently, with at most the configured number of requests in flight."""
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def delete_object_batch(bucket_name: str, names: list[str]) -> list[DeleteError]:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return []
+
+    client = _client([f"models/test/{i}" for i in range(10)])
+    client.delete_object_batch.side_effect = delete_object_batch
+
+    progress = await delete_prefix(client, "test-bucket", "models/test", batch_size=1, concurrency=3)
+
+    assert progress.deleted == 10
+    assert 1 < max_in_flight <= 3
+
+
+@pytest.mark.asyncio
+async def test_delete_prefix_raises_for_objects_not_deleted() -> None:
+    """Test per-object errors are collected and raised once all batches ran."""
+    client = _client([f"models/test/{i}" for i in range(4)])
+    client.delete_object_batch.side_effect = [
+        [DeleteError("AccessDenied", "Access Denied", "models/test/1", None)],
+        [],
+    ]
+    progress = PrefixDeletionProgress(bucket_name="test-bucket", prefix="models/test")
+
+    with pytest.raises(ExternalServiceError, match="Failed to delete some objects"):
+        await delete_prefix(client, "test-bucket", "models/test", batch_size=2, progress=progress)
+
+    assert progress.deleted == 3
+    assert progress.errors == ["Error deleting models/test/1: Access Denied"]
+
+
+@pytest.mark.asyncio
+async def test_delete_prefix_stops_when_a_request_fails() -> None:
+    """Test a failed DeleteObjects request stops the deletion and is raised."""
+    client = _client([f"models/test/{i}" for i in range(10)])
+    client.delete_object_batch.side_effect = S3Error("InternalError", "boom", "", "", "", MagicMock())
+    progress = PrefixDeletionProgress(bucket_name="test-bucket", prefix="models/test")
+
+    with pytest.raises(S3Error):
+        await delete_prefix(client, "test-bucket", "models/test", batch_size=1, concurrency=1, progress=progress)
+
+    assert progress.deleted == 0
+    assert progress.listed < 10
+    assert not progress.done
+
+
+@pytest.mark.asyncio
+async def test_start_background_deletion_logs_failures() -> None:
+    """Test background deletions run after the caller returned and do not raise."""
+
+    async def deletion() -> None:
+        raise NotFoundException("Nothing found")
+
+    task = start_background_deletion(deletion(), "weights of model test")
+    await asyncio.wait_for(task, timeout=1)
+
+    assert task.exception() is None
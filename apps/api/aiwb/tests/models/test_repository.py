@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
+from datetime import timedelta
 from uuid import UUID, uuid4
 
 import pytest
@@ -154,7 +155,7 @@ async def test_update_onboarding_statuses(db_session: AsyncSession, test_namespa
         db_session, namespace=test_namespace, status=WorkloadStatus.FAILED, model_id=model2.id
     )
 
-    await update_onboarding_statuses(db_session, test_namespace)
+    assert await update_onboarding_statuses(db_session) == 2
 
     await db_session.refresh(model1)
     await db_session.refresh(model2)
@@ -175,7 +176,7 @@ async def test_update_onboarding_statuses_no_workloads_marks_failed(
         db_session, namespace=test_namespace, name="Model 2", onboarding_status=OnboardingStatus.pending
     )
 
-    await update_onboarding_statuses(db_session, test_namespace)
+    await update_onboarding_statuses(db_session)
 
     await db_session.refresh(model1)
     await db_session.refresh(model2)
@@ -446,7 +447,7 @@ async def test_update_onboarding_statuses_with_completed_workload(
         model_id=model.id,
     )
 
-    await update_onboarding_statuses(db_session, test_namespace)
+    await update_onboarding_statuses(db_session)
 
     await db_session.refresh(model)
     assert model.onboarding_status == OnboardingStatus.ready
@@ -466,7 +467,7 @@ async def test_update_onboarding_statuses_with_failed_workload(db_session: Async
         model_id=model.id,
     )
 
-    await update_onboarding_statuses(db_session, test_namespace)
+    await update_onboarding_statuses(db_session)
 
     await db_session.refresh(model)
     assert model.onboarding_status == OnboardingStatus.failed
@@ -480,5 +481,65 @@ async def test_update_onboarding_statuses_no_pending_models(db_session: AsyncSes
         db_session, namespace=test_namespace, name="Ready Model", onboarding_status=OnboardingStatus.ready
     )
 
-    # This should complete without errors
-    await update_onboarding_statuses(db_session, test_namespace)
+    assert await update_onboarding_statuses(db_session) == 0
+
+
+@pytest.mark.asyncio
+async def test_update_onboarding_statuses_keeps_models_with_running_workload_pending(
+    db_session: AsyncSession, test_namespace: str
+) -> None:
+    """Test update_onboarding_statuses leaves models pending while their workload is in progress."""
+    model = await factory.create_inference_model(
+        db_session, namespace=test_namespace, name="Model 1", onboarding_status=OnboardingStatus.pending
+    )
+    await factory.create_workload(
+        db_session, namespace=test_namespace, status=WorkloadStatus.RUNNING, model_id=model.id
+    )
+
+    assert await update_onboarding_statuses(db_session) == 0
+
+    await db_session.refresh(model)
+    assert model.onboarding_status == OnboardingStatus.pending
+
+
+@pytest.mark.asyncio
+async def test_update_onboarding_statuses_uses_latest_workload(db_session: AsyncSession, test_namespace: str) -> None:
+    """Test update_onboarding_statuses derives the status from the most recently created workload of a model."""
+    model = await factory.create_inference_model(
+        db_session, namespace=test_namespace, name="Model 1", onboarding_status=OnboardingStatus.pending
+    )
+    failed = await factory.create_workload(
+        db_session, namespace=test_namespace, status=WorkloadStatus.FAILED, model_id=model.id
+    )
+    complete = await factory.create_workload(
+        db_session, namespace=test_namespace, status=WorkloadStatus.COMPLETE, model_id=model.id
+    )
+    failed.created_at = complete.created_at - timedelta(minutes=5)
+    await db_session.flush()
+
+    await update_onboarding_statuses(db_session)
+
+    await db_session.refresh(model)
+    assert model.onboarding_status == OnboardingStatus.ready
+    assert model.updated_by == "system"
+
+
+@pytest.mark.asyncio
+async def test_update_onboarding_statuses_across_namespaces(db_session: AsyncSession) -> None:
+    """Test update_onboarding_statuses updates pending models in every namespace at once."""
+    models = [
+        await factory.create_inference_model(
+            db_session, namespace=namespace, name="Model", onboarding_status=OnboardingStatus.pending
+        )
+        for namespace in ("namespace-a", "namespace-b")
+    ]
+    for model in models:
+        await factory.create_workload(
+            db_session, namespace=model.namespace, status=WorkloadStatus.COMPLETE, model_id=model.id
+        )
+
+    assert await update_onboarding_statuses(db_session) == 2
+
+    for model in models:
+        await db_session.refresh(model)
+        assert model.onboarding_status == OnboardingStatus.ready
@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -14,7 +15,7 @@ from app.dispatch.crds import K8sMetadata
 from app.dispatch.kube_client import KubernetesClient
 from app.minio.client import MinioClient
 from app.models.models import OnboardingStatus
-from app.models.repository import insert_model, select_model, update_onboarding_statuses
+from app.models.repository import insert_model, select_model
 from app.models.schemas import FinetuneCreate, ModelDeployRequest
 from app.models.service import (
     delete_model,
@@ -36,9 +37,7 @@ async def test_get_model_success(db_session: AsyncSession, test_namespace: str)
     """Test successfully getting a model by ID."""
     model = await factory.create_inference_model(db_session, namespace=test_namespace)
 
-    with patch("app.models.service.update_onboarding_statuses", wraps=update_onboarding_statuses) as spy:
-        result = await get_model(db_session, model.id, test_namespace)
-        spy.assert_called_once()
+    result = await get_model(db_session, model.id, test_namespace)
 
     assert result is not None
     assert result.id == model.id
@@ -61,9 +60,7 @@ async def test_list_models_success(db_session: AsyncSession, test_namespace: str
     await factory.create_inference_model(db_session, namespace=test_namespace, name="Model 1")
     await factory.create_inference_model(db_session, namespace=test_namespace, name="Model 2")
 
-    with patch("app.models.service.update_onboarding_statuses", wraps=update_onboarding_statuses) as spy:
-        result = await list_models(db_session, namespace=test_namespace)
-        spy.assert_called_once()
+    result = await list_models(db_session, namespace=test_namespace)
 
     assert len(result) == 2
     names = {m.name for m in result}
@@ -71,6 +68,22 @@ async def test_list_models_success(db_session: AsyncSession, test_namespace: str
     assert "Model 2" in names
 
 
+@pytest.mark.asyncio
+async def test_list_models_does_not_update_onboarding_status(db_session: AsyncSession, test_namespace: str) -> None:
+    """Test listing models only reads, leaving onboarding status updates to the workload syncer."""
+    model = await factory.create_inference_model(
+        db_session, namespace=test_namespace, name="Pending Model", onboarding_status=OnboardingStatus.pending
+    )
+    await factory.create_workload(
+        db_session, namespace=test_namespace, status=WorkloadStatus.COMPLETE, model_id=model.id
+    )
+
+    result = await list_models(db_session, namespace=test_namespace)
+
+    assert [m.onboarding_status for m in result] == [OnboardingStatus.pending]
+    assert not db_session.dirty
+
+
 @pytest.mark.asyncio
 async def test_list_models_with_status_filter(db_session: AsyncSession, test_namespace: str) -> None:
     """Test listing models with onboarding status filter."""
@@ -105,11 +118,11 @@ async def test_delete_model_success(db_session: AsyncSession, test_namespace: st
 
     with (
         patch("app.models.service.delete_from_s3", return_value=None) as mock_delete_s3,
-        patch("app.models.service.update_onboarding_statuses", wraps=update_onboarding_statuses) as spy,
+        patch("app.models.service.start_background_deletion") as mock_start_background_deletion,
     ):
         await delete_model(db_session, model_id, test_namespace, mock_minio_client)
         mock_delete_s3.assert_called_once()
-        spy.assert_called_once()
+        mock_start_background_deletion.assert_called_once_with(None, f"weights of model {model_id}")
 
 
 @pytest.mark.asyncio
@@ -202,10 +215,11 @@ async def test_delete_model_with_s3_not_found(db_session: AsyncSession, test_nam
 
     mock_minio_client = MagicMock(spec=MinioClient)
 
-    # Mock S3 deletion to raise NotFoundException
-    with patch("app.models.service.delete_from_s3", side_effect=NotFoundException("S3 object not found")):
+    # Mock S3 deletion to raise NotFoundException in the background
+    with patch("app.models.service.delete_from_s3", AsyncMock(side_effect=NotFoundException("S3 object not found"))):
         # Should not raise - just log warning
         await delete_model(db_session, model_id, test_namespace, mock_minio_client)
+        await asyncio.sleep(0)
 
     # Verify model was still deleted from database
     deleted_model = await select_model(db_session, model_id, test_namespace)
@@ -322,7 +336,6 @@ async def test_run_finetune_model_workload_with_uuid(
         patch("app.models.service.get_workloads", return_value=[]),
         patch("app.models.service.render_helm_template", return_value="mock-manifest"),
         patch("app.models.service.apply_manifest", new_callable=AsyncMock) as mock_apply,
-        patch("app.models.service.update_onboarding_statuses", wraps=update_onboarding_statuses) as spy,
     ):
         result = await run_finetune_model_workload(
             session=db_session,
@@ -334,7 +347,6 @@ async def test_run_finetune_model_workload_with_uuid(
         )
 
         mock_apply.assert_called_once()
-        spy.assert_called_once()
 
         assert result.name == "Finetuned Model"
         assert result.canonical_name == "meta-llama/Llama-3.1-8B"
@@ -721,7 +733,6 @@ async def test_run_model_deployment_success(db_session: AsyncSession, test_names
         patch("app.models.service.list_overlays", return_value=[mock_overlay]),
         patch("app.models.service.render_helm_template", return_value="mock-manifest"),
         patch("app.models.service.apply_manifest", new_callable=AsyncMock) as mock_apply,
-        patch("app.models.service.update_onboarding_statuses", wraps=update_onboarding_statuses) as spy,
     ):
         result = await run_model_deployment(
             session=db_session,
@@ -732,7 +743,6 @@ async def test_run_model_deployment_success(db_session: AsyncSession, test_names
         )
 
         mock_apply.assert_called_once()
-        spy.assert_called_once()
 
         assert result.name == "Ready Model"
         assert result.id == model.id
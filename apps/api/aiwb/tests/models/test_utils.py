@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -68,23 +68,17 @@ async def test_delete_from_s3_success() -> None:
         updated_by="test@example.com",
     )
 
-    # Mock MinIO client
     mock_minio_client = MagicMock(spec=MinioClient)
-    mock_minio_client.delete_objects = MagicMock(spec=[], return_value=None)
 
-    # Mock asyncio.to_thread to call delete_objects synchronously
     with (
-        patch("asyncio.to_thread", side_effect=lambda fn, **kwargs: fn(**kwargs)),
+        patch("app.models.utils.delete_prefix", new_callable=AsyncMock) as mock_delete_prefix,
         patch("app.models.utils.MINIO_BUCKET", "test-bucket"),
     ):
-        # Call delete_from_s3
         await delete_from_s3(model, mock_minio_client)
 
-    # Verify delete_objects was called with correct parameters
-    mock_minio_client.delete_objects.assert_called_once()
-    call_args = mock_minio_client.delete_objects.call_args
-    assert call_args[1]["bucket_name"] == "test-bucket"
-    assert call_args[1]["prefix"] == "test-namespace/models/test-model/weights.bin"
+    mock_delete_prefix.assert_awaited_once_with(
+        mock_minio_client, "test-bucket", "test-namespace/models/test-model/weights.bin"
+    )
 
 
 @pytest.mark.asyncio
@@ -102,15 +96,30 @@ async def test_delete_from_s3_handles_not_found_gracefully() -> None:
         updated_by="test@example.com",
     )
 
-    # Mock MinIO client to raise NotFoundException
     mock_minio_client = MagicMock(spec=MinioClient)
-    mock_minio_client.delete_objects = MagicMock(spec=[], side_effect=NotFoundException("S3 object not found"))
-
-    # Mock asyncio.to_thread to call delete_objects synchronously
-    async def async_to_thread(fn, **kwargs):
-        return fn(**kwargs)
 
-    with patch("asyncio.to_thread", side_effect=async_to_thread):
+    with patch("app.models.utils.delete_prefix", AsyncMock(side_effect=NotFoundException("S3 object not found"))):
         # Call delete_from_s3 - should propagate NotFoundException
         with pytest.raises(NotFoundException, match="S3 object not found"):
             await delete_from_s3(model, mock_minio_client)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("model_weights_path", [None, ""])
+async def test_delete_from_s3_skips_models_without_weights_path(model_weights_path: str | None) -> None:
+    """Test a model without weights path never deletes from the bucket."""
+    model = InferenceModel(
+        id=uuid4(),
+        name="Test Model",
+        namespace="test-namespace",
+        canonical_name="test/model",
+        model_weights_path=model_weights_path,
+        onboarding_status=OnboardingStatus.pending,
+        created_by="test@example.com",
+        updated_by="test@example.com",
+    )
+
+    with patch("app.models.utils.delete_prefix", new_callable=AsyncMock) as mock_delete_prefix:
+        await delete_from_s3(model, MagicMock(spec=MinioClient))
+
+    mock_delete_prefix.assert_not_awaited()
@@ -0,0 +1,13 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from api_common.collections import SnapshotCache
+
+
+@pytest.fixture(autouse=True)
+def disable_metrics_snapshots(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Compute namespace metrics for every request, so that results never leak between tests."""
+    monkeypatch.setattr("app.namespaces.service._metrics_snapshots", SnapshotCache(ttl_seconds=0))
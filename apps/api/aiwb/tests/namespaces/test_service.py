@@ -12,7 +12,7 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api_common.collections import SortDirection
+from api_common.collections import SnapshotCache, SortDirection
 from app.aims.crds import AIMServiceResource, AIMServiceSpec, AIMServiceStatusFields
 from app.aims.enums import AIMServiceStatus
 from app.dispatch.crds import K8sMetadata
@@ -321,6 +321,75 @@ async def test_get_namespace_workload_metrics_paginated_pagination(
         assert result3.page == 3
 
 
+@pytest.mark.asyncio
+async def test_get_namespace_workload_metrics_paginated_reuses_snapshot(
+    mock_kube_client: MagicMock,
+    mock_db_session: AsyncMock,
+    mock_prometheus_client: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the following pages and sort orders are cut from the snapshot of the first request."""
+    monkeypatch.setattr("app.namespaces.service._metrics_snapshots", SnapshotCache(ttl_seconds=60))
+    namespace = MagicMock()
+    namespace.name = "test-namespace"
+
+    workloads = []
+    for i in range(5):
+        workload = MagicMock()
+        workload.id = uuid4()
+        workload.name = f"workload-{i}"
+        workload.display_name = f"Workload {i}"
+        workload.type = WorkloadType.INFERENCE
+        workload.status = WorkloadStatus.RUNNING
+        workload.manifest = DEFAULT_TEST_MANIFEST
+        workload.created_at = datetime(2025, 1, 1 + i, tzinfo=UTC)
+        workload.created_by = "test-user"
+        workloads.append(workload)
+
+    with (
+        patch("app.namespaces.service.list_aim_services", new_callable=AsyncMock) as mock_list_aims,
+        patch("app.namespaces.service.get_workloads", new_callable=AsyncMock) as mock_get_workloads,
+        patch(
+            "app.namespaces.service.get_gpu_utilization_by_workload_in_namespace", new_callable=AsyncMock
+        ) as mock_gpu,
+        patch("app.namespaces.service.get_gpu_vram_by_workload_in_namespace", new_callable=AsyncMock) as mock_vram,
+    ):
+        mock_list_aims.return_value = []
+        mock_get_workloads.return_value = workloads
+        mock_gpu.return_value = {}
+        mock_vram.return_value = {}
+
+        pages = [
+            await get_namespace_workload_metrics_paginated(
+                kube_client=mock_kube_client,
+                session=mock_db_session,
+                namespace=namespace,
+                prometheus_client=mock_prometheus_client,
+                page=page,
+                page_size=2,
+                sort_by="created_at",
+                sort_order=sort_order,
+            )
+            for page, sort_order in [(1, SortDirection.desc), (2, SortDirection.desc), (1, SortDirection.asc)]
+        ]
+
+        mock_get_workloads.assert_called_once()
+        assert [item.name for item in pages[0].data] == ["workload-4", "workload-3"]
+        assert [item.name for item in pages[1].data] == ["workload-2", "workload-1"]
+        assert [item.name for item in pages[2].data] == ["workload-0", "workload-1"]
+        assert all(page.total == 5 and page.total_pages == 3 for page in pages)
+
+        await get_namespace_workload_metrics_paginated(
+            kube_client=mock_kube_client,
+            session=mock_db_session,
+            namespace=namespace,
+            prometheus_client=mock_prometheus_client,
+            status_filter=[WorkloadStatus.RUNNING],
+        )
+
+        assert mock_get_workloads.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_get_namespace_workload_metrics_paginated_empty_namespace(
     mock_kube_client: MagicMock,
@@ -14,6 +14,7 @@ def mock_kube_api_client() -> MagicMock:
     """Create a mock Kubernetes API client with async methods."""
     mock_client = MagicMock()
     # Make core_v1 methods async
+    mock_client.list_namespaced_secret_metadata = AsyncMock()
     mock_client.core_v1.list_namespaced_secret = AsyncMock()
     mock_client.core_v1.read_namespaced_secret = AsyncMock()
     mock_client.core_v1.create_namespaced_secret = AsyncMock()
@@ -41,7 +41,7 @@ async def test_list_kubernetes_secrets(mock_kube_api_client: MagicMock) -> None:
     mock_list_response.items = [mock_secret_1, mock_secret_2]
 
     # Set the async return value
-    mock_kube_api_client.core_v1.list_namespaced_secret.return_value = mock_list_response
+    mock_kube_api_client.list_namespaced_secret_metadata.return_value = mock_list_response
 
     result = await list_kubernetes_secrets(
         kube_client=mock_kube_api_client,
@@ -49,9 +49,8 @@ async def test_list_kubernetes_secrets(mock_kube_api_client: MagicMock) -> None:
     )
 
     # Verify the K8s API was called correctly
-    mock_kube_api_client.core_v1.list_namespaced_secret.assert_awaited_once_with(
-        namespace="test-ns",
-    )
+    mock_kube_api_client.list_namespaced_secret_metadata.assert_awaited_once_with("test-ns")
+    mock_kube_api_client.core_v1.list_namespaced_secret.assert_not_awaited()
 
     # Verify results
     assert len(result) == 2
@@ -65,7 +64,7 @@ async def test_list_kubernetes_secrets_empty_namespace(mock_kube_api_client: Mag
     mock_list_response = MagicMock()
     mock_list_response.items = []
 
-    mock_kube_api_client.core_v1.list_namespaced_secret.return_value = mock_list_response
+    mock_kube_api_client.list_namespaced_secret_metadata.return_value = mock_list_response
 
     result = await list_kubernetes_secrets(
         kube_client=mock_kube_api_client,
@@ -79,7 +78,7 @@ async def test_list_kubernetes_secrets_empty_namespace(mock_kube_api_client: Mag
 async def test_list_kubernetes_secrets_api_error(mock_kube_api_client: MagicMock) -> None:
     """Test listing Kubernetes Secrets with API error."""
     # Simulate API error
-    mock_kube_api_client.core_v1.list_namespaced_secret.side_effect = ApiException(status=500)
+    mock_kube_api_client.list_namespaced_secret_metadata.side_effect = ApiException(status=500)
 
     result = await list_kubernetes_secrets(
         kube_client=mock_kube_api_client,
@@ -114,7 +113,7 @@ async def test_list_kubernetes_secrets_invalid_item_skipped(mock_kube_api_client
     mock_list_response = MagicMock()
     mock_list_response.items = [valid_secret, invalid_secret]
 
-    mock_kube_api_client.core_v1.list_namespaced_secret.return_value = mock_list_response
+    mock_kube_api_client.list_namespaced_secret_metadata.return_value = mock_list_response
 
     result = await list_kubernetes_secrets(
         kube_client=mock_kube_api_client,
@@ -140,7 +139,7 @@ async def test_list_kubernetes_secrets_with_none_labels_and_annotations(mock_kub
     mock_list_response = MagicMock()
     mock_list_response.items = [mock_secret]
 
-    mock_kube_api_client.core_v1.list_namespaced_secret.return_value = mock_list_response
+    mock_kube_api_client.list_namespaced_secret_metadata.return_value = mock_list_response
 
     result = await list_kubernetes_secrets(
         kube_client=mock_kube_api_client,
@@ -7,7 +7,7 @@ from uuid import uuid4
 
 from app.workloads.enums import WorkloadType
 from app.workloads.models import Workload
-from app.workloads.utils import apply_manifest, get_dynamic_client
+from app.workloads.utils import apply_manifest
 
 
 async def apply_test_manifest(manifest: str) -> tuple[list[dict], MagicMock]:
@@ -24,7 +24,7 @@ async def apply_test_manifest(manifest: str) -> tuple[list[dict], MagicMock]:
     dyn_client = MagicMock()
     dyn_client.resources.get.return_value = api_resource
 
-    with patch("app.workloads.utils.get_dynamic_client", spec=get_dynamic_client, return_value=dyn_client):
+    with patch("app.workloads.utils.resolve_resource", side_effect=dyn_client.resources.get):
         await apply_manifest(AsyncMock(), manifest, workload, "test-namespace", "test@example.com")
 
     bodies = [c.kwargs["body"] for c in api_resource.create.call_args_list]
@@ -0,0 +1,124 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for the deletion of workload resources from Kubernetes."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.client import ApiException
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+
+from app.workloads.constants import WORKLOAD_ID_LABEL, WORKLOAD_RESOURCES
+from app.workloads.enums import DeletionPropagationPolicy
+from app.workloads.gateway import delete_workload_resources, delete_workloads_resources
+
+
+def _resolver(resources: dict[str, MagicMock]):
+    async def resolve_resource(api_version: str, kind: str) -> MagicMock:
+        return resources.setdefault(kind, MagicMock())
+
+    return resolve_resource
+
+
+@pytest.mark.asyncio
+async def test_delete_workload_resources_deletes_each_kind() -> None:
+    """Test every workload resource kind is deleted by label selector with the propagation policy."""
+    resources: dict[str, MagicMock] = {}
+
+    with patch("app.workloads.gateway.resolve_resource", side_effect=_resolver(resources)):
+        await delete_workload_resources("test-ns", "abc", DeletionPropagationPolicy.FOREGROUND)
+
+    assert set(resources) == {resource.kind for resource in WORKLOAD_RESOURCES}
+    for resource in resources.values():
+        resource.delete.assert_called_once_with(
+            namespace="test-ns",
+            label_selector=f"{WORKLOAD_ID_LABEL} in (abc)",
+            propagation_policy=DeletionPropagationPolicy.FOREGROUND,
+        )
+
+
+@pytest.mark.asyncio
+async def test_delete_workloads_resources_bounds_calls_in_flight() -> None:
+    """Test the delete-collection calls run concurrently, at most WORKLOAD_DELETION_CONCURRENCY at once."""
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def delete(**kwargs) -> None:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+
+    resources: dict[str, MagicMock] = {resource.kind: MagicMock() for resource in WORKLOAD_RESOURCES}
+    for resource in resources.values():
+        resource.delete.side_effect = delete
+
+    with (
+        patch("app.workloads.gateway.resolve_resource", side_effect=_resolver(resources)),
+        patch("app.workloads.gateway.WORKLOAD_DELETION_CONCURRENCY", 3),
+    ):
+        await delete_workloads_resources("test-ns", ["a", "b"])
+
+    assert 1 < max_in_flight <= 3
+
+
+@pytest.mark.asyncio
+async def test_delete_workloads_resources_splits_long_selectors() -> None:
+    """Test many workloads are deleted with several set-based selectors of bounded length."""
+    resources: dict[str, MagicMock] = {}
+    workload_ids = [f"id-{i}" for i in range(5)]
+
+    with (
+        patch("app.workloads.gateway.resolve_resource", side_effect=_resolver(resources)),
+        patch("app.workloads.gateway.MAX_WORKLOAD_IDS_PER_SELECTOR", 2),
+    ):
+        await delete_workloads_resources("test-ns", workload_ids)
+
+    selectors = sorted(call.kwargs["label_selector"] for call in resources["ConfigMap"].delete.call_args_list)
+    assert selectors == [
+        f"{WORKLOAD_ID_LABEL} in (id-0,id-1)",
+        f"{WORKLOAD_ID_LABEL} in (id-2,id-3)",
+        f"{WORKLOAD_ID_LABEL} in (id-4)",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_delete_workloads_resources_ignores_missing_kinds() -> None:
+    """Test kinds answered with 404 or not served by the cluster are skipped."""
+    resources: dict[str, MagicMock] = {resource.kind: MagicMock() for resource in WORKLOAD_RESOURCES}
+    resources["CronJob"].delete.side_effect = ApiException(status=404, reason="Not Found")
+    resolve = _resolver(resources)
+
+    async def resolve_resource(api_version: str, kind: str) -> MagicMock:
+        if kind == "HTTPRoute":
+            raise ResourceNotFoundError("No matches found")
+        return await resolve(api_version=api_version, kind=kind)
+
+    with patch("app.workloads.gateway.resolve_resource", side_effect=resolve_resource):
+        await delete_workloads_resources("test-ns", ["abc"])
+
+    resources["Deployment"].delete.assert_called_once()
+    resources["HTTPRoute"].delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delete_workloads_resources_raises_after_all_kinds() -> None:
+    """Test a failed deletion raises RuntimeError once the other kinds were deleted."""
+    resources: dict[str, MagicMock] = {resource.kind: MagicMock() for resource in WORKLOAD_RESOURCES}
+    resources["Deployment"].delete.side_effect = ApiException(status=403, reason="Forbidden")
+
+    with patch("app.workloads.gateway.resolve_resource", side_effect=_resolver(resources)):
+        with pytest.raises(RuntimeError, match="Failed to delete Kubernetes resources for 2 workloads"):
+            await delete_workloads_resources("test-ns", ["a", "b"])
+
+    for kind, resource in resources.items():
+        if kind != "Deployment":
+            resource.delete.assert_called_once()
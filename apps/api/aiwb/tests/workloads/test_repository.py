@@ -8,6 +8,7 @@ import pytest
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.workloads.constants import WORKSPACE_POOL_SUBMITTER
 from app.workloads.enums import WorkloadStatus, WorkloadType
 from app.workloads.repository import (
     create_workload,
@@ -163,6 +164,17 @@ async def test_get_workloads_by_namespace(db_session: AsyncSession) -> None:
     assert all(w.namespace == "namespace-a" for w in workloads)
 
 
+@pytest.mark.asyncio
+async def test_get_workloads_exclude_submitter(db_session: AsyncSession) -> None:
+    """Test listing workloads without those of a submitter, such as the idle workspaces of the warm pool."""
+    await factory.create_workload(db_session, namespace="namespace-a", submitter="user@example.com")
+    await factory.create_workload(db_session, namespace="namespace-a", submitter=WORKSPACE_POOL_SUBMITTER)
+
+    workloads = await get_workloads(db_session, namespace="namespace-a", exclude_submitter=WORKSPACE_POOL_SUBMITTER)
+
+    assert [w.created_by for w in workloads] == ["user@example.com"]
+
+
 @pytest.mark.asyncio
 async def test_get_workloads_by_type(db_session: AsyncSession) -> None:
     """Test listing workloads filtered by type and namespace."""
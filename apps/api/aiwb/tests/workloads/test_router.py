@@ -15,6 +15,7 @@ from fastapi.testclient import TestClient
 from api_common.exceptions import NotFoundException, ValidationException
 from api_common.schemas import PaginationMetadataResponse
 from app import app  # type: ignore[attr-defined]
+from app.dispatch.schemas import ResourceEvent
 from app.logs.schemas import LogEntry, LogLevel, LogType, WorkloadLogsResponse
 from app.metrics.enums import MetricName
 from app.metrics.schemas import (
@@ -99,6 +100,33 @@ def test_get_workload_not_found(mock_get: AsyncMock) -> None:
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+@override_dependencies(SESSION_OVERRIDES)
+@patch("app.workloads.router.get_workload_events")
+@patch("app.workloads.router.get_workload_by_id")
+def test_get_workload_events(mock_get: AsyncMock, mock_get_events: AsyncMock) -> None:
+    """Test GET /v1/namespaces/{ns}/workloads/{id}/events returns the events of the workload."""
+    mock_get.return_value = MagicMock()
+    mock_get_events.return_value = [ResourceEvent(kind="Pod", name="my-pod", reason="Scheduled")]
+
+    with TestClient(app) as client:
+        response = client.get(f"/v1/namespaces/test-namespace/workloads/{uuid4()}/events")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"][0]["reason"] == "Scheduled"
+
+
+@override_dependencies(SESSION_OVERRIDES)
+@patch("app.workloads.router.get_workload_by_id")
+def test_get_workload_events_not_found(mock_get: AsyncMock) -> None:
+    """Test GET /v1/namespaces/{ns}/workloads/{id}/events returns 404 when not found."""
+    mock_get.return_value = None
+
+    with TestClient(app) as client:
+        response = client.get(f"/v1/namespaces/test-namespace/workloads/{uuid4()}/events")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 @override_dependencies(SESSION_OVERRIDES)
 @patch("app.workloads.router.delete_workload_components")
 @patch("app.workloads.router.get_workload_by_id")
@@ -456,6 +484,49 @@ def test_delete_workload_success(mock_get: AsyncMock, mock_delete: AsyncMock) ->
     mock_delete.assert_called_once()
 
 
+@override_dependencies(SESSION_OVERRIDES)
+@patch("app.workloads.router.delete_workloads_components")
+@patch("app.workloads.router.get_workloads_by_ids")
+def test_batch_delete_workloads(mock_get: AsyncMock, mock_delete: AsyncMock) -> None:
+    """Test POST /v1/namespaces/{ns}/workloads/delete deletes all workloads with the requested propagation."""
+    workloads = [
+        factory.make_workload_mock(workload_id=uuid4(), namespace="test-namespace", status=WorkloadStatus.RUNNING)
+        for _ in range(2)
+    ]
+    mock_get.return_value = workloads
+    mock_delete.return_value = None
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/v1/namespaces/test-namespace/workloads/delete?propagation_policy=Foreground",
+            json={"ids": [str(workload.id) for workload in workloads]},
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [str(workload.id) for workload in workloads]
+    mock_delete.assert_called_once()
+    assert mock_delete.call_args.args[1] == workloads
+    assert mock_delete.call_args.kwargs["propagation_policy"] == "Foreground"
+
+
+@override_dependencies(SESSION_OVERRIDES)
+@patch("app.workloads.router.delete_workloads_components")
+@patch("app.workloads.router.get_workloads_by_ids")
+def test_batch_delete_workloads_not_found(mock_get: AsyncMock, mock_delete: AsyncMock) -> None:
+    """Test POST /v1/namespaces/{ns}/workloads/delete returns 404 and deletes nothing if an ID is unknown."""
+    workload = factory.make_workload_mock(workload_id=uuid4(), namespace="test-namespace")
+    mock_get.return_value = [workload]
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/v1/namespaces/test-namespace/workloads/delete",
+            json={"ids": [str(workload.id), str(uuid4())]},
+        )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    mock_delete.assert_not_called()
+
+
 @override_dependencies(SESSION_OVERRIDES)
 @patch("app.workloads.router.delete_workload_components")
 @patch("app.workloads.router.get_workload_by_id")
@@ -809,11 +880,70 @@ def test_metrics_invalid_datetime_format() -> None:
 
 
 # =============================================================================
-
-# =============================================================================
-# GET /workloads/{id}/logs Tests
+# GET /workloads/{id}/logs/export Tests
 # =============================================================================
 
+
+@override_dependencies(SESSION_OVERRIDES)
+@patch("app.workloads.router.export_workload_logs")
+@patch("app.workloads.router.get_workload_by_id")
+def test_export_workload_logs(mock_get_workload: AsyncMock, mock_export_logs: MagicMock) -> None:
+    """Test GET /workloads/{id}/logs/export streams NDJSON."""
+    workload_id = uuid4()
+    mock_get_workload.return_value = MagicMock(id=workload_id)
+    log_entry = LogEntry(timestamp=datetime(2025, 1, 1, 10, 0, 0, tzinfo=UTC), level=LogLevel.INFO, message="line")
+
+    async def content():
+        yield f"{log_entry.model_dump_json()}\n".encode()
+
+    mock_export_logs.return_value = content()
+
+    with TestClient(app) as client:
+        response = client.get(
+            f"/v1/namespaces/test-namespace/workloads/{workload_id}/logs/export",
+            params={"start": "2025-01-01T00:00:00Z", "end": "2025-01-01T23:59:59Z", "level": "error"},
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert f"workload-{workload_id}-logs.ndjson" in response.headers["content-disposition"]
+    assert LogEntry.model_validate_json(response.text.splitlines()[0]).message == "line"
+    assert mock_export_logs.call_args.kwargs["level_filter"] == LogLevel.ERROR
+    assert mock_export_logs.call_args.kwargs["compress"] is False
+
+
+@override_dependencies(SESSION_OVERRIDES)
+@patch("app.workloads.router.get_workload_by_id")
+def test_export_workload_logs_not_found(mock_get_workload: AsyncMock) -> None:
+    """Test GET /workloads/{id}/logs/export returns 404 for unknown workloads."""
+    mock_get_workload.return_value = None
+
+    with TestClient(app) as client:
+        response = client.get(
+            f"/v1/namespaces/test-namespace/workloads/{uuid4()}/logs/export",
+            params={"start": "2025-01-01T00:00:00Z", "end": "2025-01-01T23:59:59Z"},
+        )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@override_dependencies(SESSION_OVERRIDES)
+@patch("app.workloads.router.get_workload_by_id")
+def test_export_workload_logs_invalid_time_range(mock_get_workload: AsyncMock) -> None:
+    """Test GET /workloads/{id}/logs/export returns 400 when start is not before end."""
+    workload_id = uuid4()
+    mock_get_workload.return_value = MagicMock(id=workload_id)
+
+    with TestClient(app) as client:
+        response = client.get(
+            f"/v1/namespaces/test-namespace/workloads/{workload_id}/logs/export",
+            params={"start": "2025-01-02T00:00:00Z", "end": "2025-01-01T00:00:00Z"},
+        )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Invalid time range" in response.json()["detail"]
+
+
 # =============================================================================
 # GET /workloads/{id}/logs Tests
 # =============================================================================
@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 from uuid import uuid4
 
 import httpx
@@ -12,10 +12,13 @@ from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api_common.exceptions import NotFoundException, ValidationException
-from app.workloads.enums import WorkloadStatus, WorkloadType
+from app.workloads.constants import WORKLOAD_ID_LABEL
+from app.workloads.enums import DeletionPropagationPolicy, WorkloadStatus, WorkloadType
 from app.workloads.service import (
     chat_with_workload,
     delete_workload_components,
+    delete_workloads_components,
+    get_workload_events,
     is_workload_chattable,
     list_chattable_workloads,
     stream_downstream,
@@ -34,7 +37,9 @@ async def test_delete_workload_components_success(db_session: AsyncSession) -> N
         await delete_workload_components("test-ns", workload.id, db_session)
 
         # Verify gateway was called
-        mock_delete.assert_called_once_with("test-ns", str(workload.id))
+        mock_delete.assert_called_once_with(
+            "test-ns", str(workload.id), propagation_policy=DeletionPropagationPolicy.BACKGROUND
+        )
 
         # Verify workload status was updated to DELETED
         await db_session.refresh(workload)
@@ -66,6 +71,25 @@ async def test_delete_workload_components_gateway_error(db_session: AsyncSession
             await delete_workload_components("test-ns", workload.id, db_session)
 
 
+@pytest.mark.asyncio
+async def test_delete_workloads_components_groups_by_namespace(db_session: AsyncSession) -> None:
+    """Test several workloads are deleted with one gateway call per namespace and marked as DELETED."""
+    first = await factory.create_workload(db_session, namespace="ns-a", status=WorkloadStatus.RUNNING)
+    second = await factory.create_workload(db_session, namespace="ns-a", status=WorkloadStatus.PENDING)
+    other = await factory.create_workload(db_session, namespace="ns-b", status=WorkloadStatus.RUNNING)
+
+    with patch("app.workloads.service.delete_workloads_resources") as mock_delete:
+        await delete_workloads_components(db_session, [first, second, other], DeletionPropagationPolicy.FOREGROUND)
+
+    assert mock_delete.call_args_list == [
+        call("ns-a", [str(first.id), str(second.id)], DeletionPropagationPolicy.FOREGROUND),
+        call("ns-b", [str(other.id)], DeletionPropagationPolicy.FOREGROUND),
+    ]
+    for workload in (first, second, other):
+        await db_session.refresh(workload)
+        assert workload.status == WorkloadStatus.DELETED
+
+
 @pytest.mark.asyncio
 async def test_is_workload_chattable_running_with_chat(db_session: AsyncSession) -> None:
     """Test that a RUNNING inference workload with chat overlay is chattable."""
@@ -857,7 +881,9 @@ async def test_delete_workload_components_deleting_status(db_session: AsyncSessi
         assert first_call.args[2] == WorkloadStatus.DELETING
 
         # Verify gateway was called
-        mock_delete.assert_called_once_with("test-ns", str(workload.id))
+        mock_delete.assert_called_once_with(
+            "test-ns", str(workload.id), propagation_policy=DeletionPropagationPolicy.BACKGROUND
+        )
 
         # Verify status was updated to DELETED after gateway call
         second_call = mock_update_status.call_args_list[1]
@@ -1051,3 +1077,33 @@ async def test_list_chattable_workloads_validation_error(db_session: AsyncSessio
         # Should raise ValidationError when trying to create WorkloadResponse
         with pytest.raises(ValidationError):
             await list_chattable_workloads(db_session, namespace="test-ns")
+
+
+@pytest.mark.asyncio
+async def test_get_workload_events() -> None:
+    """Test events are collected for the manifest objects and pods of a workload."""
+    workload = MagicMock(id=uuid4(), namespace="test-ns")
+    workload.manifest = (
+        "apiVersion: apps/v1\nkind: Deployment\nmetadata:\n  name: my-app\n"
+        "---\napiVersion: v1\nkind: Service\nmetadata:\n  name: my-app\n"
+    )
+    pod = MagicMock()
+    pod.metadata.name = "my-app-abc12"
+    kube_client = MagicMock()
+    kube_client.core_v1.list_namespaced_pod = AsyncMock(return_value=MagicMock(items=[pod]))
+    kube_client.get_events_for_resource = AsyncMock(
+        side_effect=lambda namespace, name, kind: [
+            {"type": "Normal", "reason": f"{kind}Event", "message": "", "timestamp": None, "count": 1}
+        ]
+    )
+
+    events = await get_workload_events(kube_client, workload)
+
+    assert sorted((event.kind, event.name) for event in events) == [
+        ("Deployment", "my-app"),
+        ("Pod", "my-app-abc12"),
+        ("Service", "my-app"),
+    ]
+    kube_client.core_v1.list_namespaced_pod.assert_awaited_once_with(
+        namespace="test-ns", label_selector=f"{WORKLOAD_ID_LABEL}={workload.id}"
+    )
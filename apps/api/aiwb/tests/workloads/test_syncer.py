@@ -0,0 +1,49 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for the workload syncer."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.workloads.syncer import sync_workloads
+
+
+def _session() -> AsyncMock:
+    session = AsyncMock()
+    session.begin_nested = MagicMock(return_value=AsyncMock())
+    return session
+
+
+@pytest.mark.asyncio
+async def test_sync_workloads_updates_onboarding_statuses() -> None:
+    """Test sync derives model onboarding statuses and counts the updated models as changes."""
+    session = _session()
+
+    with (
+        patch("app.workloads.syncer.get_workloads", return_value=[]),
+        patch("app.workloads.syncer.update_onboarding_statuses", return_value=2) as mock_update,
+    ):
+        changed = await sync_workloads(session, MagicMock())
+
+    mock_update.assert_awaited_once_with(session)
+    session.begin_nested.assert_called_once()
+    session.commit.assert_awaited_once()
+    assert changed == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_workloads_commits_when_onboarding_update_fails() -> None:
+    """Test a failing onboarding status update does not discard the workload status updates."""
+    session = _session()
+
+    with (
+        patch("app.workloads.syncer.get_workloads", return_value=[]),
+        patch("app.workloads.syncer.update_onboarding_statuses", side_effect=RuntimeError("boom")),
+    ):
+        changed = await sync_workloads(session, MagicMock())
+
+    session.commit.assert_awaited_once()
+    assert changed == 0
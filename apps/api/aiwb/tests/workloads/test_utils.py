@@ -25,7 +25,6 @@ from app.workloads.utils import (
     derive_job_status,
     generate_display_name,
     generate_workload_name,
-    get_dynamic_client,
     get_resource_type,
     get_workload_host_from_HTTPRoute_manifest,
     get_workload_internal_url,
@@ -345,7 +344,7 @@ spec:
     mock_api_resource.namespaced = True
     mock_api_resource.create = MagicMock()
 
-    with patch("app.workloads.utils.get_dynamic_client", spec=get_dynamic_client, return_value=mock_dynamic_client):
+    with patch("app.workloads.utils.resolve_resource", side_effect=mock_dynamic_client.resources.get):
         await apply_manifest(mock_kube_client, manifest, workload, "test-namespace", "test-user@example.com")
 
     # Verify resource was created
@@ -397,7 +396,7 @@ spec:
     mock_api_resource.namespaced = True
     mock_api_resource.create = MagicMock()
 
-    with patch("app.workloads.utils.get_dynamic_client", spec=get_dynamic_client, return_value=mock_dynamic_client):
+    with patch("app.workloads.utils.resolve_resource", side_effect=mock_dynamic_client.resources.get):
         await apply_manifest(mock_kube_client, manifest, workload, "test-namespace", "test-user@example.com")
 
     # Verify both resources were created
@@ -430,7 +429,7 @@ spec:
     mock_api_resource.namespaced = True
     mock_api_resource.create = MagicMock()
 
-    with patch("app.workloads.utils.get_dynamic_client", spec=get_dynamic_client, return_value=mock_dynamic_client):
+    with patch("app.workloads.utils.resolve_resource", side_effect=mock_dynamic_client.resources.get):
         await apply_manifest(mock_kube_client, manifest, workload, "test-namespace", "test-user@example.com")
 
     # Verify metadata was created
@@ -468,7 +467,7 @@ spec:
     mock_api_resource.namespaced = True
     mock_api_resource.create = MagicMock()
 
-    with patch("app.workloads.utils.get_dynamic_client", spec=get_dynamic_client, return_value=mock_dynamic_client):
+    with patch("app.workloads.utils.resolve_resource", side_effect=mock_dynamic_client.resources.get):
         await apply_manifest(mock_kube_client, manifest, workload, "new-namespace", "test-user@example.com")
 
     # Verify namespace was overwritten
@@ -504,7 +503,7 @@ spec:
     mock_api_resource.namespaced = True
     mock_api_resource.create = MagicMock()
 
-    with patch("app.workloads.utils.get_dynamic_client", spec=get_dynamic_client, return_value=mock_dynamic_client):
+    with patch("app.workloads.utils.resolve_resource", side_effect=mock_dynamic_client.resources.get):
         await apply_manifest(mock_kube_client, manifest, workload, "test-namespace", "test-user@example.com")
 
     # Verify workload ID label was injected
@@ -540,7 +539,7 @@ spec:
     mock_api_resource.namespaced = True
     mock_api_resource.create = MagicMock()
 
-    with patch("app.workloads.utils.get_dynamic_client", spec=get_dynamic_client, return_value=mock_dynamic_client):
+    with patch("app.workloads.utils.resolve_resource", side_effect=mock_dynamic_client.resources.get):
         await apply_manifest(mock_kube_client, manifest, workload, "test-namespace", "test-user@example.com")
 
     # Verify chart label was injected for CRD
@@ -579,7 +578,7 @@ spec:
     mock_api_resource.namespaced = True
     mock_api_resource.create = MagicMock()
 
-    with patch("app.workloads.utils.get_dynamic_client", spec=get_dynamic_client, return_value=mock_dynamic_client):
+    with patch("app.workloads.utils.resolve_resource", side_effect=mock_dynamic_client.resources.get):
         await apply_manifest(mock_kube_client, manifest, workload, "test-namespace", "test-user@example.com")
 
     # Verify model and dataset labels were injected
@@ -621,7 +620,7 @@ spec:
     conflict_error = ApiException(status=409, reason="Conflict")
     mock_api_resource.create.side_effect = conflict_error
 
-    with patch("app.workloads.utils.get_dynamic_client", spec=get_dynamic_client, return_value=mock_dynamic_client):
+    with patch("app.workloads.utils.resolve_resource", side_effect=mock_dynamic_client.resources.get):
         # Should not raise exception
         await apply_manifest(mock_kube_client, manifest, workload, "test-namespace", "test-user@example.com")
 
@@ -629,6 +628,37 @@ spec:
     mock_api_resource.create.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_apply_manifest_refreshes_discovery_on_not_found() -> None:
+    """Test a 404 on create rediscovers the kind once and retries with the refreshed resource."""
+    manifest = """
+apiVersion: v1
+kind: Service
+metadata:
+  name: test-service
+"""
+    workload = MagicMock(spec=Workload)
+    workload.id = uuid4()
+    workload.chart_id = uuid4()
+    workload.type = WorkloadType.INFERENCE
+    workload.display_name = "test-workload"
+    workload.model_id = None
+    workload.dataset_id = None
+
+    stale_resource = MagicMock(namespaced=True)
+    stale_resource.create.side_effect = ApiException(status=404, reason="Not Found")
+    refreshed_resource = MagicMock(namespaced=True)
+
+    with (
+        patch("app.workloads.utils.resolve_resource", return_value=stale_resource),
+        patch("app.workloads.utils.refresh_resource", return_value=refreshed_resource) as mock_refresh,
+    ):
+        await apply_manifest(AsyncMock(), manifest, workload, "test-namespace", "test-user@example.com")
+
+    mock_refresh.assert_awaited_once_with(api_version="v1", kind="Service")
+    refreshed_resource.create.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_apply_manifest_raises_on_other_api_errors() -> None:
     """Test that non-409 ApiException raises RuntimeError."""
@@ -661,7 +691,7 @@ spec:
     forbidden_error.body = "Access denied"
     mock_api_resource.create.side_effect = forbidden_error
 
-    with patch("app.workloads.utils.get_dynamic_client", spec=get_dynamic_client, return_value=mock_dynamic_client):
+    with patch("app.workloads.utils.resolve_resource", side_effect=mock_dynamic_client.resources.get):
         with pytest.raises(RuntimeError, match="Failed to create Service/test-service"):
             await apply_manifest(mock_kube_client, manifest, workload, "test-namespace", "test-user@example.com")
 
@@ -682,7 +712,7 @@ async def test_apply_manifest_invalid_yaml() -> None:
     mock_kube_client = AsyncMock()
     mock_dynamic_client = MagicMock()
 
-    with patch("app.workloads.utils.get_dynamic_client", spec=get_dynamic_client, return_value=mock_dynamic_client):
+    with patch("app.workloads.utils.resolve_resource", side_effect=mock_dynamic_client.resources.get):
         # Invalid YAML should raise exception
         with pytest.raises(Exception):
             await apply_manifest(mock_kube_client, manifest, workload, "test-namespace", "test-user@example.com")
@@ -715,7 +745,7 @@ spec:
     mock_api_resource.namespaced = True
     mock_api_resource.create = MagicMock()
 
-    with patch("app.workloads.utils.get_dynamic_client", spec=get_dynamic_client, return_value=mock_dynamic_client):
+    with patch("app.workloads.utils.resolve_resource", side_effect=mock_dynamic_client.resources.get):
         # Should skip document without apiVersion
         await apply_manifest(mock_kube_client, manifest, workload, "test-namespace", "test-user@example.com")
 
@@ -750,7 +780,7 @@ spec:
     mock_api_resource.namespaced = True
     mock_api_resource.create = MagicMock()
 
-    with patch("app.workloads.utils.get_dynamic_client", spec=get_dynamic_client, return_value=mock_dynamic_client):
+    with patch("app.workloads.utils.resolve_resource", side_effect=mock_dynamic_client.resources.get):
         # Should skip document without kind
         await apply_manifest(mock_kube_client, manifest, workload, "test-namespace", "test-user@example.com")
 
@@ -779,7 +809,7 @@ async def test_apply_manifest_empty_yaml() -> None:
     mock_api_resource.namespaced = True
     mock_api_resource.create = MagicMock()
 
-    with patch("app.workloads.utils.get_dynamic_client", spec=get_dynamic_client, return_value=mock_dynamic_client):
+    with patch("app.workloads.utils.resolve_resource", side_effect=mock_dynamic_client.resources.get):
         # Should handle empty YAML gracefully
         await apply_manifest(mock_kube_client, manifest, workload, "test-namespace", "test-user@example.com")
 
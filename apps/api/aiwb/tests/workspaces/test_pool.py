@@ -0,0 +1,179 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for the warm pool of development workspaces."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.workloads.constants import WORKSPACE_POOL_SUBMITTER
+from app.workloads.enums import WorkloadStatus
+from app.workspaces.config import parse_pool_sizes
+from app.workspaces.enums import WorkspacePoolPolicy, WorkspaceType, workspace_type_chart_name_mapping
+from app.workspaces.pool import get_pool_targets, sync_workspace_pool
+
+VSCODE_CHART = workspace_type_chart_name_mapping[WorkspaceType.VSCODE]
+JUPYTERLAB_CHART = workspace_type_chart_name_mapping[WorkspaceType.JUPYTERLAB]
+
+
+def _pooled(status: WorkloadStatus, namespace: str = "team-a", chart_name: str = VSCODE_CHART) -> MagicMock:
+    workload = MagicMock(id=uuid4(), namespace=namespace, status=status, created_by=WORKSPACE_POOL_SUBMITTER)
+    workload.chart.name = chart_name
+    return workload
+
+
+@contextmanager
+def _pool(
+    targets: dict[tuple[str, WorkspaceType], int], workloads: list[MagicMock]
+) -> Iterator[tuple[AsyncMock, AsyncMock]]:
+    """Patch the sizing and state of the pool and yield the (deploy, delete) mocks."""
+    with (
+        patch("app.workspaces.pool.WORKSPACE_POOL_SIZES", {WorkspaceType.VSCODE: 2}),
+        patch("app.workspaces.pool.get_pool_targets", return_value=targets),
+        patch("app.workspaces.pool.get_pool_workspaces", return_value=workloads),
+        patch("app.workspaces.pool.get_chart", return_value=MagicMock()),
+        patch("app.workspaces.pool.deploy_development_workspace") as mock_deploy,
+        patch("app.workspaces.pool.delete_workload_components") as mock_delete,
+    ):
+        mock_deploy.side_effect = lambda *args, **kwargs: _pooled(WorkloadStatus.PENDING)
+        yield mock_deploy, mock_delete
+
+
+def test_parse_pool_sizes() -> None:
+    """Test pool sizes are parsed per workspace type, skipping namespace-scoped types and empty pools."""
+    charts = list(workspace_type_chart_name_mapping.values())
+    assert parse_pool_sizes("vscode=2, jupyterlab=1,comfyui=0,mlflow=1", charts) == {
+        WorkspaceType.VSCODE: 2,
+        WorkspaceType.JUPYTERLAB: 1,
+    }
+    assert parse_pool_sizes("", charts) == {}
+    with pytest.raises(ValueError):
+        parse_pool_sizes("emacs=1", charts)
+
+
+def test_parse_pool_sizes_requires_user_agnostic_chart() -> None:
+    """Test only workspace types whose chart is declared user agnostic are pooled."""
+    assert parse_pool_sizes("vscode=2,jupyterlab=1", [VSCODE_CHART]) == {WorkspaceType.VSCODE: 2}
+    assert parse_pool_sizes("vscode=2", []) == {}
+
+
+@pytest.mark.asyncio
+async def test_get_pool_targets_fixed() -> None:
+    """Test the fixed policy keeps the full size in every configured namespace."""
+    with (
+        patch("app.workspaces.pool.WORKSPACE_POOL_POLICY", WorkspacePoolPolicy.FIXED),
+        patch("app.workspaces.pool.WORKSPACE_POOL_SIZES", {WorkspaceType.VSCODE: 2, WorkspaceType.JUPYTERLAB: 1}),
+        patch("app.workspaces.pool.WORKSPACE_POOL_NAMESPACES", ["team-a", "team-b"]),
+    ):
+        targets = await get_pool_targets(AsyncMock())
+
+    assert targets == {
+        ("team-a", WorkspaceType.VSCODE): 2,
+        ("team-a", WorkspaceType.JUPYTERLAB): 1,
+        ("team-b", WorkspaceType.VSCODE): 2,
+        ("team-b", WorkspaceType.JUPYTERLAB): 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_pool_targets_demand() -> None:
+    """Test the demand policy follows recent creations per namespace, up to the size and in allowed namespaces."""
+    created = {("team-a", VSCODE_CHART): 5, ("team-b", VSCODE_CHART): 1, ("team-c", JUPYTERLAB_CHART): 3}
+    with (
+        patch("app.workspaces.pool.WORKSPACE_POOL_POLICY", WorkspacePoolPolicy.DEMAND),
+        patch("app.workspaces.pool.WORKSPACE_POOL_SIZES", {WorkspaceType.VSCODE: 2, WorkspaceType.JUPYTERLAB: 2}),
+        patch("app.workspaces.pool.WORKSPACE_POOL_NAMESPACES", ["team-a", "team-b"]),
+        patch("app.workspaces.pool.count_workspaces_created_since", return_value=created) as mock_count,
+    ):
+        targets = await get_pool_targets(AsyncMock(), now=datetime(2025, 1, 2, tzinfo=UTC))
+
+    assert targets == {("team-a", WorkspaceType.VSCODE): 2, ("team-b", WorkspaceType.VSCODE): 1}
+    assert mock_count.await_args.args[1] == datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_sync_workspace_pool_disabled() -> None:
+    """Test the syncer does nothing without configured pool sizes."""
+    session = AsyncMock()
+    with patch("app.workspaces.pool.WORKSPACE_POOL_SIZES", {}):
+        assert await sync_workspace_pool(session, MagicMock()) == 0
+    session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sync_workspace_pool_refills_to_target() -> None:
+    """Test the syncer deploys idle workspaces up to the target, counting pending and unknown ones."""
+    session = AsyncMock()
+    existing = [_pooled(WorkloadStatus.RUNNING), _pooled(WorkloadStatus.UNKNOWN)]
+
+    with _pool({("team-a", WorkspaceType.VSCODE): 3}, existing) as (mock_deploy, mock_delete):
+        changes = await sync_workspace_pool(session, MagicMock())
+
+    assert changes == 1
+    mock_deploy.assert_awaited_once()
+    assert mock_deploy.await_args.args[3:] == (WORKSPACE_POOL_SUBMITTER, "team-a", {}, WorkspaceType.VSCODE)
+    mock_delete.assert_not_called()
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_sync_workspace_pool_limits_creations_per_run() -> None:
+    """Test the syncer deploys at most WORKSPACE_POOL_MAX_CREATIONS_PER_RUN workspaces per run."""
+    targets = {("team-a", WorkspaceType.VSCODE): 2, ("team-b", WorkspaceType.VSCODE): 2}
+
+    with (
+        _pool(targets, []) as (mock_deploy, _),
+        patch("app.workspaces.pool.WORKSPACE_POOL_MAX_CREATIONS_PER_RUN", 3),
+    ):
+        changes = await sync_workspace_pool(AsyncMock(), MagicMock())
+
+    assert changes == 3
+    assert [call.args[4] for call in mock_deploy.await_args_list] == ["team-a", "team-a", "team-b"]
+
+
+@pytest.mark.asyncio
+async def test_sync_workspace_pool_removes_failed_and_excess() -> None:
+    """Test the syncer removes failed workspaces and the newest idle ones above the target."""
+    session = AsyncMock()
+    oldest, newer, newest = (_pooled(WorkloadStatus.RUNNING) for _ in range(3))
+    failed = _pooled(WorkloadStatus.FAILED)
+
+    with _pool({("team-a", WorkspaceType.VSCODE): 1}, [oldest, failed, newer, newest]) as (mock_deploy, mock_delete):
+        changes = await sync_workspace_pool(session, MagicMock())
+
+    assert changes == 3
+    assert [call.args[1] for call in mock_delete.await_args_list] == [failed.id, newest.id, newer.id]
+    mock_deploy.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sync_workspace_pool_empties_pools_without_target() -> None:
+    """Test idle workspaces of namespaces that no longer need a pool are removed."""
+    stale = _pooled(WorkloadStatus.PENDING, namespace="team-b")
+
+    with _pool({}, [stale]) as (_, mock_delete):
+        changes = await sync_workspace_pool(AsyncMock(), MagicMock())
+
+    assert changes == 1
+    mock_delete.assert_awaited_once_with("team-b", stale.id, mock_delete.await_args.args[2])
+
+
+@pytest.mark.asyncio
+async def test_sync_workspace_pool_continues_after_deploy_failure() -> None:
+    """Test a failing deployment in one namespace does not stop the syncer from refilling the others."""
+    session = AsyncMock()
+    targets = {("team-a", WorkspaceType.VSCODE): 1, ("team-b", WorkspaceType.VSCODE): 1}
+
+    with _pool(targets, []) as (mock_deploy, _):
+        mock_deploy.side_effect = [RuntimeError("helm failed"), _pooled(WorkloadStatus.PENDING, namespace="team-b")]
+        changes = await sync_workspace_pool(session, MagicMock())
+
+    assert changes == 1
+    assert mock_deploy.await_count == 2
+    session.commit.assert_awaited_once()
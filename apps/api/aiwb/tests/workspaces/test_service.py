@@ -10,6 +10,7 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api_common.exceptions import ConflictException
+from app.workloads.constants import WORKSPACE_POOL_SUBMITTER
 from app.workloads.enums import WorkloadStatus, WorkloadType
 from app.workloads.repository import get_workloads
 from app.workspaces.enums import WorkspaceType, workspace_type_chart_name_mapping
@@ -544,3 +545,102 @@ async def test_create_development_workspace_without_image_pull_secrets(
         # Neither camelCase nor snake_case should be present
         assert "imagePullSecrets" not in overlays_values[0]
         assert "image_pull_secrets" not in overlays_values[0]
+
+
+@pytest.mark.asyncio
+async def test_create_development_workspace_claims_pooled_workspace(
+    db_session: AsyncSession, mock_kube_client: AsyncMock
+) -> None:
+    """Test a request with default settings is served by an idle pooled workspace without rendering the chart."""
+    chart_name = workspace_type_chart_name_mapping[WorkspaceType.VSCODE]
+    chart = await factory.create_chart(db_session, name=chart_name, chart_type=WorkloadType.WORKSPACE)
+    pooled = await factory.create_workload(
+        db_session,
+        namespace="test-namespace",
+        chart=chart,
+        status=WorkloadStatus.RUNNING,
+        submitter=WORKSPACE_POOL_SUBMITTER,
+        include_isolation_data=False,
+    )
+
+    with (
+        patch("app.workspaces.service.WORKSPACE_POOL_SIZES", {WorkspaceType.VSCODE: 1}),
+        patch("app.workspaces.service.hand_over_workspace", autospec=True, return_value="manifest") as mock_hand_over,
+        patch("app.workspaces.service.render_helm_template", autospec=True) as mock_render,
+    ):
+        result = await create_development_workspace(
+            session=db_session,
+            kube_client=mock_kube_client,
+            submitter="test@example.com",
+            namespace="test-namespace",
+            request=DevelopmentWorkspaceRequest(),
+            workspace_type=WorkspaceType.VSCODE,
+            display_name="My Workspace",
+        )
+
+    assert result.id == pooled.id
+    assert result.created_by == "test@example.com"
+    assert result.updated_by == "test@example.com"
+    assert result.display_name == "My Workspace"
+    assert result.manifest == "manifest"
+    mock_hand_over.assert_awaited_once_with(result, "test@example.com")
+    mock_render.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_development_workspace_pool_miss_deploys(
+    db_session: AsyncSession, mock_kube_client: AsyncMock
+) -> None:
+    """Test a request deploys a new workspace when the pool has no idle workspace of the type."""
+    chart_name = workspace_type_chart_name_mapping[WorkspaceType.VSCODE]
+    await factory.create_chart(db_session, name=chart_name, chart_type=WorkloadType.WORKSPACE)
+
+    with (
+        patch("app.workspaces.service.WORKSPACE_POOL_SIZES", {WorkspaceType.VSCODE: 1}),
+        patch("app.workspaces.service.render_helm_template", autospec=True, return_value="manifest"),
+        patch("app.workspaces.service.apply_manifest", autospec=True) as mock_apply,
+    ):
+        result = await create_development_workspace(
+            session=db_session,
+            kube_client=mock_kube_client,
+            submitter="test@example.com",
+            namespace="test-namespace",
+            request=DevelopmentWorkspaceRequest(),
+            workspace_type=WorkspaceType.VSCODE,
+        )
+
+    assert result.created_by == "test@example.com"
+    mock_apply.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_development_workspace_with_inputs_skips_pool(
+    db_session: AsyncSession, mock_kube_client: AsyncMock
+) -> None:
+    """Test a request with explicit settings does not claim a pooled workspace deployed with the defaults."""
+    chart_name = workspace_type_chart_name_mapping[WorkspaceType.VSCODE]
+    chart = await factory.create_chart(db_session, name=chart_name, chart_type=WorkloadType.WORKSPACE)
+    pooled = await factory.create_workload(
+        db_session,
+        namespace="test-namespace",
+        chart=chart,
+        status=WorkloadStatus.RUNNING,
+        submitter=WORKSPACE_POOL_SUBMITTER,
+        include_isolation_data=False,
+    )
+
+    with (
+        patch("app.workspaces.service.WORKSPACE_POOL_SIZES", {WorkspaceType.VSCODE: 1}),
+        patch("app.workspaces.service.render_helm_template", autospec=True, return_value="manifest"),
+        patch("app.workspaces.service.apply_manifest", autospec=True),
+    ):
+        result = await create_development_workspace(
+            session=db_session,
+            kube_client=mock_kube_client,
+            submitter="test@example.com",
+            namespace="test-namespace",
+            request=DevelopmentWorkspaceRequest(gpus=2),
+            workspace_type=WorkspaceType.VSCODE,
+        )
+
+    assert result.id != pooled.id
@@ -4,12 +4,19 @@
 
 """Tests for Workspaces utility functions."""
 
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api_common.yaml_codec import load_all
+from app.config import SUBMITTER_ANNOTATION
+from app.dispatch.utils import sanitize_label_value
+from app.workloads.constants import DISPLAY_NAME_LABEL, WORKLOAD_ID_LABEL
 from app.workloads.enums import WorkloadStatus, WorkloadType
 from app.workspaces.enums import WorkspaceType, workspace_type_chart_name_mapping
-from app.workspaces.utils import check_workspace_availability_per_namespace
+from app.workspaces.utils import check_workspace_availability_per_namespace, hand_over_workspace
 from tests import factory
 
 
@@ -330,3 +337,73 @@ async def test_check_workspace_availability_different_chart_allows(db_session: A
         db_session, "test-namespace", WorkspaceType.VSCODE, "user1@example.com"
     )
     assert result is True
+
+
+POOLED_MANIFEST = """
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: wb-dev-workspace-vscode
+  labels:
+    app: vscode
+    user: workspace-pool
+spec:
+  template:
+    metadata:
+      labels:
+        app: vscode
+---
+apiVersion: v1
+kind: Service
+metadata:
+  name: wb-dev-workspace-vscode
+  labels:
+    user: workspace-pool
+"""
+
+
+@pytest.mark.asyncio
+async def test_hand_over_workspace_patches_every_resource() -> None:
+    """Test handing over a pooled workspace patches the metadata of all its resources and returns the new manifest."""
+    workload = MagicMock(id=uuid4(), namespace="test-namespace", display_name="My Workspace", manifest=POOLED_MANIFEST)
+    api_resource = MagicMock(namespaced=True)
+
+    with patch("app.workspaces.utils.resolve_resource", AsyncMock(return_value=api_resource)) as mock_resolve:
+        manifest = await hand_over_workspace(workload, "user@example.com")
+
+    assert [call.kwargs["kind"] for call in mock_resolve.await_args_list] == ["Deployment", "Service"]
+    deployment_patch, service_patch = (call.kwargs for call in api_resource.patch.call_args_list)
+    assert deployment_patch == {
+        "body": {
+            "metadata": {
+                "labels": {
+                    "app": "vscode",
+                    "user": "user-example-com",
+                    WORKLOAD_ID_LABEL: str(workload.id),
+                    DISPLAY_NAME_LABEL: sanitize_label_value("My Workspace"),
+                },
+                "annotations": {SUBMITTER_ANNOTATION: "user@example.com"},
+            }
+        },
+        "name": "wb-dev-workspace-vscode",
+        "namespace": "test-namespace",
+        "content_type": "application/merge-patch+json",
+    }
+    assert service_patch["body"]["metadata"]["labels"] == {
+        "user": "user-example-com",
+        WORKLOAD_ID_LABEL: str(workload.id),
+    }
+
+    deployment, service = load_all(manifest)
+    assert deployment["metadata"]["labels"] == {"app": "vscode", "user": "user-example-com"}
+    assert deployment["spec"]["template"]["metadata"]["labels"] == {"app": "vscode"}
+    assert service["metadata"]["labels"] == {"user": "user-example-com"}
+
+
+@pytest.mark.asyncio
+async def test_hand_over_workspace_without_manifest_fails() -> None:
+    """Test a pooled workspace without manifest cannot be handed over, so the claim falls back to a new workspace."""
+    workload = MagicMock(id=uuid4(), manifest=None)
+
+    with pytest.raises(ValueError, match="has no manifest"):
+        await hand_over_workspace(workload, "user@example.com")
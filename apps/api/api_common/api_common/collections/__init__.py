@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
+from .paging import DEFAULT_LIST_CHUNK_SIZE, iter_list_items, list_all_items
 from .schemas import (
     BaseFilterableList,
     BasePaginationList,
@@ -12,7 +13,8 @@ from .schemas import (
     SortCondition,
     SortDirection,
 )
-from .utils import PaginatedResult, paginate_list, sort_list
+from .snapshots import SnapshotCache
+from .utils import PaginatedResult, paginate_list, sort_and_paginate_list, sort_list, top_k
 
 __all__ = [
     # Schemas
@@ -27,5 +29,12 @@ __all__ = [
     # Utils
     "PaginatedResult",
     "paginate_list",
+    "sort_and_paginate_list",
     "sort_list",
+    "top_k",
+    # Kubernetes lists
+    "DEFAULT_LIST_CHUNK_SIZE",
+    "SnapshotCache",
+    "iter_list_items",
+    "list_all_items",
 ]
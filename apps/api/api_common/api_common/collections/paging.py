@@ -0,0 +1,41 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Chunked listing of Kubernetes resources using the API server's limit and continue tokens."""
+
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+# Items per list request; the API server returns a continue token when more remain
+DEFAULT_LIST_CHUNK_SIZE = 500
+
+
+async def iter_list_items(
+    list_fn: Callable[..., Awaitable[dict[str, Any]]],
+    chunk_size: int = DEFAULT_LIST_CHUNK_SIZE,
+    **kwargs: Any,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield the items of a Kubernetes list call, requesting them in chunks of chunk_size.
+
+    list_fn is a list call returning a dict, such as CustomObjectsApi.list_namespaced_custom_object, and kwargs are
+    passed on to it. Chunks are requested one at a time as the items are consumed, so a large collection is never
+    held in a single response. All chunks are served from the resource version of the first one.
+    """
+    continue_token = None
+    while True:
+        result = await list_fn(**kwargs, limit=chunk_size, _continue=continue_token)
+        for item in result.get("items", []):
+            yield item
+        continue_token = result.get("metadata", {}).get("continue")
+        if not continue_token:
+            return
+
+
+async def list_all_items(
+    list_fn: Callable[..., Awaitable[dict[str, Any]]],
+    chunk_size: int = DEFAULT_LIST_CHUNK_SIZE,
+    **kwargs: Any,
+) -> list[dict[str, Any]]:
+    """Return all items of a Kubernetes list call, requested in chunks of chunk_size (see iter_list_items)."""
+    return [item async for item in iter_list_items(list_fn, chunk_size, **kwargs)]
@@ -0,0 +1,46 @@
+# Copyright © Advanced Micro Devices, Inc., or its affiliates.
+#
+# SPDX-License-Identifier: MIT
+
+"""Short-lived snapshots of list results shared by consecutive page requests."""
+
+import time
+from collections.abc import Awaitable, Callable, Hashable
+
+
+class SnapshotCache[V]:
+    """Keep the result of an expensive list for a few seconds, keyed by its scope and filters.
+
+    Paging through a list issues one request per page. With a snapshot, the pages after the first are cut from the
+    same items instead of listing, converting and filtering everything again, and they stay consistent with each
+    other while the snapshot lives. Snapshots are kept per process, and concurrent misses for a key each load it.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[Hashable, tuple[float, V]] = {}
+
+    async def get_or_load(self, key: Hashable, load: Callable[[], Awaitable[V]]) -> V:
+        """Return the snapshot for the key, calling load to take a new one if it is missing or expired."""
+        if self.ttl_seconds <= 0:
+            return await load()
+
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        value = await load()
+        self._store(key, value)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _store(self, key: Hashable, value: V) -> None:
+        now = time.monotonic()
+        self._entries.pop(key, None)
+        self._entries = {k: entry for k, entry in self._entries.items() if entry[0] > now}
+        while len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (now + self.ttl_seconds, value)
@@ -4,6 +4,8 @@
 
 """Utilities for collection operations (pagination, sorting, etc.)."""
 
+import heapq
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import Any
 
@@ -39,7 +41,25 @@ def sort_list[T](
     if not sort_by or not items:
         return items
 
-    def get_sort_key(item: T) -> tuple[int, Any]:
+    return sorted(items, key=_get_sort_key(sort_by), reverse=(sort_order == SortDirection.desc))
+
+
+def top_k[T](
+    items: Iterable[T],
+    k: int,
+    sort_by: str,
+    sort_order: SortDirection = SortDirection.desc,
+) -> list[T]:
+    """Select the first k items of sort_list(items, sort_by, sort_order) without sorting all of them.
+
+    Uses a heap of k items, so selecting a page from n items takes O(n log k) instead of O(n log n).
+    """
+    select = heapq.nlargest if sort_order == SortDirection.desc else heapq.nsmallest
+    return select(k, items, key=_get_sort_key(sort_by))
+
+
+def _get_sort_key(sort_by: str) -> Callable[[Any], tuple[int, Any]]:
+    def get_sort_key(item: Any) -> tuple[int, Any]:
         if hasattr(item, sort_by):
             value = getattr(item, sort_by)
         elif isinstance(item, dict):
@@ -51,7 +71,7 @@ def sort_list[T](
             return (1, "")
         return (0, value)
 
-    return sorted(items, key=get_sort_key, reverse=(sort_order == SortDirection.desc))
+    return get_sort_key
 
 
 def paginate_list[T](items: list[T], page: int = 1, page_size: int = 20) -> PaginatedResult[T]:
@@ -77,3 +97,24 @@ def paginate_list[T](items: list[T], page: int = 1, page_size: int = 20) -> Pagi
         page_size=page_size,
         total_pages=total_pages,
     )
+
+
+def sort_and_paginate_list[T](
+    items: list[T],
+    page: int = 1,
+    page_size: int = 20,
+    sort_by: str | None = None,
+    sort_order: SortDirection = SortDirection.desc,
+) -> PaginatedResult[T]:
+    """Return a page of the sorted items, equal to paginate_list(sort_list(items, ...), ...).
+
+    Only the items up to the end of the requested page are selected in order (see top_k).
+    """
+    if not sort_by or not items:
+        return paginate_list(items, page=page, page_size=page_size)
+
+    head = top_k(items, page * page_size, sort_by=sort_by, sort_order=sort_order)
+    result = paginate_list(head, page=page, page_size=page_size)
+    result.total = len(items)
+    result.total_pages = (result.total + page_size - 1) // page_size
+    return result
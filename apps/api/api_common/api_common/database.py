@@ -17,6 +17,8 @@ from typing import Any
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
+from .request_timing import instrument_engine
+
 # Module-level globals - same pattern as AIRM
 engine: AsyncEngine | None = None
 session_maker: async_sessionmaker[AsyncSession] | None = None
@@ -92,6 +94,7 @@ def create_engine(
         conn_string,
         **engine_kwargs,
     )
+    instrument_engine(engine)
     session_maker = async_sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
     return engine, session_maker
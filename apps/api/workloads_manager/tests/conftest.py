@@ -23,3 +23,11 @@ def temp_yaml_file(tmp_path: Path) -> Iterator[Callable[[dict[str, object]], Pat
             return temp_file
 
     yield _create_temp_yaml
+
+
+@pytest.fixture(autouse=True)
+def registration_state_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep registration content hashes out of the user's home directory."""
+    state_file = tmp_path / "registrations.json"
+    monkeypatch.setattr("workloads_manager.config.REGISTRATION_STATE_FILE", str(state_file))
+    return state_file
@@ -5,20 +5,24 @@
 """Tests for registration module."""
 
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import httpx
+import yaml
 
-from workloads_manager.core.api import make_api_request
+from workloads_manager.core.api import check_api_server, make_api_request
 from workloads_manager.core.registration import (
     get_chart_id,
     get_overlay_id,
     process_single_overlay,
     register_workload,
+    register_workloads,
 )
 from workloads_manager.models import (
     ProcessingStatus,
+    Workload,
     WorkloadRegistrationResult,
 )
 
@@ -381,3 +385,114 @@ def test_register_workload_api_server_not_accessible(mock_check_api, mock_get_wo
     assert isinstance(result, WorkloadRegistrationResult)
     assert not result.success
     assert "API server at http://api.test is not accessible" in result.error
+
+
+def test_check_api_server_uses_shared_client():
+    """Test check_api_server reports transport errors as an inaccessible server."""
+    ok = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"status": "ok"})))
+    assert check_api_server(httpx.URL("http://api.test"), ok)
+
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    refused = httpx.Client(transport=httpx.MockTransport(refuse))
+    assert not check_api_server(httpx.URL("http://api.test"), refused)
+
+
+def make_workload(tmp_path: Path, name: str, overlays: dict[str, dict] | None = None) -> Workload:
+    """Create a registerable workload directory with a chart, a signature and model overlays."""
+    chart_dir = tmp_path / "workloads" / name / "helm"
+    dev_center = chart_dir / "overrides" / "dev-center"
+    dev_center.mkdir(parents=True)
+    (dev_center / "_metadata.yaml").write_text(yaml.dump({"id": name, "type": "INFERENCE"}))
+    (dev_center / "signature.yaml").write_text("model: {}\n")
+    (chart_dir / "Chart.yaml").write_text(f"name: {name}\n")
+    models_dir = chart_dir / "overrides" / "models"
+    models_dir.mkdir()
+    for file_name, content in (overlays or {}).items():
+        (models_dir / file_name).write_text(yaml.dump(content))
+    return Workload(path=chart_dir.parent)
+
+
+class FakeAPI:
+    """Record API requests and answer them like the workloads API."""
+
+    def __init__(self, charts: dict[str, str] | None = None, overlays: dict[str, list[dict]] | None = None):
+        self.charts = charts or {}
+        self.overlays = overlays or {}
+        self.requests: list[tuple[str, str]] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, method, endpoint, api_url, data=None, files=None, client=None):
+        assert client is not None
+        with self.lock:
+            self.requests.append((method, endpoint))
+        if (method, endpoint) == ("GET", "charts"):
+            return True, {"data": [{"id": chart_id, "name": name} for name, chart_id in self.charts.items()]}
+        if method == "GET" and endpoint.startswith("overlays?chart_id="):
+            return True, {"data": self.overlays.get(endpoint.split("=", 1)[1], [])}
+        if method == "POST" and endpoint == "charts":
+            return True, {"id": f"new-{data['name']}"}
+        return True, {"id": f"{method}-{endpoint}"}
+
+    def calls(self, method: str, prefix: str = "") -> list[str]:
+        return sorted(endpoint for m, endpoint in self.requests if m == method and endpoint.startswith(prefix))
+
+
+@patch("workloads_manager.core.registration.check_api_server", return_value=True)
+@patch("workloads_manager.config.TOKEN", "test-token")
+def test_register_workloads_looks_up_charts_and_overlays_once(mock_check_api, tmp_path):
+    """Test charts are listed once and overlays once per existing chart, not once per file."""
+    existing = make_workload(tmp_path, "existing", {"a.yaml": {"model": "org/a"}, "b.yaml": {"model": "org/b"}})
+    new = make_workload(tmp_path, "new", {"c.yaml": {"model": "org/c"}})
+    api = FakeAPI(
+        charts={"existing": "chart-1"}, overlays={"chart-1": [{"id": "overlay-a", "canonical_name": "org/a"}]}
+    )
+
+    with patch("workloads_manager.core.registration.make_api_request", side_effect=api):
+        batch = register_workloads([existing, new], httpx.URL("http://api.test"), jobs=4)
+
+    assert batch.error is None
+    assert api.calls("GET") == ["charts", "overlays?chart_id=chart-1"]
+    assert api.calls("PUT") == ["charts/chart-1", "overlays/overlay-a"]
+    assert api.calls("POST") == ["charts", "overlays", "overlays"]
+    assert batch.results["existing"].chart_id == "chart-1"
+    assert batch.results["existing"].stats.failed == 0
+    assert batch.results["new"].chart_id == "new-new"
+    assert set(batch.timings) == {"health check", "hashing", "chart lookup", "charts", "overlays"}
+
+
+@patch("workloads_manager.core.registration.check_api_server", return_value=True)
+@patch("workloads_manager.config.TOKEN", "test-token")
+def test_register_workloads_skips_unchanged_workloads(mock_check_api, tmp_path):
+    """Test a workload is only uploaded again when its content changes or its chart is gone."""
+    workload = make_workload(tmp_path, "workload", {"a.yaml": {"model": "org/a"}})
+    url = httpx.URL("http://api.test")
+
+    api = FakeAPI()
+    with patch("workloads_manager.core.registration.make_api_request", side_effect=api):
+        register_workloads([workload], url)
+
+    api = FakeAPI(charts={"workload": "new-workload"})
+    with patch("workloads_manager.core.registration.make_api_request", side_effect=api):
+        batch = register_workloads([workload], url)
+    assert batch.results["workload"].unchanged
+    assert api.calls("PUT") == []
+
+    with patch("workloads_manager.core.registration.make_api_request", side_effect=api):
+        batch = register_workloads([workload], url, force=True)
+    assert not batch.results["workload"].unchanged
+    assert api.calls("PUT") == ["charts/new-workload"]
+
+    (workload.chart_path / "Chart.yaml").write_text("name: workload\nversion: 2\n")
+    api = FakeAPI(charts={"workload": "new-workload"})
+    with patch("workloads_manager.core.registration.make_api_request", side_effect=api):
+        batch = register_workloads([workload], url)
+    assert not batch.results["workload"].unchanged
+    assert api.calls("PUT") == ["charts/new-workload"]
+
+    # The chart was deleted on the server, so it is created again
+    api = FakeAPI()
+    with patch("workloads_manager.core.registration.make_api_request", side_effect=api):
+        batch = register_workloads([workload], url)
+    assert api.calls("POST", "charts") == ["charts"]
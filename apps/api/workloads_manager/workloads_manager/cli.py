@@ -220,11 +220,22 @@ def create_patches():
     envvar="WM_SKIP_CONFIRMATIONS",
     default=False,
 )
-def register(workload: str | None, url: str, yes: bool = False) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Number of charts and overlays to upload concurrently",
+    envvar="WM_JOBS",
+    default=4,
+    show_default=True,
+)
+@click.option("--force", is_flag=True, help="Register workloads even if they did not change since the last run")
+def register(workload: str | None, url: str, yes: bool = False, jobs: int = 4, force: bool = False) -> None:
     """Register a workload template to the service.
 
     If WORKLOAD is not provided, you will be prompted to select from available workloads.
     If WORKLOAD is 'all', a list of all registerable workloads will be displayed.
+    Workloads that did not change since they were last registered to the same URL are skipped.
     """
     # Check repository and token
     dir_status = repository.check_directories()
@@ -288,11 +299,18 @@ def register(workload: str | None, url: str, yes: bool = False) -> None:
         success_count = 0
         failed_workloads = []
 
-        for w in registerable_workloads:
-            console.print(f"\n[bold]Registering workload: {w.dir_name}[/]")
+        batch = registration.register_workloads(registerable_workloads, httpx.URL(url), jobs=jobs, force=force)
+        if batch.error:
+            console.print(f"[bold red]❌ {batch.error}[/]")
+            sys.exit(1)
 
-            result = registration.register_workload(w.dir_name, httpx.URL(url))
-            utils.display_registration_result(result, console)
+        for w in registerable_workloads:
+            result = batch.results[w.dir_name]
+            if result.unchanged:
+                console.print(f"\n[grey70]Workload {w.dir_name} is unchanged, skipped[/grey70]")
+            else:
+                console.print(f"\n[bold]Registered workload: {w.dir_name}[/]")
+                utils.display_registration_result(result, console)
 
             # Check if there were any failed files in the registration
             failed_files = result.stats.failed
@@ -307,10 +325,15 @@ def register(workload: str | None, url: str, yes: bool = False) -> None:
                         f"[yellow]⚠️  Workload {w.dir_name} had {failed_files} failed file(s) and will be marked as failed[/]"
                     )
 
+        utils.display_timings(batch.timings, console)
+
         # Show summary
         console.print("\n[bold]Registration summary:[/]")
         console.print(f"Total workloads: {len(registerable_workloads)}")
         console.print(f"Successfully registered: {success_count}")
+        unchanged_count = sum(1 for result in batch.results.values() if result.unchanged)
+        if unchanged_count:
+            console.print(f"Unchanged (skipped): {unchanged_count}")
 
         if failed_workloads:
             console.print(f"[bold red]Failed workloads: {len(failed_workloads)}[/]")
@@ -341,8 +364,19 @@ def register(workload: str | None, url: str, yes: bool = False) -> None:
     # If a specific workload is provided (not 'all' and not from interactive selection)
     if workload != "all":
         console.print(f"\n[bold]Registering workload: {workload}[/]")
-        result = registration.register_workload(workload, httpx.URL(url))  # type: ignore
-        utils.display_registration_result(result, console)
+        selected = [w for w in registerable_workloads if w.dir_name == workload]
+        batch = registration.register_workloads(selected, httpx.URL(url), jobs=jobs, force=force)
+        if batch.error:
+            console.print(f"[bold red]❌ Failed to register workload: {batch.error}[/]")
+            sys.exit(1)
+        result = batch.results[workload]  # type: ignore
+        if result.unchanged:
+            console.print(
+                f"[grey70]Workload {workload} is unchanged, skipped (use --force to register it anyway)[/grey70]"
+            )
+        else:
+            utils.display_registration_result(result, console)
+        utils.display_timings(batch.timings, console)
 
         if not result.success:
             console.print(f"[bold red]❌ Failed to register workload: {result.error or 'Unknown error'}[/]")
@@ -33,6 +33,11 @@ MAIN_BRANCH = os.environ.get("WM_MAIN_BRANCH", "main")
 API_BASE_URL = os.environ.get("WM_API_URL", "http://127.0.0.1:8001")
 TOKEN = os.environ.get("TOKEN")
 
+# Content hashes of the last registered workloads per API URL, used to skip unchanged workloads
+REGISTRATION_STATE_FILE = os.environ.get(
+    "WM_REGISTRATION_STATE_FILE", str(Path.home() / ".workloads-manager-registrations.json")
+)
+
 # Deployment configuration
 # Paths relative to helm directory that should be included in chart uploads
 # Only these specific files and directories will be included, everything else will be skipped
@@ -4,7 +4,6 @@
 
 """API client functionality for workloads manager."""
 
-import subprocess
 from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
@@ -14,6 +13,23 @@ from loguru import logger
 
 from .. import config
 
+API_TIMEOUT = httpx.Timeout(5.0, read=30.0)
+
+
+def create_api_client(max_connections: int = 10) -> httpx.Client:
+    """Create an HTTP client whose connections are reused across API requests.
+
+    Args:
+        max_connections: Maximum number of concurrent connections to the API server
+
+    Returns:
+        httpx.Client to pass to make_api_request and check_api_server; the caller closes it
+    """
+    return httpx.Client(
+        timeout=API_TIMEOUT,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+    )
+
 
 def get_content_type(file_path: Path | str) -> str:
     """Get MIME type based on file extension."""
@@ -34,6 +50,7 @@ def make_api_request(
     api_url: httpx.URL,
     data: Mapping[str, Any] | None = None,
     files: Mapping[str, list[Path]] | None = None,
+    client: httpx.Client | None = None,
 ) -> tuple[bool, Mapping[str, Any]]:
     """Make an API request using the httpx library.
 
@@ -44,6 +61,7 @@ def make_api_request(
         data: Optional data to send (for POST)
         files: Optional files to upload - dict mapping field_name to list of file_paths.
                Each field can have multiple files: {'field1': ['path1.txt'], 'field2': ['path2.txt', 'path3.txt']}
+        client: Optional shared client; a new client is opened for this request when not provided
 
     Returns:
         Tuple of (success, response_data)
@@ -100,14 +118,11 @@ def make_api_request(
 
     try:
         # Make the request with appropriate timeout
-        with httpx.Client(timeout=httpx.Timeout(5.0, read=30.0)) as client:
-            response = client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                data=data,
-                files=request_files,
-            )
+        if client is None:
+            with httpx.Client(timeout=API_TIMEOUT) as own_client:
+                response = own_client.request(method=method, url=url, headers=headers, data=data, files=request_files)
+        else:
+            response = client.request(method=method, url=url, headers=headers, data=data, files=request_files)
 
         # Handle 204 No Content response (common for DELETE requests)
         if response.status_code == 204:
@@ -140,25 +155,25 @@ def make_api_request(
         return False, {"error": f"Request failed: {str(e)}"}
 
 
-def check_api_server(api_url: httpx.URL) -> bool:
+def check_api_server(api_url: httpx.URL, client: httpx.Client | None = None) -> bool:
     """Check if the API server is accessible.
 
     Args:
         api_url: API URL to check as httpx.URL
+        client: Optional shared client; a new client is opened for the check when not provided
 
     Returns:
         True if accessible, False otherwise
     """
+    health_url = api_url.copy_with(path="/health")
     try:
-        health_url = api_url.copy_with(path="/health")
-        result = subprocess.run(
-            ["curl", "-s", str(health_url)],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        logger.debug(f"API health check response: {result.stdout}")
+        if client is None:
+            with httpx.Client(timeout=API_TIMEOUT) as own_client:
+                response = own_client.get(health_url)
+        else:
+            response = client.get(health_url)
+        logger.debug(f"API health check response: {response.text}")
         return True
-    except subprocess.CalledProcessError:
+    except httpx.HTTPError:
         logger.error(f"API server at {api_url} is not accessible")
         return False
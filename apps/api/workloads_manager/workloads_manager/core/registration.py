@@ -4,7 +4,14 @@
 
 """Registration functionality."""
 
+import hashlib
+import json
+import time
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
 
 import httpx
 import yaml
@@ -14,13 +21,15 @@ from pydantic import ValidationError
 from .. import config
 from ..core.workloads import get_workloads
 from ..models import (
+    BatchRegistrationResult,
     FileProcessingResult,
     OverlayData,
     ProcessingStats,
     ProcessingStatus,
+    Workload,
     WorkloadRegistrationResult,
 )
-from .api import check_api_server, make_api_request
+from .api import check_api_server, create_api_client, make_api_request
 from .utils import temp_file_with_content
 
 
@@ -38,37 +47,116 @@ def register_workload(workload_name: str, api_url: httpx.URL) -> WorkloadRegistr
             success=False, error=f"Workload {workload_name} is not registerable (missing metadata)"
         )
 
+    batch = register_workloads([workload], api_url, force=True)
+    if batch.error:
+        return WorkloadRegistrationResult(success=False, error=batch.error)
+    return batch.results[workload_name]
+
+
+def register_workloads(
+    workloads: list[Workload], api_url: httpx.URL, jobs: int = 1, force: bool = False
+) -> BatchRegistrationResult:
+    """Register workload templates to the service, uploading up to `jobs` charts and overlays at a time.
+
+    Workloads whose content hash matches the last successful registration to the same API are skipped,
+    unless `force` is set or their chart no longer exists on the server.
+    """
+    batch = BatchRegistrationResult()
+
     if not config.TOKEN:
         logger.error("TOKEN environment variable not set")
-        return WorkloadRegistrationResult(success=False, error="TOKEN environment variable not set")
-
-    if not check_api_server(api_url):
-        logger.error(f"Cannot register workload: API server at {api_url} is not accessible")
-        return WorkloadRegistrationResult(
-            success=False, error=f"Cannot register workload: API server at {api_url} is not accessible"
+        batch.error = "TOKEN environment variable not set"
+        return batch
+
+    with create_api_client(max_connections=jobs) as client, ThreadPoolExecutor(max_workers=jobs) as executor:
+        with _timed(batch, "health check"):
+            if not check_api_server(api_url, client):
+                logger.error(f"Cannot register workload: API server at {api_url} is not accessible")
+                batch.error = f"Cannot register workload: API server at {api_url} is not accessible"
+                return batch
+
+        with _timed(batch, "hashing"):
+            hashes = dict(zip([w.dir_name for w in workloads], executor.map(workload_content_hash, workloads)))
+            state = load_registration_state()
+            registered = state.setdefault(str(api_url), {})
+
+        with _timed(batch, "chart lookup"):
+            chart_ids = list_chart_ids(api_url, client)
+
+        pending = []
+        for workload in workloads:
+            previous = registered.get(workload.dir_name, {})
+            if (
+                not force
+                and previous.get("hash") == hashes[workload.dir_name]
+                and chart_ids.get(workload.chart_name) == previous.get("chart_id")  # type: ignore
+            ):
+                logger.info(f"Skipping unchanged workload: {workload.dir_name}")
+                batch.results[workload.dir_name] = WorkloadRegistrationResult(
+                    success=True, chart_id=previous["chart_id"], chart_name=workload.chart_name, unchanged=True
+                )
+            else:
+                pending.append(workload)
+
+        def upload(workload: Workload) -> tuple[str | None, dict[str | None, str]]:
+            existing_chart_id = chart_ids.get(workload.chart_name)  # type: ignore
+            chart_id = upload_chart(workload, api_url, client, existing_chart_id=existing_chart_id)
+            overlay_ids = list_overlay_ids(existing_chart_id, api_url, client) if chart_id and existing_chart_id else {}
+            return chart_id, overlay_ids
+
+        with _timed(batch, "charts"):
+            uploads = dict(zip([w.dir_name for w in pending], executor.map(upload, pending)))
+
+        overlay_tasks = [
+            (workload, file_path, rel_path_str)
+            for workload in pending
+            if uploads[workload.dir_name][0]
+            for file_path, rel_path_str in workload.get_overlay_files()
+        ]
+
+        def upload_overlay(task: tuple[Workload, Path, str]) -> tuple[str, str]:
+            workload, file_path, rel_path_str = task
+            chart_id, overlay_ids = uploads[workload.dir_name]
+            return process_single_overlay(file_path, rel_path_str, api_url, chart_id, client, overlay_ids)  # type: ignore
+
+        with _timed(batch, "overlays"):
+            overlay_results = list(executor.map(upload_overlay, overlay_tasks))
+
+    processed_overlays: dict[str, list[FileProcessingResult]] = {w.dir_name: [] for w in pending}
+    for (workload, _, rel_path_str), (status, file_id) in zip(overlay_tasks, overlay_results):
+        processed_overlays[workload.dir_name].append(
+            FileProcessingResult(path=rel_path_str, status=ProcessingStatus(status), id=file_id)
         )
 
-    logger.info(f"Processing chart: {workload.chart_name}")
-    chart_id = upload_chart(workload.path, api_url)
+    for workload in pending:
+        chart_id = uploads[workload.dir_name][0]
+        if not chart_id:
+            logger.error("Failed to upload chart. Please check API server accessibility.")
+            batch.results[workload.dir_name] = WorkloadRegistrationResult(
+                success=False,
+                error="Failed to upload chart. Please check API server accessibility.",
+                chart_name=workload.chart_name,
+            )
+            continue
+
+        result = _build_registration_result(workload, chart_id, processed_overlays[workload.dir_name])
+        batch.results[workload.dir_name] = result
+        if result.stats.failed == 0:
+            registered[workload.dir_name] = {"hash": hashes[workload.dir_name], "chart_id": chart_id}
+        else:
+            registered.pop(workload.dir_name, None)
 
-    if not chart_id:
-        logger.error("Failed to upload chart. Please check API server accessibility.")
-        return WorkloadRegistrationResult(
-            success=False,
-            error="Failed to upload chart. Please check API server accessibility.",
-            chart_name=workload.chart_name,
-        )
+    save_registration_state(state)
+    return batch
 
-    processed_files: list[FileProcessingResult] = []
-    stats = ProcessingStats()
 
-    # Process overlay files using workload method
-    overlay_files = workload.get_overlay_files()
-    for file_path, rel_path_str in overlay_files:
-        status, file_id = process_single_overlay(file_path, rel_path_str, api_url, chart_id)
-        result = FileProcessingResult(path=rel_path_str, status=ProcessingStatus(status), id=file_id)
-        processed_files.append(result)
-        stats.increment(ProcessingStatus(status))
+def _build_registration_result(
+    workload: Workload, chart_id: str, processed_files: list[FileProcessingResult]
+) -> WorkloadRegistrationResult:
+    """Build the registration result of a workload from its processed overlay files."""
+    stats = ProcessingStats()
+    for result in processed_files:
+        stats.increment(result.status)
 
     # Process all other files for reporting (chart files + skipped files)
     processed_paths = {result.path for result in processed_files}
@@ -96,13 +184,95 @@ def register_workload(workload_name: str, api_url: httpx.URL) -> WorkloadRegistr
     )
 
 
-def upload_chart(workload_path: Path, api_url: httpx.URL) -> str | None:
-    """Upload or update a chart to the service and return the chart ID."""
-    workload = next((w for w in get_workloads() if w.dir_name == workload_path.name), None)
-    if not workload:
-        logger.error(f"Workload {workload_path.name} not found")
-        return None
+@contextmanager
+def _timed(batch: BatchRegistrationResult, phase: str) -> Iterator[None]:
+    """Record the wall-clock duration of a registration phase."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        batch.timings[phase] = time.perf_counter() - start
+
 
+def workload_content_hash(workload: Workload) -> str:
+    """Hash everything registration sends for a workload: chart fields, chart files, signature and overlays."""
+    digest = hashlib.sha256()
+    form_data = {"name": workload.chart_name, "type": workload.type, **workload.get_metadata_for_api()}
+    digest.update(json.dumps(form_data, sort_keys=True, default=str).encode())
+    for file_path, rel_path_str in sorted(workload._iter_files(), key=lambda item: item[1]):
+        digest.update(rel_path_str.encode())
+        digest.update(file_path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_registration_state() -> dict[str, dict[str, dict[str, str]]]:
+    """Load the content hashes of previous registrations, keyed by API URL and workload."""
+    path = Path(config.REGISTRATION_STATE_FILE)
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable registration state {path}: {e}")
+        return {}
+
+
+def save_registration_state(state: Mapping[str, Any]) -> None:
+    """Persist the content hashes of registered workloads."""
+    path = Path(config.REGISTRATION_STATE_FILE)
+    try:
+        path.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Could not save registration state to {path}: {e}")
+
+
+def _list_items(response: Any) -> list:
+    """Return the items of a list response, which the API wraps in a `data` field."""
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict):
+        if isinstance(response.get("data"), list):
+            return response["data"]
+        return [response] if response else []
+    return []
+
+
+def list_chart_ids(api_url: httpx.URL, client: httpx.Client | None = None) -> dict[str, str]:
+    """Get the IDs of all registered charts by name."""
+    success, response = make_api_request("GET", "charts", api_url, client=client)
+    if not success:
+        logger.debug(f"Failed to list charts: {response.get('error', 'Unknown error')}")
+        return {}
+    return {
+        chart["name"]: chart["id"]
+        for chart in _list_items(response)
+        if isinstance(chart, dict) and chart.get("name") and chart.get("id")
+    }
+
+
+def list_overlay_ids(chart_id: str, api_url: httpx.URL, client: httpx.Client | None = None) -> dict[str | None, str]:
+    """Get the IDs of the overlays of a chart by canonical name, as get_overlay_id matches them."""
+    success, response = make_api_request("GET", f"overlays?chart_id={chart_id}", api_url, client=client)
+    if not success:
+        logger.debug(f"Failed to get overlays: {response.get('error', 'Unknown error')}")
+        return {}
+    overlay_ids: dict[str | None, str] = {}
+    for overlay in _list_items(response):
+        if isinstance(overlay, dict) and overlay.get("id"):
+            overlay_ids.setdefault(overlay.get("canonical_name"), overlay["id"])
+    return overlay_ids
+
+
+def upload_chart(
+    workload: Workload,
+    api_url: httpx.URL,
+    client: httpx.Client | None = None,
+    existing_chart_id: str | None = None,
+) -> str | None:
+    """Upload or update a chart to the service and return the chart ID.
+
+    The chart is updated when `existing_chart_id` is given and created otherwise.
+    """
     if not workload.chart_path.exists():
         logger.error(f"Chart directory not found at {workload.chart_path}")
         return None
@@ -118,7 +288,6 @@ def upload_chart(workload_path: Path, api_url: httpx.URL) -> str | None:
     metadata = workload.get_metadata_for_api()
     form_data.update(metadata)
 
-    existing_chart_id = get_chart_id(workload.chart_name, api_url)  # type: ignore
     if existing_chart_id:
         endpoint = f"charts/{existing_chart_id}"
         method = "PUT"
@@ -130,7 +299,7 @@ def upload_chart(workload_path: Path, api_url: httpx.URL) -> str | None:
         method = "POST"
         logger.info(f"Creating chart: {workload.chart_name} with {len(api_files['files'])} chart files + signature")
 
-    success, response_data = make_api_request(method, endpoint, api_url, data=form_data, files=api_files)
+    success, response_data = make_api_request(method, endpoint, api_url, data=form_data, files=api_files, client=client)
 
     if not success:
         error_msg = response_data.get("error", "Unknown error")
@@ -165,19 +334,12 @@ def get_chart_id(chart_name: str, api_url: httpx.URL) -> str | None:
         return None
 
     # The API might return a list of charts or a single chart
-    if isinstance(response, dict):
-        chart_id = response.get("id")
-        if chart_id:
-            logger.debug(f"Found existing chart: {chart_name} (ID: {chart_id})")
-            return chart_id
-    elif isinstance(response, list):
-        # If it's a list, find the chart with matching name
-        for chart in response:
-            if isinstance(chart, dict) and chart.get("name") == chart_name:
-                chart_id = chart.get("id")
-                if chart_id:
-                    logger.debug(f"Found existing chart: {chart_name} (ID: {chart_id})")
-                    return chart_id
+    for chart in _list_items(response):
+        if isinstance(chart, dict) and chart.get("name", chart_name) == chart_name:
+            chart_id = chart.get("id")
+            if chart_id:
+                logger.debug(f"Found existing chart: {chart_name} (ID: {chart_id})")
+                return chart_id
 
     logger.debug(f"No existing chart found for: {chart_name}")
     return None
@@ -190,15 +352,25 @@ def get_overlay_id(chart_id: str, canonical_name: str | None, api_url: httpx.URL
         logger.debug(f"Failed to get overlays: {response.get('error', 'Unknown error')}")
         return None
 
-    overlays = response if isinstance(response, list) else [response] if response else []
-    for overlay in overlays:
+    for overlay in _list_items(response):
         if isinstance(overlay, dict) and canonical_name == overlay.get("canonical_name"):
             return overlay.get("id")
     return None
 
 
-def process_single_overlay(overlay_file: Path, rel_path_str: str, api_url: httpx.URL, chart_id: str) -> tuple[str, str]:
-    """Process a single overlay file and return (status, file_id)."""
+def process_single_overlay(
+    overlay_file: Path,
+    rel_path_str: str,
+    api_url: httpx.URL,
+    chart_id: str,
+    client: httpx.Client | None = None,
+    overlay_ids: Mapping[str | None, str] | None = None,
+) -> tuple[str, str]:
+    """Process a single overlay file and return (status, file_id).
+
+    `overlay_ids` maps the canonical names of the chart's existing overlays to their IDs;
+    the overlay is looked up on the server when it is not given.
+    """
     try:
         content = overlay_file.read_text(encoding="utf-8")
 
@@ -229,11 +401,14 @@ def process_single_overlay(overlay_file: Path, rel_path_str: str, api_url: httpx
 
             files = {"overlay_file": [Path(temp_path)]}
 
-            existing_id = get_overlay_id(chart_id, canonical_name, api_url)
+            if overlay_ids is None:
+                existing_id = get_overlay_id(chart_id, canonical_name, api_url)
+            else:
+                existing_id = overlay_ids.get(canonical_name)
             endpoint = f"overlays/{existing_id}" if existing_id else "overlays"
             method = "PUT" if existing_id else "POST"
 
-            success, response = make_api_request(method, endpoint, api_url, data=data, files=files)
+            success, response = make_api_request(method, endpoint, api_url, data=data, files=files, client=client)
 
             if success and "id" in response:
                 overlay_id = existing_id or response["id"]
@@ -84,6 +84,25 @@ def display_registration_result(result: "WorkloadRegistrationResult", console: C
         console.print("[bold red]❌ Workload registration failed[/]")
 
 
+def display_timings(timings: dict[str, float], console: Console) -> None:
+    """Display the time spent in each registration phase.
+
+    Args:
+        timings: Seconds spent per phase, in execution order
+        console: Rich console instance to print to
+    """
+    if not timings:
+        return
+
+    table = rich.table.Table(title="Registration timings", show_header=True, header_style="bold")
+    table.add_column("Phase")
+    table.add_column("Seconds", justify="right")
+    for phase, seconds in timings.items():
+        table.add_row(phase, f"{seconds:.2f}")
+    table.add_row("[bold]total[/]", f"[bold]{sum(timings.values()):.2f}[/]")
+    console.print(table)
+
+
 @contextmanager
 def temp_file_with_content(content: str, suffix: str = ".yaml") -> Iterator[str]:
     """Context manager for temporary files.
@@ -6,7 +6,7 @@
 
 from .base import FileProcessingResult, ProcessingStats, ProcessingStatus
 from .overlay import OverlayData, OverlayType, OverlayUploadData
-from .workload import Workload, WorkloadMetadata, WorkloadRegistrationResult
+from .workload import BatchRegistrationResult, Workload, WorkloadMetadata, WorkloadRegistrationResult
 
 __all__ = [
     # Base models
@@ -17,6 +17,7 @@ __all__ = [
     "Workload",
     "WorkloadMetadata",
     "WorkloadRegistrationResult",
+    "BatchRegistrationResult",
     # Overlay models
     "OverlayData",
     "OverlayType",
@@ -247,3 +247,14 @@ class WorkloadRegistrationResult(BaseModel):
     files: list[FileProcessingResult] = Field(default_factory=list, description="Results for individual files")
     stats: ProcessingStats = Field(default_factory=ProcessingStats, description="Processing statistics")
     error: str | None = Field(None, description="Error message if registration failed")
+    unchanged: bool = Field(False, description="Whether registration was skipped because the workload did not change")
+
+
+class BatchRegistrationResult(BaseModel):
+    """Result of registering several workloads in one run."""
+
+    results: dict[str, WorkloadRegistrationResult] = Field(
+        default_factory=dict, description="Registration results by workload directory name"
+    )
+    timings: dict[str, float] = Field(default_factory=dict, description="Seconds spent in each registration phase")
+    error: str | None = Field(None, description="Error message if the run could not start")